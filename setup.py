@@ -41,7 +41,8 @@ setup(
               'thingsboard_gateway.gateway.shell', 'thingsboard_gateway.gateway.statistics',
               'thingsboard_gateway.storage', 'thingsboard_gateway.storage.memory',
               'thingsboard_gateway.gateway.report_strategy', 'thingsboard_gateway.storage.file',
-              'thingsboard_gateway.storage.sqlite',
+              'thingsboard_gateway.storage.sqlite', 'thingsboard_gateway.storage.priority',
+              'thingsboard_gateway.storage.hybrid',
               'thingsboard_gateway.connectors',
               'thingsboard_gateway.connectors.ble', 'thingsboard_gateway.extensions.ble',
               'thingsboard_gateway.connectors.socket', 'thingsboard_gateway.extensions.socket',
@@ -0,0 +1,160 @@
+#     Copyright 2026. ThingsBoard
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+"""
+Replays CAN frames through the CAN connector and reports decoded frames per second.
+
+Frames are read from a python-can log file (asc, blf, csv, ...) if it is passed as the first argument,
+otherwise synthetic frames for the example configuration below are generated. With --virtual-bus frames
+are sent through python-can virtual bus to the running connector, so bus reading is measured too.
+
+    python -m tests.benchmarks.bench_can_frame_decoding [frames.log] [--batch-size 100] [--virtual-bus]
+"""
+
+import logging
+import struct
+from argparse import ArgumentParser
+from itertools import islice
+from random import randint, seed
+from threading import Event
+from time import perf_counter
+from unittest.mock import MagicMock, patch
+
+from can import Bus, LogReader, Message
+
+from thingsboard_gateway.connectors.can.bytes_can_uplink_converter import BytesCanUplinkConverter
+from thingsboard_gateway.connectors.can.can_connector import CanConnector
+
+CONFIG = {
+    "name": "CAN benchmark",
+    "devices": [{
+        "name": "Car %i" % device,
+        "timeseries": [
+            {"key": "rpm", "nodeId": 0x100 + device, "command": "0:1:big:1", "value": "1:2:big:int",
+             "expression": "value / 4"},
+            {"key": "speed", "nodeId": 0x100 + device, "command": "0:1:big:2", "value": "1:1:int"},
+            {"key": "load", "nodeId": 0x100 + device, "command": "0:1:big:3", "value": "1:4:little:float"},
+            {"key": "temperature", "nodeId": 0x200 + device, "value": "0:2:little:int:signed"}
+        ],
+        "attributes": [{"key": "vin", "nodeId": 0x300 + device, "value": "0:8:string:ascii"}]
+    } for device in range(10)]
+}
+
+
+def generate_frames(count):
+    seed(0)
+    for _ in range(count):
+        device = randint(0, 9)
+        kind = randint(0, 4)
+        if kind < 3:
+            payload = bytes([kind + 1]) + (struct.pack('<f', randint(0, 100) / 3) if kind == 2
+                                            else randint(0, 0xffff).to_bytes(4, 'big'))
+            yield Message(arbitration_id=0x100 + device, data=payload)
+        elif kind == 3:
+            yield Message(arbitration_id=0x200 + device, data=randint(-500, 500).to_bytes(2, 'little', signed=True))
+        else:
+            yield Message(arbitration_id=0x300 + device, data=b'WVWZZZ%02i' % device)
+
+
+def create_connector(config=None):
+    logger = logging.getLogger('can_benchmark')
+    logger.setLevel(logging.WARNING)
+    logger.trace = logger.debug
+    logger.stop = lambda: None
+    with patch('thingsboard_gateway.connectors.can.can_connector.init_logger', return_value=logger):
+        return CanConnector(MagicMock(), config or CONFIG, 'can')
+
+
+def run_per_frame_conversion(frames):
+    """Conversion as it was done before the dispatch table: parse configuration for every frame."""
+
+    converter = BytesCanUplinkConverter(logging.getLogger('can_benchmark'))
+    connector = create_connector()
+    nodes = connector._CanConnector__nodes
+    commands = connector._CanConnector__commands
+
+    started = perf_counter()
+    for message in frames:
+        if message.arbitration_id not in nodes:
+            continue
+        cmd_conf = commands[message.arbitration_id]
+        cmd_id = int.from_bytes(message.data[cmd_conf["start"]:cmd_conf["start"] + cmd_conf["length"]],
+                                cmd_conf["byteorder"]) if cmd_conf is not None else CanConnector.NO_CMD_ID
+        if cmd_id in nodes[message.arbitration_id]:
+            converter.convert(nodes[message.arbitration_id][cmd_id], message.data)
+    return perf_counter() - started
+
+
+def run_dispatch_table(frames, batch_size):
+    connector = create_connector()
+    frames_iterator = iter(frames)
+    started = perf_counter()
+    while batch := list(islice(frames_iterator, batch_size)):
+        connector.process_messages(batch)
+    return perf_counter() - started
+
+
+def run_virtual_bus(frames, batch_size):
+    connector = create_connector({**CONFIG, "interface": "virtual", "channel": "can_benchmark",
+                                  "maxFramesPerBatch": batch_size})
+    processed = [0]
+    done = Event()
+    process_messages = connector.process_messages
+
+    def count_processed(messages):
+        process_messages(messages)
+        processed[0] += len(messages)
+        if processed[0] >= len(frames):
+            done.set()
+
+    connector.process_messages = count_processed
+    connector.open()
+    while not connector.is_connected():
+        done.wait(.01)
+
+    with Bus(interface='virtual', channel='can_benchmark') as bus:
+        started = perf_counter()
+        for message in frames:
+            bus.send(message)
+        done.wait(60)
+        elapsed = perf_counter() - started
+
+    connector.close()
+    return elapsed
+
+
+def main():
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument('log_file', nargs='?', help='python-can log file to replay')
+    parser.add_argument('--frames', type=int, default=200000, help='count of synthetic frames')
+    parser.add_argument('--batch-size', type=int, default=CanConnector.DEFAULT_MAX_FRAMES_PER_BATCH)
+    parser.add_argument('--virtual-bus', action='store_true', help='replay frames through virtual CAN bus')
+    args = parser.parse_args()
+
+    frames = list(LogReader(args.log_file)) if args.log_file else list(generate_frames(args.frames))
+    for message in frames:
+        message.data = bytearray(message.data)
+
+    per_frame = run_per_frame_conversion(frames)
+    dispatch = run_dispatch_table(frames, args.batch_size)
+    print("Frames:                %i" % len(frames))
+    print("Per frame conversion:  %.0f frames/s" % (len(frames) / per_frame))
+    print("Dispatch table:        %.0f frames/s (batch size %i)" % (len(frames) / dispatch, args.batch_size))
+    if args.virtual_bus:
+        virtual_bus = run_virtual_bus(frames, args.batch_size)
+        print("Virtual bus replay:    %.0f frames/s" % (len(frames) / virtual_bus))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,116 @@
+#     Copyright 2026. ThingsBoard
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+"""
+Ingestion benchmark for the gRPC server: an out-of-process connector sends telemetry through one channel,
+reports datapoints per second that reached send_to_storage.
+
+    python -m tests.benchmarks.bench_grpc_ingestion [--messages 2000] [--datapoints 50] [--batch-size 20]
+
+Every message contains telemetry of one device with the given number of datapoints, with --batch-size greater
+than 1 messages are sent as GatewayTelemetryBatchMsg frames. The client runs in a separate process.
+"""
+
+import socket
+from argparse import ArgumentParser
+from multiprocessing import Event as MultiprocessingEvent, Process
+from threading import Event
+from time import perf_counter, sleep
+from unittest.mock import MagicMock
+
+import grpc
+
+from thingsboard_gateway.gateway.constant_enums import Status
+from thingsboard_gateway.gateway.grpc_service.tb_grpc_manager import TBGRPCServerManager
+from thingsboard_gateway.gateway.proto import messages_pb2_grpc
+from thingsboard_gateway.grpc_connectors.gw_grpc_msg_creator import GrpcMsgCreator
+
+SESSION_ID = 'benchmark-session'
+
+
+class CountingGateway:
+    def __init__(self, expected_datapoints):
+        self.datapoints = 0
+        self.expected_datapoints = expected_datapoints
+        self.done = Event()
+
+    def send_to_storage(self, connector_name, connector_id, data):
+        for device_data in data:
+            self.datapoints += sum(len(entry['values']) for entry in device_data['telemetry'])
+        if self.datapoints >= self.expected_datapoints:
+            self.done.set()
+
+    def __getattr__(self, item):
+        return MagicMock()
+
+
+def get_free_port():
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def run_client(port, messages, datapoints, batch_size, ready_event):
+    channel = grpc.insecure_channel('127.0.0.1:%i' % port)
+    grpc.channel_ready_future(channel).result(timeout=15)
+    stub = messages_pb2_grpc.TBGatewayProtoServiceStub(channel)
+    metadata = [('identifier', SESSION_ID)]
+
+    telemetry_messages = [GrpcMsgCreator.create_telemetry_connector_msg(
+        {'ts': 1000 + number, 'values': {'key_%i' % key: float(key) for key in range(datapoints)}},
+        device_name='Device %i' % (number % 100)) for number in range(messages)]
+
+    if batch_size > 1:
+        requests = [GrpcMsgCreator.create_telemetry_batch_connector_msg(telemetry_messages[index:index + batch_size])
+                    for index in range(0, messages, batch_size)]
+    else:
+        requests = telemetry_messages
+
+    ready_event.set()
+    for request in requests:
+        stub.stream(request, metadata=metadata, timeout=15)
+    channel.close()
+
+
+def main():
+    parser = ArgumentParser()
+    parser.add_argument('--messages', type=int, default=2000)
+    parser.add_argument('--datapoints', type=int, default=50)
+    parser.add_argument('--batch-size', type=int, default=20)
+    args = parser.parse_args()
+
+    expected_datapoints = args.messages * args.datapoints
+    gateway = CountingGateway(expected_datapoints)
+    port = get_free_port()
+    manager = TBGRPCServerManager(gateway, {'serverPort': port})
+    manager.set_gateway_read_callbacks(MagicMock(), MagicMock())
+    manager.registration_finished(Status.SUCCESS, SESSION_ID, {'name': 'Benchmark', 'id': 'benchmark', 'config': {}})
+    sleep(1)
+
+    ready_event = MultiprocessingEvent()
+    client = Process(target=run_client, args=(port, args.messages, args.datapoints, args.batch_size, ready_event),
+                     daemon=True)
+    client.start()
+    ready_event.wait(timeout=60)
+    started = perf_counter()
+    gateway.done.wait(timeout=600)
+    elapsed = perf_counter() - started
+    client.join(timeout=15)
+
+    print('Datapoints: %i of %i in %.2f s, %.0f datapoints/s' % (gateway.datapoints, expected_datapoints, elapsed,
+                                                                gateway.datapoints / elapsed))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,171 @@
+#     Copyright 2026. ThingsBoard
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+"""
+Load test for the OCPP connector: many simulated charge points connect over websocket concurrently,
+send BootNotification and a series of MeterValues, reports OCPP messages per second processed by the connector.
+
+    python -m tests.benchmarks.bench_ocpp_load [--charge-points 1000] [--messages 20] [--processes 4]
+
+Charge points are simulated in separate processes, so the connector doesn't share GIL with them.
+"""
+
+import asyncio
+import logging
+import socket
+from argparse import ArgumentParser
+from datetime import datetime, timezone
+from multiprocessing import Event as MultiprocessingEvent, Process
+from time import perf_counter, sleep
+from unittest.mock import MagicMock, patch
+
+import websockets
+from ocpp.v16 import ChargePoint, call
+
+from thingsboard_gateway.connectors.ocpp.ocpp_connector import OcppConnector
+
+CONFIG = {
+    "name": "OCPP benchmark",
+    "centralSystem": {
+        "name": "Central System",
+        "host": "127.0.0.1",
+        "connection": {"type": "insecure"}
+    },
+    "chargePoints": [
+        {
+            "idRegexpPattern": "CP_.*",
+            "deviceNameExpression": "${Vendor} ${Model}",
+            "deviceTypeExpression": "default",
+            "attributes": [
+                {"messageTypeFilter": "MeterValues,", "key": "connectorId", "value": "${connector_id}"}
+            ],
+            "timeseries": [
+                {"messageTypeFilter": "MeterValues,", "key": "power",
+                 "value": "${meter_value[:].sampled_value[:].value}"}
+            ]
+        }
+    ]
+}
+
+
+class CountingGateway:
+    def __init__(self):
+        self.stored = 0
+
+    def send_to_storage(self, connector_name, connector_id, data):
+        self.stored += 1
+
+    def __getattr__(self, item):
+        return MagicMock()
+
+
+def get_free_port():
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def start_connector(gateway):
+    port = get_free_port()
+    config = {**CONFIG, "centralSystem": {**CONFIG["centralSystem"], "port": port}}
+
+    logger = logging.getLogger('OCPP benchmark')
+    logger.setLevel(logging.WARNING)
+    logger.trace = logger.debug
+    logger.stop = lambda: None
+    with patch('thingsboard_gateway.connectors.ocpp.ocpp_connector.init_logger', return_value=logger):
+        connector = OcppConnector(gateway, config, 'ocpp')
+    connector.open()
+
+    while not connector.is_connected():
+        sleep(.01)
+
+    return connector, port
+
+
+async def run_charge_point(port, index, messages, connected):
+    async with connected:
+        websocket = await websockets.connect('ws://127.0.0.1:%i/CP_%i' % (port, index), subprotocols=['ocpp1.6'],
+                                             open_timeout=60)
+
+    charge_point = ChargePoint('CP_%i' % index, websocket)
+    listener = asyncio.ensure_future(charge_point.start())
+
+    await charge_point.call(call.BootNotificationPayload(charge_point_model='Model %i' % index,
+                                                         charge_point_vendor='Vendor'))
+    for value in range(messages):
+        timestamp = datetime.now(timezone.utc).isoformat()
+        await charge_point.call(call.MeterValuesPayload(
+            connector_id=1,
+            meter_value=[{"timestamp": timestamp, "sampledValue": [{"value": str(value)}]}]))
+
+    return websocket, listener
+
+
+async def run_charge_points(port, charge_points, messages, processed):
+    # limits concurrent connection attempts, so the listen backlog is not overflown
+    connected = asyncio.Semaphore(64)
+    clients = await asyncio.gather(*(run_charge_point(port, index, messages, connected) for index in charge_points))
+
+    # connections are kept open until the connector processes messages of all charge points
+    while not processed.is_set():
+        await asyncio.sleep(.1)
+
+    for websocket, listener in clients:
+        listener.cancel()
+        await websocket.close()
+
+
+def run_process(port, charge_points, messages, processed):
+    asyncio.run(run_charge_points(port, charge_points, messages, processed))
+
+
+def main():
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument('--charge-points', type=int, default=1000, help='count of simulated charge points')
+    parser.add_argument('--messages', type=int, default=20, help='MeterValues sent by every charge point')
+    parser.add_argument('--processes', type=int, default=4, help='count of processes simulating charge points')
+    args = parser.parse_args()
+
+    expected_messages = args.charge_points * (args.messages + 1)
+    gateway = CountingGateway()
+    connector, port = start_connector(gateway)
+
+    processed = MultiprocessingEvent()
+    processes = [Process(target=run_process,
+                         args=(port, range(index, args.charge_points, args.processes), args.messages, processed))
+                 for index in range(args.processes)]
+
+    started = perf_counter()
+    for process in processes:
+        process.start()
+    while connector.statistics['MessagesReceived'] < expected_messages and perf_counter() - started < 120:
+        sleep(.01)
+    elapsed = perf_counter() - started
+
+    processed.set()
+    for process in processes:
+        process.join(30)
+    connector.close()
+    connector.join(5)
+
+    print("Charge points:  %i" % args.charge_points)
+    print("Messages:       %i sent, %i processed, %i stored" % (expected_messages,
+                                                                connector.statistics['MessagesReceived'],
+                                                                gateway.stored))
+    print("Throughput:     %.0f messages/s" % (connector.statistics['MessagesReceived'] / elapsed))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+#     Copyright 2026. ThingsBoard
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+"""
+Polls local SQLite database through ODBC (SQLite3 ODBC driver is required) and compares
+row by row processing with batched fetchmany processing of the ODBC connector.
+
+    python -m tests.benchmarks.bench_odbc_polling [--rows 100000] [--devices 100] [--batch-size 1000]
+"""
+
+import logging
+import sqlite3
+from argparse import ArgumentParser
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from unittest.mock import MagicMock, patch
+
+from thingsboard_gateway.connectors.odbc.odbc_connector import OdbcConnector
+
+
+def create_database(database_path, rows, devices):
+    with sqlite3.connect(database_path) as connection:
+        connection.execute("CREATE TABLE readings (device TEXT, temperature REAL, humidity REAL, ts INTEGER)")
+        connection.executemany("INSERT INTO readings VALUES (?, ?, ?, ?)",
+                               (("Sensor %i" % (i % devices), 20 + i % 10, 40 + i % 20, 1700000000000 + i)
+                                for i in range(rows)))
+
+
+def create_connector(database_path, config_path, batch_size):
+    config = {
+        "name": "ODBC benchmark",
+        "connection": {"str": "Driver={SQLite3};Database=%s;" % database_path, "reconnect": False},
+        "polling": {
+            "query": "SELECT device, temperature, humidity, ts FROM readings WHERE ts > ? ORDER BY ts ASC",
+            "batchSize": batch_size,
+            "iterator": {"column": "ts", "value": 0, "persistent": True}
+        },
+        "mapping": {
+            "device": {"name": "device", "type": "'sensor'"},
+            "timeseries": [{"name": "temperature", "column": "temperature"},
+                           {"name": "humidity", "column": "humidity"}]
+        }
+    }
+
+    logger = logging.getLogger('odbc_benchmark')
+    logger.setLevel(logging.WARNING)
+    logger.trace = logger.debug
+    gateway = MagicMock()
+    gateway.get_config_path.return_value = config_path
+    with patch('thingsboard_gateway.connectors.odbc.odbc_connector.init_logger', return_value=logger):
+        return OdbcConnector(gateway, config, 'odbc'), gateway
+
+
+def run(database_path, config_path, batch_size):
+    connector, gateway = create_connector(database_path, config_path, batch_size)
+    connector._OdbcConnector__init_connection()
+    connector._OdbcConnector__init_iterator()
+
+    started = perf_counter()
+    connector._OdbcConnector__poll()
+    elapsed = perf_counter() - started
+
+    connector._OdbcConnector__close()
+    return elapsed, gateway.send_to_storage.call_count
+
+
+def main():
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument('--rows', type=int, default=100000)
+    parser.add_argument('--devices', type=int, default=100)
+    parser.add_argument('--batch-size', type=int, default=1000)
+    args = parser.parse_args()
+
+    with TemporaryDirectory() as directory:
+        database_path = directory + '/benchmark.db'
+        create_database(database_path, args.rows, args.devices)
+
+        for title, batch_size in (("Row by row", 0), ("fetchmany(%i)" % args.batch_size, args.batch_size)):
+            config_path = directory + '/batch_size_%i/' % batch_size
+            Path(config_path).mkdir()
+            elapsed, messages = run(database_path, config_path, batch_size)
+            print("%-20s %.0f rows/s, %i messages to storage" % (title + ':', args.rows / elapsed, messages))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,125 @@
+#     Copyright 2026. ThingsBoard
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+"""
+Simulation harness for the pack planner: devices produce telemetry every tick, the sender plans the pending data
+of all devices with the given merge mode and sends the messages while the simulated gateway rate limits allow it.
+Reports messages sent and datapoints delivered for every merge mode, time is simulated, so the run is instant.
+
+    python -m tests.benchmarks.bench_pack_planner [--devices 200] [--datapoints-per-device 5]
+        [--messages-rate-limit 10:1,300:60] [--datapoints-rate-limit 5000:1,300000:60]
+        [--max-payload-size 8196] [--seconds 120]
+
+Rate limits use the ThingsBoard "limit:seconds" format, values are used as is (without the client percentage).
+"""
+
+from argparse import ArgumentParser
+from math import ceil
+
+from thingsboard_gateway.gateway.pack_planner import MERGE_DEVICES_MODES, PackPlanner, RateLimitBudget
+
+
+class SimulatedRateLimit:
+    def __init__(self, rate_limit):
+        # [capacity, duration, tokens] per window
+        self.buckets = []
+        for rate in filter(None, rate_limit.replace(';', ',').split(',')):
+            capacity, duration = rate.split(':')
+            self.buckets.append([int(capacity), int(duration), float(capacity)])
+
+    def refill(self, elapsed):
+        for bucket in self.buckets:
+            bucket[2] = min(bucket[0], bucket[2] + elapsed * bucket[0] / bucket[1])
+
+    def remaining(self):
+        return int(min(bucket[2] for bucket in self.buckets)) if self.buckets else float('inf')
+
+    def minimal_limit(self):
+        return min(bucket[0] for bucket in self.buckets) if self.buckets else 0
+
+    def consume(self, amount):
+        for bucket in self.buckets:
+            bucket[2] -= amount
+
+
+def telemetry(device_index, ts, datapoints):
+    return {'ts': ts, 'values': {'key%i' % key: device_index * 0.5 + key for key in range(datapoints)}}
+
+
+def client_messages_count(message, max_payload_size, max_datapoints_per_message):
+    # the client splits data of a single device that does not fit into one message
+    if len(message.devices_data) > 1:
+        return 1
+    parts = ceil(message.size / max_payload_size)
+    if max_datapoints_per_message > 0:
+        parts = max(parts, ceil(message.datapoints / max_datapoints_per_message))
+    return max(parts, 1)
+
+
+def simulate(mode, args):
+    messages_rate_limit = SimulatedRateLimit(args.messages_rate_limit)
+    datapoints_rate_limit = SimulatedRateLimit(args.datapoints_rate_limit)
+    planner = PackPlanner(args.max_payload_size, mode)
+    pending = {}
+    messages_sent = 0
+    datapoints_sent = 0
+    produced = 0
+
+    for tick in range(int(args.seconds / args.tick)):
+        ts = tick * int(args.tick * 1000)
+        for device_index in range(args.devices):
+            pending.setdefault('Device %i' % device_index, []).append(
+                telemetry(device_index, ts, args.datapoints_per_device))
+            produced += args.datapoints_per_device
+        messages_rate_limit.refill(args.tick)
+        datapoints_rate_limit.refill(args.tick)
+
+        budget = RateLimitBudget(messages_rate_limit.remaining(), datapoints_rate_limit.remaining(),
+                                 datapoints_rate_limit.minimal_limit())
+        for message in planner.plan(pending, budget):
+            messages = client_messages_count(message, args.max_payload_size, budget.max_datapoints_per_message)
+            if messages_rate_limit.remaining() < messages or datapoints_rate_limit.remaining() < message.datapoints:
+                # data stays pending and is planned again on the next tick
+                continue
+            messages_rate_limit.consume(messages)
+            datapoints_rate_limit.consume(message.datapoints)
+            messages_sent += messages
+            datapoints_sent += message.datapoints
+            for device in message.devices_data:
+                del pending[device]
+
+    print("%-7s %10i %12i %12.1f %10.1f %12i" % (mode, messages_sent, datapoints_sent,
+                                                  datapoints_sent / args.seconds,
+                                                  datapoints_sent / messages_sent if messages_sent else 0,
+                                                  produced - datapoints_sent))
+
+
+def main():
+    parser = ArgumentParser()
+    parser.add_argument('--devices', type=int, default=200)
+    parser.add_argument('--datapoints-per-device', type=int, default=5)
+    parser.add_argument('--messages-rate-limit', default='10:1,300:60')
+    parser.add_argument('--datapoints-rate-limit', default='5000:1,300000:60')
+    parser.add_argument('--max-payload-size', type=int, default=8196)
+    parser.add_argument('--seconds', type=int, default=120)
+    parser.add_argument('--tick', type=float, default=1.0)
+    args = parser.parse_args()
+
+    print("mode      messages   datapoints       dp/s     dp/msg      backlog")
+    for mode in MERGE_DEVICES_MODES:
+        simulate(mode, args)
+
+
+if __name__ == '__main__':
+    main()
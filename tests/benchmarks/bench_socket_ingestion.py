@@ -0,0 +1,175 @@
+#     Copyright 2026. ThingsBoard
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+"""
+Load test for the Socket connector: many simulated clients send framed messages concurrently,
+reports messages per second stored by the connector.
+
+    python -m tests.benchmarks.bench_socket_ingestion [--clients 2000] [--messages 50] [--udp]
+"""
+
+import asyncio
+import logging
+import socket
+from argparse import ArgumentParser
+from threading import Event
+from time import perf_counter, sleep
+from unittest.mock import MagicMock, patch
+
+from thingsboard_gateway.connectors.socket.socket_connector import SocketConnector
+
+CONFIG = {
+    "name": "Socket benchmark",
+    "socket": {
+        "address": "127.0.0.1",
+        "bufferSize": 65536,
+        "receiveBufferSize": 4194304,
+        "framing": {"type": "delimiter", "delimiter": "\n"}
+    },
+    "devices": [
+        {
+            "address": "127.0.0.1:*",
+            "deviceName": "Socket benchmark device",
+            "deviceType": "default",
+            "encoding": "utf-8",
+            "telemetry": [{"key": "temperature", "byteFrom": 0, "byteTo": -1}],
+            "attributes": []
+        }
+    ]
+}
+
+
+UDP_BURST_SIZE = 50
+
+
+class CountingGateway:
+    def __init__(self, expected_messages):
+        self.messages = 0
+        self.expected_messages = expected_messages
+        self.done = Event()
+
+    def send_to_storage(self, connector_name, connector_id, data):
+        self.messages += 1
+        if self.messages >= self.expected_messages:
+            self.done.set()
+
+    def __getattr__(self, item):
+        return MagicMock()
+
+
+def wait_for_messages(gateway, idle_timeout=3):
+    # stops waiting if no messages were stored for idle_timeout seconds, lost UDP datagrams are never received
+    stored_messages = -1
+    while not gateway.done.wait(idle_timeout) and gateway.messages != stored_messages:
+        stored_messages = gateway.messages
+
+
+def get_free_port(socket_type):
+    with socket.socket(socket.AF_INET, socket_type) as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def start_connector(gateway, socket_type):
+    port = get_free_port(socket.SOCK_STREAM if socket_type == 'TCP' else socket.SOCK_DGRAM)
+    config = {**CONFIG, "socket": {**CONFIG["socket"], "type": socket_type, "port": port}}
+
+    logger = logging.getLogger('Socket benchmark')
+    logger.setLevel(logging.WARNING)
+    logger.trace = logger.debug
+    logger.stop = lambda: None
+    with patch('thingsboard_gateway.connectors.socket.socket_connector.init_logger', return_value=logger):
+        connector = SocketConnector(gateway, config, 'socket')
+    connector.open()
+
+    while connector.loop is None or not connector.loop.is_running():
+        sleep(.01)
+    sleep(.5)
+
+    return connector, port
+
+
+async def run_tcp_client(port, messages, connected):
+    reader, writer = await asyncio.open_connection('127.0.0.1', port)
+    connected.release()
+
+    payload = b''.join(b'%i\n' % value for value in range(messages))
+    writer.write(payload)
+    await writer.drain()
+    return writer
+
+
+async def run_tcp_clients(port, clients, messages):
+    # limits concurrent connection attempts, so the listen backlog is not overflown
+    connected = asyncio.Semaphore(256)
+
+    async def client():
+        await connected.acquire()
+        return await run_tcp_client(port, messages, connected)
+
+    return await asyncio.gather(*(client() for _ in range(clients)))
+
+
+async def run_udp_clients(port, clients, messages):
+    loop = asyncio.get_running_loop()
+    transports = []
+    for _ in range(clients):
+        transport, _ = await loop.create_datagram_endpoint(asyncio.DatagramProtocol,
+                                                           remote_addr=('127.0.0.1', port))
+        transports.append(transport)
+
+    sent = 0
+    for value in range(messages):
+        for transport in transports:
+            transport.sendto(b'%i\n' % value)
+            sent += 1
+            # gives the connector time to read, UDP datagrams are dropped if the socket receive buffer is full
+            if sent % UDP_BURST_SIZE == 0:
+                await asyncio.sleep(.001)
+
+    return transports
+
+
+def main():
+    parser = ArgumentParser(description=__doc__)
+    parser.add_argument('--clients', type=int, default=2000, help='count of simulated clients')
+    parser.add_argument('--messages', type=int, default=50, help='messages sent by every client')
+    parser.add_argument('--udp', action='store_true', help='send messages over UDP instead of TCP')
+    args = parser.parse_args()
+
+    expected_messages = args.clients * args.messages
+    gateway = CountingGateway(expected_messages)
+    connector, port = start_connector(gateway, 'UDP' if args.udp else 'TCP')
+
+    started = perf_counter()
+    run_clients = run_udp_clients if args.udp else run_tcp_clients
+    loop = asyncio.new_event_loop()
+    clients = loop.run_until_complete(run_clients(port, args.clients, args.messages))
+    wait_for_messages(gateway)
+    elapsed = perf_counter() - started
+
+    for client in clients:
+        client.close()
+    loop.run_until_complete(asyncio.sleep(.1))
+    loop.close()
+    connector.close()
+    connector.join(5)
+
+    print("Clients:        %i (%s)" % (args.clients, 'UDP' if args.udp else 'TCP'))
+    print("Messages:       %i sent, %i stored" % (expected_messages, gateway.messages))
+    print("Throughput:     %.0f messages/s" % (gateway.messages / elapsed))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,104 @@
+#     Copyright 2026. ThingsBoard
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+"""
+Throughput benchmark for compressed payload blocks in the SQLite storage: writes the same events with one record per
+event and with compressed blocks, then reads and deletes them back and reports write/read rates and file size.
+
+    python -m tests.benchmarks.bench_sqlite_compressed_blocks [--events 50000] [--block-size 1000]
+
+zstd is measured only if the optional zstandard package is installed.
+"""
+
+from argparse import ArgumentParser
+from logging import getLogger
+from os import path
+from shutil import rmtree
+from tempfile import mkdtemp
+from threading import Event
+from time import perf_counter, sleep
+
+from thingsboard_gateway.storage.sqlite import events_block_codec
+from thingsboard_gateway.storage.sqlite.sqlite_event_storage import SQLiteEventStorage
+from thingsboard_gateway.storage.sqlite.storage_settings import StorageSettings
+
+LOG = getLogger("BENCHMARK")
+LOG.trace = LOG.debug
+
+
+def make_event(index):
+    return ('{"deviceName":"Device %i","deviceType":"default","attributes":{},'
+            '"telemetry":[{"ts":%i,"values":{"temperature":%.1f,"humidity":%i,"status":"OK"}}]}') % (
+        index % 100, 1700000000000 + index, 20 + index % 50 / 10, 40 + index % 20)
+
+
+def run(mode, codec, events, block_size):
+    directory = mkdtemp(prefix="tb_storage_blocks_")
+    stop_event = Event()
+    settings = StorageSettings({
+        "data_file_path": directory + "/",
+        "max_read_records_count": block_size,
+        "writing_batch_size": block_size,
+        "compression_enabled": codec is not None,
+        "compression_codec": codec or "zlib",
+        "compression_block_size": block_size,
+    }, enable_validation=False)
+    storage = SQLiteEventStorage(settings, LOG, stop_event)
+    try:
+        started = perf_counter()
+        for index in range(events):
+            storage.put(make_event(index))
+        while storage.len() < events:
+            sleep(0.01)
+        write_time = perf_counter() - started
+        # not checkpointed records are kept in the write-ahead log
+        file_size = sum(path.getsize(path.join(directory, file_name))
+                        for file_name in ("data.db", "data.db-wal") if path.exists(path.join(directory, file_name)))
+
+        started = perf_counter()
+        read_count = 0
+        while read_count < events:
+            event_pack = storage.get_event_pack()
+            if not event_pack:
+                sleep(0.01)
+                continue
+            read_count += len(event_pack)
+            storage.event_pack_processing_done()
+        read_time = perf_counter() - started
+
+        print("%-5s  %12.0f  %11.0f  %7.2f" % (mode, events / write_time, events / read_time, file_size / 1000000))
+    finally:
+        stop_event.set()
+        storage.stop()
+        sleep(1)
+        rmtree(directory, ignore_errors=True)
+
+
+def main():
+    parser = ArgumentParser()
+    parser.add_argument('--events', type=int, default=50000)
+    parser.add_argument('--block-size', type=int, default=1000)
+    args = parser.parse_args()
+
+    modes = [("rows", None), ("zlib", events_block_codec.ZLIB_CODEC)]
+    if events_block_codec.zstandard is not None:
+        modes.append(("zstd", events_block_codec.ZSTD_CODEC))
+
+    print("mode   write ev/s    read ev/s  file MB")
+    for mode, codec in modes:
+        run(mode, codec, args.events, args.block_size)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,114 @@
+#     Copyright 2026. ThingsBoard
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+"""
+Soak benchmark for the SQLite storage: simulates a day of write/read/delete churn in hourly steps and reports
+read latency, file size and free pages for every simulated hour.
+
+    python -m tests.benchmarks.bench_sqlite_storage_churn [--hours 24] [--events-per-hour 5000] [--vacuum-pages 256]
+
+During the first third of the day the platform is unavailable and the backlog grows, then packs are read and
+deleted faster than new events arrive. With --vacuum-pages 0 free pages are not returned to the file system.
+"""
+
+from argparse import ArgumentParser
+from logging import getLogger
+from os import path
+from random import randint
+from shutil import rmtree
+from statistics import median
+from tempfile import mkdtemp
+from threading import Event
+from time import perf_counter, sleep
+
+from thingsboard_gateway.storage.sqlite.sqlite_event_storage import SQLiteEventStorage
+from thingsboard_gateway.storage.sqlite.storage_settings import StorageSettings
+
+LOG = getLogger("BENCHMARK")
+LOG.trace = LOG.debug
+
+
+def make_event(index):
+    return '{"deviceName":"Device %i","deviceType":"default","telemetry":[{"ts":%i,"values":{"value":"%s"}}]}' % (
+        index % 100, index, "x" * randint(50, 2000))
+
+
+def wait_for_writes(storage):
+    while not storage.write_queue.empty():
+        sleep(0.01)
+    sleep(0.3)
+
+
+def percentile(values, fraction):
+    if not values:
+        return 0
+    values = sorted(values)
+    return values[min(int(len(values) * fraction), len(values) - 1)]
+
+
+def main():
+    parser = ArgumentParser()
+    parser.add_argument('--hours', type=int, default=24)
+    parser.add_argument('--events-per-hour', type=int, default=5000)
+    parser.add_argument('--read-records-count', type=int, default=100)
+    parser.add_argument('--vacuum-pages', type=int, default=256)
+    args = parser.parse_args()
+
+    directory = mkdtemp(prefix="tb_storage_churn_")
+    stop_event = Event()
+    settings = StorageSettings({
+        "data_file_path": directory + "/",
+        "max_read_records_count": args.read_records_count,
+        "incremental_vacuum_pages": args.vacuum_pages,
+    }, enable_validation=False)
+    storage = SQLiteEventStorage(settings, LOG, stop_event)
+    database_path = path.join(directory, "data.db")
+    outage_hours = args.hours // 3
+
+    print("hour  written  read  stored  read p50 ms  read p99 ms  file MB")
+    event_index = 0
+    try:
+        for hour in range(args.hours):
+            for _ in range(args.events_per_hour):
+                storage.put(make_event(event_index))
+                event_index += 1
+            wait_for_writes(storage)
+
+            read_latencies = []
+            events_to_read = 0 if hour < outage_hours else args.events_per_hour * 3 // 2
+            read_count = 0
+            while read_count < events_to_read:
+                started = perf_counter()
+                event_pack = storage.get_event_pack()
+                read_latencies.append((perf_counter() - started) * 1000)
+                if not event_pack:
+                    break
+                read_count += len(event_pack)
+                storage.event_pack_processing_done()
+            # idle time of the database thread, free pages are reclaimed there
+            sleep(1)
+
+            print("%4i  %7i  %4i  %6i  %11.2f  %11.2f  %7.2f" % (
+                hour, args.events_per_hour, read_count, storage.len(),
+                median(read_latencies) if read_latencies else 0, percentile(read_latencies, 0.99),
+                path.getsize(database_path) / 1000000))
+    finally:
+        stop_event.set()
+        storage.stop()
+        sleep(1)
+        rmtree(directory, ignore_errors=True)
+
+
+if __name__ == '__main__':
+    main()
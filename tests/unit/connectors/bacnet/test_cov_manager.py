@@ -0,0 +1,131 @@
+#     Copyright 2026. ThingsBoard
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+import logging
+from asyncio import Queue
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import AsyncMock, MagicMock
+
+from bacpypes3.apdu import UnconfirmedCOVNotificationRequest
+from bacpypes3.basetypes import PropertyValue
+from bacpypes3.constructeddata import Any
+from bacpypes3.pdu import Address
+from bacpypes3.primitivedata import ObjectIdentifier, Real
+
+from tests.unit.connectors.bacnet.bacnet_base_test import BacnetBaseTestCase
+from thingsboard_gateway.connectors.bacnet.application import Application
+from thingsboard_gateway.connectors.bacnet.cov_manager import COVManager
+from thingsboard_gateway.connectors.bacnet.device import Device
+
+DEVICE_ADDRESS = '192.168.1.136:47809'
+
+
+class BACnetCOVManagerTests(IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.log = logging.getLogger('Bacnet COV test')
+        self.log.trace = self.log.debug
+
+        self.application = Application.__new__(Application)
+        self.application._Application__log = self.log
+        self.application.subscribe_cov = AsyncMock(return_value=True)
+
+        self.data_to_convert_queue = Queue()
+        self.cov_manager = COVManager(self.application, self.data_to_convert_queue, self.log)
+        self.device = Device(connector_type='bacnet',
+                             config={
+                                 'host': '192.168.1.136',
+                                 'port': 47809,
+                                 'deviceInfo': {
+                                     'deviceNameExpression': 'test device',
+                                     'deviceProfileExpression': 'default',
+                                     'deviceNameExpressionSource': 'constant',
+                                     'deviceProfileExpressionSource': 'constant'
+                                 },
+                                 'timeseries': [
+                                     {'key': 'temperature', 'objectType': 'analogInput', 'objectId': 1,
+                                      'propertyId': 'presentValue', 'cov': True},
+                                     {'key': 'status', 'objectType': 'analogInput', 'objectId': 1,
+                                      'propertyId': 'statusFlags', 'cov': {'enabled': True, 'lifetime': 60}},
+                                     {'key': 'units', 'objectType': 'analogInput', 'objectId': 1,
+                                      'propertyId': 'units', 'cov': {'confirmed': True}},
+                                     {'key': 'humidity', 'objectType': 'analogInput', 'objectId': 2,
+                                      'propertyId': 'presentValue'}
+                                 ]
+                             },
+                             i_am_request=BacnetBaseTestCase.create_fake_apdu_i_am_request(addr=DEVICE_ADDRESS),
+                             reading_queue=Queue(),
+                             rescan_queue=Queue(),
+                             logger=self.log,
+                             converter_logger=MagicMock())
+
+    @staticmethod
+    def polled_keys(device):
+        return [item['key'] for item in device.objects_to_poll]
+
+    async def test_subscribed_objects_are_excluded_from_polling(self):
+        await self.cov_manager.subscribe_device(self.device)
+
+        calls = {(call.args[1], call.kwargs['property_id']): call for call in
+                 self.application.subscribe_cov.call_args_list}
+        object_id = ObjectIdentifier('analogInput:1')
+        self.assertEqual(len(calls), 2)
+        # presentValue and statusFlags are covered by single SubscribeCOV
+        self.assertEqual(calls[(object_id, None)].args[3], 300)
+        self.assertFalse(calls[(object_id, None)].args[4])
+        self.assertTrue(calls[(object_id, 'units')].args[4])
+        self.assertEqual(self.polled_keys(self.device), ['humidity'])
+
+    async def test_rejected_subscription_falls_back_to_polling(self):
+        self.application.subscribe_cov = AsyncMock(side_effect=lambda *args, **kwargs: kwargs['property_id'] is None)
+
+        await self.cov_manager.subscribe_device(self.device)
+
+        self.assertEqual(self.polled_keys(self.device), ['units', 'humidity'])
+        self.assertEqual(len(self.cov_manager.subscriptions), 1)
+
+    async def test_failed_renewal_falls_back_to_polling(self):
+        await self.cov_manager.subscribe_device(self.device)
+        self.application.subscribe_cov = AsyncMock(return_value=False)
+        for subscription in self.cov_manager.subscriptions:
+            subscription.renew_at = 0
+
+        await self.cov_manager.renew_subscriptions()
+
+        self.assertEqual(len(self.cov_manager.subscriptions), 0)
+        self.assertEqual(len(self.polled_keys(self.device)), 4)
+
+    async def test_notification_is_routed_to_conversion_queue(self):
+        await self.cov_manager.subscribe_device(self.device)
+        subscription = next(filter(lambda sub: sub.property_id is None, self.cov_manager.subscriptions))
+
+        apdu = UnconfirmedCOVNotificationRequest(
+            subscriberProcessIdentifier=subscription.process_id,
+            initiatingDeviceIdentifier=('device', 1234),
+            monitoredObjectIdentifier=ObjectIdentifier('analogInput:1'),
+            timeRemaining=200,
+            listOfValues=[PropertyValue(propertyIdentifier='presentValue', value=Any(Real(21.5)))]
+        )
+        apdu.pduSource = Address(DEVICE_ADDRESS)
+
+        self.assertTrue(self.cov_manager.handle_notification(apdu))
+
+        device, config, values = self.data_to_convert_queue.get_nowait()
+        self.assertIs(device, self.device)
+        self.assertEqual([item['key'] for item in config], ['temperature', 'status'])
+        converted_data = device.uplink_converter.convert(config, values)
+        self.assertEqual({datapoint_key.key: value for datapoint_key, value in converted_data.telemetry[0].values.items()},
+                         {'temperature': 21.5})
+
+        apdu.subscriberProcessIdentifier = subscription.process_id + 100
+        self.assertFalse(self.cov_manager.handle_notification(apdu))
@@ -0,0 +1,121 @@
+#     Copyright 2026. ThingsBoard
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+import logging
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import AsyncMock
+
+from bacpypes3.apdu import AbortPDU, ReadPropertyMultipleACK
+
+from tests.unit.connectors.bacnet.bacnet_base_test import BacnetBaseTestCase
+from thingsboard_gateway.connectors.bacnet.application import Application, ObjectIterator
+from thingsboard_gateway.connectors.bacnet.entities.bacnet_device_details import BACnetDeviceDetails
+
+
+class FakeDevice:
+    def __init__(self, max_apdu, segmentation):
+        self.details = BACnetDeviceDetails(BacnetBaseTestCase.create_fake_apdu_i_am_request(max_apdu=max_apdu,
+                                                                                           segmentation=segmentation))
+
+
+class BACnetReadPropertyMultiplePackingTests(IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.application = Application.__new__(Application)
+        self.application._Application__log = logging.getLogger('Bacnet RPM test')
+        self.objects = [{'objectType': 'analogInput', 'objectId': i, 'propertyId': 'presentValue'}
+                        for i in range(100)]
+
+    def fake_request(self, max_objects):
+        async def request(apdu):
+            specs = apdu.listOfReadAccessSpecs
+            if len(specs) > max_objects:
+                raise AbortPDU(reason='segmentationNotSupported')
+            return ReadPropertyMultipleACK()
+
+        self.application.request = AsyncMock(side_effect=request)
+        self.application.decode_tag_list = lambda result, _: [None]
+
+    @staticmethod
+    def get_batch_sizes(iterator):
+        sizes = []
+        while iterator.index < len(iterator.items):
+            end_index = iterator.get_batch_end_index()
+            sizes.append(end_index - iterator.index)
+            iterator.index = end_index
+        return sizes
+
+    def test_batch_size_depends_on_device_apdu_and_segmentation(self):
+        small_device = FakeDevice(max_apdu=206, segmentation='noSegmentation')
+        large_device = FakeDevice(max_apdu=1476, segmentation='noSegmentation')
+        segmented_device = FakeDevice(max_apdu=1476, segmentation='segmentedBoth')
+
+        small_batches = self.get_batch_sizes(ObjectIterator(self.application, small_device, self.objects, None))
+        large_batches = self.get_batch_sizes(ObjectIterator(self.application, large_device, self.objects, None))
+        segmented_batches = self.get_batch_sizes(ObjectIterator(self.application, segmented_device, self.objects,
+                                                                None))
+
+        self.assertEqual(sum(small_batches), 100)
+        self.assertEqual(sum(large_batches), 100)
+        self.assertGreater(len(small_batches), len(large_batches))
+        self.assertEqual(segmented_batches, [100])
+
+        for batch_size in small_batches:
+            _, response_size = ObjectIterator.estimate_encoded_size(self.objects[0])
+            self.assertLessEqual(batch_size * response_size, 206)
+
+    def test_large_property_reduces_batch_size(self):
+        device = FakeDevice(max_apdu=480, segmentation='noSegmentation')
+        objects_with_names = [{**item, 'propertyId': {'presentValue', 'objectName'}} for item in self.objects]
+
+        values_batches = self.get_batch_sizes(ObjectIterator(self.application, device, self.objects, None))
+        names_batches = self.get_batch_sizes(ObjectIterator(self.application, device, objects_with_names, None))
+
+        self.assertGreater(len(names_batches), len(values_batches))
+
+    async def test_request_is_split_on_abort_and_limit_is_cached(self):
+        device = FakeDevice(max_apdu=1476, segmentation='segmentedBoth')
+        self.fake_request(max_objects=30)
+
+        iterator = ObjectIterator(self.application, device, self.objects, self.application.read_multiple_objects)
+        results, config, finished = await iterator.get_next()
+
+        self.assertTrue(finished)
+        self.assertEqual(len(config), 100)
+        # 100 objects were split to 4 requests of 25 objects
+        self.assertEqual(len(results), 4)
+        self.assertEqual(device.details.rpm_batch_limit, 25)
+
+        self.application.request.reset_mock()
+        iterator = ObjectIterator(self.application, device, self.objects, self.application.read_multiple_objects)
+        finished = False
+        while not finished:
+            _, _, finished = await iterator.get_next()
+
+        self.assertEqual(self.application.request.call_count, 4)
+        for call in self.application.request.call_args_list:
+            self.assertEqual(len(call.args[0].listOfReadAccessSpecs), 25)
+
+    async def test_single_object_properties_are_split_on_abort(self):
+        device = FakeDevice(max_apdu=50, segmentation='noSegmentation')
+        self.application.request = AsyncMock(side_effect=[AbortPDU(reason='apduTooLong'),
+                                                          ReadPropertyMultipleACK(),
+                                                          ReadPropertyMultipleACK()])
+        self.application.decode_tag_list = lambda result, _: [None]
+
+        results = await self.application.read_multiple_objects(
+            device, [{'objectType': 'analogInput', 'objectId': 1, 'propertyId': {'presentValue', 'objectName'}}])
+
+        self.assertEqual(len(results), 2)
+        self.assertEqual(self.application.request.call_count, 3)
+        self.assertIsNone(device.details.rpm_batch_limit)
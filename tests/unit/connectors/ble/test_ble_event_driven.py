@@ -0,0 +1,232 @@
+#     Copyright 2026. ThingsBoard
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+import asyncio
+import logging
+import sys
+from types import ModuleType, SimpleNamespace
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import MagicMock, patch
+
+try:
+    import bleak  # noqa: F401
+except ImportError:
+    # bleak backend is replaced by fake clients below, module is needed only to import the connector package
+    bleak = ModuleType('bleak')
+    bleak.BleakClient = MagicMock
+    bleak.BleakScanner = MagicMock
+    sys.modules['bleak'] = bleak
+
+from thingsboard_gateway.connectors.ble.connection_pool import ConnectionPool
+from thingsboard_gateway.connectors.ble.device import Device
+from thingsboard_gateway.connectors.ble.read_scheduler import ReadScheduler
+
+NOTIFY_CHAR_UUID = '226CAA55-6476-4566-7562-66734470666D'
+READ_CHAR_UUID = '00002A00-0000-1000-8000-00805F9B34FB'
+
+
+class FakeBleakClient:
+    def __init__(self, address, disconnected_callback=None, properties=None, connect_failures=0):
+        self.address = address
+        self.disconnected_callback = disconnected_callback
+        self.is_connected = False
+        self.connect_calls = 0
+        self.connect_failures = connect_failures
+        self.notify_callbacks = {}
+        self.read_calls = 0
+        characteristics = {uuid: SimpleNamespace(uuid=uuid, properties=props)
+                           for uuid, props in (properties or {}).items()}
+        self.services = SimpleNamespace(get_characteristic=characteristics.get)
+
+    async def connect(self, timeout=10):
+        self.connect_calls += 1
+        if self.connect_calls <= self.connect_failures:
+            raise TimeoutError('Device not found')
+        self.is_connected = True
+
+    async def disconnect(self):
+        self.is_connected = False
+        self.notify_callbacks.clear()
+        if self.disconnected_callback is not None:
+            self.disconnected_callback(self)
+
+    async def start_notify(self, char, callback):
+        self.notify_callbacks[char.uuid] = callback
+
+    async def read_gatt_char(self, char):
+        self.read_calls += 1
+        return bytearray(b'\x01\x02')
+
+
+class ReadSchedulerTests(IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.scheduler = ReadScheduler(MagicMock())
+        self.scheduler_task = asyncio.create_task(self.scheduler.run())
+
+    async def asyncTearDown(self):
+        self.scheduler.stop()
+        await asyncio.wait_for(self.scheduler_task, 1)
+
+    async def test_rpc_read_is_executed_before_due_polls(self):
+        executed = []
+
+        async def job(name):
+            executed.append(name)
+            await asyncio.sleep(0.01)
+            return name
+
+        # worker is busy with the first poll while the rest of reads are queued
+        for index in range(3):
+            self.scheduler.schedule_periodic(index, lambda index=index: job('poll %s' % index), period=10)
+        await asyncio.sleep(0)
+        result = await self.scheduler.submit(lambda: job('rpc'))
+
+        self.assertEqual(result, 'rpc')
+        self.assertEqual(executed[:2], ['poll 0', 'rpc'])
+
+    async def test_periodic_read_is_repeated_until_cancelled(self):
+        owner = object()
+        reads = []
+
+        async def job():
+            reads.append(1)
+
+        self.scheduler.schedule_periodic(owner, job, period=0.02)
+        await asyncio.sleep(0.15)
+        self.scheduler.cancel(owner)
+        reads_count = len(reads)
+        await asyncio.sleep(0.1)
+
+        self.assertGreaterEqual(reads_count, 3)
+        self.assertEqual(len(reads), reads_count)
+        self.assertEqual(len(self.scheduler), 0)
+
+    async def test_submit_raises_job_exception(self):
+        async def job():
+            raise RuntimeError('Read failed')
+
+        with self.assertRaises(RuntimeError):
+            await self.scheduler.submit(job)
+
+
+class FakeDevice:
+    def __init__(self, name, connect_failures=0):
+        self.name = name
+        self.mac_address = name
+        self.timeout = 1
+        self.stopped = False
+        self.client = FakeBleakClient(name, connect_failures=connect_failures)
+
+
+class ConnectionPoolTests(IsolatedAsyncioTestCase):
+
+    async def test_connections_are_limited(self):
+        pool = ConnectionPool(MagicMock(), max_connections=2)
+        devices = [FakeDevice('device %s' % index) for index in range(3)]
+
+        tasks = [asyncio.create_task(pool.connect(device)) for device in devices]
+        await asyncio.sleep(0.05)
+
+        self.assertEqual(len(pool.connected_devices), 2)
+        self.assertFalse(devices[2].client.is_connected)
+
+        pool.release(devices[0])
+        self.assertTrue(await asyncio.wait_for(tasks[2], 1))
+        self.assertEqual(pool.connected_devices, frozenset(devices[1:]))
+        await asyncio.gather(*tasks)
+
+    async def test_reconnect_delay_grows_exponentially(self):
+        pool = ConnectionPool(MagicMock(), max_reconnect_delay=30)
+        device = FakeDevice('device', connect_failures=3)
+        delays = []
+
+        async def fake_sleep(delay):
+            delays.append(delay)
+
+        with patch('thingsboard_gateway.connectors.ble.connection_pool.asyncio.sleep', fake_sleep):
+            self.assertTrue(await pool.connect(device))
+
+        self.assertEqual(device.client.connect_calls, 4)
+        for attempt, delay in enumerate(delays):
+            self.assertGreaterEqual(delay, 2 ** attempt / 2)
+            self.assertLessEqual(delay, 2 ** attempt)
+        self.assertLessEqual(pool.get_reconnect_delay(20), 30)
+
+
+class EventDrivenDeviceTests(IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.logger = logging.getLogger('ble_test')
+        self.logger.trace = self.logger.debug
+        self.received = []
+        self.clients = []
+
+        def create_client(address, disconnected_callback=None):
+            client = FakeBleakClient(address, disconnected_callback,
+                                     properties={NOTIFY_CHAR_UUID: ['read', 'notify'], READ_CHAR_UUID: ['read']})
+            self.clients.append(client)
+            return client
+
+        with patch('thingsboard_gateway.connectors.ble.device.BleakClient', side_effect=create_client):
+            self.device = Device({
+                'name': 'Temperature and humidity sensor',
+                'MACAddress': '4C:65:A8:DF:85:C0',
+                'pollPeriod': 20,
+                'connector_type': 'ble',
+                'callback': self.received.append,
+                'telemetry': [
+                    {'key': 'temperature', 'method': 'read', 'characteristicUUID': NOTIFY_CHAR_UUID,
+                     'valueExpression': '[0]'},
+                    {'key': 'humidity', 'method': 'notify', 'characteristicUUID': NOTIFY_CHAR_UUID,
+                     'valueExpression': '[1]'}
+                ],
+                'attributes': [
+                    {'key': 'name', 'method': 'read', 'characteristicUUID': READ_CHAR_UUID, 'valueExpression': '[:]'}
+                ]
+            }, self.logger)
+        self.client = self.clients[0]
+
+        self.pool = ConnectionPool(self.logger, max_connections=1)
+        self.scheduler = ReadScheduler(self.logger)
+        self.tasks = [asyncio.create_task(self.scheduler.run()),
+                      asyncio.create_task(self.device.run_event_driven(self.pool, self.scheduler, dict))]
+        await asyncio.sleep(0.05)
+
+    async def asyncTearDown(self):
+        self.device.stop()
+        self.scheduler.stop()
+        for task in self.tasks:
+            task.cancel()
+        await asyncio.gather(*self.tasks, return_exceptions=True)
+
+    async def test_notifiable_characteristic_is_subscribed_instead_of_polled(self):
+        self.assertEqual(list(self.client.notify_callbacks), [NOTIFY_CHAR_UUID])
+        self.assertGreater(self.client.read_calls, 0)
+        self.assertTrue(all(not data['data']['telemetry'] for data in self.received))
+
+        self.received.clear()
+        self.client.notify_callbacks[NOTIFY_CHAR_UUID](None, bytearray(b'\x15\x30'))
+
+        notification = next(data for data in self.received if data['data']['telemetry'])
+        self.assertEqual([item['key'] for item in notification['data']['telemetry']], ['temperature', 'humidity'])
+        self.assertEqual(notification['data']['telemetry'][0]['data'], bytearray(b'\x15\x30'))
+
+    async def test_reconnects_and_resubscribes_after_disconnect(self):
+        await self.client.disconnect()
+        self.assertEqual(self.client.notify_callbacks, {})
+
+        await asyncio.sleep(0.05)
+
+        self.assertEqual(self.client.connect_calls, 2)
+        self.assertEqual(self.pool.connected_devices, frozenset([self.device]))
+        self.assertEqual(list(self.client.notify_callbacks), [NOTIFY_CHAR_UUID])
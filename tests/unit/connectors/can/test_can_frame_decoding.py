@@ -0,0 +1,150 @@
+#     Copyright 2026. ThingsBoard
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+import logging
+import struct
+import unittest
+from unittest.mock import MagicMock, patch
+
+from can import Message
+
+from tests.unit.BaseUnitTest import BaseUnitTest
+from thingsboard_gateway.connectors.can.bytes_can_uplink_converter import BytesCanUplinkConverter
+from thingsboard_gateway.connectors.can.can_connector import CanConnector
+from thingsboard_gateway.connectors.can.can_frame_decoder import CanFrameDecoder, compile_int_decoder
+
+
+class CanFrameDecodingTests(BaseUnitTest):
+    PARSING_CONFIG = {
+        'deviceName': 'Car',
+        'deviceType': 'default',
+        'configs': [
+            {"key": "door", "is_ts": False, "type": "bool", "start": 0, "strictEval": True},
+            {"key": "rpm", "is_ts": True, "type": "int", "start": 1, "length": 2, "byteorder": "big",
+             "signed": False, "expression": "value / 4", "strictEval": True},
+            {"key": "temp", "is_ts": True, "type": "int", "start": 3, "length": 3, "byteorder": "little",
+             "signed": True, "strictEval": False},
+            {"key": "load", "is_ts": True, "type": "float", "start": 6, "length": 4, "byteorder": "little",
+             "strictEval": True},
+            {"key": "tag", "is_ts": False, "type": "string", "start": 10, "length": 2, "encoding": "ascii",
+             "strictEval": True},
+            {"key": "tail", "is_ts": True, "type": "raw", "start": 12, "strictEval": True}
+        ]
+    }
+
+    CAN_DATA = bytearray(b'\x01\x0b\xb8\xfe\xff\xff' + struct.pack('<f', 0.75) + b'ok\xaa\xbb')
+
+    def test_int_decoder(self):
+        data = bytearray(b'\x00\xff\xfe\x01\x02\x03')
+        for start, length, byteorder, signed in ((1, 2, 'big', False), (1, 2, 'little', True), (3, 3, 'big', False),
+                                                 (0, 4, 'little', True), (2, -1, 'big', False), (5, 1, 'big', True)):
+            end = start + length if length != -1 else None
+            self.assertEqual(int.from_bytes(data[start:end], byteorder, signed=signed),
+                             compile_int_decoder(start, length, byteorder, signed)(data))
+
+    def test_decoder_produces_same_values_as_converter(self):
+        expected = BytesCanUplinkConverter(self.log).convert(self.PARSING_CONFIG, self.CAN_DATA)
+
+        attributes, telemetry = {}, {}
+        count = CanFrameDecoder(self.PARSING_CONFIG, self.log).decode(self.CAN_DATA, attributes, telemetry)
+
+        self.assertEqual(6, count)
+        self.assertEqual(expected.attributes.to_dict(), {key.key: value for key, value in attributes.items()})
+        # converter creates an entry per key, so they can get different ts
+        expected_telemetry = {}
+        for telemetry_entry in expected.telemetry:
+            expected_telemetry.update(telemetry_entry.to_dict()['values'])
+        self.assertEqual(expected_telemetry, {key.key: value for key, value in telemetry.items()})
+
+    def process_batch(self, **connector_config):
+        logger = logging.getLogger('can_test')
+        logger.trace = logger.debug
+        logger.stop = MagicMock()
+        gateway = MagicMock()
+        config = {
+            "name": "CAN",
+            "devices": [{
+                "name": "Car",
+                "timeseries": [
+                    {"key": "rpm", "nodeId": 1, "command": "0:1:big:1", "value": "1:2:big:int"},
+                    {"key": "speed", "nodeId": 1, "command": "0:1:big:2", "value": "1:1:int"}
+                ],
+                "attributes": [{"key": "vin", "nodeId": 2, "value": "0:3:string:ascii"}]
+            }],
+            **connector_config
+        }
+        with patch('thingsboard_gateway.connectors.can.can_connector.init_logger', return_value=logger):
+            connector = CanConnector(gateway, config, 'can')
+
+        connector.process_messages([
+            Message(timestamp=1700000000.0011, arbitration_id=1, data=[1, 0x0b, 0xb8]),
+            Message(timestamp=1700000000.0012, arbitration_id=1, data=[2, 60]),
+            Message(timestamp=1700000000.0015, arbitration_id=2, data=b'ABC'),
+            Message(timestamp=1700000000.0016, arbitration_id=3, data=[1, 2]),
+            Message(timestamp=1700000000.0017, arbitration_id=1, data=[3, 1, 2]),
+            Message(timestamp=1700000000.0018, arbitration_id=1, data=[1, 0x0b, 0xb9]),
+            Message(timestamp=1700000000.0025, arbitration_id=1, data=[1, 0x0b, 0xba])
+        ])
+
+        telemetry = []
+        attributes = {}
+        for call in gateway.send_to_storage.call_args_list:
+            data = call.args[2]
+            self.assertEqual('Car', data.device_name)
+            telemetry.extend(telemetry_entry.to_dict() for telemetry_entry in data.telemetry)
+            attributes.update(data.attributes.to_dict())
+        self.assertEqual({'vin': 'ABC'}, attributes)
+        return telemetry
+
+    def test_connector_keeps_every_frame_of_batch(self):
+        telemetry = self.process_batch(useBusTimestamp=True)
+
+        # rpm samples of the same millisecond are not merged into one entry
+        self.assertEqual([{'ts': 1700000000001, 'values': {'rpm': 3000, 'speed': 60}},
+                          {'ts': 1700000000001, 'values': {'rpm': 3001}},
+                          {'ts': 1700000000002, 'values': {'rpm': 3002}}], telemetry)
+
+    def test_frames_get_receive_time_by_default(self):
+        with patch('thingsboard_gateway.connectors.can.can_connector.time') as time_mock:
+            time_mock.time.return_value = 1800000000.5
+            telemetry = self.process_batch()
+
+        self.assertEqual([{'ts': 1800000000500, 'values': {'rpm': 3000, 'speed': 60}},
+                          {'ts': 1800000000500, 'values': {'rpm': 3001}},
+                          {'ts': 1800000000500, 'values': {'rpm': 3002}}], telemetry)
+
+    def test_dropped_frame_is_counted(self):
+        config = {
+            "name": "CAN",
+            "devices": [{
+                "name": "Car",
+                "timeseries": [{"key": "rpm", "nodeId": 1, "value": "0:2:big:int", "expression": "value / 0"}]
+            }]
+        }
+        logger = logging.getLogger('can_test')
+        logger.trace = logger.debug
+        logger.stop = MagicMock()
+        gateway = MagicMock()
+        with patch('thingsboard_gateway.connectors.can.can_connector.init_logger', return_value=logger):
+            connector = CanConnector(gateway, config, 'can')
+
+        with patch('thingsboard_gateway.connectors.can.can_frame_decoder.StatisticsService') as statistics:
+            connector.process_messages([Message(arbitration_id=1, data=[0x0b, 0xb8])])
+
+        statistics.count_connector_message.assert_called_once_with('can_test', 'convertersMsgDropped')
+        gateway.send_to_storage.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
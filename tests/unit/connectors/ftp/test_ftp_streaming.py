@@ -0,0 +1,197 @@
+#     Copyright 2026. ThingsBoard
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+import logging
+import tracemalloc
+import unittest
+from ftplib import FTP
+from os import path
+from tempfile import TemporaryDirectory
+from threading import Thread
+from unittest.mock import MagicMock, patch
+
+from tests.unit.BaseUnitTest import BaseUnitTest
+
+try:
+    from pyftpdlib.authorizers import DummyAuthorizer
+    from pyftpdlib.handlers import FTPHandler
+    from pyftpdlib.servers import FTPServer
+except ImportError:
+    FTPServer = None
+
+from thingsboard_gateway.connectors.ftp.ftp_connector import FTPConnector
+
+
+class CountingGateway:
+    def __init__(self):
+        self.messages = 0
+        self.telemetry = 0
+        self.values = []
+        self.keep_values = True
+
+    def send_to_storage(self, connector_name, connector_id, data):
+        self.messages += 1
+        self.telemetry += data.telemetry_datapoints_count
+        if self.keep_values:
+            for entry in data.telemetry:
+                self.values.extend(entry.values.values())
+
+    def __getattr__(self, item):
+        return MagicMock()
+
+
+@unittest.skipIf(FTPServer is None, "pyftpdlib is not installed")
+class FTPStreamingTests(BaseUnitTest):
+    HEADER = 'device,ts,temperature\n'
+
+    def setUp(self):
+        super().setUp()
+        self.directory = TemporaryDirectory()
+        self.file_path = path.join(self.directory.name, 'readings.csv')
+        with open(self.file_path, 'w') as file:
+            file.write(self.HEADER)
+
+        authorizer = DummyAuthorizer()
+        authorizer.add_anonymous(self.directory.name)
+        handler = type('Handler', (FTPHandler,), {'authorizer': authorizer})
+        logging.getLogger('pyftpdlib').setLevel(logging.WARNING)
+        self.server = FTPServer(('127.0.0.1', 0), handler)
+        Thread(target=self.server.serve_forever, kwargs={'handle_exit': False}, daemon=True).start()
+
+        self.ftp = FTP()
+        self.ftp.connect('127.0.0.1', self.server.address[1])
+        self.ftp.login()
+
+    def tearDown(self):
+        self.ftp.close()
+        self.server.close_all()
+        self.directory.cleanup()
+        super().tearDown()
+
+    def append_lines(self, start, count, with_newline=True):
+        with open(self.file_path, 'a') as file:
+            file.write('\n'.join('SN-%i,%i,%i' % (i % 10, 1700000000000 + i, i) for i in range(start, start + count)))
+            if with_newline:
+                file.write('\n')
+
+    def create_connector(self, read_mode, batch_size=1000, timeseries=None, max_file_size=100):
+        config = {
+            "name": "FTP",
+            "parameters": {"host": "127.0.0.1", "port": self.server.address[1], "security": {"type": "anonymous"}},
+            "paths": [{
+                "devicePatternName": "${device}",
+                "devicePatternType": "default",
+                "delimiter": ",",
+                "path": "readings.csv",
+                "readMode": read_mode,
+                "maxFileSize": max_file_size,
+                "pollPeriod": 0,
+                "txtFileDataView": "TABLE",
+                "batchSize": batch_size,
+                "attributes": [],
+                "timeseries": timeseries or [{"type": "integer", "key": "ts", "value": "${ts}"},
+                                             {"type": "integer", "key": "temperature", "value": "${temperature}"}]
+            }]
+        }
+        self.gateway = CountingGateway()
+        logger = logging.getLogger('ftp_test')
+        logger.trace = logger.debug
+        with patch('thingsboard_gateway.connectors.ftp.ftp_connector.init_logger', return_value=logger):
+            connector = FTPConnector(self.gateway, config, 'ftp')
+        connector.paths[0].find_files(self.ftp)
+        return connector
+
+    def poll(self, connector):
+        connector.paths[0].last_polled_time = 0
+        connector._FTPConnector__process_paths(self.ftp)
+
+    def test_partial_mode_reads_only_appended_lines(self):
+        connector = self.create_connector('PARTIAL', batch_size=100)
+        self.append_lines(0, 250)
+        self.poll(connector)
+        self.assertEqual(250, self.gateway.telemetry)
+        # 3 batches with 10 devices each
+        self.assertEqual(30, self.gateway.messages)
+
+        self.append_lines(250, 5, with_newline=False)
+        self.poll(connector)
+        # Last line is not completed yet
+        self.assertEqual(254, self.gateway.telemetry)
+
+        with open(self.file_path, 'a') as file:
+            file.write('\n')
+        self.poll(connector)
+        self.assertEqual(255, self.gateway.telemetry)
+        self.assertEqual(list(range(255)), sorted(int(value) for value in self.gateway.values))
+
+    def test_partial_mode_reads_finished_last_line_without_newline(self):
+        connector = self.create_connector('PARTIAL')
+        self.append_lines(0, 5, with_newline=False)
+        self.poll(connector)
+        self.assertEqual(4, self.gateway.telemetry)
+
+        # File is not changed since the previous poll, so the last line is finished
+        self.poll(connector)
+        self.assertEqual(5, self.gateway.telemetry)
+
+        self.poll(connector)
+        self.assertEqual(5, self.gateway.telemetry)
+        self.assertEqual(list(range(5)), sorted(int(value) for value in self.gateway.values))
+
+    def test_text_file_is_not_limited_by_max_file_size(self):
+        connector = self.create_connector('FULL', max_file_size=0)
+        self.append_lines(0, 10)
+
+        self.poll(connector)
+
+        self.assertEqual(10, self.gateway.telemetry)
+
+    def test_lines_without_ts_are_not_merged(self):
+        with open(self.file_path, 'w') as file:
+            file.write('device,temperature\n')
+            file.write(''.join('SN-%i,%i\n' % (i % 2, i) for i in range(20)))
+        connector = self.create_connector('FULL', timeseries=[{"type": "integer", "key": "temperature",
+                                                               "value": "${temperature}"}])
+
+        with patch('thingsboard_gateway.gateway.entities.telemetry_entry.time', return_value=1700000000.0):
+            self.poll(connector)
+
+        self.assertEqual(20, self.gateway.telemetry)
+        self.assertEqual(list(range(20)), sorted(int(value) for value in self.gateway.values))
+
+    def measure_poll_peak_memory(self, connector):
+        tracemalloc.start()
+        try:
+            self.poll(connector)
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    def test_full_mode_memory_does_not_depend_on_file_size(self):
+        connector = self.create_connector('FULL', batch_size=100)
+        self.gateway.keep_values = False
+
+        self.append_lines(0, 10000)
+        small_file_peak = self.measure_poll_peak_memory(connector)
+
+        self.append_lines(10000, 40000)
+        large_file_peak = self.measure_poll_peak_memory(connector)
+
+        self.assertEqual(60000, self.gateway.telemetry)
+        self.assertLess(large_file_peak, small_file_peak * 1.5)
+        self.assertLess(large_file_peak, path.getsize(self.file_path) / 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+#     Copyright 2026. ThingsBoard
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+from time import monotonic
+from unittest.mock import MagicMock, patch
+
+from tests.unit.BaseUnitTest import BaseUnitTest
+from thingsboard_gateway.connectors.knx.entities.group_value_cache import GroupValueCache
+
+GROUP_ADDRESS = 2054
+
+
+class GroupValueCacheTests(BaseUnitTest):
+    def setUp(self):
+        super().setUp()
+        self.decoder = MagicMock(side_effect=lambda payload, value_type: '%s:%s' % (value_type, payload))
+        self.cache = GroupValueCache(self.decoder, MagicMock())
+
+    def test_observed_payload_is_decoded_once_per_value_type(self):
+        self.cache.update(GROUP_ADDRESS, 21)
+
+        self.assertEqual(self.cache.get(GROUP_ADDRESS, 'temperature', 10), 'temperature:21')
+        self.assertEqual(self.cache.get(GROUP_ADDRESS, 'temperature', 10), 'temperature:21')
+        self.assertEqual(self.cache.get(GROUP_ADDRESS, None, 10), 'None:21')
+        self.assertEqual(self.decoder.call_count, 2)
+
+    def test_stale_value_is_not_returned(self):
+        self.cache.update(GROUP_ADDRESS, 21)
+
+        with patch('thingsboard_gateway.connectors.knx.entities.group_value_cache.monotonic',
+                   return_value=monotonic() + 5):
+            self.assertIsNone(self.cache.get(GROUP_ADDRESS, 'temperature', 1))
+            self.assertEqual(self.cache.get(GROUP_ADDRESS, 'temperature', 10), 'temperature:21')
+
+        self.assertIsNone(self.cache.get(GROUP_ADDRESS + 1, 'temperature', 10))
+
+    def test_read_value_keeps_payload_of_response_telegram(self):
+        read_started = monotonic()
+        self.cache.update(GROUP_ADDRESS, 21)
+        self.cache.set_value(GROUP_ADDRESS, 'temperature', 21.0, read_started)
+
+        self.assertEqual(self.cache.get(GROUP_ADDRESS, 'temperature', 10), 21.0)
+        self.assertEqual(self.cache.get(GROUP_ADDRESS, 'humidity', 10), 'humidity:21')
+        self.decoder.assert_called_once_with(21, 'humidity')
+
+    def test_read_value_replaces_older_payload(self):
+        self.cache.update(GROUP_ADDRESS, 21)
+        self.cache.set_value(GROUP_ADDRESS, 'temperature', 22.0, monotonic() + 1)
+
+        self.assertEqual(self.cache.get(GROUP_ADDRESS, 'temperature', 10), 22.0)
+        self.assertIsNone(self.cache.get(GROUP_ADDRESS, 'humidity', 10))
+
+    def test_decoding_error_returns_none(self):
+        self.decoder.side_effect = ValueError('Wrong payload')
+        self.cache.update(GROUP_ADDRESS, 21)
+
+        self.assertIsNone(self.cache.get(GROUP_ADDRESS, 'temperature', 10))
@@ -0,0 +1,103 @@
+#     Copyright 2026. ThingsBoard
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+import logging
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import MagicMock, patch
+
+from ocpp.v16.enums import Action
+
+from thingsboard_gateway.connectors.ocpp.charge_point import ChargePoint
+from thingsboard_gateway.connectors.ocpp.ocpp_connector import OcppConnector
+from thingsboard_gateway.connectors.ocpp.ocpp_uplink_converter import OcppUplinkConverter
+
+CHARGE_POINT_CONFIG = {
+    "idRegexpPattern": "CP_.*",
+    "uplink_converter_name": "OcppUplinkConverter",
+    "deviceNameExpression": "${Vendor} ${Model}",
+    "deviceTypeExpression": "default",
+    "attributes": [
+        {"messageTypeFilter": "MeterValues,", "key": "connectorId", "value": "${connector_id}"}
+    ],
+    "timeseries": [
+        {"messageTypeFilter": "MeterValues,", "key": "power", "value": "${meter_value[:].sampled_value[:].value}"},
+        {"messageTypeFilter": "DataTransfer,", "key": "temp", "value": "${data.temp}"}
+    ]
+}
+
+
+def meter_values(connector_id, value):
+    return {'connector_id': connector_id,
+            'meter_value': [{'timestamp': '2026-01-01T00:00:00Z', 'sampled_value': [{'value': value}]}]}
+
+
+class OcppMessagesProcessingTests(IsolatedAsyncioTestCase):
+    def setUp(self):
+        self.logger = logging.getLogger('OCPP test')
+        self.logger.trace = self.logger.debug
+        self.gateway = MagicMock()
+        with patch('thingsboard_gateway.connectors.ocpp.ocpp_connector.init_logger', return_value=self.logger):
+            self.connector = OcppConnector(self.gateway, {
+                'name': 'OCPP test',
+                'centralSystem': {'name': 'Central System', 'connection': {'type': 'insecure'}},
+                'chargePoints': [CHARGE_POINT_CONFIG]
+            }, 'ocpp')
+        self.converter = OcppUplinkConverter(CHARGE_POINT_CONFIG, self.logger)
+
+    @staticmethod
+    def message_config(message_type):
+        return {'deviceName': 'Vendor Model', 'deviceType': 'default', 'messageType': message_type, 'profile': {}}
+
+    def test_meter_values_batch_converted_to_single_data(self):
+        with patch('thingsboard_gateway.gateway.entities.telemetry_entry.time', side_effect=[1, 2]):
+            converted_data_list = self.converter.convert_batch(self.message_config(Action.MeterValues),
+                                                               [meter_values(1, '10'), meter_values(2, '20')])
+
+        self.assertEqual(len(converted_data_list), 1)
+        self.assertEqual(converted_data_list[0].telemetry_datapoints_count, 2)
+        self.assertEqual([entry.ts for entry in converted_data_list[0].telemetry], [1000, 2000])
+        self.assertEqual(converted_data_list[0].attributes.to_dict(), {'connectorId': '2'})
+
+    @patch('thingsboard_gateway.gateway.entities.telemetry_entry.time', return_value=1700000000)
+    def test_meter_values_batch_without_ts_keeps_every_value(self, _):
+        converted_data_list = self.converter.convert_batch(self.message_config(Action.MeterValues),
+                                                           [meter_values(1, str(value)) for value in range(50)])
+
+        values = [entry.to_dict()['values']['power'] for data in converted_data_list for entry in data.telemetry]
+        self.assertEqual(values, [str(value) for value in range(50)])
+
+    @patch('thingsboard_gateway.gateway.entities.telemetry_entry.time', side_effect=[1, 2, 3, 4])
+    def test_consecutive_messages_of_same_type_are_grouped(self, _):
+        self.connector._process_messages_batch(self.converter, [
+            (self.message_config(Action.MeterValues), meter_values(1, '10')),
+            (self.message_config(Action.MeterValues), meter_values(1, '11')),
+            (self.message_config(Action.DataTransfer), {'data': {'temp': 25}}),
+            (self.message_config(Action.MeterValues), meter_values(1, '12'))
+        ])
+
+        stored = [call.args[2] for call in self.gateway.send_to_storage.call_args_list]
+        self.assertEqual([data.telemetry_datapoints_count for data in stored], [2, 1, 1])
+        self.assertEqual(self.connector.statistics['MessagesReceived'], 4)
+        self.assertEqual(self.connector.statistics['MessagesSent'], 3)
+
+    async def test_charge_point_messages_are_returned_in_batches(self):
+        charge_point = ChargePoint('CP_1', MagicMock(), CHARGE_POINT_CONFIG, self.logger, queue_size=10)
+
+        for value in range(5):
+            await charge_point.on_meter_values(**meter_values(1, str(value)))
+        await charge_point.stop_messages_processing()
+
+        self.assertEqual(len(await charge_point.get_messages(3)), 3)
+        self.assertEqual(len(await charge_point.get_messages(3)), 2)
+        self.assertIsNone(await charge_point.get_messages(3))
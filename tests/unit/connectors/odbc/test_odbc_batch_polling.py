@@ -0,0 +1,96 @@
+#     Copyright 2026. ThingsBoard
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+import logging
+import unittest
+from unittest.mock import MagicMock, patch
+
+from tests.unit.BaseUnitTest import BaseUnitTest
+
+try:
+    import pyodbc
+except ImportError:
+    pyodbc = None
+
+if pyodbc is not None:
+    from thingsboard_gateway.connectors.odbc.odbc_connector import OdbcConnector
+
+
+@unittest.skipIf(pyodbc is None, "pyodbc or ODBC driver manager is not installed")
+class OdbcBatchPollingTests(BaseUnitTest):
+    CONFIG = {
+        "name": "ODBC",
+        "connection": {"str": ""},
+        "polling": {
+            "query": "SELECT id, entity_id, temp FROM readings WHERE id > ? ORDER BY id",
+            "batchSize": 100,
+            "iterator": {"column": "id", "persistent": False}
+        },
+        "mapping": {
+            "device": {"name": "'ODBC ' + entity_id", "type": "'sensor'"},
+            "attributes": [],
+            "timeseries": [{"name": "temp", "value": "temp"}]
+        }
+    }
+
+    def create_connector(self):
+        logger = logging.getLogger('odbc_test')
+        logger.trace = logger.debug
+        logger.stop = MagicMock()
+        self.gateway = MagicMock()
+        self.gateway.get_config_path.return_value = ''
+        with patch('thingsboard_gateway.connectors.odbc.odbc_connector.init_logger', return_value=logger):
+            connector = OdbcConnector(self.gateway, self.CONFIG, 'odbc')
+        cursor = MagicMock()
+        cursor.description = [('id',), ('entity_id',), ('temp',)]
+        connector._OdbcConnector__cursor = cursor
+        connector._OdbcConnector__iterator = {"name": "id", "value": 0, "total": 0}
+        return connector, cursor
+
+    def test_rows_without_ts_are_not_merged(self):
+        connector, cursor = self.create_connector()
+        rows = [(i + 1, 'A' if i % 2 else 'B', i) for i in range(10)]
+        cursor.fetchmany.side_effect = [rows, []]
+
+        with patch('thingsboard_gateway.gateway.entities.telemetry_entry.time', return_value=1700000000.0):
+            connector._OdbcConnector__poll_in_batches()
+
+        temperatures = {}
+        for call in self.gateway.send_to_storage.call_args_list:
+            data = call.args[2]
+            self.assertEqual('sensor', data.device_type)
+            for telemetry_entry in data.telemetry:
+                self.assertEqual(1700000000000, telemetry_entry.ts)
+                temperatures.setdefault(data.device_name, []).extend(telemetry_entry.to_dict()['values'].values())
+
+        self.assertEqual({'ODBC A': [1, 3, 5, 7, 9], 'ODBC B': [0, 2, 4, 6, 8]}, temperatures)
+        self.assertEqual(10, connector._OdbcConnector__iterator["value"])
+        self.assertEqual(10, connector._OdbcConnector__iterator["total"])
+
+    def test_query_without_iterator_column_is_skipped(self):
+        connector, cursor = self.create_connector()
+        cursor.description = [('entity_id',), ('temp',)]
+        cursor.fetchmany.side_effect = [[('A', 1)], []]
+
+        with self.assertLogs('odbc_test', level='ERROR') as logs:
+            connector._OdbcConnector__poll_in_batches()
+
+        self.assertIn("Iterator column 'id' is not found", logs.output[0])
+        cursor.fetchmany.assert_not_called()
+        self.gateway.send_to_storage.assert_not_called()
+        self.assertEqual(0, connector._OdbcConnector__iterator["value"])
+
+
+if __name__ == '__main__':
+    unittest.main()
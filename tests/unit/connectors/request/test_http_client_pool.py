@@ -0,0 +1,134 @@
+#     Copyright 2026. ThingsBoard
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+import logging
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Lock, Thread
+from time import sleep
+from unittest.mock import MagicMock, patch
+
+from tests.unit.BaseUnitTest import BaseUnitTest
+from thingsboard_gateway.connectors.request.http_client_pool import HttpClientPool
+from thingsboard_gateway.connectors.request.request_connector import RequestConnector
+from thingsboard_gateway.gateway.statistics.statistics_service import StatisticsService
+
+
+class CountingHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    lock = Lock()
+    connections = set()
+    active = 0
+    max_active = 0
+
+    delay = .05
+    requests_count = 0
+
+    def do_GET(self):
+        with CountingHandler.lock:
+            CountingHandler.connections.add(self.client_address)
+            CountingHandler.active += 1
+            CountingHandler.requests_count += 1
+            CountingHandler.max_active = max(CountingHandler.max_active, CountingHandler.active)
+        sleep(CountingHandler.delay)
+        with CountingHandler.lock:
+            CountingHandler.active -= 1
+        body = b'{"value": 1}'
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class HttpClientPoolTests(BaseUnitTest):
+    def setUp(self):
+        super().setUp()
+        CountingHandler.connections = set()
+        CountingHandler.active = 0
+        CountingHandler.max_active = 0
+        CountingHandler.requests_count = 0
+        CountingHandler.delay = .05
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), CountingHandler)
+        self.url = 'http://127.0.0.1:%i/data' % self.server.server_address[1]
+        Thread(target=self.server.serve_forever, daemon=True).start()
+        self.pool = HttpClientPool('test', max_workers=8, max_concurrent_requests_per_host=2)
+
+    def tearDown(self):
+        self.pool.close()
+        self.server.shutdown()
+        self.server.server_close()
+        super().tearDown()
+
+    def test_connections_are_reused_and_limited_per_host(self):
+        futures = [self.pool.submit(self.pool.request, 'GET', self.url, timeout=5) for _ in range(20)]
+        responses = [future.result(timeout=10) for future in futures]
+
+        self.assertTrue(all(response.json() == {'value': 1} for response in responses))
+        self.assertLessEqual(CountingHandler.max_active, 2)
+        self.assertLessEqual(len(CountingHandler.connections), 2)
+        self.assertEqual(20, CountingHandler.requests_count)
+
+    def test_requests_metrics_reported_to_connector_statistics(self):
+        StatisticsService.enable_statistics()
+        StatisticsService.clear_statistics()
+        try:
+            for _ in range(3):
+                self.pool.request('GET', self.url, timeout=5)
+
+            statistics = StatisticsService.CONNECTOR_STATISTICS_STORAGE['test']
+            self.assertEqual(3, statistics['requestsCompleted'])
+            self.assertEqual(0, statistics['requestsInFlight'])
+            self.assertGreaterEqual(statistics['requestsMaxLatencyMs'], 50)
+        finally:
+            StatisticsService.clear_statistics()
+            StatisticsService.disable_statistics()
+
+    def test_poll_skipped_while_previous_poll_in_progress(self):
+        CountingHandler.delay = .5
+        host, port = self.server.server_address
+        logger = logging.getLogger('request_test')
+        logger.trace = logger.debug
+        logger.stop = MagicMock()
+        with patch('thingsboard_gateway.connectors.request.request_connector.init_logger', return_value=logger):
+            connector = RequestConnector(MagicMock(), {
+                "name": "Request test",
+                "host": "http://%s:%i" % (host, port),
+                "mapping": [{
+                    "url": "data",
+                    "httpMethod": "GET",
+                    "timeout": 5,
+                    "scanPeriod": .05,
+                    "converter": {"type": "json", "deviceNameJsonExpression": "Device",
+                                  "deviceTypeJsonExpression": "default", "attributes": [],
+                                  "telemetry": [{"key": "value", "type": "int", "value": "${value}"}]}
+                }]
+            }, 'request')
+        connector.start()
+        try:
+            sleep(1.2)
+        finally:
+            connector.close()
+
+        # polls every 50 ms, but the next one is sent only after the previous response
+        self.assertEqual(1, CountingHandler.max_active)
+        self.assertLessEqual(CountingHandler.requests_count, 3)
+        self.assertGreaterEqual(CountingHandler.requests_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
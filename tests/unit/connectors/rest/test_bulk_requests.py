@@ -0,0 +1,136 @@
+#     Copyright 2026. ThingsBoard
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+import asyncio
+import gzip
+import unittest
+from unittest.mock import MagicMock, patch
+
+from aiohttp import web
+from aiohttp.test_utils import TestClient, TestServer
+from simplejson import dumps
+
+from tests.unit.BaseUnitTest import BaseUnitTest
+from thingsboard_gateway.connectors.rest.bulk_data_reader import BulkDataReader
+from thingsboard_gateway.connectors.rest.json_rest_uplink_converter import JsonRESTUplinkConverter
+from thingsboard_gateway.connectors.rest.rest_connector import AnonymousDataHandler
+
+
+class ChunkedStream:
+    def __init__(self, data: bytes, chunk_size: int):
+        self.__data = data
+        self.__chunk_size = chunk_size
+        self.__position = 0
+
+    async def read(self, _):
+        chunk = self.__data[self.__position:self.__position + self.__chunk_size]
+        self.__position += self.__chunk_size
+        return chunk
+
+
+class RESTBulkRequestsTests(BaseUnitTest):
+    ENDPOINT_CONFIG = {
+        "endpoint": "/bulk",
+        "HTTPMethods": ["POST"],
+        "bulk": {"enabled": True, "batchSize": 2},
+        "security": {"type": "anonymous"},
+        "converter": {
+            "type": "json",
+            "deviceInfo": {
+                "deviceNameExpressionSource": "request",
+                "deviceNameExpression": "${sensorName}",
+                "deviceProfileExpressionSource": "constant",
+                "deviceProfileExpression": "default"
+            },
+            "attributes": [],
+            "timeseries": [{"type": "double", "key": "temperature", "value": "${temp}"}]
+        }
+    }
+
+    READINGS = [{"sensorName": "SN-1" if i % 2 else "SN-2", "temp": 20 + i, "ts": 1700000000000 + i}
+                for i in range(6)]
+
+    def setUp(self):
+        super().setUp()
+        self.send_to_storage = MagicMock()
+
+    @staticmethod
+    def read_all(reader):
+        async def collect():
+            return [item async for item in reader]
+        return asyncio.run(collect())
+
+    def post(self, body, headers=None):
+        handler = AnonymousDataHandler(self.send_to_storage, 'REST', 'id',
+                                       {"config": self.ENDPOINT_CONFIG, "converter": JsonRESTUplinkConverter},
+                                       self.log, self.log)
+
+        async def send():
+            app = web.Application()
+            app.router.add_route('POST', '/bulk', handler)
+            async with TestClient(TestServer(app)) as client:
+                response = await client.post('/bulk', data=body, headers=headers or {})
+                return response.status
+
+        return asyncio.run(send())
+
+    def test_reader_parses_json_array_split_into_small_chunks(self):
+        data = dumps(self.READINGS).encode('utf-8')
+        result = self.read_all(BulkDataReader(ChunkedStream(data, 7)))
+        self.assertEqual(self.READINGS, result)
+
+    def test_reader_parses_ndjson_stream(self):
+        data = '\n'.join(dumps(reading) for reading in self.READINGS).encode('utf-8')
+        result = self.read_all(BulkDataReader(ChunkedStream(data, 5), content_type='application/x-ndjson'))
+        self.assertEqual(self.READINGS, result)
+
+    def test_reader_keeps_multibyte_characters_split_between_chunks(self):
+        data = dumps([{"name": "тест"}], ensure_ascii=False).encode('utf-8')
+        result = self.read_all(BulkDataReader(ChunkedStream(data, 1)))
+        self.assertEqual([{"name": "тест"}], result)
+
+    def test_bulk_request_groups_data_per_device_and_batch(self):
+        status = self.post(dumps(self.READINGS), headers={'Content-Type': 'application/json'})
+        self.assertEqual(200, status)
+
+        # 6 readings with batch size 2 give 3 batches, each one has both devices
+        self.assertEqual(6, self.send_to_storage.call_count)
+        telemetry_count = sum(call.args[2].telemetry_datapoints_count for call in self.send_to_storage.call_args_list)
+        self.assertEqual(len(self.READINGS), telemetry_count)
+
+    def test_gzip_ndjson_bulk_request(self):
+        body = gzip.compress('\n'.join(dumps(reading) for reading in self.READINGS).encode('utf-8'))
+        status = self.post(body, headers={'Content-Type': 'application/x-ndjson', 'Content-Encoding': 'gzip'})
+        self.assertEqual(200, status)
+        telemetry_count = sum(call.args[2].telemetry_datapoints_count for call in self.send_to_storage.call_args_list)
+        self.assertEqual(len(self.READINGS), telemetry_count)
+
+    def test_bulk_request_keeps_readings_without_ts(self):
+        readings = [{"sensorName": "SN-1", "temp": 20 + i} for i in range(6)]
+        handler_config = dict(self.ENDPOINT_CONFIG, bulk={"enabled": True, "batchSize": 1000})
+        with patch.dict(self.ENDPOINT_CONFIG, handler_config):
+            status = self.post(dumps(readings), headers={'Content-Type': 'application/json'})
+        self.assertEqual(200, status)
+
+        values = [entry.to_dict()['values']['temperature']
+                  for call in self.send_to_storage.call_args_list for entry in call.args[2].telemetry]
+        self.assertEqual([str(20 + i) for i in range(6)], values)
+
+    def test_invalid_bulk_body(self):
+        status = self.post('[{"sensorName": "SN-1", "temp": ', headers={'Content-Type': 'application/json'})
+        self.assertEqual(400, status)
+
+
+if __name__ == '__main__':
+    unittest.main()
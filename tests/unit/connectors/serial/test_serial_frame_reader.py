@@ -0,0 +1,158 @@
+#     Copyright 2026. ThingsBoard
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+import logging
+import os
+from queue import Queue
+from threading import Event, Thread
+from time import monotonic
+from unittest.mock import MagicMock
+
+import serial
+
+from tests.unit.BaseUnitTest import BaseUnitTest
+from thingsboard_gateway.extensions.serial.custom_serial_connector import SerialDevice
+from thingsboard_gateway.extensions.serial.custom_serial_uplink_converter import SerialUplinkConverter
+from thingsboard_gateway.extensions.serial.serial_frame_reader import SerialFrameReader
+
+BAUDRATE_921600_BYTES_PER_SECOND = 921600 // 10
+
+
+class FakeSerial:
+    """Returns one chunk per read call, as if the whole chunk arrived while waiting for the first byte."""
+
+    in_waiting = 0
+
+    def __init__(self, chunks):
+        self.chunks = list(chunks)
+
+    def read(self, size=1):
+        return self.chunks.pop(0) if self.chunks else b''
+
+
+class SerialFrameReaderTests(BaseUnitTest):
+    def setUp(self):
+        super().setUp()
+        self.logger = MagicMock()
+
+    def test_delimiter_frames_with_partial_tail(self):
+        reader = SerialFrameReader({'delimiter': '\r\n'}, self.logger)
+        serial_conn = FakeSerial([b'1.5\r\n2.5\r', b'\n3.', b'5\r\n'])
+
+        self.assertEqual(reader.read_frames(serial_conn), [b'1.5\r\n'])
+        self.assertEqual(reader.pending_bytes, 4)
+        self.assertEqual(reader.read_frames(serial_conn), [b'2.5\r\n'])
+        self.assertEqual(reader.read_frames(serial_conn), [b'3.5\r\n'])
+        self.assertEqual(reader.pending_bytes, 0)
+
+    def test_fixed_length_frames(self):
+        reader = SerialFrameReader({'framing': {'type': 'fixedLength', 'length': 4}}, self.logger)
+        serial_conn = FakeSerial([b'AAAABBBBCC', b'CCDD'])
+
+        self.assertEqual(reader.read_frames(serial_conn), [b'AAAA', b'BBBB'])
+        self.assertEqual(reader.read_frames(serial_conn), [b'CCCC'])
+        self.assertEqual(reader.pending_bytes, 2)
+
+    def test_regex_frames(self):
+        reader = SerialFrameReader({'framing': {'type': 'regex', 'regex': r'<[^>]*>'}}, self.logger)
+        serial_conn = FakeSerial([b'<t=1><t=2><t'])
+
+        self.assertEqual(reader.read_frames(serial_conn), [b'<t=1>', b'<t=2>'])
+        self.assertEqual(reader.pending_bytes, 2)
+
+    def test_buffer_dropped_when_frame_too_big(self):
+        reader = SerialFrameReader({'maxFrameSize': 8}, self.logger)
+        serial_conn = FakeSerial([b'0123456789', b'ok\n'])
+
+        self.assertEqual(reader.read_frames(serial_conn), [])
+        self.assertEqual(reader.pending_bytes, 0)
+        self.logger.error.assert_called_once()
+        self.assertEqual(reader.read_frames(serial_conn), [b'ok\n'])
+
+    def test_read_frame_keeps_following_frames(self):
+        reader = SerialFrameReader({}, self.logger)
+        serial_conn = FakeSerial([b'response\nnext\n'])
+
+        self.assertEqual(reader.read_frame(serial_conn, 1), b'response\n')
+        self.assertEqual(reader.read_frames(serial_conn), [b'next\n'])
+
+    def test_read_frame_returns_partial_data_on_timeout(self):
+        reader = SerialFrameReader({}, self.logger)
+
+        self.assertEqual(reader.read_frame(FakeSerial([b'partial']), 0.05), b'partial')
+        self.assertEqual(reader.pending_bytes, 0)
+
+
+class SerialDeviceThroughputTests(BaseUnitTest):
+    FRAMES_COUNT = 50000
+
+    def setUp(self):
+        super().setUp()
+        self.master_fd, slave_fd = os.openpty()
+        self.port = os.ttyname(slave_fd)
+        # keep slave side open, otherwise pty is hung up between reconnects
+        self.slave_fd = slave_fd
+        self.logger = logging.getLogger('serial_test')
+        self.logger.setLevel(logging.WARNING)
+        self.logger.trace = self.logger.debug
+        self.stop_event = Event()
+        self.device = None
+
+    def tearDown(self):
+        self.stop_event.set()
+        if self.device is not None:
+            self.device.stop()
+            self.device.join(5)
+        os.close(self.master_fd)
+        os.close(self.slave_fd)
+        super().tearDown()
+
+    def test_sustained_throughput_over_pty(self):
+        device_config = {
+            'name': 'SerialDevice1',
+            'port': self.port,
+            'baudrate': 921600,
+            'timeout': 0.1,
+            'telemetry': [{'type': 'float', 'key': 'temperature', 'untilDelimiter': '\n'}]
+        }
+        uplink_queue = Queue()
+        converter = SerialUplinkConverter(device_config, self.logger)
+        self.device = SerialDevice(device_config, converter, self.stop_event, self.logger, uplink_queue)
+        self.assertIsInstance(self.device.get_serial(), serial.Serial)
+        self.device.start()
+
+        frames = [b'%010.3f\n' % (index / 1000) for index in range(1, self.FRAMES_COUNT + 1)]
+        payload = b''.join(frames)
+
+        def write_payload():
+            view = memoryview(payload)
+            while view:
+                written = os.write(self.master_fd, view[:4096])
+                view = view[written:]
+
+        started = monotonic()
+        writer = Thread(target=write_payload, daemon=True)
+        writer.start()
+
+        received = []
+        while len(received) < self.FRAMES_COUNT and monotonic() - started < 30:
+            batch = uplink_queue.get(timeout=5)
+            received.extend(batch)
+        elapsed = monotonic() - started
+        writer.join(5)
+
+        self.assertEqual(len(received), self.FRAMES_COUNT)
+        self.assertEqual(received[-1].telemetry[0].values[next(iter(received[-1].telemetry[0].values))],
+                         self.FRAMES_COUNT / 1000)
+        self.assertGreater(len(payload) / elapsed, BAUDRATE_921600_BYTES_PER_SECOND)
@@ -0,0 +1,123 @@
+#     Copyright 2026. ThingsBoard
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+import asyncio
+import logging
+from time import monotonic
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import MagicMock, patch
+
+from thingsboard_gateway.connectors.snmp.snmp_connector import SNMPConnector
+
+HUNG_DEVICE_IP = '127.0.0.100'
+
+
+class FakeSNMPClient:
+    calls = []
+
+    def __init__(self, client):
+        self.ip = client.ip
+
+    async def get(self, oid):
+        FakeSNMPClient.calls.append(('get', self.ip, oid))
+        await asyncio.sleep(.2)
+        return oid
+
+    async def multiget(self, oids):
+        FakeSNMPClient.calls.append(('multiget', self.ip, tuple(oids)))
+        await asyncio.sleep(100 if self.ip == HUNG_DEVICE_IP else .2)
+        return list(oids)
+
+    async def bulktable(self, oid, bulk_size=10):
+        FakeSNMPClient.calls.append(('bulktable', self.ip, oid))
+        return [{'1': oid}]
+
+
+class SNMPPollingTests(IsolatedAsyncioTestCase):
+    @staticmethod
+    def create_device(name, ip, **kwargs):
+        return {
+            "deviceName": name,
+            "deviceType": "snmp",
+            "ip": ip,
+            "community": "public",
+            "pollPeriod": 60000,
+            "attributes": [],
+            "telemetry": [{"key": "key%i" % i, "method": "get", "oid": "1.3.6.1.2.1.1.%i.0" % i}
+                          for i in range(3)],
+            **kwargs
+        }
+
+    def create_connector(self, devices):
+        logger = logging.getLogger('SNMP test')
+        logger.trace = logger.debug
+        with patch('thingsboard_gateway.connectors.snmp.snmp_connector.init_logger', return_value=logger):
+            connector = SNMPConnector(MagicMock(), {"devices": devices}, 'snmp')
+        connector._SNMPConnector__fill_converters()
+        return connector
+
+    def setUp(self):
+        FakeSNMPClient.calls = []
+        self.client_patch = patch('thingsboard_gateway.connectors.snmp.snmp_connector.Client',
+                                  side_effect=lambda ip, **kwargs: MagicMock(ip=ip))
+        self.wrapper_patch = patch('thingsboard_gateway.connectors.snmp.snmp_connector.PyWrapper', FakeSNMPClient)
+        self.client_patch.start()
+        self.wrapper_patch.start()
+
+    def tearDown(self):
+        self.client_patch.stop()
+        self.wrapper_patch.stop()
+
+    async def test_get_keys_are_coalesced_and_devices_polled_concurrently(self):
+        devices = [self.create_device("Device %i" % i, "127.0.0.%i" % (i + 1)) for i in range(5)]
+        connector = self.create_connector(devices)
+        semaphore = asyncio.Semaphore(32)
+
+        started = monotonic()
+        await asyncio.gather(*(connector._SNMPConnector__process_data(device, semaphore) for device in devices))
+        elapsed = monotonic() - started
+
+        self.assertEqual(5, len(FakeSNMPClient.calls))
+        self.assertTrue(all(call[0] == 'multiget' and len(call[2]) == 3 for call in FakeSNMPClient.calls))
+        self.assertLess(elapsed, .6)
+        self.assertEqual(5, connector._SNMPConnector__gateway.send_to_storage.call_count)
+
+    async def test_table_uses_getbulk_for_v2c_devices(self):
+        device = self.create_device("Device", "127.0.0.1", snmpVersion="v2c", useBulkRequests=True)
+        device["attributes"] = [{"key": "table", "method": "table", "oid": "1.3.6.1.2.1.2.2"}]
+        device["telemetry"] = []
+        connector = self.create_connector([device])
+
+        await connector._SNMPConnector__process_data(device, asyncio.Semaphore(1))
+
+        self.assertEqual([('bulktable', '127.0.0.1', '1.3.6.1.2.1.2.2')], FakeSNMPClient.calls)
+
+    async def test_hung_device_poll_is_cancelled_without_delaying_other_devices(self):
+        hung_device = self.create_device("Hung device", HUNG_DEVICE_IP, pollTimeout=300)
+        device = self.create_device("Device", "127.0.0.1")
+        connector = self.create_connector([hung_device, device])
+        connector._SNMPConnector__polling_devices.update({"Hung device", "Device"})
+        semaphore = asyncio.Semaphore(1)
+
+        started = monotonic()
+        await asyncio.wait_for(asyncio.gather(connector._SNMPConnector__poll_device(hung_device, semaphore),
+                                              connector._SNMPConnector__poll_device(device, semaphore)), 5)
+        elapsed = monotonic() - started
+
+        self.assertLess(elapsed, 1)
+        gateway = connector._SNMPConnector__gateway
+        self.assertEqual(1, gateway.send_to_storage.call_count)
+        self.assertEqual("Device", gateway.send_to_storage.call_args.args[2].device_name)
+        self.assertEqual(set(), connector._SNMPConnector__polling_devices)
+        self.assertFalse(semaphore.locked())
@@ -0,0 +1,137 @@
+#     Copyright 2026. ThingsBoard
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+import socket
+from time import monotonic, sleep
+from unittest.mock import MagicMock, patch
+
+from tests.unit.BaseUnitTest import BaseUnitTest
+from thingsboard_gateway.connectors.socket.socket_connector import SocketConnector
+
+
+class CollectingGateway:
+    def __init__(self):
+        self.data = []
+
+    def send_to_storage(self, connector_name, connector_id, data):
+        self.data.append(data)
+
+    def __getattr__(self, item):
+        return MagicMock()
+
+
+class SocketConnectorTests(BaseUnitTest):
+    def setUp(self):
+        super().setUp()
+        self.gateway = CollectingGateway()
+        self.connector = None
+
+    def tearDown(self):
+        if self.connector is not None:
+            self.connector.close()
+            self.connector.join(5)
+        super().tearDown()
+
+    @staticmethod
+    def get_free_port(socket_type):
+        with socket.socket(socket.AF_INET, socket_type) as sock:
+            sock.bind(('127.0.0.1', 0))
+            return sock.getsockname()[1]
+
+    def start_connector(self, socket_type, framing, devices=None):
+        port = self.get_free_port(socket.SOCK_STREAM if socket_type == 'TCP' else socket.SOCK_DGRAM)
+        config = {
+            'name': 'Socket test',
+            'socket': {'type': socket_type, 'address': '127.0.0.1', 'port': port, 'bufferSize': 1024,
+                       'framing': framing},
+            'devices': devices or [{
+                'address': '127.0.0.1:*',
+                'deviceName': 'Socket device',
+                'deviceType': 'default',
+                'encoding': 'utf-8',
+                'telemetry': [{'key': 'value', 'byteFrom': 0, 'byteTo': -1}],
+                'attributes': []
+            }]
+        }
+
+        logger = MagicMock()
+        with patch('thingsboard_gateway.connectors.socket.socket_connector.init_logger', return_value=logger):
+            self.connector = SocketConnector(self.gateway, config, 'socket')
+        self.connector.open()
+
+        for _ in range(50):
+            if self.connector.loop is not None and self.connector.loop.is_running():
+                break
+            sleep(.1)
+        sleep(.2)
+
+        return port
+
+    def wait_for_messages(self, count, timeout=10):
+        started = monotonic()
+        while len(self.gateway.data) < count and monotonic() - started < timeout:
+            sleep(.05)
+
+    def get_values(self):
+        return [list(data.telemetry[0].values.values())[0] for data in self.gateway.data]
+
+    def test_tcp_delimiter_framing(self):
+        port = self.start_connector('TCP', {'type': 'delimiter', 'delimiter': '\n'})
+
+        with socket.create_connection(('127.0.0.1', port)) as client:
+            client.sendall(b'1\n2\n3')
+            sleep(.2)
+            client.sendall(b'3\n4\n')
+            self.wait_for_messages(4)
+
+        self.assertEqual(self.get_values(), ['1', '2', '33', '4'])
+
+    def test_tcp_many_clients(self):
+        port = self.start_connector('TCP', {'type': 'lengthPrefix', 'lengthBytes': 2})
+
+        clients = [socket.create_connection(('127.0.0.1', port)) for _ in range(50)]
+        for index, client in enumerate(clients):
+            payload = str(index).encode()
+            client.sendall(len(payload).to_bytes(2, 'big') + payload)
+
+        self.wait_for_messages(50)
+        for client in clients:
+            client.close()
+
+        self.assertEqual(sorted(int(value) for value in self.get_values()), list(range(50)))
+
+    def test_udp_datagrams_are_split_to_frames(self):
+        port = self.start_connector('UDP', {'type': 'fixedLength', 'length': 2})
+
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as client:
+            client.sendto(b'aabbc', ('127.0.0.1', port))
+            client.sendto(b'dd', ('127.0.0.1', port))
+            self.wait_for_messages(3)
+
+        self.assertEqual(self.get_values(), ['aa', 'bb', 'dd'])
+
+    def test_message_is_sent_for_every_matching_device(self):
+        device = {'deviceType': 'default', 'encoding': 'utf-8',
+                  'telemetry': [{'key': 'value', 'byteFrom': 0, 'byteTo': -1}], 'attributes': []}
+        port = self.start_connector('TCP', {'type': 'delimiter'}, devices=[
+            {**device, 'address': '127.0.0.1:*', 'deviceName': 'First'},
+            {**device, 'address': '*', 'deviceName': 'Second'},
+            {**device, 'address': '10.0.0.1:*', 'deviceName': 'Other'},
+        ])
+
+        with socket.create_connection(('127.0.0.1', port)) as client:
+            client.sendall(b'1\n2\n')
+            self.wait_for_messages(4)
+
+        self.assertEqual([data.device_name for data in self.gateway.data], ['First', 'Second', 'First', 'Second'])
@@ -0,0 +1,96 @@
+#     Copyright 2026. ThingsBoard
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+from tests.unit.BaseUnitTest import BaseUnitTest
+from thingsboard_gateway.connectors.framing import (
+    DelimiterFramer,
+    FixedLengthFramer,
+    FramingError,
+    LengthPrefixFramer,
+    NoFramer,
+    RegexFramer,
+    create_framer
+)
+
+
+class SocketFramingTests(BaseUnitTest):
+    def test_create_framer(self):
+        self.assertIsInstance(create_framer({}), NoFramer)
+        self.assertIsInstance(create_framer({'type': 'delimiter'}), DelimiterFramer)
+        self.assertIsInstance(create_framer({'type': 'fixedLength', 'length': 4}), FixedLengthFramer)
+        self.assertIsInstance(create_framer({'type': 'lengthPrefix'}), LengthPrefixFramer)
+        self.assertIsInstance(create_framer({'type': 'regex', 'regex': '.'}), RegexFramer)
+
+        with self.assertRaises(FramingError):
+            create_framer({'type': 'unknown'})
+
+    def test_delimiter_framing_keeps_incomplete_frame(self):
+        framer = create_framer({'type': 'delimiter', 'delimiter': '\r\n'})
+
+        self.assertEqual(framer.feed(b'first\r\nsec'), [b'first'])
+        self.assertEqual(framer.feed(b'ond\r'), [])
+        self.assertEqual(framer.feed(b'\nthird\r\n\r\nfourth\r\n'), [b'second', b'third', b'fourth'])
+        self.assertEqual(framer.pending_bytes, 0)
+
+    def test_delimiter_included_into_frame(self):
+        framer = create_framer({'type': 'delimiter', 'includeDelimiter': True})
+
+        self.assertEqual(framer.feed(b'first\n\nsec'), [b'first\n', b'\n'])
+        self.assertEqual(framer.flush(), b'sec')
+        self.assertEqual(framer.pending_bytes, 0)
+
+    def test_hex_delimiter(self):
+        framer = create_framer({'type': 'delimiter', 'delimiter': '0x03'})
+
+        self.assertEqual(framer.feed(b'\x02abc\x03\x02de'), [b'\x02abc'])
+
+    def test_delimiter_framing_drops_too_long_frame(self):
+        framer = create_framer({'type': 'delimiter', 'maxFrameSize': 8})
+
+        with self.assertRaises(FramingError):
+            framer.feed(b'0123456789')
+
+        self.assertEqual(framer.feed(b'ok\n'), [b'ok'])
+
+    def test_fixed_length_framing(self):
+        framer = create_framer({'type': 'fixedLength', 'length': 3})
+
+        self.assertEqual(framer.feed(b'aaabbbc'), [b'aaa', b'bbb'])
+        self.assertEqual(framer.feed(b'cc'), [b'ccc'])
+
+    def test_length_prefix_framing(self):
+        framer = create_framer({'type': 'lengthPrefix', 'lengthBytes': 2, 'byteorder': 'little'})
+        data = b'\x03\x00abc' + b'\x00\x00' + b'\x05\x00hello'
+
+        self.assertEqual(framer.feed(data[:4]), [])
+        self.assertEqual(framer.feed(data[4:12]), [b'abc', b''])
+        self.assertEqual(framer.feed(data[12:]), [b'hello'])
+
+    def test_length_prefix_including_prefix_size(self):
+        framer = create_framer({'type': 'lengthPrefix', 'lengthBytes': 1, 'lengthIncludesPrefix': True})
+
+        self.assertEqual(framer.feed(b'\x03ab\x02c'), [b'ab', b'c'])
+
+        with self.assertRaises(FramingError):
+            framer.feed(b'\x00')
+
+    def test_regex_framing_skips_bytes_between_frames(self):
+        framer = create_framer({'type': 'regex', 'regex': r'<[^>]*>', 'maxFrameSize': 8})
+
+        self.assertEqual(framer.feed(b'<t=1>noise<t=2><t'), [b'<t=1>', b'<t=2>'])
+        self.assertEqual(framer.feed(b'=3>'), [b'<t=3>'])
+
+        with self.assertRaises(FramingError):
+            framer.feed(b'0123456789')
+        self.assertEqual(framer.pending_bytes, 0)
@@ -0,0 +1,149 @@
+#     Copyright 2026. ThingsBoard
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+import asyncio
+import logging
+from unittest import IsolatedAsyncioTestCase
+from unittest.mock import MagicMock, patch
+
+from thingsboard_gateway.connectors.xmpp.xmpp_connector import XMPPConnector
+
+DEVICE_JID = 'device@localhost/TMP_1101'
+
+
+def device_config(**kwargs):
+    config = {
+        "jid": DEVICE_JID,
+        "deviceNameExpression": "${serialNumber}",
+        "deviceTypeExpression": "default",
+        "attributes": [{"key": "model", "value": "${model}"}],
+        "timeseries": [{"key": "temperature", "value": "${temp}"}]
+    }
+    config.update(kwargs)
+    return config
+
+
+class XmppMessagesProcessingTests(IsolatedAsyncioTestCase):
+    def create_connector(self, devices):
+        self.logger = logging.getLogger('XMPP test')
+        self.logger.trace = self.logger.debug
+        self.gateway = MagicMock()
+        with patch('thingsboard_gateway.connectors.xmpp.xmpp_connector.init_logger', return_value=self.logger):
+            connector = XMPPConnector(self.gateway, {
+                'name': 'XMPP test',
+                'server': {'jid': 'gateway@localhost', 'password': 'password', 'host': 'localhost', 'port': 5222},
+                'devices': devices
+            }, 'xmpp')
+        return connector
+
+    def stored_data(self):
+        return [call.args[2] for call in self.gateway.send_to_storage.call_args_list]
+
+    def test_converter_loaded_once_for_devices_with_same_converter(self):
+        with patch.object(XMPPConnector, '_load_converter', wraps=XMPPConnector._load_converter,
+                          autospec=True) as load_converter:
+            connector = self.create_connector([device_config(), device_config(jid='other@localhost')])
+
+        self.assertEqual(load_converter.call_count, 1)
+        self.assertEqual(len(connector._devices), 2)
+
+    def test_batch_of_messages_from_same_device_sent_as_single_data(self):
+        connector = self.create_connector([device_config()])
+
+        connector._process_messages_batch([
+            (DEVICE_JID, '{"serialNumber": "SN-1", "temp": 20, "model": "A", "ts": 1000}'),
+            (DEVICE_JID, '{"serialNumber": "SN-1", "temp": 21, "model": "B", "ts": 2000}'),
+            ('unknown@localhost', '{"serialNumber": "SN-2", "temp": 22}')
+        ])
+
+        stored = self.stored_data()
+        self.assertEqual(len(stored), 1)
+        self.assertEqual(stored[0].device_name, 'SN-1')
+        self.assertEqual([entry.ts for entry in stored[0].telemetry], [1000, 2000])
+        self.assertEqual(stored[0].attributes.to_dict(), {'model': 'B'})
+        self.assertEqual(connector._available_device, {'SN-1': DEVICE_JID})
+
+    def test_bare_jid_device_matches_any_resource(self):
+        connector = self.create_connector([device_config(jid='device@localhost')])
+
+        connector._process_messages_batch([(DEVICE_JID, '{"serialNumber": "SN-1", "temp": 20, "model": "A"}')])
+
+        self.assertEqual(len(self.stored_data()), 1)
+        self.assertIs(connector._devices_by_sender_jid[DEVICE_JID], connector._devices['device@localhost'])
+
+    def test_bulk_message_with_json_array(self):
+        connector = self.create_connector([device_config(bulkMessages=True)])
+
+        connector._process_messages_batch([
+            (DEVICE_JID, '[{"serialNumber": "SN-1", "temp": 20, "model": "A", "ts": 1000},'
+                         ' {"serialNumber": "SN-1", "temp": 21, "model": "A", "ts": 2000},'
+                         ' {"serialNumber": "SN-2", "temp": 22, "model": "B", "ts": 1000}]')
+        ])
+
+        stored = {data.device_name: data for data in self.stored_data()}
+        self.assertEqual(set(stored), {'SN-1', 'SN-2'})
+        self.assertEqual(stored['SN-1'].telemetry_datapoints_count, 2)
+        self.assertEqual(stored['SN-2'].telemetry_datapoints_count, 1)
+
+    def test_bulk_message_with_delimited_readings(self):
+        connector = self.create_connector([device_config(bulkMessages=True, bulkMessagesDelimiter=';')])
+
+        connector._process_messages_batch([
+            (DEVICE_JID, '{"serialNumber": "SN-1", "temp": 20, "ts": 1000};'
+                         '{"serialNumber": "SN-1", "temp": 21, "ts": 2000};')
+        ])
+
+        stored = self.stored_data()
+        self.assertEqual(len(stored), 1)
+        self.assertEqual([entry.ts for entry in stored[0].telemetry], [1000, 2000])
+
+    @patch('thingsboard_gateway.gateway.entities.telemetry_entry.time', return_value=1700000000)
+    def test_batch_of_messages_without_ts_keeps_every_reading(self, _):
+        connector = self.create_connector([device_config()])
+
+        connector._process_messages_batch([
+            (DEVICE_JID, '{"serialNumber": "SN-1", "temp": 20, "model": "A"}'),
+            (DEVICE_JID, '{"serialNumber": "SN-1", "temp": 21, "model": "A"}'),
+            (DEVICE_JID, '{"serialNumber": "SN-1", "temp": 22, "model": "A"}')
+        ])
+
+        readings = [entry.values for data in self.stored_data() for entry in data.telemetry]
+        self.assertEqual([value for values in readings for value in values.values()], ['20', '21', '22'])
+
+    @patch('thingsboard_gateway.gateway.entities.telemetry_entry.time', return_value=1700000000)
+    def test_bulk_message_without_ts_keeps_every_reading(self, _):
+        connector = self.create_connector([device_config(bulkMessages=True)])
+
+        connector._process_messages_batch([
+            (DEVICE_JID, '[{"serialNumber": "SN-1", "temp": 20}, {"serialNumber": "SN-1", "temp": 21}]')
+        ])
+
+        stored = self.stored_data()
+        self.assertEqual(sum(data.telemetry_datapoints_count for data in stored), 2)
+
+    async def test_queued_messages_processed_on_event_loop(self):
+        connector = self.create_connector([device_config()])
+        connector._incoming_messages = asyncio.Queue()
+        for ts in (1000, 2000, 3000):
+            connector.message({'from': DEVICE_JID, 'body': '{"serialNumber": "SN-1", "temp": 20, "ts": %d}' % ts})
+
+        task = asyncio.create_task(connector._process_messages())
+        while not connector._incoming_messages.empty():
+            await asyncio.sleep(0)
+        await asyncio.sleep(0)
+        connector.close()
+        await task
+
+        self.assertEqual(self.gateway.send_to_storage.call_count, 1)
+        self.assertEqual(self.stored_data()[0].telemetry_datapoints_count, 3)
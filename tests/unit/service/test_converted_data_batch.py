@@ -0,0 +1,61 @@
+#     Copyright 2026. ThingsBoard
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+from unittest import TestCase
+
+from thingsboard_gateway.gateway.entities.converted_data import ConvertedData
+from thingsboard_gateway.gateway.entities.converted_data_batch import ConvertedDataBatch
+from thingsboard_gateway.gateway.entities.datapoint_key import DatapointKey
+from thingsboard_gateway.gateway.entities.telemetry_entry import TelemetryEntry
+
+
+def converted_data(device_name, values, ts, attributes=None):
+    data = ConvertedData(device_name)
+    data.add_to_telemetry(TelemetryEntry({DatapointKey(key): value for key, value in values.items()}, ts))
+    if attributes:
+        data.add_to_attributes(attributes)
+    return data
+
+
+class TestConvertedDataBatch(TestCase):
+    def test_data_with_different_ts_merged_per_device(self):
+        batch = ConvertedDataBatch()
+        for i in range(4):
+            batch.add(converted_data('Device %i' % (i % 2), {'temp': i}, 1000 + i))
+
+        self.assertEqual(len(batch), 2)
+        self.assertEqual(batch.messages_count, 4)
+        self.assertEqual([data.telemetry_datapoints_count for data in batch], [2, 2])
+
+    def test_same_ts_without_common_keys_merged(self):
+        batch = ConvertedDataBatch()
+        batch.add(converted_data('Device', {'temp': 1}, 1000))
+        batch.add(converted_data('Device', {'humidity': 2}, 1000, {'firmware': '1.0'}))
+
+        self.assertEqual(len(batch), 1)
+        data = next(iter(batch))
+        self.assertEqual(data.to_dict()['telemetry'], [{'ts': 1000, 'values': {'temp': 1, 'humidity': 2}}])
+        self.assertEqual(data.to_dict()['attributes'], {'firmware': '1.0'})
+
+    def test_same_ts_values_are_not_overwritten(self):
+        batch = ConvertedDataBatch()
+        for i in range(3):
+            batch.add(converted_data('Device', {'temp': i}, 1000))
+
+        self.assertEqual([data.to_dict()['telemetry'] for data in batch],
+                         [[{'ts': 1000, 'values': {'temp': i}}] for i in range(3)])
+
+        batch.clear()
+        self.assertEqual(len(batch), 0)
+        self.assertEqual(batch.messages_count, 0)
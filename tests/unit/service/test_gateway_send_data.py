@@ -0,0 +1,237 @@
+#     Copyright 2026. ThingsBoard
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+from logging import getLogger
+from time import time
+from unittest import TestCase
+from unittest.mock import MagicMock, patch
+
+from orjson import loads
+from tb_device_mqtt import RateLimit
+from tb_gateway_mqtt import GATEWAY_ATTRIBUTES_TOPIC, GATEWAY_TELEMETRY_TOPIC
+
+from thingsboard_gateway.gateway.pack_planner import (ALWAYS_MERGE_DEVICES, AUTO_MERGE_DEVICES, PackPlanner,
+                                                      RateLimitBudget)
+from thingsboard_gateway.gateway.publish_window import PublishWindow
+from thingsboard_gateway.gateway.tb_client import TBGatewayDevicesMqttClient
+from thingsboard_gateway.gateway.tb_gateway_service import TBGatewayService
+
+
+class TestGatewaySendData(TestCase):
+    def setUp(self):
+        self.gateway = TBGatewayService.__new__(TBGatewayService)
+        self.gateway.name = 'Gateway'
+        self.gateway.quality_of_service = 1
+        self.gateway._TBGatewayService__renamed_devices = {'Device 1': 'Renamed device 1'}
+        self.gateway._TBGatewayService__pack_planner = PackPlanner(8196, ALWAYS_MERGE_DEVICES)
+        self.gateway.tb_client = MagicMock()
+        self.gateway.tb_client.get_max_payload_size.return_value = 8196
+        self.gateway.tb_client.client.get_devices_rate_limit_budget.return_value = RateLimitBudget()
+
+    def send_data(self, devices_data):
+        return self.gateway._TBGatewayService__send_data(devices_data)
+
+    def test_devices_data_sent_in_one_message(self):
+        devices_data = {'Device %i' % i: {'telemetry': [{'ts': 1, 'values': {'temperature': i}}],
+                                          'attributes': {'firmware': '1.%i' % i, 'model': 'A'}} for i in range(100)}
+
+        published_events = self.send_data(devices_data)
+
+        client = self.gateway.tb_client.client
+        self.assertEqual(len(published_events), 2)
+        client.gw_send_devices_attributes.assert_called_once()
+        client.gw_send_devices_telemetry.assert_called_once()
+        client.gw_send_attributes.assert_not_called()
+        client.gw_send_telemetry.assert_not_called()
+        devices_attributes, datapoints = client.gw_send_devices_attributes.call_args.args
+        self.assertEqual(len(devices_attributes), 100)
+        self.assertEqual(datapoints, 200)
+        self.assertEqual(devices_attributes['Renamed device 1'], {'firmware': '1.1', 'model': 'A'})
+        self.assertNotIn('Device 1', devices_attributes)
+        devices_telemetry, datapoints = client.gw_send_devices_telemetry.call_args.args
+        self.assertEqual(len(devices_telemetry), 100)
+        self.assertEqual(datapoints, 100)
+        self.assertEqual(devices_telemetry['Renamed device 1'], [{'ts': 1, 'values': {'temperature': 1}}])
+        self.assertEqual(devices_data['Device 0'], {'telemetry': [], 'attributes': {}})
+
+    def test_attributes_and_telemetry_share_budget(self):
+        self.gateway._TBGatewayService__pack_planner.merge_mode = AUTO_MERGE_DEVICES
+        self.gateway.tb_client.client.get_devices_rate_limit_budget.return_value = RateLimitBudget(messages=15)
+
+        published_events = self.send_data({'Device %i' % i: {'telemetry': [{'temperature': i}],
+                                                             'attributes': {'model': 'A'}} for i in range(10)})
+
+        client = self.gateway.tb_client.client
+        self.assertEqual(client.gw_send_attributes.call_count, 10)
+        client.gw_send_devices_telemetry.assert_called_once()
+        self.assertEqual(len(published_events), 11)
+
+    def test_messages_split_by_payload_size(self):
+        self.gateway.tb_client.get_max_payload_size.return_value = 1024
+        devices_data = {'Device %i' % i: {'attributes': {'key%i' % key: key for key in range(10)}}
+                        for i in range(50)}
+
+        published_events = self.send_data(devices_data)
+
+        calls = self.gateway.tb_client.client.gw_send_devices_attributes.call_args_list
+        self.assertGreater(len(calls), 1)
+        self.assertEqual(len(published_events), len(calls))
+        self.assertEqual(sum(len(call.args[0]) for call in calls), 50)
+
+    def test_single_device_and_gateway_data_use_client_methods(self):
+        self.send_data({'Gateway': {'telemetry': [{'cpu': 10}]},
+                        'Device 2': {'telemetry': [{'temperature': 20}]}})
+
+        client = self.gateway.tb_client.client
+        client.send_telemetry.assert_called_once_with([{'cpu': 10}], quality_of_service=1)
+        client.gw_send_telemetry.assert_called_once_with('Device 2', [{'temperature': 20}], quality_of_service=1)
+        client.gw_send_devices_telemetry.assert_not_called()
+
+    def test_pack_failed_on_send_error(self):
+        self.gateway.tb_client.client.gw_send_devices_attributes.side_effect = RuntimeError("Connection lost")
+
+        with patch('thingsboard_gateway.gateway.tb_gateway_service.log', getLogger("TEST")):
+            published_events = self.send_data({'Device %i' % i: {'attributes': {'model': 'A'}}
+                                               for i in range(2)})
+
+        self.assertEqual(published_events, [None])
+
+
+def create_client():
+    client = TBGatewayDevicesMqttClient('localhost', 1883, 'token')
+    client.is_connected = lambda: True
+    client._client.publish = MagicMock()
+    client._client.publish.return_value.rc = 0
+    return client
+
+
+class TestGatewayDevicesMqttClient(TestCase):
+    def setUp(self):
+        self.client = create_client()
+        self.client._devices_connected_through_gateway_telemetry_messages_rate_limit = RateLimit('10:100')
+        self.client._devices_connected_through_gateway_telemetry_datapoints_rate_limit = RateLimit('100:100')
+
+    def tearDown(self):
+        self.client.stop()
+
+    def test_devices_attributes_published_in_one_message(self):
+        self.client.gw_send_devices_attributes({'Device 1': {'model': 'A', 'firmware': '1.0'},
+                                                'Device 2': {'model': 'B'}}, 3)
+
+        publish = self.client._client.publish
+        publish.assert_called_once()
+        self.assertEqual(publish.call_args.kwargs['topic'], GATEWAY_ATTRIBUTES_TOPIC)
+        self.assertEqual(loads(publish.call_args.kwargs['payload']),
+                         {'Device 1': {'model': 'A', 'firmware': '1.0'}, 'Device 2': {'model': 'B'}})
+        dp_rate_limit = self.client._devices_connected_through_gateway_telemetry_datapoints_rate_limit
+        self.assertFalse(dp_rate_limit.check_limit_reached(77))
+        self.assertTrue(dp_rate_limit.check_limit_reached(78))
+
+    def test_devices_telemetry_published_in_one_message(self):
+        sent_ts = int(time() * 1000)
+        publish_info = self.client.gw_send_devices_telemetry({
+            'Device 1': [{'ts': 1, 'values': {'temperature': 20}, 'metadata': {'source': 'modbus'}}],
+            'Device 2': [{'ts': 1, 'values': {'temperature': 21}}]
+        }, 2)
+
+        publish = self.client._client.publish
+        publish.assert_called_once()
+        self.assertEqual(publish_info.message_info, [publish.return_value])
+        self.assertEqual(publish.call_args.kwargs['topic'], GATEWAY_TELEMETRY_TOPIC)
+        payload = loads(publish.call_args.kwargs['payload'])
+        self.assertEqual(payload['Device 2'], [{'ts': 1, 'values': {'temperature': 21}}])
+        entry = payload['Device 1'][0]
+        self.assertEqual(entry['metadata']['source'], 'modbus')
+        self.assertGreaterEqual(entry['metadata']['publishedTs'], sent_ts)
+
+    def test_rate_limit_budget(self):
+        self.client._devices_connected_through_gateway_telemetry_messages_rate_limit.increase_rate_limit_counter(3)
+        self.client._devices_connected_through_gateway_telemetry_datapoints_rate_limit.increase_rate_limit_counter(30)
+
+        budget = self.client.get_devices_rate_limit_budget()
+
+        self.assertEqual(budget.messages, 5)
+        self.assertEqual(budget.datapoints, 50)
+        self.assertEqual(budget.max_datapoints_per_message, 80)
+
+    def test_budget_without_rate_limits_is_infinite(self):
+        self.client._devices_connected_through_gateway_telemetry_messages_rate_limit = RateLimit('0:0')
+        self.client._devices_connected_through_gateway_telemetry_datapoints_rate_limit = RateLimit('0:0')
+
+        budget = self.client.get_devices_rate_limit_budget()
+
+        self.assertEqual(budget.messages, float('inf'))
+        self.assertEqual(budget.datapoints, float('inf'))
+
+
+class TestGatewaySendDataThroughClient(TestCase):
+    def setUp(self):
+        self.gateway = TBGatewayService.__new__(TBGatewayService)
+        self.gateway.name = 'Gateway'
+        self.gateway.quality_of_service = 1
+        self.gateway._TBGatewayService__renamed_devices = {'Device 1': 'Renamed device 1'}
+        self.gateway._TBGatewayService__pack_planner = PackPlanner(8196, ALWAYS_MERGE_DEVICES)
+        self.gateway.tb_client = MagicMock()
+        self.gateway.tb_client.get_max_payload_size.return_value = 8196
+        self.gateway.tb_client.client = create_client()
+
+    def tearDown(self):
+        self.gateway.tb_client.client.stop()
+
+    def test_published_payloads(self):
+        published_events = self.gateway._TBGatewayService__send_data({
+            'Device 1': {'telemetry': [{'ts': 1, 'values': {'temperature': 20}}], 'attributes': {'model': 'A'}},
+            'Device 2': {'telemetry': [{'ts': 1, 'values': {'temperature': 21}}], 'attributes': {'model': 'B'}}
+        })
+
+        self.assertEqual(len(published_events), 2)
+        published = [(call.kwargs['topic'], loads(call.kwargs['payload']))
+                     for call in self.gateway.tb_client.client._client.publish.call_args_list]
+        self.assertEqual(published, [
+            (GATEWAY_ATTRIBUTES_TOPIC, {'Renamed device 1': {'model': 'A'}, 'Device 2': {'model': 'B'}}),
+            (GATEWAY_TELEMETRY_TOPIC, {'Renamed device 1': [{'ts': 1, 'values': {'temperature': 20}}],
+                                       'Device 2': [{'ts': 1, 'values': {'temperature': 21}}]})
+        ])
+
+    def test_every_merged_message_is_acknowledged_separately(self):
+        self.gateway._TBGatewayService__pack_planner = PackPlanner(1024)
+        self.gateway.tb_client.get_max_payload_size.return_value = 1024
+        message_infos = []
+
+        def publish(**_):
+            message_info = MagicMock(rc=0)
+            message_info.is_published.return_value = False
+            message_infos.append(message_info)
+            return message_info
+
+        self.gateway.tb_client.client._client.publish.side_effect = publish
+        published_events = self.gateway._TBGatewayService__send_data({
+            'Device %i' % i: {'telemetry': [{'ts': 1, 'values': {'key%i' % key: key for key in range(10)}}]}
+            for i in range(50)})
+
+        self.assertGreater(len(published_events), 1)
+        self.assertLess(len(published_events), 50)
+        self.assertEqual([event.message_info for event in published_events], [[info] for info in message_infos])
+        payloads = [loads(call.kwargs['payload']) for call in
+                    self.gateway.tb_client.client._client.publish.call_args_list]
+        self.assertEqual(sum(len(payload) for payload in payloads), 50)
+        self.assertTrue(all(isinstance(payload, dict) for payload in payloads))
+
+        publish_window = PublishWindow()
+        publish_window.add(published_events, 50)
+        for message_info in message_infos[:-1]:
+            message_info.is_published.return_value = True
+        self.assertEqual(publish_window.pop_acknowledged(), [])
+        message_infos[-1].is_published.return_value = True
+        self.assertEqual(len(publish_window.pop_acknowledged()), 1)
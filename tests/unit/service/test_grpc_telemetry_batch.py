@@ -0,0 +1,85 @@
+#     Copyright 2026. ThingsBoard
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from thingsboard_gateway.gateway.constant_enums import Status
+from thingsboard_gateway.gateway.grpc_service.grpc_uplink_converter import GrpcUplinkConverter
+from thingsboard_gateway.gateway.grpc_service.tb_grpc_manager import TBGRPCServerManager
+from thingsboard_gateway.grpc_connectors.gw_grpc_client import GrpcClient
+from thingsboard_gateway.grpc_connectors.gw_grpc_msg_creator import GrpcMsgCreator
+
+SESSION_ID = 'session'
+
+
+def telemetry_message(device_name, ts, value):
+    return GrpcMsgCreator.create_telemetry_connector_msg({"ts": ts, "values": {"temperature": value}},
+                                                         device_name=device_name)
+
+
+class GrpcTelemetryBatchTests(unittest.TestCase):
+    def setUp(self):
+        self.batch_message = GrpcMsgCreator.create_telemetry_batch_connector_msg([
+            telemetry_message('Device 1', 1000, 20.5),
+            telemetry_message('Device 2', 1000, 30),
+            telemetry_message('Device 1', 2000, 21.5)
+        ])
+
+    def test_batch_converted_with_telemetry_merged_by_device(self):
+        result = GrpcUplinkConverter().convert(None, self.batch_message.gatewayTelemetryBatchMsg)
+
+        self.assertEqual(result, [
+            {"deviceName": "Device 1", "telemetry": [{"ts": 1000, "values": {"temperature": 20.5}},
+                                                     {"ts": 2000, "values": {"temperature": 21.5}}]},
+            {"deviceName": "Device 2", "telemetry": [{"ts": 1000, "values": {"temperature": 30}}]}
+        ])
+
+    def test_batch_sent_to_storage_once(self):
+        gateway = MagicMock()
+        gateway.get_devices.return_value = {}
+        with patch.object(TBGRPCServerManager, 'start'):
+            manager = TBGRPCServerManager(gateway, {'serverPort': 9595})
+        manager.registration_finished(Status.SUCCESS, SESSION_ID, {'name': 'Connector', 'id': 'connector-id',
+                                                                   'config': {}})
+
+        manager.incoming_messages_cb(SESSION_ID, self.batch_message)
+        manager.incoming_messages_cb(SESSION_ID, GrpcMsgCreator.create_get_connected_devices_msg('key'))
+
+        gateway.send_to_storage.assert_called_once()
+        self.assertEqual(gateway.send_to_storage.call_args.args[:2], ('Connector', 'connector-id'))
+        self.assertEqual(len(gateway.send_to_storage.call_args.args[2]), 2)
+        self.assertEqual(manager.get_connector_statistics(SESSION_ID)['MessagesReceived'], 3)
+        gateway.get_devices.assert_called_once_with('connector-id')
+
+    def test_client_coalesces_queued_telemetry_messages(self):
+        client = GrpcClient(MagicMock(), MagicMock(), 'localhost', 9596, max_telemetry_batch_size=2)
+        try:
+            client.connected = True
+            for ts in (1000, 2000, 3000):
+                client.send(telemetry_message('Device 1', ts, 20))
+            client.send(GrpcMsgCreator.create_device_connected_msg('Device 2'))
+
+            sent_messages = [message for _ in range(3) for message in client.output_iter()]
+        finally:
+            client.stop()
+
+        self.assertEqual(len(sent_messages[0].gatewayTelemetryBatchMsg.msg), 2)
+        self.assertFalse(sent_messages[1].HasField('gatewayTelemetryBatchMsg'))
+        self.assertTrue(sent_messages[1].HasField('gatewayTelemetryMsg'))
+        self.assertTrue(sent_messages[2].HasField('connectMsg'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,154 @@
+#     Copyright 2026. ThingsBoard
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+from logging import getLogger
+from shutil import rmtree
+from threading import Event
+from time import monotonic, sleep
+from unittest import TestCase
+
+from thingsboard_gateway.storage.hybrid.hybrid_event_storage import HybridEventStorage
+
+LOG = getLogger("TEST")
+LOG.trace = LOG.debug
+
+
+class TestHybridEventStorage(TestCase):
+    def setUp(self):
+        self.directory = "./hybrid_data/"
+        self.stop_event = Event()
+        self.storages = []
+
+    def tearDown(self):
+        self.stop_event.set()
+        for storage in self.storages:
+            storage.stop()
+        sleep(1)
+        rmtree(self.directory, ignore_errors=True)
+
+    def create_storage(self, **config):
+        storage = HybridEventStorage({
+            "type": "hybrid",
+            "spill_storage_type": "sqlite",
+            "data_file_path": self.directory,
+            "data_folder_path": self.directory,
+            "read_records_count": 10,
+            "max_read_records_count": 10,
+            "max_records_per_file": 1000,
+            **config
+        }, LOG, self.stop_event)
+        self.storages.append(storage)
+        return storage
+
+    @staticmethod
+    def read_events(storage, count, timeout=5):
+        events = []
+        wait_until = monotonic() + timeout
+        while len(events) < count and monotonic() < wait_until:
+            event_pack = storage.get_event_pack()
+            if not event_pack:
+                sleep(0.05)
+                continue
+            events.extend(event_pack)
+            storage.event_pack_processing_done()
+        return events
+
+    def test_events_are_kept_in_memory_while_connected(self):
+        storage = self.create_storage()
+        storage.update_connection_state(True)
+        for index in range(25):
+            self.assertTrue(storage.put(str(index)))
+
+        self.assertEqual(storage.len(), 25)
+        self.assertEqual(storage.spill_storage.len(), 0)
+        self.assertListEqual(self.read_events(storage, 25), [str(index) for index in range(25)])
+        self.assertEqual(storage.len(), 0)
+
+    def test_events_are_spilled_on_disconnect_and_read_in_order(self):
+        storage = self.create_storage()
+        storage.update_connection_state(True)
+        for index in range(15):
+            storage.put(str(index))
+
+        storage.update_connection_state(False)
+        for index in range(15, 30):
+            storage.put(str(index))
+        storage.update_connection_state(True)
+        for index in range(30, 45):
+            storage.put(str(index))
+
+        self.assertListEqual(self.read_events(storage, 45), [str(index) for index in range(45)])
+
+    def test_events_are_spilled_when_memory_limits_are_exceeded(self):
+        storage = self.create_storage(max_memory_size_in_bytes=50)
+        storage.update_connection_state(True)
+        for index in range(20):
+            storage.put("event_%02i" % index)
+
+        self.assertLessEqual(storage.len() - storage.spill_storage.len(), 6)
+
+        aged_storage = self.create_storage(data_file_path=self.directory + "aged/", max_memory_event_age_in_seconds=0)
+        aged_storage.update_connection_state(True)
+        aged_storage.put("old")
+        sleep(0.01)
+        aged_storage.put("new")
+        sleep(1)
+
+        self.assertEqual(aged_storage.spill_storage.len(), 2)
+        self.assertListEqual(self.read_events(storage, 20), ["event_%02i" % index for index in range(20)])
+
+    def test_reset_read_ahead_returns_memory_and_spilled_packs_again(self):
+        storage = self.create_storage()
+        storage.update_connection_state(True)
+        for index in range(10):
+            storage.put(str(index))
+        first_pack = storage.get_event_pack()
+        storage.update_connection_state(False)
+        for index in range(10, 20):
+            storage.put(str(index))
+        sleep(1)
+        second_pack = storage.read_ahead_event_pack()
+
+        storage.reset_read_ahead()
+
+        self.assertListEqual(storage.get_event_pack(), first_pack)
+        self.assertListEqual(storage.read_ahead_event_pack(), second_pack)
+        self.assertListEqual(first_pack + second_pack, [str(index) for index in range(20)])
+
+    def test_not_processed_events_are_saved_on_stop(self):
+        storage = self.create_storage()
+        storage.update_connection_state(True)
+        for index in range(20):
+            storage.put(str(index))
+        storage.get_event_pack()
+
+        storage.stop()
+        self.storages.remove(storage)
+
+        restarted_storage = self.create_storage()
+        self.assertListEqual(self.read_events(restarted_storage, 20), [str(index) for index in range(20)])
+
+    def test_file_storage_is_drained_before_memory(self):
+        storage = self.create_storage(spill_storage_type="file")
+        for index in range(15):
+            storage.put(str(index))
+        storage.update_connection_state(True)
+        for index in range(15, 30):
+            storage.put(str(index))
+
+        self.assertListEqual(self.read_events(storage, 30), [str(index) for index in range(30)])
+
+    def test_unknown_spill_storage_type(self):
+        with self.assertRaises(ValueError):
+            self.create_storage(spill_storage_type="memory")
@@ -0,0 +1,100 @@
+#     Copyright 2026. ThingsBoard
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+from logging import getLogger
+from threading import Event, Thread
+from time import monotonic, sleep
+from unittest import TestCase
+
+from thingsboard_gateway.storage.memory.memory_event_storage import (BLOCK_POLICY, DROP_NEWEST_POLICY,
+                                                                     DROP_OLDEST_POLICY, MemoryEventStorage)
+
+LOG = getLogger("TEST")
+LOG.trace = LOG.debug
+
+
+class TestMemoryEventStorageOverflow(TestCase):
+    def create_storage(self, **config):
+        return MemoryEventStorage({"type": "memory", "read_records_count": 4, "max_records_count": 5, **config},
+                                  LOG, Event())
+
+    def test_drop_newest_keeps_stored_events(self):
+        storage = self.create_storage()
+
+        results = [storage.put(str(index)) for index in range(7)]
+
+        self.assertListEqual(results, [True] * 5 + [False] * 2)
+        self.assertListEqual(storage.get_event_pack(), ["0", "1", "2", "3"])
+        self.assertEqual(storage.dropped_events_count[DROP_NEWEST_POLICY], 2)
+        self.assertEqual(storage.get_dropped_events_count(), 2)
+
+    def test_drop_oldest_keeps_new_events(self):
+        storage = self.create_storage(overflow_policy=DROP_OLDEST_POLICY)
+
+        for index in range(7):
+            self.assertTrue(storage.put(str(index)))
+
+        self.assertListEqual(storage.get_event_pack(), ["2", "3", "4", "5"])
+        storage.event_pack_processing_done()
+        self.assertListEqual(storage.get_event_pack(), ["6"])
+        self.assertEqual(storage.dropped_events_count[DROP_OLDEST_POLICY], 2)
+
+    def test_size_in_bytes_is_limited(self):
+        storage = self.create_storage(max_records_count=100, max_size_in_bytes=10, overflow_policy=DROP_OLDEST_POLICY)
+
+        for event in ("aaaa", "bbbb", "cccc"):
+            storage.put(event)
+
+        self.assertEqual(storage.len(), 2)
+        self.assertFalse(storage.put("x" * 11))
+        self.assertListEqual(storage.get_event_pack(), ["bbbb", "cccc"])
+        self.assertTrue(storage.put("dddddddddd"))
+
+    def test_size_in_bytes_counts_encoded_events(self):
+        storage = self.create_storage(max_records_count=100, max_size_in_bytes=8)
+
+        self.assertTrue(storage.put("\u00b0C\u00b0C"))
+        self.assertFalse(storage.put("\u00b0C\u00b0"))
+        self.assertTrue(storage.put("ab"))
+        self.assertListEqual(storage.get_event_pack(), ["\u00b0C\u00b0C", "ab"])
+        self.assertTrue(storage.put("\u00b0C\u00b0C\u00b0"))
+
+    def test_block_waits_until_events_are_read(self):
+        storage = self.create_storage(overflow_policy=BLOCK_POLICY, overflow_block_timeout_in_seconds=5)
+        for index in range(5):
+            storage.put(str(index))
+
+        reader = Thread(target=lambda: (sleep(0.2), storage.get_event_pack()))
+        reader.start()
+        started = monotonic()
+        self.assertTrue(storage.put("5"))
+        reader.join()
+
+        self.assertGreaterEqual(monotonic() - started, 0.15)
+        self.assertEqual(storage.len(), 2)
+
+    def test_block_drops_event_after_timeout(self):
+        storage = self.create_storage(overflow_policy=BLOCK_POLICY, overflow_block_timeout_in_seconds=0.1)
+        for index in range(5):
+            storage.put(str(index))
+
+        self.assertFalse(storage.put("5"))
+        self.assertEqual(storage.dropped_events_count[BLOCK_POLICY], 1)
+
+    def test_unknown_policy_falls_back_to_drop_newest(self):
+        storage = self.create_storage(overflow_policy="drop_random")
+        for index in range(6):
+            storage.put(str(index))
+
+        self.assertEqual(storage.dropped_events_count[DROP_NEWEST_POLICY], 1)
@@ -0,0 +1,86 @@
+#     Copyright 2026. ThingsBoard
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+from unittest import TestCase
+
+from orjson import dumps
+
+from thingsboard_gateway.gateway.pack_planner import ALWAYS_MERGE_DEVICES, AUTO_MERGE_DEVICES, NEVER_MERGE_DEVICES, \
+    PackPlanner, RateLimitBudget
+
+
+def telemetry(values_count, ts=1):
+    return [{'ts': ts, 'values': {'key%i' % i: i for i in range(values_count)}}]
+
+
+class TestPackPlanner(TestCase):
+    def setUp(self):
+        self.devices_data = {'Device %i' % i: telemetry(5) for i in range(10)}
+
+    def test_count_datapoints(self):
+        self.assertEqual(PackPlanner.count_datapoints(telemetry(5) + telemetry(3, ts=2)), 8)
+        self.assertEqual(PackPlanner.count_datapoints([{'key1': 1, 'key2': 2}]), 2)
+        self.assertEqual(PackPlanner.count_datapoints({'attr1': 1, 'attr2': 2, 'attr3': 3}), 3)
+
+    def test_message_per_device_when_budget_is_enough(self):
+        budget = RateLimitBudget(messages=100, datapoints=1000)
+        messages = PackPlanner(8196, AUTO_MERGE_DEVICES).plan(self.devices_data, budget)
+
+        self.assertEqual(len(messages), 10)
+        self.assertTrue(all(len(message.devices_data) == 1 for message in messages))
+        self.assertEqual(budget.messages, 90)
+        self.assertEqual(budget.datapoints, 950)
+
+    def test_devices_merged_when_messages_are_bottleneck(self):
+        budget = RateLimitBudget(messages=3, datapoints=1000)
+        messages = PackPlanner(8196, AUTO_MERGE_DEVICES).plan(self.devices_data, budget)
+
+        self.assertEqual(len(messages), 1)
+        self.assertEqual(messages[0].devices_data, self.devices_data)
+        self.assertEqual(messages[0].datapoints, 50)
+        self.assertEqual(messages[0].size, len(dumps(self.devices_data)))
+        self.assertEqual(budget.messages, 2)
+
+    def test_merged_messages_fit_payload_size(self):
+        max_payload_size = len(dumps({'Device 0': telemetry(5)})) * 3 + 2
+        messages = PackPlanner(max_payload_size, ALWAYS_MERGE_DEVICES).plan(self.devices_data, RateLimitBudget())
+
+        self.assertEqual(len(messages), 4)
+        self.assertEqual(sum(len(message.devices_data) for message in messages), 10)
+        for message in messages:
+            self.assertEqual(message.size, len(dumps(message.devices_data)))
+            self.assertLessEqual(message.size, max_payload_size)
+        merged = {}
+        for message in messages:
+            merged.update(message.devices_data)
+        self.assertEqual(list(merged), list(self.devices_data))
+
+    def test_merged_messages_fit_datapoints_limit(self):
+        budget = RateLimitBudget(messages=1, datapoints=1000, max_datapoints_per_message=20)
+        messages = PackPlanner(8196, AUTO_MERGE_DEVICES).plan(self.devices_data, budget)
+
+        self.assertEqual([message.datapoints for message in messages], [20, 20, 10])
+
+    def test_oversized_device_data_is_planned_alone(self):
+        devices_data = {'Small 1': telemetry(1), 'Big': telemetry(500), 'Small 2': telemetry(1)}
+        messages = PackPlanner(1024, ALWAYS_MERGE_DEVICES).plan(devices_data, RateLimitBudget())
+
+        self.assertEqual([list(message.devices_data) for message in messages], [['Small 1', 'Small 2'], ['Big']])
+
+    def test_never_merge(self):
+        budget = RateLimitBudget(messages=1, datapoints=1000)
+        messages = PackPlanner(8196, NEVER_MERGE_DEVICES).plan(self.devices_data, budget)
+
+        self.assertEqual(len(messages), 10)
+        self.assertEqual(budget.messages, 0)
@@ -0,0 +1,132 @@
+#     Copyright 2026. ThingsBoard
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+from collections import Counter
+from logging import getLogger
+from os import path
+from threading import Event
+from unittest import TestCase
+
+from thingsboard_gateway.storage.file.file_event_storage import FileEventStorage
+from thingsboard_gateway.storage.memory.memory_event_storage import MemoryEventStorage
+from thingsboard_gateway.storage.priority.priority_event_storage import (ATTRIBUTES_LANE, BACKLOG_LANE, LIVE_LANE,
+                                                                         PriorityEventStorage)
+from thingsboard_gateway.storage.sqlite.sqlite_event_storage import SQLiteEventStorage
+
+LOG = getLogger("TEST")
+LOG.trace = LOG.debug
+
+
+class TestPriorityEventStorage(TestCase):
+    def setUp(self):
+        self.config = {
+            "type": "memory",
+            "read_records_count": 1,
+            "max_records_count": 1000,
+            "priority_lanes": {ATTRIBUTES_LANE: 1, LIVE_LANE: 3, BACKLOG_LANE: 1}
+        }
+        self.storage = PriorityEventStorage(self.config, LOG, Event(), MemoryEventStorage)
+
+    def fill_lanes(self, count):
+        for lane in (ATTRIBUTES_LANE, LIVE_LANE, BACKLOG_LANE):
+            for index in range(count):
+                self.assertTrue(self.storage.put(f"{lane}_{index}", lane))
+
+    def read_lanes_of_packs(self, count):
+        lanes = []
+        for _ in range(count):
+            event_pack = self.storage.read_ahead_event_pack()
+            if not event_pack:
+                break
+            lanes.append(event_pack[0].split("_")[0])
+        return lanes
+
+    def test_packs_are_shared_between_lanes_by_weights(self):
+        self.fill_lanes(100)
+
+        lanes = self.read_lanes_of_packs(50)
+
+        self.assertEqual(Counter(lanes), {LIVE_LANE: 30, ATTRIBUTES_LANE: 10, BACKLOG_LANE: 10})
+        self.assertEqual(lanes[:5].count(LIVE_LANE), 3)
+
+    def test_lanes_without_data_give_share_to_other_lanes(self):
+        for index in range(10):
+            self.storage.put(f"{BACKLOG_LANE}_{index}", BACKLOG_LANE)
+
+        self.assertListEqual(self.read_lanes_of_packs(20), [BACKLOG_LANE] * 10)
+
+    def test_events_of_lane_are_kept_in_order(self):
+        self.fill_lanes(5)
+
+        events = []
+        while True:
+            event_pack = self.storage.get_event_pack()
+            if not event_pack:
+                break
+            events.extend(event_pack)
+            self.storage.event_pack_processing_done()
+
+        self.assertEqual(len(events), 15)
+        for lane in (ATTRIBUTES_LANE, LIVE_LANE, BACKLOG_LANE):
+            self.assertListEqual([event for event in events if event.startswith(lane)],
+                                 [f"{lane}_{index}" for index in range(5)])
+        self.assertEqual(self.storage.len(), 0)
+
+    def test_reset_read_ahead_replays_not_processed_packs(self):
+        self.fill_lanes(2)
+        processed_event_pack = self.storage.get_event_pack()
+        for _ in range(3):
+            self.storage.read_ahead_event_pack()
+        self.storage.event_pack_processing_done()
+
+        self.storage.reset_read_ahead()
+
+        events = list(self.storage.get_event_pack())
+        while True:
+            event_pack = self.storage.read_ahead_event_pack()
+            if not event_pack:
+                break
+            events.extend(event_pack)
+
+        self.assertCountEqual(events + processed_event_pack,
+                              [f"{lane}_{index}" for lane in (ATTRIBUTES_LANE, LIVE_LANE, BACKLOG_LANE)
+                               for index in range(2)])
+
+    def test_unknown_lane_and_invalid_weight_are_skipped(self):
+        storage = PriorityEventStorage({**self.config, "priority_lanes": {"rpc": 10, LIVE_LANE: "high"}},
+                                       LOG, Event(), MemoryEventStorage)
+
+        self.assertListEqual(list(storage.lanes), [ATTRIBUTES_LANE, LIVE_LANE, BACKLOG_LANE])
+        self.assertEqual(storage.weights[LIVE_LANE], 4)
+
+
+class TestStorageLaneConfiguration(TestCase):
+    def test_file_storage_lane_is_kept_in_subfolder(self):
+        lane_config = FileEventStorage.get_lane_configuration({"data_folder_path": "./data/"}, LIVE_LANE)
+
+        self.assertEqual(lane_config["data_folder_path"], path.join("./data/", LIVE_LANE, ""))
+
+    def test_sqlite_storage_lane_is_kept_in_subfolder(self):
+        lane_config = SQLiteEventStorage.get_lane_configuration({"data_file_path": "./data/"}, ATTRIBUTES_LANE)
+
+        self.assertEqual(lane_config["data_file_path"], path.join("./data", ATTRIBUTES_LANE, ""))
+
+    def test_storage_without_lanes_ignores_lane(self):
+        storage = MemoryEventStorage({"type": "memory", "read_records_count": 10, "max_records_count": 10},
+                                     LOG, Event())
+
+        self.assertTrue(storage.put("attributes_0", ATTRIBUTES_LANE))
+        self.assertTrue(storage.put("live_0", LIVE_LANE))
+
+        self.assertListEqual(storage.get_event_pack(), ["attributes_0", "live_0"])
@@ -0,0 +1,175 @@
+#     Copyright 2026. ThingsBoard
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+from logging import getLogger
+from os import path
+from shutil import rmtree
+from threading import Event
+from time import sleep
+from unittest import TestCase
+
+from thingsboard_gateway.gateway.publish_window import PublishWindow
+from thingsboard_gateway.storage.memory.memory_event_storage import MemoryEventStorage
+from thingsboard_gateway.storage.sqlite.sqlite_event_storage import SQLiteEventStorage
+from thingsboard_gateway.storage.sqlite.storage_settings import StorageSettings
+
+LOG = getLogger("TEST")
+LOG.trace = LOG.debug
+
+
+class FakeMessageInfo:
+    def __init__(self):
+        self.published = False
+
+    def is_published(self):
+        return self.published
+
+    def wait_for_publish(self, timeout=None):
+        return self.published
+
+
+class FakePublishInfo:
+    TB_ERR_SUCCESS = 0
+
+    def __init__(self, rc=0):
+        self.message_info = FakeMessageInfo()
+        self.__rc = rc
+
+    def rc(self):
+        return self.__rc
+
+
+class TestPublishWindow(TestCase):
+    def test_packs_are_released_in_order(self):
+        window = PublishWindow(max_in_flight=3)
+        infos = [FakePublishInfo() for _ in range(3)]
+        for info in infos:
+            window.add([info], 10, telemetry_dp_count=5)
+
+        self.assertTrue(window.is_full())
+
+        infos[1].message_info.published = True
+        infos[2].message_info.published = True
+        self.assertListEqual(window.pop_acknowledged(), [])
+        self.assertEqual(len(window), 3)
+
+        infos[0].message_info.published = True
+        acknowledged_packs = window.pop_acknowledged()
+        self.assertListEqual([pack.position for pack in acknowledged_packs], [0, 1, 2])
+        self.assertEqual(window.acknowledged_events, 30)
+        self.assertEqual(len(window), 0)
+        self.assertFalse(window.failed)
+
+    def test_failed_pack_marks_window_as_failed(self):
+        window = PublishWindow(max_in_flight=2)
+        window.add([FakePublishInfo()], 1)
+        window.add([FakePublishInfo(rc=4)], 1)
+
+        self.assertListEqual(window.pop_acknowledged(), [])
+        self.assertTrue(window.failed)
+
+        window.clear()
+        self.assertEqual(len(window), 0)
+        self.assertFalse(window.failed)
+
+    def test_not_acknowledged_pack_times_out(self):
+        window = PublishWindow(max_in_flight=2, acknowledgement_timeout=0)
+        window.add([FakePublishInfo()], 1)
+        sleep(0.01)
+
+        window.pop_acknowledged()
+        self.assertTrue(window.failed)
+
+    def test_pack_without_acknowledgement_is_released_immediately(self):
+        window = PublishWindow(max_in_flight=2)
+        window.add([FakePublishInfo()], 7, wait_for_acknowledgement=False)
+
+        self.assertEqual(len(window.pop_acknowledged()), 1)
+        self.assertEqual(window.acknowledged_events, 7)
+
+
+class TestMemoryEventStorageReadAhead(TestCase):
+    def setUp(self):
+        self.storage = MemoryEventStorage({"type": "memory", "read_records_count": 2, "max_records_count": 100},
+                                          LOG, Event())
+        for value in range(7):
+            self.storage.put(str(value))
+
+    def test_read_ahead_returns_next_packs(self):
+        self.assertListEqual(self.storage.get_event_pack(), ["0", "1"])
+        self.assertListEqual(self.storage.read_ahead_event_pack(), ["2", "3"])
+        self.assertListEqual(self.storage.read_ahead_event_pack(), ["4", "5"])
+
+        self.storage.event_pack_processing_done()
+        self.assertListEqual(self.storage.get_event_pack(), ["2", "3"])
+        self.assertListEqual(self.storage.read_ahead_event_pack(), ["6"])
+        self.assertListEqual(self.storage.read_ahead_event_pack(), [])
+
+    def test_reset_read_ahead_replays_not_processed_packs(self):
+        self.storage.get_event_pack()
+        self.storage.read_ahead_event_pack()
+        self.storage.read_ahead_event_pack()
+
+        self.storage.reset_read_ahead()
+
+        self.assertListEqual(self.storage.get_event_pack(), ["0", "1"])
+        self.assertListEqual(self.storage.read_ahead_event_pack(), ["2", "3"])
+        self.assertListEqual(self.storage.read_ahead_event_pack(), ["4", "5"])
+        self.assertListEqual(self.storage.read_ahead_event_pack(), ["6"])
+
+
+class TestSQLiteEventStorageReadAhead(TestCase):
+    def setUp(self):
+        self.directory = "./read_ahead_data/"
+        self.stop_event = Event()
+        settings = StorageSettings({
+            "data_file_path": path.join(self.directory, "data.db"),
+            "messages_ttl_check_in_hours": 1,
+            "messages_ttl_in_days": 7,
+            "max_read_records_count": 10,
+        }, enable_validation=False)
+        self.storage = SQLiteEventStorage(settings, LOG, self.stop_event)
+        for value in range(35):
+            self.storage.put(str(value))
+        sleep(1)
+
+    def tearDown(self):
+        self.stop_event.set()
+        self.storage.stop()
+        sleep(1)
+        rmtree(self.directory, ignore_errors=True)
+
+    def test_read_ahead_packs_are_committed_in_order(self):
+        packs = [self.storage.get_event_pack()]
+        while True:
+            pack = self.storage.read_ahead_event_pack()
+            if not pack:
+                break
+            packs.append(pack)
+
+        self.assertListEqual([value for pack in packs for value in pack], [str(value) for value in range(35)])
+
+        for _ in packs:
+            self.storage.event_pack_processing_done()
+        self.assertListEqual(self.storage.get_event_pack(), [])
+
+    def test_reset_read_ahead_replays_not_processed_packs(self):
+        first_pack = self.storage.get_event_pack()
+        second_pack = self.storage.read_ahead_event_pack()
+        self.storage.event_pack_processing_done()
+
+        self.storage.reset_read_ahead()
+
+        self.assertListEqual(self.storage.get_event_pack(), second_pack)
+        self.assertListEqual(first_pack, [str(value) for value in range(10)])
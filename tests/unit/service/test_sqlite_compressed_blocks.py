@@ -0,0 +1,146 @@
+#     Copyright 2026. ThingsBoard
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+import sqlite3
+from logging import getLogger
+from os import makedirs, path
+from shutil import rmtree
+from threading import Event
+from time import sleep, time
+from unittest import TestCase
+
+from simplejson import dumps, loads
+
+from thingsboard_gateway.storage.sqlite.events_block_codec import EventsBlockCodec
+from thingsboard_gateway.storage.sqlite.sqlite_event_storage import SQLiteEventStorage
+from thingsboard_gateway.storage.sqlite.storage_settings import StorageSettings
+
+LOG = getLogger("TEST")
+LOG.trace = LOG.debug
+
+
+class TestEventsBlockCodec(TestCase):
+    def test_round_trip(self):
+        events = ['{"ts": 1, "values": {"temperature": 22.5}}', "", "événement"]
+        block = EventsBlockCodec().encode(events)
+
+        self.assertTrue(EventsBlockCodec.is_block(block))
+        self.assertEqual(EventsBlockCodec.decode(block), events)
+
+    def test_unknown_codec_falls_back_to_zlib(self):
+        codec = EventsBlockCodec("lz4")
+
+        self.assertEqual(codec.codec, "zlib")
+        self.assertEqual(EventsBlockCodec.decode(codec.encode(["1", "2"])), ["1", "2"])
+
+
+class TestSQLiteCompressedBlocks(TestCase):
+    def setUp(self):
+        self.directory = "./compressed_blocks_data/"
+        makedirs(self.directory, exist_ok=True)
+        self.stop_event = Event()
+        self.storage = None
+
+    def tearDown(self):
+        self.stop_event.set()
+        if self.storage is not None:
+            self.storage.stop()
+        sleep(1)
+        rmtree(self.directory, ignore_errors=True)
+
+    def create_storage(self, **config):
+        settings = StorageSettings({
+            "data_file_path": self.directory,
+            "max_read_records_count": 30,
+            "compression_enabled": True,
+            "compression_block_size": 10,
+            **config
+        }, enable_validation=False)
+        self.storage = SQLiteEventStorage(settings, LOG, self.stop_event)
+        return self.storage
+
+    def count_rows(self):
+        connection = sqlite3.connect(path.join(self.directory, "data.db"))
+        try:
+            return connection.execute("SELECT COUNT(*), SUM(events_count) FROM messages;").fetchone()
+        finally:
+            connection.close()
+
+    def test_events_are_written_as_blocks_and_read_in_order(self):
+        storage = self.create_storage()
+        for index in range(100):
+            storage.put(str(index))
+        sleep(1)
+
+        rows_count, events_count = self.count_rows()
+        self.assertLess(rows_count, 100)
+        self.assertEqual(events_count, 100)
+        self.assertEqual(storage.len(), 100)
+
+        received = []
+        while True:
+            event_pack = storage.get_event_pack()
+            if not event_pack:
+                break
+            self.assertLessEqual(len(event_pack), 30)
+            received.extend(event_pack)
+            storage.event_pack_processing_done()
+
+        self.assertEqual(received, [str(index) for index in range(100)])
+        self.assertEqual(storage.len(), 0)
+
+    def test_plain_records_are_read_together_with_blocks(self):
+        connection = sqlite3.connect(path.join(self.directory, "data.db"))
+        connection.execute("CREATE TABLE messages (id INTEGER PRIMARY KEY AUTOINCREMENT, "
+                           "timestamp INTEGER NOT NULL, message TEXT NOT NULL);")
+        connection.executemany("INSERT INTO messages (timestamp, message) VALUES (?, ?);",
+                               [(int(time() * 1000), "old_%i" % index) for index in range(3)])
+        connection.commit()
+        connection.close()
+
+        storage = self.create_storage()
+        for index in range(5):
+            storage.put("new_%i" % index)
+        sleep(1)
+
+        self.assertEqual(storage.len(), 8)
+        # batch prefetched by the database thread may contain only records written before
+        received = []
+        for _ in range(2):
+            received.extend(storage.get_event_pack())
+            storage.event_pack_processing_done()
+        self.assertEqual(received, ["old_0", "old_1", "old_2"] + ["new_%i" % index for index in range(5)])
+        self.assertEqual(storage.len(), 0)
+
+    def test_read_ahead_expands_blocks(self):
+        storage = self.create_storage()
+        for index in range(60):
+            storage.put(str(index))
+        sleep(1)
+
+        first_pack = storage.get_event_pack()
+        second_pack = storage.read_ahead_event_pack()
+
+        self.assertEqual(first_pack + second_pack, [str(index) for index in range(60)])
+
+    def test_blocks_are_compacted(self):
+        storage = self.create_storage(compaction_enabled=True, compaction_period_in_seconds=0,
+                                      compaction_batch_size=2)
+        for value in range(25):
+            storage.put(dumps({"deviceName": "Device A", "deviceType": "default",
+                               "attributes": {"counter": value}, "telemetry": []}))
+        sleep(3)
+
+        self.assertEqual(storage.len(), 1)
+        self.assertEqual([loads(event)["attributes"] for event in storage.get_event_pack()], [{"counter": 24}])
@@ -0,0 +1,100 @@
+#     Copyright 2026. ThingsBoard
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+import sqlite3
+from logging import getLogger
+from os import makedirs
+from queue import Queue
+from shutil import rmtree
+from threading import Event
+from unittest import TestCase
+
+from thingsboard_gateway.storage.sqlite.database import Database
+from thingsboard_gateway.storage.sqlite.storage_settings import StorageSettings
+
+LOG = getLogger("TEST")
+LOG.trace = LOG.debug
+
+
+class TestDatabaseReads(TestCase):
+    def setUp(self):
+        self.directory = "./database_reads_data/"
+        makedirs(self.directory, exist_ok=True)
+        self.settings = StorageSettings({
+            "data_file_path": self.directory + "data.db",
+            "max_read_records_count": 10,
+            "writing_batch_size": 10000,
+            "incremental_vacuum_pages": 50,
+        }, enable_validation=False)
+        self.queue = Queue()
+        self.database = Database(self.settings, self.queue, LOG, stopped=Event())
+
+    def tearDown(self):
+        self.database.close_db()
+        self.database.db.close()
+        rmtree(self.directory, ignore_errors=True)
+
+    def write(self, messages):
+        for message in messages:
+            self.queue.put(message)
+        while not self.queue.empty():
+            self.database.process()
+
+    def get_freelist_count(self):
+        return self.database.db.execute_read("PRAGMA freelist_count;").fetchone()[0]
+
+    def test_reading_continues_after_last_deleted_record(self):
+        self.write([str(index) for index in range(30)])
+
+        first_batch = self.database.read_data()
+        self.database.delete_data(first_batch[-1]["id"])
+        self.database.can_prepare_new_batch()
+        second_batch = self.database.read_data()
+
+        self.assertListEqual([row["message"] for row in first_batch], [str(index) for index in range(10)])
+        self.assertListEqual([row["message"] for row in second_batch], [str(index) for index in range(10, 20)])
+
+    def test_free_pages_are_reclaimed_in_steps(self):
+        self.write(["x" * 4096 for _ in range(200)])
+        self.database.delete_data(10 ** 9)
+        free_pages_count = self.get_freelist_count()
+        self.assertGreater(free_pages_count, 50)
+
+        self.assertEqual(self.database.reclaim_free_pages(), 50)
+        self.assertEqual(self.get_freelist_count(), free_pages_count - 50)
+
+        while self.database.reclaim_free_pages():
+            pass
+        self.assertEqual(self.get_freelist_count(), 0)
+
+    def test_empty_database_without_auto_vacuum_is_converted(self):
+        self.database.close_db()
+        self.database.db.close()
+        rmtree(self.directory, ignore_errors=True)
+        makedirs(self.directory, exist_ok=True)
+        connection = sqlite3.connect(self.settings.data_file_path)
+        connection.execute("PRAGMA journal_mode=WAL;")
+        connection.execute("CREATE TABLE messages (id INTEGER PRIMARY KEY AUTOINCREMENT, "
+                           "timestamp INTEGER NOT NULL, message TEXT NOT NULL);")
+        connection.commit()
+        connection.close()
+        self.database = Database(self.settings, self.queue, LOG, stopped=Event())
+
+        self.write(["x" * 4096 for _ in range(100)])
+        self.database.delete_data(10 ** 9)
+        while self.database.reclaim_free_pages():
+            pass
+
+        self.assertEqual(self.database.db.execute_read("PRAGMA auto_vacuum;").fetchone()[0], 2)
+        self.assertEqual(self.get_freelist_count(), 0)
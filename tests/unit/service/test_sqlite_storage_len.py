@@ -0,0 +1,107 @@
+#     Copyright 2026. ThingsBoard
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+import sqlite3
+from logging import getLogger
+from os import makedirs, path
+from shutil import rmtree
+from threading import Event
+from time import sleep, time
+from unittest import TestCase
+
+from thingsboard_gateway.storage.sqlite.sqlite_event_storage import SQLiteEventStorage
+from thingsboard_gateway.storage.sqlite.storage_settings import StorageSettings
+
+LOG = getLogger("TEST")
+LOG.trace = LOG.debug
+
+
+class TestSQLiteEventStorageLen(TestCase):
+    def setUp(self):
+        self.directory = "./len_data/"
+        makedirs(self.directory, exist_ok=True)
+        self.stop_event = Event()
+        self.storage = None
+
+    def tearDown(self):
+        self.stop_event.set()
+        if self.storage is not None:
+            self.storage.stop()
+        sleep(1)
+        rmtree(self.directory, ignore_errors=True)
+
+    def create_storage(self):
+        settings = StorageSettings({
+            "data_file_path": self.directory,
+            "max_read_records_count": 30,
+        }, enable_validation=False)
+        self.storage = SQLiteEventStorage(settings, LOG, self.stop_event)
+        return self.storage
+
+    def create_database_file(self, file_name, messages_count):
+        connection = sqlite3.connect(path.join(self.directory, file_name))
+        connection.execute("CREATE TABLE messages (id INTEGER PRIMARY KEY AUTOINCREMENT, "
+                           "timestamp INTEGER NOT NULL, message TEXT NOT NULL);")
+        connection.executemany("INSERT INTO messages (timestamp, message) VALUES (?, ?);",
+                               [(int(time() * 1000), str(index)) for index in range(messages_count)])
+        connection.commit()
+        connection.close()
+
+    @staticmethod
+    def count_rows(file_path):
+        connection = sqlite3.connect(file_path)
+        try:
+            return connection.execute("SELECT COUNT(*) FROM messages;").fetchone()[0]
+        finally:
+            connection.close()
+
+    def test_counter_follows_inserts_and_deletes(self):
+        storage = self.create_storage()
+        for index in range(100):
+            storage.put(str(index))
+        sleep(1)
+
+        self.assertEqual(storage.len(), 100)
+
+        storage.get_event_pack()
+        storage.event_pack_processing_done()
+
+        self.assertEqual(storage.len(), 70)
+        self.assertEqual(self.count_rows(path.join(self.directory, "data.db")), 70)
+
+    def test_database_without_metadata_is_counted_once(self):
+        self.create_database_file("data.db", 5)
+
+        storage = self.create_storage()
+
+        self.assertEqual(storage.len(), 5)
+        storage.put("new")
+        sleep(1)
+        self.assertEqual(storage.len(), 6)
+
+    def test_rotated_databases_counts_are_cached(self):
+        self.create_database_file("data_1000.db", 2)
+        self.create_database_file("data_2000.db", 3)
+        self.create_database_file("data_3000.db", 4)
+
+        storage = self.create_storage()
+
+        self.assertEqual(storage.len(), 9)
+
+        connection = sqlite3.connect(path.join(self.directory, "data_2000.db"))
+        connection.execute("DELETE FROM messages;")
+        connection.commit()
+        connection.close()
+
+        self.assertEqual(storage.len(), 9)
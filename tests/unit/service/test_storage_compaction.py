@@ -0,0 +1,145 @@
+#     Copyright 2026. ThingsBoard
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+from logging import getLogger
+from shutil import rmtree
+from threading import Event
+from time import sleep
+from unittest import TestCase
+
+from simplejson import dumps, loads
+
+from thingsboard_gateway.storage.event_compactor import EventCompactor
+from thingsboard_gateway.storage.file.file_event_storage import FileEventStorage
+from thingsboard_gateway.storage.sqlite.sqlite_event_storage import SQLiteEventStorage
+from thingsboard_gateway.storage.sqlite.storage_settings import StorageSettings
+
+LOG = getLogger("TEST")
+LOG.trace = LOG.debug
+
+
+def attributes_event(device_name, attributes):
+    return dumps({"deviceName": device_name, "deviceType": "default", "attributes": attributes, "telemetry": []})
+
+
+def telemetry_event(device_name, ts, values):
+    return dumps({"deviceName": device_name, "deviceType": "default", "attributes": {},
+                  "telemetry": [{"ts": ts, "values": values}]})
+
+
+def compact_events(compactor, events):
+    compactor.start_pass()
+    compacted_events = []
+    for event in reversed(events):
+        compacted_event, _ = compactor.compact(event)
+        if compacted_event is not None:
+            compacted_events.append(loads(compacted_event))
+    return list(reversed(compacted_events))
+
+
+class TestEventCompactor(TestCase):
+    def test_overwritten_attributes_are_removed(self):
+        events = [
+            attributes_event("Device A", {"state": "off", "firmware": "1.0"}),
+            attributes_event("Device B", {"state": "on"}),
+            attributes_event("Device A", {"state": "on"}),
+        ]
+
+        compacted_events = compact_events(EventCompactor(), events)
+
+        self.assertListEqual([event["attributes"] for event in compacted_events],
+                             [{"firmware": "1.0"}, {"state": "on"}, {"state": "on"}])
+
+    def test_latest_only_telemetry_keeps_newest_value(self):
+        events = [
+            telemetry_event("Device A", 1, {"temperature": 20, "status": "ok"}),
+            telemetry_event("Device A", 2, {"temperature": 21}),
+            telemetry_event("Device A", 3, {"status": "alarm", "temperature": 22}),
+        ]
+
+        compacted_events = compact_events(EventCompactor(["status"]), events)
+
+        self.assertListEqual([event["telemetry"] for event in compacted_events],
+                             [[{"ts": 1, "values": {"temperature": 20}}],
+                              [{"ts": 2, "values": {"temperature": 21}}],
+                              [{"ts": 3, "values": {"status": "alarm", "temperature": 22}}]])
+
+    def test_unchanged_and_invalid_events_are_kept(self):
+        compactor = EventCompactor()
+        event = telemetry_event("Device A", 1, {"temperature": 20})
+
+        self.assertEqual(compactor.compact(event), (event, False))
+        self.assertEqual(compactor.compact("not a json"), ("not a json", False))
+
+
+class TestSQLiteStorageCompaction(TestCase):
+    def setUp(self):
+        self.directory = "./compaction_data/"
+        self.stop_event = Event()
+        settings = StorageSettings({
+            "data_file_path": self.directory,
+            "max_read_records_count": 1000,
+            "compaction_enabled": True,
+            "compaction_period_in_seconds": 0,
+            "compaction_batch_size": 7,
+        }, enable_validation=False)
+        self.storage = SQLiteEventStorage(settings, LOG, self.stop_event)
+
+    def tearDown(self):
+        self.stop_event.set()
+        self.storage.stop()
+        sleep(1)
+        rmtree(self.directory, ignore_errors=True)
+
+    def test_overwritten_attribute_events_are_removed(self):
+        for value in range(50):
+            self.storage.put(attributes_event("Device A", {"counter": value}))
+        self.storage.put(telemetry_event("Device A", 1, {"temperature": 20}))
+        sleep(3)
+
+        events = [loads(event) for event in self.storage.get_event_pack()]
+
+        self.assertListEqual(events, [loads(attributes_event("Device A", {"counter": 49})),
+                                      loads(telemetry_event("Device A", 1, {"temperature": 20}))])
+
+
+class TestFileStorageCompaction(TestCase):
+    def setUp(self):
+        self.directory = "./compaction_files/"
+        self.storage = FileEventStorage({
+            "data_folder_path": self.directory,
+            "max_file_count": 100,
+            "max_records_per_file": 10,
+            "max_read_records_count": 1000,
+            "compaction_enabled": True,
+            "compaction_period_in_seconds": 0.1,
+        }, LOG, Event())
+
+    def tearDown(self):
+        self.storage.stop()
+        sleep(0.5)
+        rmtree(self.directory, ignore_errors=True)
+
+    def test_closed_data_files_are_compacted(self):
+        self.storage.get_event_pack()
+        for value in range(35):
+            self.storage.put(attributes_event("Device A", {"counter": value}))
+            sleep(0.002)
+        sleep(3)
+
+        events = [loads(event) for event in self.storage.get_event_pack()]
+
+        # the first file is opened by the reader and the last one by the writer, only the files between are compacted
+        self.assertListEqual([event["attributes"]["counter"] for event in events],
+                             list(range(10)) + [29] + list(range(30, 35)))
@@ -18,24 +18,45 @@ from bacpypes3.ipv4.app import NormalApplication, ForeignApplication
 from bacpypes3.local.device import DeviceObject
 from bacpypes3.pdu import Address, IPv4Address
 from bacpypes3.primitivedata import ObjectIdentifier, Unsigned
-from bacpypes3.basetypes import PropertyIdentifier, ReadAccessSpecification
+from bacpypes3.basetypes import PropertyIdentifier, PropertyReference, ReadAccessSpecification
 from bacpypes3.vendor import get_vendor_info
 from bacpypes3.constructeddata import SequenceOf, Array
 from bacpypes3.apdu import (
     APDU,
     AbortPDU,
+    AbortReason,
+    RejectReason,
     ComplexAckPDU,
     ErrorPDU,
     RejectPDU,
     SimpleAckPDU,
     ErrorRejectAbortNack,
     ReadPropertyMultipleRequest,
-    ReadPropertyMultipleACK
+    ReadPropertyMultipleACK,
+    SubscribeCOVRequest,
+    SubscribeCOVPropertyRequest,
+    ConfirmedCOVNotificationRequest,
+    UnconfirmedCOVNotificationRequest
 )
 from bacpypes3.comm import bind
+from bacpypes3.errors import ServicesError
 
 from thingsboard_gateway.connectors.bacnet.application_service_access_point import ApplicationServiceAccessPoint
+from thingsboard_gateway.connectors.bacnet.constants import (
+    RPM_APDU_HEADER_SIZE,
+    RPM_OBJECT_ENCODED_SIZE,
+    RPM_PROPERTY_REQUEST_ENCODED_SIZE,
+    RPM_PROPERTY_RESPONSE_ENCODED_SIZE,
+    RPM_DEFAULT_VALUE_ENCODED_SIZE,
+    RPM_ALL_PROPERTIES_ENCODED_SIZE,
+    RPM_VALUE_ENCODED_SIZES
+)
 from thingsboard_gateway.connectors.bacnet.entities.device_object_config import DeviceObjectConfig
+from thingsboard_gateway.tb_utility.tb_utility import TBUtility
+
+# device responds with these reasons if ReadPropertyMultiple request or response doesn't fit into APDU
+APDU_SIZE_ABORT_REASONS = (AbortReason.segmentationNotSupported, AbortReason.apduTooLong, AbortReason.bufferOverflow)
+APDU_SIZE_REJECT_REASONS = (RejectReason.bufferOverflow,)
 
 
 class Application(NormalApplication, ForeignApplication):
@@ -61,6 +82,7 @@ class Application(NormalApplication, ForeignApplication):
         self.__indication_callback = indication_callback
         self.__confirmation_queue = Queue(1_000_000)
         self.__is_foreign_application = is_foreign_application
+        self.__cov_subscriptions = set()
 
     def register_foreign_device(self, address: IPv4Address, ttl: int) -> None:
         if self.__is_foreign_application:
@@ -86,6 +108,20 @@ class Application(NormalApplication, ForeignApplication):
         await super().indication(apdu)
         self.__indication_callback(apdu)
 
+    async def do_ConfirmedCOVNotificationRequest(self, apdu: ConfirmedCOVNotificationRequest) -> None:
+        """
+        Acknowledges notifications for subscriptions made by the connector,
+        notification values are routed to the connector through the indication callback.
+        """
+
+        if (str(apdu.pduSource), apdu.subscriberProcessIdentifier) not in self.__cov_subscriptions:
+            raise ServicesError(errorCode="unknownSubscription")
+
+        await self.response(SimpleAckPDU(context=apdu))
+
+    async def do_UnconfirmedCOVNotificationRequest(self, apdu: UnconfirmedCOVNotificationRequest) -> None:
+        pass
+
     async def confirmation(self, apdu: APDU) -> None:
         self.__confirmation_queue.put_nowait(apdu)
 
@@ -203,9 +239,19 @@ class Application(NormalApplication, ForeignApplication):
             destination=Address(device.details.address),
         )
 
-        result = await self.__send_request_wrapper(self.request,
-                                                   err_msg=f"Failed to read {device.details.object_id} objects",
-                                                   apdu=request)
+        err_msg = f"Failed to read {device.details.object_id} objects"
+        try:
+            result = await self.request(request)
+        except (AbortPDU, RejectPDU) as e:
+            if self.is_apdu_size_error(e) and self.__can_split_objects(object_list):
+                self.__log.debug("%s: %s, retrying with split request", err_msg, e)
+                return await self.__read_multiple_objects_split(device, object_list)
+
+            self.__log_request_error(err_msg, e)
+            return []
+        except (ErrorRejectAbortNack, Exception) as e:
+            self.__log_request_error(err_msg, e)
+            return []
 
         if not isinstance(result, ReadPropertyMultipleACK):
             self.__log.error("Invalid response type: %s", type(result))
@@ -215,6 +261,43 @@ class Application(NormalApplication, ForeignApplication):
 
         return decoded_result
 
+    @staticmethod
+    def is_apdu_size_error(error):
+        if isinstance(error, AbortPDU):
+            return error.apduAbortRejectReason in APDU_SIZE_ABORT_REASONS
+
+        if isinstance(error, RejectPDU):
+            return error.apduAbortRejectReason in APDU_SIZE_REJECT_REASONS
+
+        return False
+
+    @staticmethod
+    def __can_split_objects(object_list):
+        properties = object_list[0]['propertyId']
+        return len(object_list) > 1 or (isinstance(properties, (set, list)) and len(properties) > 1)
+
+    async def __read_multiple_objects_split(self, device, object_list):
+        """
+        Reads objects with two requests, objects count that fits into device APDU is cached for next requests.
+        If request for a single object is too long, its properties are split.
+        """
+
+        if len(object_list) > 1:
+            middle = len(object_list) // 2
+            device.details.rpm_batch_limit = middle
+            parts = (object_list[:middle], object_list[middle:])
+        else:
+            properties = list(object_list[0]['propertyId'])
+            middle = len(properties) // 2
+            parts = ([{**object_list[0], 'propertyId': set(properties[:middle])}],
+                     [{**object_list[0], 'propertyId': set(properties[middle:])}])
+
+        results = []
+        for part in parts:
+            results.extend(await self.read_multiple_objects(device, part))
+
+        return results
+
     async def get_device_objects(self, device, with_all_properties=False, index_to_read=None):
         if device.details.is_segmentation_supported():
             object_list = await self.get_object_identifiers_with_segmentation(device)
@@ -234,9 +317,68 @@ class Application(NormalApplication, ForeignApplication):
     async def get_device_values(self, device):
         return ObjectIterator(self,
                               device,
-                              device.uplink_converter_config.objects_to_read,
+                              device.objects_to_poll,
                               self.read_multiple_objects)
 
+    async def subscribe_cov(self, address, object_id, process_id, lifetime, confirmed,
+                            property_id=None, cov_increment=None):
+        """
+        Sends SubscribeCOV request, or SubscribeCOVProperty request if property_id is specified.
+        Returns True if the device accepted the subscription.
+        """
+
+        if property_id is None:
+            request = SubscribeCOVRequest(
+                subscriberProcessIdentifier=process_id,
+                monitoredObjectIdentifier=object_id,
+                issueConfirmedNotifications=confirmed,
+                lifetime=lifetime,
+                destination=Address(address),
+            )
+        else:
+            request = SubscribeCOVPropertyRequest(
+                subscriberProcessIdentifier=process_id,
+                monitoredObjectIdentifier=object_id,
+                issueConfirmedNotifications=confirmed,
+                lifetime=lifetime,
+                monitoredPropertyIdentifier=PropertyReference(propertyIdentifier=property_id),
+                covIncrement=cov_increment,
+                destination=Address(address),
+            )
+
+        # device can send the first notification before subscription acknowledgement is processed
+        self.__cov_subscriptions.add((address, process_id))
+
+        result = await self.__send_request_wrapper(self.request,
+                                                   err_msg=f"Failed to subscribe COV for {object_id} on {address}",
+                                                   apdu=request)
+        if not isinstance(result, SimpleAckPDU):
+            self.__cov_subscriptions.discard((address, process_id))
+            return False
+
+        return True
+
+    async def unsubscribe_cov(self, address, object_id, process_id, property_id=None):
+        self.__cov_subscriptions.discard((address, process_id))
+
+        if property_id is None:
+            request = SubscribeCOVRequest(
+                subscriberProcessIdentifier=process_id,
+                monitoredObjectIdentifier=object_id,
+                destination=Address(address),
+            )
+        else:
+            request = SubscribeCOVPropertyRequest(
+                subscriberProcessIdentifier=process_id,
+                monitoredObjectIdentifier=object_id,
+                monitoredPropertyIdentifier=PropertyReference(propertyIdentifier=property_id),
+                destination=Address(address),
+            )
+
+        await self.__send_request_wrapper(self.request,
+                                          err_msg=f"Failed to cancel COV subscription for {object_id} on {address}",
+                                          apdu=request)
+
     def __get_read_access_specifications(self, object_list, vendor_id):
         read_access_specifications = []
         vendor_info = get_vendor_info(vendor_id)
@@ -317,17 +459,21 @@ class Application(NormalApplication, ForeignApplication):
 
         try:
             return await func(*args, **kwargs)
-        except AbortPDU as e:
+        except (ErrorRejectAbortNack, Exception) as e:
+            self.__log_request_error(err_msg, e)
+
+        return None
+
+    def __log_request_error(self, err_msg, e):
+        if isinstance(e, AbortPDU):
             self.__log.warning("(Request aborted) %s: %s", err_msg, e)
-        except ErrorRejectAbortNack as e:
+        elif isinstance(e, ErrorRejectAbortNack):
             self.__log.warning("(Request rejected) %s: %s", err_msg, e)
-        except ErrorPDU as e:
+        elif isinstance(e, ErrorPDU):
             self.__log.error("(Error in request) %s: %s", err_msg, e)
-        except Exception as e:
+        else:
             self.__log.error("(Unexpected error in request) %s: %s", err_msg, e)
 
-        return None
-
     def decode_tag_list(self, tag_list, vendor_id):
         vendor_info = get_vendor_info(vendor_id)
         result_list = []
@@ -353,7 +499,7 @@ class Application(NormalApplication, ForeignApplication):
                         )
                         continue
 
-                    property_type = object_class.get_property_type(property_identifier)
+                    property_type = self.__get_property_type(object_class, property_identifier, property_array_index)
                     if property_type is None:
                         self.__log.warning("%r not supported", property_identifier)
 
@@ -367,14 +513,6 @@ class Application(NormalApplication, ForeignApplication):
                         )
                         continue
 
-                    if issubclass(property_type, Array):
-                        if property_array_index is None:
-                            pass
-                        elif property_array_index == 0:
-                            property_type = Unsigned
-                        else:
-                            property_type = property_type._subtype
-
                     property_value = read_result.propertyValue.cast_out(property_type)
 
                     result_list.append(
@@ -391,13 +529,68 @@ class Application(NormalApplication, ForeignApplication):
 
         return result_list
 
+    def decode_property_values(self, object_identifier, list_of_values, vendor_id):
+        """
+        Decodes COV notification values to the same format as decode_tag_list.
+        """
+
+        vendor_info = get_vendor_info(vendor_id)
+        object_identifier = vendor_info.object_identifier(object_identifier)
+        object_class = vendor_info.get_object_class(object_identifier[0])
+        if object_class is None:
+            self.__log.warning("unknown object type: %s", object_identifier)
+            return []
+
+        result_list = []
+        for property_value in list_of_values:
+            try:
+                property_identifier = vendor_info.property_identifier(property_value.propertyIdentifier)
+                property_array_index = property_value.propertyArrayIndex
+
+                property_type = self.__get_property_type(object_class, property_identifier, property_array_index)
+                if property_type is None:
+                    self.__log.warning("%r not supported", property_identifier)
+                    continue
+
+                result_list.append(
+                    (
+                        object_identifier,
+                        property_identifier,
+                        property_array_index,
+                        property_value.value.cast_out(property_type),
+                    )
+                )
+            except Exception as e:
+                self.__log.error('failed to decode COV notification value: %s', e)
+                continue
+
+        return result_list
+
+    @staticmethod
+    def __get_property_type(object_class, property_identifier, property_array_index):
+        property_type = object_class.get_property_type(property_identifier)
+
+        if property_type is not None and issubclass(property_type, Array):
+            if property_array_index is None:
+                pass
+            elif property_array_index == 0:
+                property_type = Unsigned
+            else:
+                property_type = property_type._subtype
+
+        return property_type
+
 
 class ObjectIterator:
+    """
+    Splits objects to ReadPropertyMultiple requests, each request is packed with as many objects as fit
+    into device APDU limits according to the estimated encoded size of requested properties.
+    """
+
     def __init__(self, app, device, object_list, func):
         self.app = app
         self.items = object_list
         self.device = device
-        self.limit = self.get_limit()
         self.func = func
         self.index = 0
 
@@ -405,7 +598,7 @@ class ObjectIterator:
         if self.index >= len(self.items):
             return [], {}, True
 
-        end_index = self.index + self.limit
+        end_index = self.get_batch_end_index()
         result = self.items[self.index:end_index]
         self.index = end_index
         finished = self.index >= len(self.items)
@@ -414,16 +607,45 @@ class ObjectIterator:
 
         return r, result, finished
 
-    def get_limit(self):
-        max_prop_count = 0
+    def get_batch_end_index(self):
+        max_request_size = self.device.details.get_max_request_size()
+        max_response_size = self.device.details.get_max_response_size()
+        limit = self.device.details.rpm_batch_limit or len(self.items)
+
+        request_size = response_size = RPM_APDU_HEADER_SIZE
+        end_index = self.index
+        while end_index < len(self.items) and end_index - self.index < limit:
+            item_request_size, item_response_size = self.estimate_encoded_size(self.items[end_index])
+            request_size += item_request_size
+            response_size += item_response_size
 
-        for item in self.items:
-            cur_prop_count = len(item['propertyId']) if isinstance(item['propertyId'], set) else 1
-            if item['propertyId'] == 'all':
-                max_prop_count = 6
+            # at least one object is always read, device will abort the request if it doesn't fit
+            if end_index > self.index and (request_size > max_request_size or response_size > max_response_size):
                 break
 
-            if cur_prop_count > max_prop_count:
-                max_prop_count = cur_prop_count
+            end_index += 1
+
+        return end_index
+
+    @staticmethod
+    def estimate_encoded_size(item):
+        """
+        Returns estimated encoded size of the object in ReadPropertyMultiple request and response.
+        """
+
+        properties = item['propertyId']
+        if not isinstance(properties, (set, list)):
+            properties = (properties,)
+
+        request_size = response_size = RPM_OBJECT_ENCODED_SIZE
+        for property_id in properties:
+            property_id = TBUtility.kebab_case_to_camel_case(str(property_id))
+            request_size += RPM_PROPERTY_REQUEST_ENCODED_SIZE
+
+            if property_id in ('all', 'required', 'optional'):
+                response_size += RPM_ALL_PROPERTIES_ENCODED_SIZE
+            else:
+                response_size += (RPM_PROPERTY_RESPONSE_ENCODED_SIZE
+                                  + RPM_VALUE_ENCODED_SIZES.get(property_id, RPM_DEFAULT_VALUE_ENCODED_SIZE))
 
-        return int(self.device.details.get_max_apdu_count() / max_prop_count) if max_prop_count > 0 else 1
+        return request_size, response_size
@@ -49,12 +49,14 @@ except ImportError:
     TBUtility.install_package("bacpypes3")
     from bacpypes3.apdu import ErrorRejectAbortNack
 
+from bacpypes3.apdu import ConfirmedCOVNotificationRequest, UnconfirmedCOVNotificationRequest
 from bacpypes3.pdu import Address, IPv4Address
 from bacpypes3.primitivedata import Null, Real
 from bacpypes3.basetypes import DailySchedule, TimeValue, DeviceObjectPropertyReference, ObjectPropertyReference, PropertyIdentifier, ObjectIdentifier
 from thingsboard_gateway.connectors.bacnet.device import Device, Devices
 from thingsboard_gateway.connectors.bacnet.entities.device_object_config import DeviceObjectConfig
 from thingsboard_gateway.connectors.bacnet.application import Application
+from thingsboard_gateway.connectors.bacnet.cov_manager import COVManager
 from thingsboard_gateway.connectors.bacnet.backward_compatibility_adapter import BackwardCompatibilityAdapter
 
 if TYPE_CHECKING:
@@ -100,6 +102,7 @@ class AsyncBACnetConnector(Thread, Connector):
         self.__connected = False
 
         self.__application = None
+        self.__cov_manager = None
 
         try:
             self.loop = asyncio.new_event_loop()
@@ -231,8 +234,11 @@ class AsyncBACnetConnector(Thread, Connector):
             self.__application = Application(DeviceObjectConfig(
                 self.__config['application']), self.__handle_indication, self.__log)
 
+        self.__cov_manager = COVManager(self.__application, self.__data_to_convert_queue, self.__log)
+
         await self.__discover_devices()
         await asyncio.gather(self.__main_loop(),
+                             self.__cov_manager.run(),
                              self.__rescan_devices(),
                              self.__convert_data(),
                              self.__save_data(),
@@ -307,6 +313,10 @@ class AsyncBACnetConnector(Thread, Connector):
             try:
                 apdu = self.__indication_queue.get_nowait()
 
+                if isinstance(apdu, (ConfirmedCOVNotificationRequest, UnconfirmedCOVNotificationRequest)):
+                    self.__cov_manager.handle_notification(apdu)
+                    continue
+
                 device_address = apdu.pduSource.__str__()
                 self.__log.info('Received APDU, from %s, trying to find device...', device_address)
 
@@ -360,6 +370,8 @@ class AsyncBACnetConnector(Thread, Connector):
         await self.__check_and_update_device_config(device)
         self.__log.debug('Checked device %s configuration.', device.device_info.device_name)
 
+        await self.__cov_manager.subscribe_device(device)
+
         self.loop.create_task(device.rescan())
 
     async def __set_additional_device_info_to_apdu(self, apdu, device_config):
@@ -708,6 +720,10 @@ class AsyncBACnetConnector(Thread, Connector):
 
         self.__devices.stop_all()
 
+        if self.__cov_manager:
+            self.__cov_manager.stop()
+            self.__cancel_cov_subscriptions()
+
         if self.__application:
             self.__application.close()
 
@@ -718,6 +734,12 @@ class AsyncBACnetConnector(Thread, Connector):
         self.__log.info('BACnet connector stopped')
         self.__log.stop()
 
+    def __cancel_cov_subscriptions(self):
+        try:
+            asyncio.run_coroutine_threadsafe(self.__cov_manager.unsubscribe_all(), self.loop).result(timeout=5)
+        except Exception as e:
+            self.__log.debug('Failed to cancel COV subscriptions: %s', e)
+
     def __check_is_alive(self):
         start_time = monotonic()
 
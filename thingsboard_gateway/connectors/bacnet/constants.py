@@ -21,6 +21,31 @@ DEFAULT_POLL_PERIOD = 10000
 EDE_FILE_PATH_PARAMETER = 'edeFilePath'
 EDE_CONFIG_PARAMETER = 'edeConfig'
 ALLOWED_APDU = (50, 128, 206, 480, 1024, 1476)
+
+# Estimated encoded sizes (in bytes) used to pack ReadPropertyMultiple requests into device APDU limits
+RPM_APDU_HEADER_SIZE = 5
+RPM_OBJECT_ENCODED_SIZE = 7
+RPM_PROPERTY_REQUEST_ENCODED_SIZE = 2
+RPM_PROPERTY_RESPONSE_ENCODED_SIZE = 4
+RPM_DEFAULT_VALUE_ENCODED_SIZE = 8
+RPM_ALL_PROPERTIES_ENCODED_SIZE = 480
+RPM_VALUE_ENCODED_SIZES = {
+    'presentValue': 6,
+    'statusFlags': 4,
+    'eventState': 2,
+    'outOfService': 1,
+    'reliability': 2,
+    'units': 2,
+    'objectIdentifier': 5,
+    'objectType': 2,
+    'objectName': 64,
+    'description': 64,
+    'deviceType': 64,
+    'stateText': 128,
+    'priorityArray': 96,
+    'weeklySchedule': 256,
+    'listOfObjectPropertyReferences': 128,
+}
 SUPPORTED_OBJECTS_TYPES = {
     '0': 'analogInput',
     '1': 'analogOutput',
@@ -0,0 +1,190 @@
+#     Copyright 2026. ThingsBoard
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+from asyncio import sleep
+from time import monotonic
+
+from thingsboard_gateway.connectors.bacnet.device import Device
+from thingsboard_gateway.connectors.bacnet.entities.cov_subscription import COVSubscription
+from thingsboard_gateway.tb_utility.tb_utility import TBUtility
+
+
+class COVManager:
+    """
+    Keeps SubscribeCOV/SubscribeCOVProperty subscriptions for objects with "cov" option enabled.
+    Objects served by COV are excluded from device polling, if device rejects subscription or
+    subscription renewal fails, objects are returned to polling.
+    """
+
+    DEFAULT_LIFETIME = 300
+    # properties reported by SubscribeCOV notifications for standard objects
+    COV_PROPERTIES = ('presentValue', 'statusFlags')
+    MAX_PROCESS_ID = (1 << 22) - 1
+
+    def __init__(self, application, data_to_convert_queue, logger):
+        self.__application = application
+        self.__data_to_convert_queue = data_to_convert_queue
+        self.__log = logger
+        self.__stopped = False
+
+        self.__subscriptions = {}
+        self.__next_process_id = 1
+
+    @property
+    def subscriptions(self):
+        return list(self.__subscriptions.values())
+
+    def stop(self):
+        self.__stopped = True
+
+    @staticmethod
+    def get_cov_config(item_config):
+        cov_config = item_config.get('cov', False)
+
+        if isinstance(cov_config, bool):
+            cov_config = {'enabled': cov_config}
+        elif not isinstance(cov_config, dict):
+            return None
+
+        return cov_config if cov_config.get('enabled', True) else None
+
+    @staticmethod
+    def is_cov_supported_item(item_config):
+        property_id = item_config.get('propertyId')
+        return (isinstance(property_id, str) and property_id not in ('*', 'all')
+                and isinstance(item_config.get('objectId'), int)
+                and '${' not in item_config['key'])
+
+    async def subscribe_device(self, device):
+        for object_id, property_id, items in self.__group_items(device):
+            cov_config = self.get_cov_config(items[0])
+            subscription = COVSubscription(self.__get_next_process_id(device.details.address),
+                                           device,
+                                           object_id,
+                                           items,
+                                           int(cov_config.get('lifetime', self.DEFAULT_LIFETIME)),
+                                           bool(cov_config.get('confirmed', False)),
+                                           property_id=property_id,
+                                           cov_increment=cov_config.get('covIncrement'))
+
+            if await self.__subscribe(subscription):
+                device.add_cov_served_items(items)
+                self.__subscriptions[(subscription.address, subscription.process_id)] = subscription
+                self.__log.info('%s subscribed to COV notifications', subscription)
+            else:
+                self.__log.warning('%s rejected, %s will be polled', subscription, object_id)
+
+    def __group_items(self, device):
+        """
+        Groups COV items by object and property. Standard COV properties (presentValue, statusFlags)
+        of the object share single SubscribeCOV, other properties are monitored with SubscribeCOVProperty.
+        """
+
+        items_by_object = {}
+        for item_config in device.uplink_converter_config.objects_to_subscribe:
+            if self.get_cov_config(item_config) is None:
+                continue
+
+            if not self.is_cov_supported_item(item_config):
+                self.__log.warning('COV is not supported for %s config item %s, it will be polled',
+                                   device, item_config['key'])
+                continue
+
+            items_by_object.setdefault(Device.get_object_id(item_config), []).append(item_config)
+
+        groups = []
+        for object_id, items in items_by_object.items():
+            items_by_property = {}
+            for item_config in items:
+                property_id = TBUtility.kebab_case_to_camel_case(item_config['propertyId'])
+                items_by_property.setdefault(None if property_id in self.COV_PROPERTIES else property_id,
+                                             []).append(item_config)
+
+            for property_id, property_items in items_by_property.items():
+                groups.append((object_id, property_id, property_items))
+
+        return groups
+
+    def __get_next_process_id(self, address):
+        while True:
+            process_id = self.__next_process_id
+            self.__next_process_id = self.__next_process_id % self.MAX_PROCESS_ID + 1
+            if (address, process_id) not in self.__subscriptions:
+                return process_id
+
+    async def __subscribe(self, subscription):
+        result = await self.__application.subscribe_cov(subscription.address,
+                                                        subscription.object_id,
+                                                        subscription.process_id,
+                                                        subscription.lifetime,
+                                                        subscription.confirmed,
+                                                        property_id=subscription.property_id,
+                                                        cov_increment=subscription.cov_increment)
+        if result:
+            subscription.schedule_renewal()
+
+        return result
+
+    def handle_notification(self, apdu):
+        """
+        Routes COV notification values to the conversion queue.
+        """
+
+        subscription = self.__subscriptions.get((str(apdu.pduSource), apdu.subscriberProcessIdentifier))
+        if subscription is None:
+            self.__log.debug('Received COV notification for unknown subscription %s from %s',
+                             apdu.subscriberProcessIdentifier, apdu.pduSource)
+            return False
+
+        results = self.__application.decode_property_values(apdu.monitoredObjectIdentifier,
+                                                             apdu.listOfValues,
+                                                             subscription.device.details.vendor_id)
+        if len(results) > 0:
+            self.__log.trace('%s COV notification values: %s', subscription, results)
+            self.__data_to_convert_queue.put_nowait((subscription.device, subscription.items, results))
+
+        return True
+
+    async def run(self):
+        while not self.__stopped:
+            try:
+                await self.renew_subscriptions()
+            except Exception as e:
+                self.__log.error('Error renewing COV subscriptions: %s', e)
+
+            await sleep(1)
+
+    async def renew_subscriptions(self):
+        current_time = monotonic()
+
+        for key, subscription in list(self.__subscriptions.items()):
+            if subscription.device.stopped:
+                self.__subscriptions.pop(key, None)
+                continue
+
+            if not subscription.need_to_renew(current_time):
+                continue
+
+            if not await self.__subscribe(subscription):
+                self.__log.warning('Failed to renew %s, falling back to polling', subscription)
+                self.__subscriptions.pop(key, None)
+                subscription.device.remove_cov_served_items(subscription.items)
+
+    async def unsubscribe_all(self):
+        for key, subscription in list(self.__subscriptions.items()):
+            self.__subscriptions.pop(key, None)
+            await self.__application.unsubscribe_cov(subscription.address,
+                                                     subscription.object_id,
+                                                     subscription.process_id,
+                                                     property_id=subscription.property_id)
@@ -66,6 +66,7 @@ class Device:
         self.details = BACnetDeviceDetails(i_am_request)
         self.device_info = DeviceInfo(self.__config.get('deviceInfo', {}), self.details)
         self.uplink_converter_config = UplinkConverterConfig(self.__config, self.device_info, self.details)
+        self.__cov_served_items = set()
 
         self.name = self.device_info.device_name
 
@@ -109,6 +110,28 @@ class Device:
         self.uplink_converter_config = UplinkConverterConfig(new_config, self.device_info, self.details)
         self.uplink_converter = self.__load_uplink_converter()
 
+    @property
+    def objects_to_poll(self):
+        """
+        Objects to read with ReadPropertyMultiple, objects with active COV subscription are excluded.
+        """
+
+        if not self.__cov_served_items:
+            return self.uplink_converter_config.objects_to_read
+
+        return [item for item in self.uplink_converter_config.objects_to_read
+                if self.get_item_key(item) not in self.__cov_served_items]
+
+    def add_cov_served_items(self, items):
+        self.__cov_served_items.update(self.get_item_key(item) for item in items)
+
+    def remove_cov_served_items(self, items):
+        self.__cov_served_items.difference_update(self.get_item_key(item) for item in items)
+
+    @staticmethod
+    def get_item_key(item_config):
+        return item_config['type'], item_config['key'], item_config['objectType'], str(item_config['objectId'])
+
     def __get_shared_attributes_keys(self):
         result = []
 
@@ -135,7 +158,7 @@ class Device:
         self.__stopped = True
 
     async def run(self):
-        if len(self.uplink_converter_config.objects_to_read) > 0:
+        if len(self.objects_to_poll) > 0:
             self.__request_process_queue.put_nowait(self)
 
         next_poll_time = monotonic() + self.__poll_period
@@ -143,7 +166,7 @@ class Device:
         while not self.__stopped:
             current_time = monotonic()
             if current_time >= next_poll_time:
-                if len(self.uplink_converter_config.objects_to_read) > 0:
+                if len(self.objects_to_poll) > 0:
                     self.__request_process_queue.put_nowait(self)
 
                 next_poll_time = current_time + self.__poll_period
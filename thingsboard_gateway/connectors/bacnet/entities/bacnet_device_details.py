@@ -15,7 +15,8 @@
 from bacpypes3.apdu import IAmRequest
 from bacpypes3.basetypes import Segmentation
 
-MAX_REQUEST_SIZE = 26
+# default maxSegmentsAccepted of the gateway local device object
+MAX_SEGMENTS_ACCEPTED = 16
 
 
 class BACnetDeviceDetails:
@@ -35,6 +36,7 @@ class BACnetDeviceDetails:
 
         self.__objects_len = 0
         self.__failed_to_read_indexes = set()
+        self.__rpm_batch_limit = None
 
     def __str__(self):
         return (f"DeviceDetails(address={self.address}, objectIdentifier={self.__object_identifier}, "
@@ -93,6 +95,20 @@ class BACnetDeviceDetails:
     def objects_len(self, value):
         self.__objects_len = value
 
+    @property
+    def rpm_batch_limit(self):
+        """
+        Max objects count in ReadPropertyMultiple request learned from device aborts, None if not limited yet.
+        """
+
+        return self.__rpm_batch_limit
+
+    @rpm_batch_limit.setter
+    def rpm_batch_limit(self, value: int):
+        value = max(1, value)
+        if self.__rpm_batch_limit is None or value < self.__rpm_batch_limit:
+            self.__rpm_batch_limit = value
+
     def sucess_read_for(self, value: int):
         if value in self.__failed_to_read_indexes:
             self.__failed_to_read_indexes.discard(value)
@@ -100,5 +116,17 @@ class BACnetDeviceDetails:
     def is_segmentation_supported(self):
         return self.__segmentation in (Segmentation.segmentedBoth, Segmentation.segmentedTransmit)
 
-    def get_max_apdu_count(self) -> int:
-        return int(self.__max_apdu_length / MAX_REQUEST_SIZE)
+    def is_segmented_receive_supported(self):
+        return self.__segmentation in (Segmentation.segmentedBoth, Segmentation.segmentedReceive)
+
+    def get_max_request_size(self) -> int:
+        if self.is_segmented_receive_supported():
+            return self.__max_apdu_length * MAX_SEGMENTS_ACCEPTED
+
+        return self.__max_apdu_length
+
+    def get_max_response_size(self) -> int:
+        if self.is_segmentation_supported():
+            return self.__max_apdu_length * MAX_SEGMENTS_ACCEPTED
+
+        return self.__max_apdu_length
@@ -0,0 +1,47 @@
+#     Copyright 2026. ThingsBoard
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+from time import monotonic
+
+# subscription is renewed after this part of its lifetime has passed
+RENEW_LIFETIME_RATIO = 0.75
+
+
+class COVSubscription:
+    def __init__(self, process_id, device, object_id, items, lifetime, confirmed, property_id=None,
+                 cov_increment=None):
+        self.process_id = process_id
+        self.device = device
+        self.object_id = object_id
+        self.items = items
+        self.lifetime = lifetime
+        self.confirmed = confirmed
+        self.property_id = property_id
+        self.cov_increment = cov_increment
+        self.renew_at = None
+
+    def __str__(self):
+        return (f"COVSubscription(device={self.device.name}, objectId={self.object_id}, "
+                f"propertyId={self.property_id}, processId={self.process_id})")
+
+    @property
+    def address(self):
+        return self.device.details.address
+
+    def schedule_renewal(self):
+        # lifetime 0 means indefinite subscription, which doesn't need renewal
+        self.renew_at = monotonic() + self.lifetime * RENEW_LIFETIME_RATIO if self.lifetime > 0 else None
+
+    def need_to_renew(self, current_time):
+        return self.renew_at is not None and current_time >= self.renew_at
@@ -20,6 +20,7 @@ class UplinkConverterConfig:
         self.device_name = device_info.device_name
         self.device_type = device_info.device_type
         self.__objects_to_read = self.__get_objects_to_read()
+        self.__objects_to_subscribe = [item for item in self.__objects_to_read if item.get('cov')]
         self.report_strategy = self.__config.get('reportStrategy', {})
 
     def __get_objects_to_read(self):
@@ -47,3 +48,7 @@ class UplinkConverterConfig:
     @property
     def objects_to_read(self):
         return self.__objects_to_read
+
+    @property
+    def objects_to_subscribe(self):
+        return self.__objects_to_subscribe
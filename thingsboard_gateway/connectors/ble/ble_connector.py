@@ -14,7 +14,8 @@
 
 from json import dumps
 import asyncio
-from queue import Queue
+from functools import partial
+from queue import Empty, Queue
 from random import choice
 from string import ascii_lowercase
 from threading import Thread
@@ -36,7 +37,10 @@ except ImportError:
     from bleak import BleakScanner
 
 from thingsboard_gateway.connectors.connector import Connector
+from thingsboard_gateway.connectors.ble.connection_pool import (ConnectionPool, DEFAULT_MAX_CONNECTIONS,
+                                                                 DEFAULT_MAX_RECONNECT_DELAY)
 from thingsboard_gateway.connectors.ble.device import Device
+from thingsboard_gateway.connectors.ble.read_scheduler import ReadScheduler
 
 
 class BLEConnector(Connector, Thread):
@@ -56,6 +60,11 @@ class BLEConnector(Connector, Thread):
         self.__notify_task = None
         self.__scanner_poll_period = self.__config.get('scannerPollPeriod', 5000) / 1000
         self.__scanner_timeout = self.__config.get("scannerTimeout", 10000) / 1000
+        self.__event_driven_mode = self.__config.get('eventDrivenMode', False)
+        self.__max_connections = self.__config.get('maxConnections', DEFAULT_MAX_CONNECTIONS)
+        self.__max_reconnect_delay = self.__config.get('maxReconnectDelay', DEFAULT_MAX_RECONNECT_DELAY * 1000) / 1000
+        self.__continuous_scanner = None
+        self.__read_scheduler = None
         self.name = self.__config.get("name", 'BLE Connector ' + ''.join(choice(ascii_lowercase) for _ in range(5)))
         self.__scanned_devices = {}
         self.__devices_tasks = []
@@ -105,6 +114,38 @@ class BLEConnector(Connector, Thread):
             sleep_time = max(0, poll_period - elapsed_time)
             await asyncio.sleep(sleep_time)
 
+    async def __start_continuous_scanner(self):
+        """
+        Scanner is started once and updates advertisement data of devices as soon as it is received,
+        so devices are not rediscovered every scanner poll period.
+        """
+        self.__continuous_scanner = BleakScanner(
+            detection_callback=self.__on_advertisement,
+            scanning_mode='passive' if self.__config.get('passiveScanMode', True) else 'active')
+        await self.__continuous_scanner.start()
+        self.__log.info("Continuous scanning started")
+
+    def __on_advertisement(self, device, advertisement_data):
+        self.__scanned_devices[device.address] = (device, advertisement_data)
+
+    def __create_event_driven_tasks(self):
+        connection_pool = ConnectionPool(self.__log, self.__max_connections, self.__max_reconnect_delay)
+        self.__read_scheduler = ReadScheduler(self.__log)
+
+        try:
+            self.__loop.run_until_complete(self.__start_continuous_scanner())
+        except Exception as e:
+            self.__log.error("Failed to start continuous scanning: %s", str(e))
+            self.__log.debug("An error occurred %s", e, exc_info=True)
+
+        tasks = [self.__loop.create_task(self.__read_scheduler.run())]
+        tasks.extend(
+            self.__loop.create_task(device.run_event_driven(connection_pool, self.__read_scheduler,
+                                                            scanned_devices_callback=self.get_scanned_devices_callback))
+            for device in self.__devices_from_config
+        )
+        return tasks
+
     async def __notify_user_on_scan_complete(self):
         while not self.__first_scan_ready_event.is_set():
             self.__log.info(
@@ -148,6 +189,13 @@ class BLEConnector(Connector, Thread):
     def run(self):
         self.__connected = True
 
+        if self.__event_driven_mode:
+            self.__devices_tasks = self.__create_event_driven_tasks()
+            Thread(target=self.__process_data, daemon=True,
+                   name='BLE Process Data Thread').start()
+            self.__loop.run_forever()
+            return
+
         if self.__notify_task is None:
             self.__notify_task = self.__loop.create_task(self.__notify_user_on_scan_complete())
 
@@ -188,6 +236,12 @@ class BLEConnector(Connector, Thread):
         self.__log.info("Connector %s stopped", self.get_name())
 
     async def __disconnect_all_devices(self):
+        if self.__continuous_scanner is not None:
+            try:
+                await self.__continuous_scanner.stop()
+            except Exception as e:
+                self.__log.debug("An error occurred while stopping scanner: %s", e)
+
         for device in self.__devices_from_config:
             try:
                 await device.client.disconnect()
@@ -200,6 +254,8 @@ class BLEConnector(Connector, Thread):
         self.__stopped = True
         for device in self.__devices_from_config:
             device.stop()
+        if self.__read_scheduler is not None:
+            self.__loop.call_soon_threadsafe(self.__read_scheduler.stop)
         for task in self.__devices_tasks:
             self.__loop.call_soon_threadsafe(task.cancel)
         asyncio.run_coroutine_threadsafe(
@@ -226,8 +282,11 @@ class BLEConnector(Connector, Thread):
 
     def __process_data(self):
         while not self.__stopped:
-            if not self.__process_data_queue.empty():
-                device_config = self.__process_data_queue.get()
+            try:
+                device_config = self.__process_data_queue.get(timeout=.2)
+            except Empty:
+                continue
+            else:
                 data = device_config.pop('data')
                 config = device_config.pop('config')
                 converter = device_config.pop('converter')
@@ -249,8 +308,6 @@ class BLEConnector(Connector, Thread):
                         self.__log.info('Data to ThingsBoard %s', converted_data)
                 except Exception as e:
                     self.__log.exception(e)
-            else:
-                sleep(.2)
 
     @CollectAllReceivedBytesStatistics(start_stat_type='allReceivedBytesFromTB')
     def on_attributes_update(self, content):
@@ -371,7 +428,11 @@ class BLEConnector(Connector, Thread):
             result = None
 
             if rpc_method.upper() == 'READ':
-                byte_result = await device.read_char(rpc_config['characteristicUUID'])
+                if self.__read_scheduler is not None:
+                    byte_result = await self.__read_scheduler.submit(
+                        partial(device.read_char, rpc_config['characteristicUUID']))
+                else:
+                    byte_result = await device.read_char(rpc_config['characteristicUUID'])
                 result = byte_result.decode('utf-8') if byte_result else None
 
             elif rpc_method.upper() == 'WRITE':
@@ -0,0 +1,83 @@
+#     Copyright 2026. ThingsBoard
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+import asyncio
+from random import uniform
+
+DEFAULT_MAX_CONNECTIONS = 5
+INITIAL_RECONNECT_DELAY = 1.0
+DEFAULT_MAX_RECONNECT_DELAY = 60.0
+
+
+class ConnectionPool:
+    """
+    Limits count of simultaneously connected devices for the adapter.
+    Devices keep connection slot until they are disconnected, while device is unreachable
+    its slot is released and reconnect delay grows exponentially up to the configured maximum.
+    """
+
+    def __init__(self, logger, max_connections=DEFAULT_MAX_CONNECTIONS,
+                 max_reconnect_delay=DEFAULT_MAX_RECONNECT_DELAY):
+        self._log = logger
+        self.__max_connections = max_connections
+        self.__max_reconnect_delay = max_reconnect_delay
+        self.__slots = asyncio.Semaphore(max_connections)
+        self.__connected_devices = set()
+
+    @property
+    def max_connections(self):
+        return self.__max_connections
+
+    @property
+    def connected_devices(self):
+        return frozenset(self.__connected_devices)
+
+    def get_reconnect_delay(self, attempt):
+        delay = min(INITIAL_RECONNECT_DELAY * 2 ** attempt, self.__max_reconnect_delay)
+        # jitter prevents devices that were lost together from reconnecting at the same moment
+        return uniform(delay / 2, delay)
+
+    async def connect(self, device):
+        """
+        Waits for a free connection slot and connects device, returns False if device was stopped before connection.
+        """
+
+        attempt = 0
+        while not device.stopped:
+            await self.__slots.acquire()
+            try:
+                self._log.info('Trying to connect to %s with %s MAC address', device.name, device.mac_address)
+                await device.client.connect(timeout=device.timeout)
+            except asyncio.CancelledError:
+                self.__slots.release()
+                raise
+            except Exception as e:
+                self._log.error('Failed to connect to %s: %s', device.name, e)
+
+            if device.client.is_connected:
+                self.__connected_devices.add(device)
+                return True
+
+            self.__slots.release()
+            delay = self.get_reconnect_delay(attempt)
+            attempt += 1
+            self._log.debug('Next connection attempt to %s in %.1f seconds', device.name, delay)
+            await asyncio.sleep(delay)
+
+        return False
+
+    def release(self, device):
+        if device in self.__connected_devices:
+            self.__connected_devices.discard(device)
+            self.__slots.release()
@@ -24,9 +24,10 @@
 #     See the License for the specific language governing permissions and
 #     limitations under the License.
 
+from functools import partial
 from platform import system
 from time import time
-from asyncio import sleep
+from asyncio import Event, sleep
 from bleak import BleakClient
 
 from thingsboard_gateway.gateway.statistics.decorators import CollectStatistics  # noqa
@@ -57,7 +58,7 @@ class Device:
 
         try:
             self.mac_address = self.validate_mac_address(config['MACAddress'])
-            self.client = BleakClient(self.mac_address)
+            self.client = BleakClient(self.mac_address, disconnected_callback=self.__on_disconnected)
         except ValueError as e:
             self.client = None
             self.stopped = True
@@ -70,6 +71,7 @@ class Device:
         self.last_polled_time = self.poll_period + 1
 
         self.notifying_chars = []
+        self.__disconnected_event = Event()
 
     def _check_adv_mode(self):
         if len(self.config['characteristic']['telemetry']) or len(self.config['characteristic']['attributes']):
@@ -205,17 +207,20 @@ class Device:
                             raise e
 
         if len(not_converted_data['telemetry']) > 0 or len(not_converted_data['attributes']) > 0:
-            data_for_converter = {
-                'deviceName': self.name,
-                'deviceType': self.device_type,
-                'reportStrategy': self.config.get('reportStrategy', None),
-                'converter': self.config['characteristic']['extension'],
-                'config': {
-                    **self.config['characteristic']
-                },
-                'data': not_converted_data
-            }
-            self.callback(data_for_converter)
+            self.__send_characteristic_data(not_converted_data)
+
+    def __send_characteristic_data(self, not_converted_data):
+        data_for_converter = {
+            'deviceName': self.name,
+            'deviceType': self.device_type,
+            'reportStrategy': self.config.get('reportStrategy', None),
+            'converter': self.config['characteristic']['extension'],
+            'config': {
+                **self.config['characteristic']
+            },
+            'data': not_converted_data
+        }
+        self.callback(data_for_converter)
 
     def __set_char_handle(self, item, char_id):
         for serv in self.client.services:
@@ -288,6 +293,91 @@ class Device:
                 await self._process_adv_data(scanned_devices_callback)
                 await sleep(self.poll_period)
 
+    async def run_event_driven(self, connection_pool, read_scheduler, scanned_devices_callback):
+        """
+        Keeps persistent connection to the device using connection slot from the pool.
+        Characteristics that support notifications or indications are subscribed,
+        other characteristics are polled through the adapter-wide read scheduler.
+        """
+
+        if self.adv_only:
+            while not self.stopped:
+                await self._process_adv_data(scanned_devices_callback)
+                await sleep(self.poll_period)
+            return
+
+        while not self.stopped:
+            self.__disconnected_event.clear()
+            if not await connection_pool.connect(self):
+                break
+
+            self._log.info('Connected to %s device', self.name)
+            try:
+                await self.__subscribe_and_schedule_reads(read_scheduler, scanned_devices_callback)
+                await self.__disconnected_event.wait()
+                self._log.warning('Device %s disconnected', self.name)
+            except Exception as e:
+                self._log.exception('Problem with connection: \n %s', e)
+                try:
+                    await self.client.disconnect()
+                except Exception as err:
+                    self._log.debug('Failed to disconnect from %s: %s', self.name, err)
+            finally:
+                read_scheduler.cancel(self)
+                self.notifying_chars = []
+                connection_pool.release(self)
+
+    async def __subscribe_and_schedule_reads(self, read_scheduler, scanned_devices_callback):
+        items_by_char = {}
+        for section in ('telemetry', 'attributes'):
+            for item in self.config['characteristic'][section]:
+                char_items = items_by_char.setdefault(item['characteristicUUID'], {'telemetry': [], 'attributes': []})
+                char_items[section].append(item)
+
+        for char_id, char_items in items_by_char.items():
+            char = self.client.services.get_characteristic(char_id)
+            if char is None:
+                self._log.error('Characteristic %s not found on %s device', char_id, self.name)
+                continue
+
+            if 'notify' in char.properties or 'indicate' in char.properties:
+                await self.client.start_notify(char, partial(self.__on_notification, char_items))
+                self.notifying_chars.append(char_id)
+                self._log.debug('Subscribed to %s characteristic of %s device', char_id, self.name)
+            elif 'read' in char.properties:
+                read_scheduler.schedule_periodic(self, partial(self.__read_characteristic, char, char_items),
+                                                 self.poll_period)
+            else:
+                self._log.error('Characteristic %s of %s device supports neither notifications nor reading',
+                                char_id, self.name)
+
+        if len(self.config['advertisement']['telemetry']) or len(self.config['advertisement']['attributes']):
+            read_scheduler.schedule_periodic(self, partial(self._process_adv_data, scanned_devices_callback),
+                                             self.poll_period)
+
+    def __on_notification(self, char_items, _sender, data):
+        self.__send_characteristic_data({section: [{'data': data, **item} for item in items]
+                                         for section, items in char_items.items()})
+
+    async def __read_characteristic(self, char, char_items):
+        if not self.client.is_connected:
+            return
+
+        try:
+            data = await self.client.read_gatt_char(char)
+        except Exception as e:
+            error = ErrorHandler(e)
+            if error.is_char_not_found() or error.is_operation_not_supported():
+                self._log.error(e)
+                return
+            raise e
+
+        self.__send_characteristic_data({section: [{'data': data, **item} for item in items]
+                                         for section, items in char_items.items()})
+
+    def __on_disconnected(self, _client):
+        self.__disconnected_event.set()
+
     async def __show_map(self, return_result=False):
         result = f'MAP FOR {self.name.upper()}'
 
@@ -0,0 +1,141 @@
+#     Copyright 2026. ThingsBoard
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+import asyncio
+from heapq import heappop, heappush
+from itertools import count
+from time import monotonic
+
+RPC_PRIORITY = 0
+POLL_PRIORITY = 10
+
+
+class ScheduledRead:
+    __slots__ = ('owner', 'job', 'priority', 'period', 'due', 'future', 'cancelled')
+
+    def __init__(self, owner, job, priority, period=None, due=0.0, future=None):
+        self.owner = owner
+        self.job = job
+        self.priority = priority
+        self.period = period
+        self.due = due
+        self.future = future
+        self.cancelled = False
+
+
+class ReadScheduler:
+    """
+    Adapter-wide queue of GATT reads, all reads are executed one by one by single worker.
+    Periodic reads wait in the timer heap until they are due, due reads are executed by priority,
+    so RPC reads are not delayed by the polling of other devices.
+    """
+
+    def __init__(self, logger):
+        self._log = logger
+        self.__counter = count()
+        self.__timers = []
+        self.__ready = []
+        self.__wakeup = asyncio.Event()
+        self.__stopped = False
+
+    def __len__(self):
+        return len(self.__timers) + len(self.__ready)
+
+    def schedule_periodic(self, owner, job, period, priority=POLL_PRIORITY):
+        """
+        Schedules job (coroutine function without arguments) to be executed every period seconds.
+        """
+
+        read = ScheduledRead(owner, job, priority, period=period, due=monotonic())
+        self.__push_ready(read)
+        return read
+
+    async def submit(self, job, priority=RPC_PRIORITY):
+        """
+        Executes job once as soon as the worker is free and returns its result.
+        """
+
+        read = ScheduledRead(None, job, priority, future=asyncio.get_running_loop().create_future())
+        self.__push_ready(read)
+        return await read.future
+
+    def cancel(self, owner):
+        """
+        Cancels all periodic reads of the owner, read that is in progress is not interrupted.
+        """
+
+        for queue in (self.__timers, self.__ready):
+            for item in queue:
+                if item[-1].owner is owner:
+                    item[-1].cancelled = True
+
+    def stop(self):
+        self.__stopped = True
+        self.__wakeup.set()
+
+    async def run(self):
+        while not self.__stopped:
+            self.__move_due_reads()
+
+            if not self.__ready:
+                timeout = self.__timers[0][0] - monotonic() if self.__timers else None
+                self.__wakeup.clear()
+                try:
+                    await asyncio.wait_for(self.__wakeup.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            read = heappop(self.__ready)[-1]
+            if read.cancelled:
+                continue
+
+            await self.__execute(read)
+
+            if read.period is not None and not read.cancelled:
+                # the next read is planned from the previous due time, skipped periods are not caught up
+                read.due = max(read.due + read.period, monotonic())
+                heappush(self.__timers, (read.due, next(self.__counter), read))
+
+        for item in self.__ready:
+            read = item[-1]
+            if read.future is not None and not read.future.done():
+                read.future.cancel()
+
+    async def __execute(self, read):
+        try:
+            result = await read.job()
+            if read.future is not None and not read.future.done():
+                read.future.set_result(result)
+        except asyncio.CancelledError:
+            if read.future is not None:
+                read.future.cancel()
+            raise
+        except Exception as e:
+            if read.future is not None and not read.future.done():
+                read.future.set_exception(e)
+            else:
+                self._log.error('Scheduled read failed: %s', e)
+                self._log.debug('Scheduled read error', exc_info=True)
+
+    def __push_ready(self, read):
+        heappush(self.__ready, (read.priority, read.due, next(self.__counter), read))
+        self.__wakeup.set()
+
+    def __move_due_reads(self):
+        now = monotonic()
+        while self.__timers and self.__timers[0][0] <= now:
+            read = heappop(self.__timers)[-1]
+            if not read.cancelled:
+                self.__push_ready(read)
@@ -14,6 +14,7 @@
 
 import re
 import sched
+import struct
 import time
 from copy import copy
 from random import choice
@@ -21,6 +22,8 @@ from string import ascii_lowercase
 from threading import Thread
 
 from thingsboard_gateway.gateway.entities.converted_data import ConvertedData
+from thingsboard_gateway.gateway.entities.converted_data_batch import ConvertedDataBatch
+from thingsboard_gateway.gateway.entities.telemetry_entry import TelemetryEntry
 from thingsboard_gateway.gateway.statistics.statistics_service import StatisticsService
 from thingsboard_gateway.tb_utility.tb_loader import TBModuleLoader
 from thingsboard_gateway.tb_utility.tb_utility import TBUtility
@@ -35,6 +38,7 @@ except ImportError:
 
 from thingsboard_gateway.connectors.can.bytes_can_downlink_converter import BytesCanDownlinkConverter
 from thingsboard_gateway.connectors.can.bytes_can_uplink_converter import BytesCanUplinkConverter
+from thingsboard_gateway.connectors.can.can_frame_decoder import CanFrameDecoder, compile_int_decoder
 from thingsboard_gateway.connectors.connector import Connector
 
 
@@ -66,6 +70,10 @@ class CanConnector(Connector, Thread):
 
     DEFAULT_RPC_RESPONSE_SEND_FLAG = False
 
+    DEFAULT_MAX_FRAMES_PER_BATCH = 100
+    # some interfaces report monotonic or hardware clock in the frame timestamp
+    DEFAULT_USE_BUS_TIMESTAMP = False
+
     def __init__(self, gateway, config, connector_type):
         self.statistics = {'MessagesReceived': 0,
                            'MessagesSent': 0}
@@ -93,6 +101,10 @@ class CanConnector(Connector, Thread):
         self.__rpc_calls = {}
         self.__shared_attributes = {}
         self.__converters = {}
+        self.__cmd_id_decoders = {}
+        self.__dispatch_table = {}
+        self.__max_frames_per_batch = max(int(config.get("maxFramesPerBatch", self.DEFAULT_MAX_FRAMES_PER_BATCH)), 1)
+        self.__use_bus_timestamp = config.get("useBusTimestamp", self.DEFAULT_USE_BUS_TIMESTAMP)
         self.__bus_error = None
         self.__connected = False
         self.__stopped = False
@@ -282,12 +294,21 @@ class CanConnector(Connector, Thread):
                 while not self.__stopped:
                     message = reader.get_message()
                     if message is not None:
-                        # log.debug("[%s] New CAN message received %s", self.get_name(), message)
+                        messages = [message]
+                        while len(messages) < self.__max_frames_per_batch:
+                            message = reader.get_message(0)
+                            if message is None:
+                                break
+                            messages.append(message)
+
                         StatisticsService.count_connector_message(self.name,
-                                                                  stat_parameter_name='connectorMsgsReceived')
-                        StatisticsService.count_connector_bytes(self.name, message,
-                                                                stat_parameter_name='connectorBytesReceived')
-                        self.__process_message(message)
+                                                                  stat_parameter_name='connectorMsgsReceived',
+                                                                  count=len(messages))
+                        if StatisticsService.ENABLED:
+                            for message in messages:
+                                StatisticsService.count_connector_bytes(self.name, message,
+                                                                        stat_parameter_name='connectorBytesReceived')
+                        self.process_messages(messages)
                     self.__check_if_error_happened()
             except Exception as e:
                 self._log.error("[%s] Error on CAN bus: %s", self.get_name(), str(e))
@@ -378,31 +399,73 @@ class CanConnector(Connector, Thread):
                 config[option_name] = rpc_config.get(option_name, option_value)
         return config
 
-    def __process_message(self, message):
-        if message.arbitration_id not in self.__nodes:
-            # Too lot log messages in case of high message generation frequency
-            self._log.debug("[%s] Ignoring CAN message. Unknown arbitration_id %d", self.get_name(), message.arbitration_id)
-            return
+    def process_messages(self, messages):
+        """
+        Dispatches batch of CAN frames through the dispatch table compiled at configuration parsing.
+        Data decoded by precompiled decoders is collected per device and sent once per batch, every frame keeps
+        its own telemetry entry with the batch receive time, or with the frame timestamp if "useBusTimestamp"
+        is enabled. Frames of devices with custom uplink converters are converted one by one.
+        """
+
+        ts = int(time.time() * 1000)
+        devices_data = ConvertedDataBatch()
+        for message in messages:
+            arbitration_id = message.arbitration_id
+            if arbitration_id not in self.__cmd_id_decoders:
+                # Too lot log messages in case of high message generation frequency
+                self._log.debug("[%s] Ignoring CAN message. Unknown arbitration_id %d", self.get_name(), arbitration_id)
+                continue
 
-        cmd_conf = self.__commands[message.arbitration_id]
-        if cmd_conf is not None:
-            cmd_id = int.from_bytes(message.data[cmd_conf["start"]:cmd_conf["start"] + cmd_conf["length"]],
-                                    cmd_conf["byteorder"])
-        else:
-            cmd_id = self.NO_CMD_ID
+            cmd_id_decoder = self.__cmd_id_decoders[arbitration_id]
 
-        if cmd_id not in self.__nodes[message.arbitration_id]:
-            self._log.debug("[%s] Ignoring CAN message. Unknown cmd_id %d", self.get_name(), cmd_id)
-            return
+            if cmd_id_decoder is not None:
+                try:
+                    cmd_id = cmd_id_decoder(message.data)
+                except struct.error:
+                    self._log.debug("[%s] Ignoring CAN message. Too short data to get cmd_id for arbitration_id %d",
+                                    self.get_name(), arbitration_id)
+                    continue
+            else:
+                cmd_id = self.NO_CMD_ID
+
+            frame_decoder, parsing_conf = self.__dispatch_table.get((arbitration_id, cmd_id), (None, None))
+            if parsing_conf is None:
+                self._log.debug("[%s] Ignoring CAN message. Unknown cmd_id %s", self.get_name(), cmd_id)
+                continue
+
+            if frame_decoder is None:
+                self.__process_message_with_converter(message, cmd_id, parsing_conf)
+                continue
+
+            attributes, telemetry = {}, {}
+            if not frame_decoder.decode(message.data, attributes, telemetry):
+                self._log.warning("[%s] Failed to process CAN message (id=%d,cmd_id=%s): data conversion failure",
+                                  self.get_name(), arbitration_id, cmd_id)
+                continue
 
+            data = ConvertedData(device_name=frame_decoder.device_name, device_type=frame_decoder.device_type)
+            if attributes:
+                data.add_to_attributes(attributes)
+            if telemetry:
+                frame_ts = int(message.timestamp * 1000) if self.__use_bus_timestamp and message.timestamp else ts
+                data.add_to_telemetry(TelemetryEntry(telemetry, frame_ts))
+            devices_data.add(data)
+
+        for data in devices_data:
+            StatisticsService.count_connector_message(self._converter_log.name, 'convertersAttrProduced',
+                                                      count=data.attributes_datapoints_count)
+            StatisticsService.count_connector_message(self._converter_log.name, 'convertersTsProduced',
+                                                      count=data.telemetry_datapoints_count)
+            self.__check_and_send(data)
+
+    def __process_message_with_converter(self, message, cmd_id, parsing_conf):
         self._log.debug("[%s] Processing CAN message (id=%d,cmd_id=%s): %s",
-                  self.get_name(), message.arbitration_id, cmd_id, message)
+                        self.get_name(), message.arbitration_id, cmd_id, message)
 
-        parsing_conf = self.__nodes[message.arbitration_id][cmd_id]
         data: ConvertedData = self.__converters[parsing_conf["deviceName"]]["uplink"].convert(parsing_conf, message.data)
         if data.attributes_datapoints_count == 0 and data.telemetry_datapoints_count == 0:
             self._log.warning("[%s] Failed to process CAN message (id=%d,cmd_id=%s): data conversion failure",
-                        self.get_name(), message.arbitration_id, cmd_id)
+                              self.get_name(), message.arbitration_id, cmd_id)
             return
 
         self.__check_and_send(data)
@@ -573,6 +636,23 @@ class CanConnector(Connector, Thread):
                 self._log.warning("[%s] Ignore '%s' device configuration, because it doesn't have attributes,"
                                   "attributeUpdates,timeseries or serverSideRpc", self.get_name(), device_name)
 
+        self.__compile_dispatch_table()
+
+    def __compile_dispatch_table(self):
+        self.__cmd_id_decoders = {}
+        self.__dispatch_table = {}
+        for node_id, node_commands in self.__nodes.items():
+            cmd_conf = self.__commands.get(node_id)
+            self.__cmd_id_decoders[node_id] = None if cmd_conf is None else \
+                compile_int_decoder(cmd_conf["start"], cmd_conf["length"], cmd_conf["byteorder"])
+
+            for cmd_id, parsing_conf in node_commands.items():
+                frame_decoder = None
+                # Only frames of the default converter can be decoded by precompiled decoders
+                if type(self.__converters[parsing_conf["deviceName"]].get("uplink")) is BytesCanUplinkConverter:
+                    frame_decoder = CanFrameDecoder(parsing_conf, self._converter_log)
+                self.__dispatch_table[(node_id, cmd_id)] = (frame_decoder, parsing_conf)
+
     def __parse_value_config(self, config):
         if config is None:
             self._log.warning("[%s] Wrong value configuration: no data", self.get_name())
@@ -0,0 +1,122 @@
+#     Copyright 2026. ThingsBoard
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+import struct
+
+from thingsboard_gateway.gateway.constants import REPORT_STRATEGY_PARAMETER
+from thingsboard_gateway.gateway.entities.report_strategy_config import ReportStrategyConfig
+from thingsboard_gateway.gateway.statistics.statistics_service import StatisticsService
+from thingsboard_gateway.tb_utility.tb_utility import TBUtility
+
+INT_FORMATS = {1: 'b', 2: 'h', 4: 'i', 8: 'q'}
+
+
+def compile_int_decoder(start, length, byteorder, signed=False):
+    """
+    Returns function that decodes integer from CAN frame data, struct is used for standard integer sizes.
+    """
+
+    if length in INT_FORMATS:
+        fmt = ('>' if byteorder[0] == 'b' else '<') + (INT_FORMATS[length] if signed else INT_FORMATS[length].upper())
+        unpack_from = struct.Struct(fmt).unpack_from
+        return lambda data: unpack_from(data, start)[0]
+
+    if length == -1:
+        return lambda data: int.from_bytes(data[start:], byteorder, signed=signed)
+
+    end = start + length
+    return lambda data: int.from_bytes(data[start:end], byteorder, signed=signed)
+
+
+class CanFrameDecoder:
+    """
+    Precompiled decoder for a CAN frame with the given (arbitration_id, cmd_id).
+    Produces the same values as BytesCanUplinkConverter, but all parsing configuration
+    is interpreted once at connector start instead of every frame.
+    """
+
+    __slots__ = ('device_name', 'device_type', 'fields', '_log')
+
+    def __init__(self, parsing_config, logger):
+        self._log = logger
+        self.device_name = parsing_config.get("deviceName")
+        self.device_type = parsing_config.get("deviceType")
+
+        device_report_strategy = None
+        try:
+            device_report_strategy = ReportStrategyConfig(parsing_config.get(REPORT_STRATEGY_PARAMETER))
+        except ValueError as e:
+            self._log.trace("Report strategy config is not specified for device %s: %s", self.device_name, e)
+
+        self.fields = []
+        for config in parsing_config.get('configs', []):
+            value_decoder = self.__compile_value_decoder(config)
+            if value_decoder is None:
+                continue
+
+            expression = None
+            if config.get("expression", ""):
+                expression = (compile(config["expression"], "<CAN '%s' expression>" % config["key"], "eval"),
+                              {"__builtins__": {}} if config["strictEval"] else globals())
+
+            datapoint_key = TBUtility.convert_key_to_datapoint_key(config["key"], device_report_strategy,
+                                                                   parsing_config, self._log)
+            self.fields.append((datapoint_key, config["is_ts"], value_decoder, expression))
+
+    def __compile_value_decoder(self, config):
+        start = config["start"]
+        length = config["length"] if config.get("length") is not None else -1
+        end = start + length if length != -1 else None
+        data_type = config["type"][0]
+
+        if data_type == "b":
+            return lambda data: bool(data[start])
+        elif data_type == "i" or data_type == "l":
+            return compile_int_decoder(start, length, config["byteorder"], config["signed"])
+        elif data_type == "f" or data_type == "d":
+            unpack_from = struct.Struct((">" if config["byteorder"][0] == "b" else "<") + data_type).unpack_from
+            return lambda data: unpack_from(bytes(data[start:end]))[0]
+        elif data_type == "s":
+            encoding = config["encoding"]
+            return lambda data: bytes(data[start:end]).decode(encoding)
+        elif data_type == "r":
+            return lambda data: bytes(data[start:end]).hex()
+
+        self._log.error("Failed to compile CAN decoder for TB %s '%s': unknown data type '%s'",
+                        "time series key" if config["is_ts"] else "attribute", config["key"], config["type"])
+        return None
+
+    def decode(self, can_data, attributes, telemetry):
+        """
+        Decodes frame data into attributes and telemetry dictionaries, returns decoded datapoints count.
+        """
+
+        count = 0
+        for datapoint_key, is_ts, value_decoder, expression in self.fields:
+            try:
+                value = value_decoder(can_data)
+                if expression is not None:
+                    value = eval(expression[0], expression[1], {"value": value, "can_data": can_data})
+            except Exception as e:
+                StatisticsService.count_connector_message(self._log.name, 'convertersMsgDropped')
+                self._log.error("Failed to convert CAN data to TB %s '%s': %s",
+                                "time series key" if is_ts else "attribute", datapoint_key.key, str(e))
+                continue
+
+            if is_ts:
+                telemetry[datapoint_key] = value
+            else:
+                attributes[datapoint_key] = value
+            count += 1
+        return count
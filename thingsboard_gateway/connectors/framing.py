@@ -0,0 +1,194 @@
+#     Copyright 2026. ThingsBoard
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+from abc import ABC, abstractmethod
+from re import compile
+
+DEFAULT_MAX_FRAME_SIZE = 65536
+
+
+class FramingError(Exception):
+    pass
+
+
+class Framer(ABC):
+    """
+    Splits byte stream received from the client or device to separate messages.
+    Every stream (e.g. TCP connection or serial port) has its own framer instance,
+    because it keeps incomplete frame between reads.
+    """
+
+    def __init__(self, config):
+        self._max_frame_size = config.get('maxFrameSize', DEFAULT_MAX_FRAME_SIZE)
+        self._buffer = bytearray()
+
+    @abstractmethod
+    def feed(self, data):
+        """
+        Appends data to the buffer and returns list of all complete frames.
+        """
+
+    def reset(self):
+        self._buffer.clear()
+
+    def flush(self):
+        """
+        Returns bytes of the incomplete frame and clears the buffer.
+        """
+
+        data = bytes(self._buffer)
+        self._buffer.clear()
+        return data
+
+    @property
+    def pending_bytes(self):
+        return len(self._buffer)
+
+
+class NoFramer(Framer):
+    """
+    Every received chunk is a separate message.
+    """
+
+    def feed(self, data):
+        return [bytes(data)] if data else []
+
+
+class DelimiterFramer(Framer):
+    """
+    Frames are separated by delimiter, it is included into the frame if "includeDelimiter" is set.
+    """
+
+    def __init__(self, config):
+        super().__init__(config)
+        delimiter = config.get('delimiter', '\n')
+        self.__delimiter = bytes.fromhex(delimiter[2:]) if delimiter.startswith('0x') else delimiter.encode('utf-8')
+        if not self.__delimiter:
+            raise FramingError('Delimiter can not be empty')
+        self.__include_delimiter = config.get('includeDelimiter', False)
+
+    def feed(self, data):
+        self._buffer += data
+
+        frames = self._buffer.split(self.__delimiter)
+        tail = frames.pop()
+        self._buffer = bytearray(tail)
+
+        if len(self._buffer) > self._max_frame_size:
+            self._buffer.clear()
+            raise FramingError('Frame exceeds max size %s bytes without delimiter' % self._max_frame_size)
+
+        if self.__include_delimiter:
+            return [bytes(frame) + self.__delimiter for frame in frames]
+        return [bytes(frame) for frame in frames if frame]
+
+
+class FixedLengthFramer(Framer):
+    def __init__(self, config):
+        super().__init__(config)
+        self.__length = int(config['length'])
+        if self.__length <= 0:
+            raise FramingError('Frame length must be positive')
+
+    def feed(self, data):
+        self._buffer += data
+
+        frames_end = len(self._buffer) - len(self._buffer) % self.__length
+        frames = [bytes(self._buffer[i:i + self.__length]) for i in range(0, frames_end, self.__length)]
+        del self._buffer[:frames_end]
+
+        return frames
+
+
+class LengthPrefixFramer(Framer):
+    """
+    Every frame starts with the payload length encoded as unsigned integer, prefix isn't included into message.
+    """
+
+    def __init__(self, config):
+        super().__init__(config)
+        self.__prefix_size = int(config.get('lengthBytes', 2))
+        self.__byteorder = config.get('byteorder', 'big')
+        self.__length_includes_prefix = config.get('lengthIncludesPrefix', False)
+
+    def feed(self, data):
+        self._buffer += data
+
+        frames = []
+        position = 0
+        buffer_length = len(self._buffer)
+        while buffer_length - position >= self.__prefix_size:
+            payload_length = int.from_bytes(self._buffer[position:position + self.__prefix_size], self.__byteorder)
+            if self.__length_includes_prefix:
+                payload_length -= self.__prefix_size
+
+            if payload_length < 0 or payload_length > self._max_frame_size:
+                self._buffer.clear()
+                raise FramingError('Invalid frame length %s' % payload_length)
+
+            frame_end = position + self.__prefix_size + payload_length
+            if frame_end > buffer_length:
+                break
+
+            frames.append(bytes(self._buffer[position + self.__prefix_size:frame_end]))
+            position = frame_end
+
+        del self._buffer[:position]
+
+        return frames
+
+
+class RegexFramer(Framer):
+    """
+    Every match of the regular expression is a frame, bytes between matches are skipped.
+    """
+
+    def __init__(self, config):
+        super().__init__(config)
+        self.__regex = compile(config['regex'].encode('utf-8'))
+
+    def feed(self, data):
+        self._buffer += data
+
+        frames = []
+        end = 0
+        for match in self.__regex.finditer(self._buffer):
+            frames.append(bytes(match.group(0)))
+            end = match.end()
+        del self._buffer[:end]
+
+        if len(self._buffer) > self._max_frame_size:
+            self._buffer.clear()
+            raise FramingError('No frame found in %s bytes' % self._max_frame_size)
+
+        return frames
+
+
+FRAMERS = {
+    'none': NoFramer,
+    'delimiter': DelimiterFramer,
+    'fixedLength': FixedLengthFramer,
+    'lengthPrefix': LengthPrefixFramer,
+    'regex': RegexFramer
+}
+
+
+def create_framer(config):
+    framer_type = config.get('type', 'none')
+
+    framer_class = FRAMERS.get(framer_type)
+    if framer_class is None:
+        raise FramingError('Unknown framing type "%s", allowed types: %s' % (framer_type, ', '.join(FRAMERS)))
+
+    return framer_class(config)
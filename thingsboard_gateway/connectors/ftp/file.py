@@ -13,8 +13,11 @@
 #     limitations under the License.
 
 from enum import Enum
+from ssl import SSLSocket
 from zlib import crc32
 
+DEFAULT_READ_CHUNK_SIZE = 65536
+
 
 class File:
     class ReadMode(Enum):
@@ -27,6 +30,10 @@ class File:
         self._max_size = max_size
         self._hash = None
         self._cursor = None
+        self._offset = 0
+        # size of the file at the last processing, it is used to find the finished last line without newline
+        self._size = None
+        self._headers = None
 
     def __str__(self):
         return f'{self._path_to_file} {self._read_mode}'
@@ -55,6 +62,33 @@ class File:
     def cursor(self, val):
         self._cursor = val
 
+    @property
+    def offset(self):
+        return self._offset
+
+    @offset.setter
+    def offset(self, val):
+        self._offset = val
+
+    @property
+    def size(self):
+        return self._size
+
+    @size.setter
+    def size(self, val):
+        self._size = val
+
+    def has_unprocessed_data(self):
+        return self._read_mode == File.ReadMode.PARTIAL and self._size is not None and self._offset < self._size
+
+    @property
+    def headers(self):
+        return self._headers
+
+    @headers.setter
+    def headers(self, val):
+        self._headers = val
+
     def has_hash(self):
         return True if self._hash else False
 
@@ -79,3 +113,44 @@ class File:
         # SIZE requires binary mode, so we restore it explicitly before calling ftp.size().
         ftp.sendcmd("TYPE I")
         return self.convert_bytes_to_mb(ftp.size(self.path_to_file)) < self._max_size
+
+    def get_size(self, ftp):
+        ftp.sendcmd("TYPE I")
+        return ftp.size(self.path_to_file)
+
+    def iter_lines(self, ftp, offset=0, chunk_size=DEFAULT_READ_CHUNK_SIZE):
+        """
+        Streams file from the given byte offset (REST command) and yields (line, end_offset, is_complete) tuples,
+        where end_offset is the byte offset right after the line. Only one chunk is kept in memory.
+        The last line without trailing newline is yielded with is_complete=False.
+        """
+
+        ftp.voidcmd("TYPE I")
+        conn = ftp.transfercmd('RETR ' + self._path_to_file, rest=offset or None)
+        finished = False
+        try:
+            tail = b''
+            while True:
+                chunk = conn.recv(chunk_size)
+                if not chunk:
+                    break
+
+                lines = (tail + chunk).split(b'\n')
+                tail = lines.pop()
+                for line in lines:
+                    offset += len(line) + 1
+                    yield str(line, 'UTF-8'), offset, True
+
+            if tail:
+                yield str(tail, 'UTF-8'), offset + len(tail), False
+            finished = True
+        finally:
+            if isinstance(conn, SSLSocket) and finished:
+                conn.unwrap()
+            conn.close()
+            try:
+                ftp.voidresp()
+            except Exception:
+                # Transfer aborted before the end of file, server replies with error code
+                if finished:
+                    raise
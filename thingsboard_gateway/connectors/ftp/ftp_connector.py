@@ -14,6 +14,7 @@
 
 import io
 import re
+from contextlib import closing
 from ftplib import FTP, FTP_TLS
 from queue import Queue
 from random import choice
@@ -29,6 +30,7 @@ from thingsboard_gateway.connectors.ftp.file import File
 from thingsboard_gateway.connectors.ftp.ftp_uplink_converter import FTPUplinkConverter
 from thingsboard_gateway.connectors.ftp.path import Path
 from thingsboard_gateway.gateway.entities.converted_data import ConvertedData
+from thingsboard_gateway.gateway.entities.converted_data_batch import ConvertedDataBatch
 from thingsboard_gateway.gateway.statistics.decorators import CollectAllReceivedBytesStatistics
 from thingsboard_gateway.gateway.statistics.statistics_service import StatisticsService
 from thingsboard_gateway.tb_utility.tb_logger import init_logger, TbLogger
@@ -135,7 +137,8 @@ class FTPConnector(Connector, Thread):
                     "poll_period": path.get('pollPeriod', 60),
                     "max_size": path.get('maxFileSize', 5),
                     "delimiter": path.get('delimiter', ','),
-                    "report_strategy": path.get('reportStrategy')
+                    "report_strategy": path.get('reportStrategy'),
+                    "batch_size": path.get('batchSize', 1000)
                 }
                 if isinstance(path.get("converter"), dict) and path["converter"].get("type"):
                     ext_conf = path["converter"].get("extension-config") or {}
@@ -224,11 +227,14 @@ class FTPConnector(Connector, Thread):
                 for file in path.files:
                     current_hash = file.get_current_hash(ftp)
 
-                    if not self.__is_file_hash_changed(file, current_hash):
+                    if not self.__is_file_hash_changed(file, current_hash) and not file.has_unprocessed_data():
                         self.__log.info("File %s hash not changed, skipping...", file.path_to_file)
                         continue
 
-                    if not file.check_size_limit(ftp):
+                    convert_conf = {'file_ext': file.path_to_file.split('.')[-1]}
+
+                    # text files are streamed line by line, so only json files are limited by size
+                    if convert_conf['file_ext'] == 'json' and not file.check_size_limit(ftp):
                         self.__log.warning("File %s size is larger than the maximum allowed size of %d MB, skipping...",
                                            file.path_to_file, file.max_size)
                         continue
@@ -237,22 +243,20 @@ class FTPConnector(Connector, Thread):
 
                     self._on_file_preprocessing(ftp, self.__log, file)
 
-                    handle_stream = io.BytesIO()
-                    ftp.retrbinary('RETR ' + file.path_to_file, handle_stream.write)
-
-                    handled_str = str(handle_stream.getvalue(), 'UTF-8')
-                    handled_array = handled_str.split('\n')
+                    self.__log.trace("Processing data from %s file", file.path_to_file)
 
-                    StatisticsService.count_connector_message(self.name,
-                                                              stat_parameter_name='connectorMsgsReceived')
-                    StatisticsService.count_connector_bytes(self.name, handled_str,
-                                                            stat_parameter_name='connectorBytesReceived')
+                    if convert_conf['file_ext'] == 'json':
+                        handle_stream = io.BytesIO()
+                        ftp.retrbinary('RETR ' + file.path_to_file, handle_stream.write)
 
-                    convert_conf = {'file_ext': file.path_to_file.split('.')[-1]}
+                        handled_str = str(handle_stream.getvalue(), 'UTF-8')
+                        handle_stream.close()
 
-                    self.__log.trace("Processing data from %s file", file.path_to_file)
+                        StatisticsService.count_connector_message(self.name,
+                                                                  stat_parameter_name='connectorMsgsReceived')
+                        StatisticsService.count_connector_bytes(self.name, handled_str,
+                                                                stat_parameter_name='connectorBytesReceived')
 
-                    if convert_conf['file_ext'] == 'json':
                         json_data = simplejson.loads(handled_str)
                         if isinstance(json_data, list):
                             for obj in json_data:
@@ -280,31 +284,77 @@ class FTPConnector(Connector, Thread):
                                 self.__log.debug('Converted data: %s', converted_data)
                                 self.__send_data(converted_data)
                     else:
-                        cursor = file.cursor or 0
-
-                        for (index, line) in enumerate(handled_array):
-                            if index == 0 and not path.txt_file_data_view == 'SLICED':
-                                convert_conf['headers'] = line.split(path.delimiter)
-                            else:
-                                if file.read_mode == File.ReadMode.PARTIAL and index >= cursor:
-                                    converted_data = converter.convert(convert_conf, line)
-                                    if index + 1 == len(handled_array):
-                                        file.cursor = index
-                                else:
-                                    converted_data = converter.convert(convert_conf, line)
+                        self.__process_text_file(ftp, path, file, converter, convert_conf)
 
-                                if converted_data:
-                                    self.__log.info(
-                                        'Converted data for device %s with type %s, attributes: %s, telemetry: %s',
-                                        converted_data.device_name, converted_data.device_type,
-                                        converted_data.attributes_datapoints_count,
-                                        converted_data.telemetry_datapoints_count)
+                    self._on_file_postprocessing(ftp, self.__log, file)
 
-                                    self.__log.debug('Converted data: %s', converted_data)
-                                    self.__send_data(converted_data)
+    def __process_text_file(self, ftp, path, file, converter, convert_conf):
+        """
+        Streams text file line by line and sends converted lines in batches grouped per device.
+        In PARTIAL read mode only data appended after the last processed byte offset is retrieved,
+        the last line without newline is left for the next polling iteration and processed
+        if the file size is not changed since then.
+        """
+
+        is_partial = file.read_mode == File.ReadMode.PARTIAL
+        with_headers = path.txt_file_data_view != 'SLICED'
+
+        offset = 0
+        size = file.get_size(ftp) if is_partial else None
+        process_last_line = is_partial and size == file.size
+        if is_partial and file.offset:
+            if size < file.offset:
+                self.__log.info("File %s was truncated, reading it from the beginning", file.path_to_file)
+            elif with_headers and file.headers is None:
+                self.__log.debug("Headers of file %s are unknown, reading it from the beginning", file.path_to_file)
+            else:
+                offset = file.offset
+                if with_headers:
+                    convert_conf['headers'] = file.headers
+
+        devices_data = ConvertedDataBatch()
+        received_bytes = 0
+        processed_offset = offset
+        with closing(file.iter_lines(ftp, offset)) as lines:
+            for line, end_offset, is_complete in lines:
+                if is_partial and not is_complete and not process_last_line:
+                    break
+
+                received_bytes += end_offset - processed_offset
+                processed_offset = end_offset
+
+                if with_headers and 'headers' not in convert_conf:
+                    convert_conf['headers'] = file.headers = line.split(path.delimiter)
+                    continue
 
-                    handle_stream.close()
-                    self._on_file_postprocessing(ftp, self.__log, file)
+                converted_data = converter.convert(convert_conf, line)
+                if converted_data:
+                    devices_data.add(converted_data)
+
+                if devices_data.messages_count >= path.batch_size:
+                    self.__send_devices_data(devices_data)
+                    devices_data.clear()
+                    if is_partial:
+                        file.offset = processed_offset
+
+        self.__send_devices_data(devices_data)
+        if is_partial:
+            file.offset = processed_offset
+            file.size = size
+
+        StatisticsService.count_connector_message(self.name, stat_parameter_name='connectorMsgsReceived')
+        StatisticsService.count_connector_message(self.name, stat_parameter_name='connectorBytesReceived',
+                                                  count=received_bytes)
+
+    def __send_devices_data(self, devices_data: ConvertedDataBatch):
+        for converted_data in devices_data:
+            self.__log.info('Converted data for device %s with type %s, attributes: %s, telemetry: %s',
+                            converted_data.device_name, converted_data.device_type,
+                            converted_data.attributes_datapoints_count,
+                            converted_data.telemetry_datapoints_count)
+
+            self.__log.debug('Converted data: %s', converted_data)
+            self.__send_data(converted_data)
 
     def __is_file_hash_changed(self, file: File, current_hash: str):
         return (file.has_hash() and current_hash != file.hash) or not file.has_hash()
@@ -25,7 +25,7 @@ COMPATIBLE_FILE_EXTENSIONS = ('json', 'txt', 'csv')
 class Path:
     def __init__(self, path: str, delimiter: str, telemetry: list, device_name: str, attributes: list,
                  txt_file_data_view: str, logger, poll_period=60, with_sorting_files=True, device_type='Device', max_size=5,
-                 read_mode='FULL', report_strategy=None, custom_converter_type=None, extension=None):
+                 read_mode='FULL', report_strategy=None, custom_converter_type=None, extension=None, batch_size=1000):
         self._path = path
         self._with_sorting_files = with_sorting_files
         self._poll_period = poll_period
@@ -41,6 +41,7 @@ class Path:
         self.__read_mode = File.ReadMode[read_mode]
         self.__max_size = max_size
         self._report_strategy = report_strategy
+        self._batch_size = max(int(batch_size), 1)
         self._custom_converter_type = custom_converter_type
         if self._custom_converter_type is not None:
             self._extension = extension
@@ -176,6 +177,10 @@ class Path:
     def txt_file_data_view(self):
         return self._txt_file_data_view
 
+    @property
+    def batch_size(self):
+        return self._batch_size
+
     @property
     def last_polled_time(self):
         return self._last_polled_time
@@ -29,6 +29,7 @@ class Device(Thread):
         self.__connector_type = connector_type
         self.__is_client_connected = is_client_connected
         self.__config = config
+        self.__poll_period = self.__config.get('pollPeriod', 10000) / 1000
 
         self.group_addresses_to_read = {}
         self.__fill_group_addresses_to_read()
@@ -42,8 +43,6 @@ class Device(Thread):
 
         self.__process_request_queue = process_request_queue
 
-        self.__poll_period = self.__config.get('pollPeriod', 10000) / 1000
-
         self.__last_poll_time = 0
 
         self.start()
@@ -64,9 +63,13 @@ class Device(Thread):
         {
             "1.0.5": {
                 "type": "string",
-                "keys": ["vendor", "deviceName"]
+                "keys": ["vendor", "deviceName"],
+                "maxAge": 10.0
             }
         }
+
+        maxAge is the smallest staleness limit (in seconds) of the datapoints with the group address,
+        cached values older than it are read from the bus.
         """
 
         self.__fill_group_addresses_from_device_info()
@@ -75,16 +78,22 @@ class Device(Thread):
             for datapoint_config in self.__config.get(section, []):
                 self.add_group_address(datapoint_config['groupAddress'],
                                        datapoint_config.get('type'),
-                                       datapoint_config['key'])
+                                       datapoint_config['key'],
+                                       datapoint_config.get('maxAge'))
+
+    def add_group_address(self, group_address, datatype, key, max_age=None):
+        max_age = max_age / 1000 if max_age is not None else self.__poll_period
 
-    def add_group_address(self, group_address, datatype, key):
         if not self.group_addresses_to_read.get(group_address):
             self.group_addresses_to_read[group_address] = {
                 'type': datatype,
-                'keys': []
+                'keys': [],
+                'maxAge': max_age
             }
 
         self.group_addresses_to_read[group_address]['keys'].append(key)
+        self.group_addresses_to_read[group_address]['maxAge'] = min(
+            self.group_addresses_to_read[group_address]['maxAge'], max_age)
 
     def __fill_group_addresses_from_device_info(self):
         device_info = self.__config['deviceInfo']
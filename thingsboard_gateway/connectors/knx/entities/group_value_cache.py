@@ -0,0 +1,74 @@
+#     Copyright 2026. ThingsBoard
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+from time import monotonic
+
+
+class GroupValueCache:
+    """
+    Last known values of KNX group addresses.
+    Cache is filled by telegrams observed on the bus (raw payload, decoded lazily for every requested data type)
+    and by results of group value reads, so polling doesn't read values that are fresh enough.
+    """
+
+    def __init__(self, decoder, logger):
+        self.__decoder = decoder
+        self.__log = logger
+        self.__entries = {}
+
+    def __len__(self):
+        return len(self.__entries)
+
+    def update(self, group_address, payload_value):
+        """
+        Stores raw payload value of the observed GroupValueWrite or GroupValueResponse telegram.
+        """
+
+        self.__entries[group_address] = (monotonic(), payload_value, {})
+
+    def set_value(self, group_address, value_type, value, read_started):
+        """
+        Stores decoded value, received as a result of group value read started at read_started (monotonic time).
+        Response telegram is usually already observed during the read, in this case its raw payload is kept.
+        """
+
+        entry = self.__entries.get(group_address)
+        if entry is not None and entry[0] >= read_started:
+            entry[2][value_type] = value
+        else:
+            self.__entries[group_address] = (monotonic(), None, {value_type: value})
+
+    def get(self, group_address, value_type, max_age):
+        """
+        Returns decoded value if it is not older than max_age seconds, otherwise None.
+        """
+
+        entry = self.__entries.get(group_address)
+        if entry is None or monotonic() - entry[0] > max_age:
+            return None
+
+        _, payload_value, values = entry
+        if value_type in values:
+            return values[value_type]
+        if payload_value is None:
+            return None
+
+        try:
+            value = self.__decoder(payload_value, value_type)
+        except Exception as e:
+            self.__log.debug('Failed to decode cached value of %s as %s: %s', group_address, value_type, e)
+            return None
+
+        values[value_type] = value
+        return value
@@ -36,7 +36,11 @@ except ImportError:
 from thingsboard_gateway.connectors.knx.entities.client_config import ClientConfig
 from thingsboard_gateway.connectors.knx.entities.gateways_scanner import GatewaysScanner
 from thingsboard_gateway.connectors.knx.entities.device import Device
+from thingsboard_gateway.connectors.knx.entities.group_value_cache import GroupValueCache
 
+from xknx.dpt import DPTBase
+from xknx.telegram import GroupAddress
+from xknx.telegram.apci import GroupValueResponse, GroupValueWrite
 from xknx.tools import read_group_value, group_value_write
 
 
@@ -65,11 +69,13 @@ class KNXConnector(Connector, Thread):
         self.daemon = True
 
         self.__process_device_request_queue = Queue(-1)
-        self.__data_to_convert_queue = Queue(-1)
-        self.__data_to_save_queue = Queue(-1)
 
         self.__loop = self.__create_event_loop()
 
+        self.__data_to_convert_queue = asyncio.Queue()
+        self.__data_to_save_queue = asyncio.Queue()
+        self.__group_value_cache = GroupValueCache(self.__decode_group_value, self.__log)
+
         self.__is_client_connected = asyncio.Event()
         self.__client = None
 
@@ -117,9 +123,25 @@ class KNXConnector(Connector, Thread):
     def open(self):
         self.start()
 
+    def telegram_received_cb(self, telegram):
+        """
+        Puts values of all group telegrams observed on the bus to the cache, so they are not read again by polling.
+        """
+        if isinstance(telegram.payload, (GroupValueWrite, GroupValueResponse)) \
+                and isinstance(telegram.destination_address, GroupAddress):
+            self.__log.trace('Telegram received: %s', telegram)
+            self.__group_value_cache.update(telegram.destination_address.raw, telegram.payload.value)
+
+    @staticmethod
+    def __decode_group_value(payload_value, value_type):
+        transcoder = DPTBase.parse_transcoder(value_type) if value_type is not None else None
+        if transcoder is not None:
+            return transcoder.from_knx(payload_value)
+        return payload_value.value
+
     @staticmethod
-    def telegram_received_cb(telegram):
-        print("Telegram received: {0}".format(telegram))
+    def __get_group_address_key(group_address):
+        return GroupAddress(group_address).raw
 
     def run(self):
         try:
@@ -166,61 +188,115 @@ class KNXConnector(Connector, Thread):
     def __create_client(self, client_config):
         client_config = ClientConfig(client_config)
         self.__client = XKNX(**client_config.__dict__)
+        self.__client.telegram_queue.register_telegram_received_cb(self.telegram_received_cb)
+
+    def __get_devices_to_poll(self):
+        devices = []
+        try:
+            while True:
+                devices.append(self.__process_device_request_queue.get_nowait())
+        except Empty:
+            return devices
 
     async def __process_device_request(self):
         while not self.__stopped.is_set():
+            devices = self.__get_devices_to_poll()
+            if not devices:
+                await asyncio.sleep(.01)
+                continue
+
+            if not self.__client.connection_manager.connected:
+                self.__log.error('KNX bus is not connected')
+                continue
+
+            group_values = await self.__read_group_values(devices)
+
+            for device in devices:
+                responses = {}
+
+                for group_address, config in device.group_addresses_to_read.items():
+                    response = group_values.get((group_address, config.get('type')))
+
+                    if response is not None:
+                        responses[group_address] = {
+                            'type': config['type'],
+                            'response': response,
+                            'keys': config['keys']
+                        }
+                    else:
+                        self.__log.warning('No response from KNX bus for %s.', group_address)
+
+                if responses:
+                    await self.__data_to_convert_queue.put((device, responses))
+
+    async def __read_group_values(self, devices):
+        """
+        Reads every group address needed by devices polled in this cycle only once,
+        values that are observed on the bus recently enough for all these devices are taken from the cache.
+        """
+        max_ages = {}
+        for device in devices:
+            for group_address, config in device.group_addresses_to_read.items():
+                key = (group_address, config.get('type'))
+                max_ages[key] = min(max_ages.get(key, config['maxAge']), config['maxAge'])
+
+        group_values = {}
+        for (group_address, value_type), max_age in max_ages.items():
             try:
-                device = self.__process_device_request_queue.get_nowait()
-
-                if self.__client.connection_manager.connected:
-                    responses = {}
-
-                    for key, config in device.group_addresses_to_read.items():
-                        try:
-                            response = await read_group_value(self.__client, key, config.get('type'))
-
-                            if response is not None:
-                                self.__log.trace('Response from KNX bus: %s', response)
-                                responses[key] = {
-                                    'type': config['type'],
-                                    'response': response,
-                                    'keys': config['keys']
-                                }
-                            else:
-                                self.__log.warning('No response from KNX bus for %s.', key)
-                        except Exception as e:
-                            self.__log.exception('Error processign %s request: %s', device.name, e)
-
-                    if responses:
-                        self.__data_to_convert_queue.put((device, responses))
+                group_address_key = self.__get_group_address_key(group_address)
+                value = self.__group_value_cache.get(group_address_key, value_type, max_age)
+
+                if value is None:
+                    read_started = monotonic()
+                    value = await read_group_value(self.__client, group_address, value_type)
+
+                    if value is not None:
+                        self.__log.trace('Response from KNX bus: %s', value)
+                        self.__group_value_cache.set_value(group_address_key, value_type, value, read_started)
                 else:
-                    self.__log.error('KNX bus is not connected')
-            except Empty:
-                await asyncio.sleep(.01)
+                    self.__log.trace('Value of %s taken from cache: %s', group_address, value)
+            except Exception as e:
+                self.__log.exception('Error processign %s request: %s', group_address, e)
+                value = None
+
+            # failed reads are not repeated for other devices in the same cycle
+            group_values[(group_address, value_type)] = value
+
+        return group_values
+
+    async def __get_from_queue(self, queue):
+        try:
+            return await asyncio.wait_for(queue.get(), timeout=.5)
+        except asyncio.TimeoutError:
+            return None
 
     async def __convert_data(self):
         while not self.__stopped.is_set():
             try:
-                device, data_to_convert = self.__data_to_convert_queue.get_nowait()
+                item = await self.__get_from_queue(self.__data_to_convert_queue)
+                if item is None:
+                    continue
+
+                device, data_to_convert = item
                 converted_data = device.uplink_converter.convert(data_to_convert)
 
                 if converted_data.telemetry_datapoints_count > 0 or converted_data.attributes_datapoints_count > 0:
-                    self.__data_to_save_queue.put((device, converted_data))
-            except Empty:
-                await asyncio.sleep(.01)
+                    await self.__data_to_save_queue.put((device, converted_data))
             except Exception as e:
                 self.__log.error('Error converting data: %s', e)
 
     async def __send_data(self):
         while not self.__stopped.is_set():
             try:
-                device, data_to_save = self.__data_to_save_queue.get_nowait()
+                item = await self.__get_from_queue(self.__data_to_save_queue)
+                if item is None:
+                    continue
+
+                device, data_to_save = item
                 self.__log.trace('%s data to save: %s', device, data_to_save)
                 StatisticsService.count_connector_message(self.get_name(), stat_parameter_name='storageMsgPushed')
                 self.__gateway.send_to_storage(self.get_name(), self.get_id(), data_to_save)
                 self.statistics[STATISTIC_MESSAGE_SENT_PARAMETER] += 1
-            except Empty:
-                await asyncio.sleep(.01)
             except Exception as e:
                 self.__log.error('Error saving data: %s', e)
 
@@ -12,6 +12,8 @@
 #     See the License for the specific language governing permissions and
 #     limitations under the License.
 
+import asyncio
+
 import simplejson
 from ocpp.v16 import ChargePoint as CP
 from ocpp.routing import on
@@ -21,13 +23,16 @@ from datetime import datetime
 
 from thingsboard_gateway.tb_utility.tb_loader import TBModuleLoader
 
+DEFAULT_MESSAGES_QUEUE_SIZE = 1000
+
 
 class ChargePoint(CP):
-    def __init__(self, charge_point_id, websocket, config, callback, logger):
+    def __init__(self, charge_point_id, websocket, config, logger, queue_size=DEFAULT_MESSAGES_QUEUE_SIZE):
         super(ChargePoint, self).__init__(charge_point_id, websocket)
         self._log = logger
         self._config = config
-        self._callback = callback
+        # bounded queue makes only this charge point wait for processing of its own messages
+        self._messages = asyncio.Queue(queue_size)
         self._uplink_converter = self._load_converter(config['uplink_converter_name'])(self._config, self._log)
         self._profile = {}
         self.name = None
@@ -39,6 +44,10 @@ class ChargePoint(CP):
     def config(self):
         return self._config
 
+    @property
+    def uplink_converter(self):
+        return self._uplink_converter
+
     @property
     def authorized(self):
         return self._authorized
@@ -61,8 +70,34 @@ class ChargePoint(CP):
         self._stopped = True
         return await self._connection.close()
 
+    async def _put_message(self, config, data):
+        await self._messages.put((config, data))
+
+    async def stop_messages_processing(self):
+        await self._messages.put(None)
+
+    async def get_messages(self, max_count):
+        """
+        Waits for the next message and returns it with all messages queued after it, up to max_count.
+        Returns None after stop_messages_processing was called and all previous messages are returned.
+        """
+        message = await self._messages.get()
+        if message is None:
+            return None
+
+        messages = [message]
+        while len(messages) < max_count and not self._messages.empty():
+            message = self._messages.get_nowait()
+            if message is None:
+                # leave the stop mark for the next call, so already received messages are processed
+                self._messages.put_nowait(None)
+                break
+            messages.append(message)
+
+        return messages
+
     @on(Action.BootNotification)
-    def on_boot_notification(self, charge_point_vendor: str, charge_point_model: str, **kwargs):
+    async def on_boot_notification(self, charge_point_vendor: str, charge_point_model: str, **kwargs):
         self._profile = {
             'Vendor': charge_point_vendor,
             'Model': charge_point_model
@@ -70,10 +105,9 @@ class ChargePoint(CP):
         self.name = self._uplink_converter.get_device_name(self._profile)
         self.type = self._uplink_converter.get_device_type(self._profile)
 
-        self._callback((self._uplink_converter,
-                        {'deviceName': self.name, 'deviceType': self.type, 'messageType': Action.MeterValues,
-                         'profile': self._profile},
-                        {'Vendor': charge_point_vendor, 'Model': charge_point_model, **kwargs}))
+        await self._put_message({'deviceName': self.name, 'deviceType': self.type, 'messageType': Action.MeterValues,
+                                 'profile': self._profile},
+                                {'Vendor': charge_point_vendor, 'Model': charge_point_model, **kwargs})
 
         return call_result.BootNotificationPayload(
             current_time=datetime.utcnow().isoformat(),
@@ -95,21 +129,19 @@ class ChargePoint(CP):
         )
 
     @on(Action.MeterValues)
-    def on_meter_values(self, **kwargs):
-        self._callback((self._uplink_converter,
-                        {'deviceName': self.name, 'deviceType': self.type, 'messageType': Action.MeterValues,
-                         'profile': self._profile}, kwargs))
+    async def on_meter_values(self, **kwargs):
+        await self._put_message({'deviceName': self.name, 'deviceType': self.type, 'messageType': Action.MeterValues,
+                                 'profile': self._profile}, kwargs)
         return call_result.MeterValuesPayload()
 
     @on(Action.DataTransfer)
-    def on_data_transfer(self, **kwargs):
+    async def on_data_transfer(self, **kwargs):
         for (key, value) in kwargs.items():
             try:
                 kwargs[key] = simplejson.loads(value)
             except (TypeError, ValueError):
                 continue
 
-        self._callback((self._uplink_converter,
-                        {'deviceName': self.name, 'deviceType': self.type, 'messageType': Action.DataTransfer,
-                         'profile': self._profile}, kwargs))
+        await self._put_message({'deviceName': self.name, 'deviceType': self.type,
+                                 'messageType': Action.DataTransfer, 'profile': self._profile}, kwargs)
         return call_result.DataTransferPayload(status=DataTransferStatus.accepted)
@@ -16,7 +16,6 @@ import asyncio
 import base64
 import re
 import ssl
-from queue import Queue
 from threading import Thread
 from random import choice
 from string import ascii_lowercase
@@ -25,7 +24,6 @@ from time import sleep
 from simplejson import dumps
 
 from thingsboard_gateway.connectors.connector import Connector
-from thingsboard_gateway.gateway.entities.converted_data import ConvertedData
 from thingsboard_gateway.gateway.statistics.decorators import CollectAllReceivedBytesStatistics
 from thingsboard_gateway.gateway.statistics.statistics_service import StatisticsService
 from thingsboard_gateway.tb_utility.tb_utility import TBUtility
@@ -46,7 +44,9 @@ except ImportError:
     import websockets
 
 from ocpp.v16 import call
-from thingsboard_gateway.connectors.ocpp.charge_point import ChargePoint
+from thingsboard_gateway.connectors.ocpp.charge_point import ChargePoint, DEFAULT_MESSAGES_QUEUE_SIZE
+
+DEFAULT_MAX_MESSAGES_BATCH_SIZE = 100
 
 
 class NotAuthorized(Exception):
@@ -54,9 +54,6 @@ class NotAuthorized(Exception):
 
 
 class OcppConnector(Connector, Thread):
-    DATA_TO_CONVERT = Queue(-1)
-    DATA_TO_SEND = Queue(-1)
-
     def __init__(self, gateway, config, connector_type):
         super().__init__()
         self._config = config
@@ -76,6 +73,11 @@ class OcppConnector(Connector, Thread):
                                           enable_remote_logging=self._config.get('enableRemoteLogging', False),
                                           is_converter_logger=True, attr_name=self.name)
 
+        self._messages_queue_size = self._central_system_config.get('messagesQueueSize',
+                                                                    DEFAULT_MESSAGES_QUEUE_SIZE)
+        self._max_messages_batch_size = self._central_system_config.get('maxMessagesBatchSize',
+                                                                        DEFAULT_MAX_MESSAGES_BATCH_SIZE)
+
         self._default_converters = {'uplink': 'OcppUplinkConverter'}
         self._server = None
         self._connected_charge_points = []
@@ -93,9 +95,6 @@ class OcppConnector(Connector, Thread):
             self._log.warning('TLS connection not set!')
             self._ssl_context = None
 
-        self._data_convert_thread = Thread(name='Convert Data Thread', daemon=True, target=self._process_data)
-        self._data_send_thread = Thread(name='Send Data Thread', daemon=True, target=self._send_data)
-
         self.__loop = asyncio.new_event_loop()
 
         self.__connected = False
@@ -111,9 +110,6 @@ class OcppConnector(Connector, Thread):
         return self._connector_type
 
     def run(self):
-        self._data_convert_thread.start()
-        self._data_send_thread.start()
-
         self.__loop.create_task(self.start_server())
         self.__loop.run_forever()
 
@@ -189,17 +185,22 @@ class OcppConnector(Connector, Thread):
         if is_valid:
             uplink_converter_name = cp_config.get('extension', self._default_converters['uplink'])
             cp = ChargePoint(charge_point_id, websocket, {**cp_config, 'uplink_converter_name': uplink_converter_name},
-                             OcppConnector._callback, self._converter_log)
+                             self._converter_log, queue_size=self._messages_queue_size)
             cp.authorized = True
 
             self._log.info('Connected Charge Point with id: %s', charge_point_id)
             self._connected_charge_points.append(cp)
+            processing_task = self.__loop.create_task(self._process_charge_point_messages(cp))
 
             try:
                 await cp.start()
             except websockets.ConnectionClosed:
                 self._connected_charge_points.pop(self._connected_charge_points.index(cp))
 
+            # messages received before disconnect are still converted and sent
+            await cp.stop_messages_processing()
+            await processing_task
+
     async def _is_charge_point_valid(self, charge_point_id, **kwargs):
         for cp_config in self._charge_points_config:
             if re.match(cp_config['idRegexpPattern'], charge_point_id):
@@ -241,38 +242,57 @@ class OcppConnector(Connector, Thread):
     def is_stopped(self):
         return self.__stopped
 
-    @classmethod
-    def _callback(cls, data):
-        cls.DATA_TO_CONVERT.put(data)
-
-    def _process_data(self):
-        while not self.__stopped:
-            if not self.DATA_TO_CONVERT.empty():
-                self.statistics['MessagesReceived'] += 1
-                (converter, config, data) = self.DATA_TO_CONVERT.get()
-
-                StatisticsService.count_connector_message(self.name, stat_parameter_name='connectorMsgsReceived')
-                StatisticsService.count_connector_bytes(self.name, data,
-                                                        stat_parameter_name='connectorBytesReceived')
-
-                self._log.debug('Data from Charge Point: %s', data)
-                converted_data: ConvertedData = converter.convert(config, data)
-                if (converted_data and
-                        (converted_data.attributes_datapoints_count > 0 or
-                         converted_data.telemetry_datapoints_count > 0)):
-                    self.DATA_TO_SEND.put(converted_data)
-
-            sleep(.001)
-
-    def _send_data(self):
-        while not self.__stopped:
-            if not self.DATA_TO_SEND.empty():
-                converted_data = self.DATA_TO_SEND.get()
+    async def _process_charge_point_messages(self, charge_point):
+        """
+        Converts messages of the charge point on the event loop, messages that are queued together
+        are converted in batches: consecutive messages of the same type become single ConvertedData.
+        """
+        while True:
+            messages = await charge_point.get_messages(self._max_messages_batch_size)
+            if messages is None:
+                return
+
+            try:
+                self._process_messages_batch(charge_point.uplink_converter, messages)
+            except Exception as e:
+                self._log.exception('Failed to process messages from Charge Point %s: %s', charge_point.id, e)
+
+            # let other charge points be processed between batches
+            await asyncio.sleep(0)
+
+    def _process_messages_batch(self, converter, messages):
+        self.statistics['MessagesReceived'] += len(messages)
+        StatisticsService.count_connector_message(self.name, stat_parameter_name='connectorMsgsReceived',
+                                                  count=len(messages))
+
+        group_config, group_data = None, []
+        for config, data in messages:
+            StatisticsService.count_connector_bytes(self.name, data, stat_parameter_name='connectorBytesReceived')
+            self._log.debug('Data from Charge Point: %s', data)
+
+            if group_config is not None and (config['deviceName'] != group_config['deviceName']
+                                             or config['messageType'] != group_config['messageType']):
+                self._convert_and_send(converter, group_config, group_data)
+                group_data = []
+
+            group_config = config
+            group_data.append(data)
+
+        self._convert_and_send(converter, group_config, group_data)
+
+    def _convert_and_send(self, converter, config, data_list):
+        if hasattr(converter, 'convert_batch'):
+            converted_data_list = converter.convert_batch(config, data_list)
+        else:
+            converted_data_list = [converter.convert(config, data) for data in data_list]
+
+        for converted_data in converted_data_list:
+            if (converted_data and
+                    (converted_data.attributes_datapoints_count > 0 or
+                     converted_data.telemetry_datapoints_count > 0)):
                 self._gateway.send_to_storage(self.name, self.get_id(), converted_data)
                 self.statistics['MessagesSent'] += 1
-                self._log.info("Data to ThingsBoard: %s", converted_data)
-
-            sleep(.001)
+                self._log.debug("Data to ThingsBoard: %s", converted_data)
 
     @staticmethod
     async def _send_request(cp, request):
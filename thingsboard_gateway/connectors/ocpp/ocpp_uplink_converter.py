@@ -18,6 +18,7 @@ from time import time
 from thingsboard_gateway.connectors.ocpp.ocpp_converter import OcppConverter
 from thingsboard_gateway.gateway.constants import REPORT_STRATEGY_PARAMETER
 from thingsboard_gateway.gateway.entities.converted_data import ConvertedData
+from thingsboard_gateway.gateway.entities.converted_data_batch import ConvertedDataBatch
 from thingsboard_gateway.gateway.entities.report_strategy_config import ReportStrategyConfig
 from thingsboard_gateway.gateway.entities.telemetry_entry import TelemetryEntry
 from thingsboard_gateway.gateway.statistics.statistics_service import StatisticsService
@@ -76,20 +77,49 @@ class OcppUplinkConverter(OcppConverter):
                             config, e)
 
     def convert(self, config, data):
-        datatypes = {"attributes": "attributes",
-                     "timeseries": "telemetry"}
+        device_name = config['deviceName']
+        converted_data = ConvertedData(device_name=device_name, device_type=config['deviceType'])
+        self.__convert_message(converted_data, config, data, self.__get_report_strategy(device_name))
 
+        self.__count_produced_datapoints(converted_data)
+        return converted_data
+
+    def convert_batch(self, config, data_list):
+        """
+        Converts several messages of the same type from one charge point, messages are grouped
+        into as few ConvertedData as possible without overwriting values. Returns list of ConvertedData.
+        """
         device_name = config['deviceName']
-        device_type = config['deviceType']
+        device_report_strategy = self.__get_report_strategy(device_name)
+
+        result = ConvertedDataBatch()
+        for data in data_list:
+            converted_data = ConvertedData(device_name=device_name, device_type=config['deviceType'])
+            self.__convert_message(converted_data, config, data, device_report_strategy)
+            result.add(converted_data)
 
-        converted_data = ConvertedData(device_name=device_name, device_type=device_type)
+        for converted_data in result:
+            self.__count_produced_datapoints(converted_data)
 
-        device_report_strategy = None
+        return list(result)
+
+    def __get_report_strategy(self, device_name):
         try:
-            device_report_strategy = ReportStrategyConfig(self.__config.get(REPORT_STRATEGY_PARAMETER))
+            return ReportStrategyConfig(self.__config.get(REPORT_STRATEGY_PARAMETER))
         except ValueError as e:
             self._log.trace("Report strategy config is not specified for device %s: %s", device_name, e)
 
+    def __count_produced_datapoints(self, converted_data):
+        self._log.debug('Converted data: %s', converted_data)
+        StatisticsService.count_connector_message(self._log.name, 'convertersAttrProduced',
+                                                  count=converted_data.attributes_datapoints_count)
+        StatisticsService.count_connector_message(self._log.name, 'convertersTsProduced',
+                                                  count=converted_data.telemetry_datapoints_count)
+
+    def __convert_message(self, converted_data, config, data, device_report_strategy):
+        datatypes = {"attributes": "attributes",
+                     "timeseries": "telemetry"}
+
         try:
             for datatype in datatypes:
                 for datatype_config in self.__config.get(datatype, []):
@@ -130,11 +160,3 @@ class OcppUplinkConverter(OcppConverter):
             StatisticsService.count_connector_message(self._log.name, 'convertersMsgDropped')
             self._log.error('Error in converter, for config: \n%s\n and message: \n%s\n %s', dumps(self.__config),
                             str(data), e)
-
-        self._log.debug('Converted data: %s', converted_data)
-        StatisticsService.count_connector_message(self._log.name, 'convertersAttrProduced',
-                                                  count=converted_data.attributes_datapoints_count)
-        StatisticsService.count_connector_message(self._log.name, 'convertersTsProduced',
-                                                  count=converted_data.telemetry_datapoints_count)
-
-        return converted_data
@@ -25,6 +25,7 @@ from simplejson import dumps, load
 
 from thingsboard_gateway.gateway.constants import TELEMETRY_PARAMETER
 from thingsboard_gateway.gateway.entities.converted_data import ConvertedData
+from thingsboard_gateway.gateway.entities.converted_data_batch import ConvertedDataBatch
 from thingsboard_gateway.gateway.statistics.decorators import CollectAllReceivedBytesStatistics
 from thingsboard_gateway.tb_utility.tb_loader import TBModuleLoader
 from thingsboard_gateway.tb_utility.tb_utility import TBUtility
@@ -51,6 +52,7 @@ class OdbcConnector(Connector, Thread):
     DEFAULT_ENABLE_UNKNOWN_RPC = False
     DEFAULT_OVERRIDE_RPC_PARAMS = False
     DEFAULT_PROCESS_RPC_RESULT = False
+    DEFAULT_BATCH_SIZE = 0
 
     def __init__(self, gateway, config, connector_type):
         super().__init__()
@@ -89,6 +91,12 @@ class OdbcConnector(Connector, Thread):
         self.__converter = OdbcUplinkConverter(self._converter_log) if not self.__config.get("converter", "") else \
             TBModuleLoader.import_module(self._connector_type, self.__config["converter"])
 
+        self.__batch_size = max(int(self.__config["polling"].get("batchSize", self.DEFAULT_BATCH_SIZE)), 0)
+        self.__device_name_expression = compile(self.__config["mapping"]["device"]["name"],
+                                                "<device name expression>", "eval")
+        self.__device_type_expression = compile(self.__config["mapping"]["device"]["type"],
+                                                "<device type expression>", "eval")
+
         self.__configure_pyodbc()
         self.__parse_rpc_config()
 
@@ -327,6 +335,10 @@ class OdbcConnector(Connector, Thread):
                 self.__column_names.append(column[0])
             self._log.info("[%s] Fetch column names: %s", self.get_name(), self.__column_names)
 
+        if self.__batch_size > 0:
+            self.__poll_in_batches()
+            return
+
         # For some reason pyodbc.Cursor.rowcount may be 0 (sqlite) so use our own row counter
         row_count = 0
         for row in rows:
@@ -345,6 +357,77 @@ class OdbcConnector(Connector, Thread):
         if self.__config["polling"]["iterator"]["persistent"] and row_count > 0:
             self.__save_iterator_config()
 
+    def __poll_in_batches(self):
+        column_names = [column[0] for column in self.__cursor.description]
+        if self.__iterator["name"] not in column_names:
+            self._log.error("[%s] Iterator column '%s' is not found in query result columns %s, rows are skipped",
+                            self.get_name(), self.__iterator["name"], column_names)
+            return
+        iterator_index = column_names.index(self.__iterator["name"])
+
+        row_count = 0
+        while not self.__stopped:
+            rows = self.__cursor.fetchmany(self.__batch_size)
+            if not rows:
+                break
+
+            StatisticsService.count_connector_message(self.name, stat_parameter_name='connectorMsgsReceived',
+                                                      count=len(rows))
+            if StatisticsService.ENABLED:
+                for row in rows:
+                    StatisticsService.count_connector_bytes(self.name, row,
+                                                            stat_parameter_name='connectorBytesReceived')
+
+            self.__process_rows(rows, column_names, iterator_index)
+            row_count += len(rows)
+            self.__iterator["total"] += len(rows)
+
+            # Checkpoint every batch, so a long backfill is resumed from the last sent batch
+            if self.__config["polling"]["iterator"]["persistent"]:
+                self.__save_iterator_config()
+
+        self._log.info("[%s] Polling iteration finished. Processed rows: current %d, total %d",
+                       self.get_name(), row_count, self.__iterator["total"])
+
+    def __process_rows(self, rows, column_names, iterator_index):
+        """
+        Converts batch of rows and groups converted data of the same device into fewer messages,
+        values of rows converted with the same ts are not overwritten.
+        The iterator value is moved only after the data of batch is sent to storage.
+        """
+
+        iterator_value = None
+        devices_data = ConvertedDataBatch()
+        for row in rows:
+            try:
+                data = dict(zip(column_names, row))
+
+                converted_data: ConvertedData = self.__converter.convert(self.__config["mapping"], data)
+                if converted_data.telemetry_datapoints_count + converted_data.attributes_datapoints_count == 0:
+                    continue
+
+                StatisticsService.count_connector_message(self._log.name, 'convertersAttrProduced',
+                                                          count=converted_data.attributes_datapoints_count)
+                StatisticsService.count_connector_message(self._log.name, 'convertersTsProduced',
+                                                          count=converted_data.telemetry_datapoints_count)
+
+                converted_data.device_name = eval(self.__device_name_expression, globals(), data)
+                device_type = eval(self.__device_type_expression, globals(), data)
+                if not device_type:
+                    device_type = self.__config["mapping"]["device"].get("type", "default")
+                converted_data.device_type = device_type
+
+                devices_data.add(converted_data)
+                iterator_value = row[iterator_index]
+            except Exception as e:
+                self._log.warning("[%s] Failed to process database row: %s", self.get_name(), str(e))
+
+        for device_data in devices_data:
+            self.__check_and_send(device_data)
+
+        if iterator_value is not None:
+            self.__iterator["value"] = iterator_value
+
     def __process_row(self, row):
         try:
             data = self.row_to_dict(row)
@@ -356,9 +439,9 @@ class OdbcConnector(Connector, Thread):
             StatisticsService.count_connector_message(self._log.name, 'convertersTsProduced',
                                                       count=converted_data.telemetry_datapoints_count)
 
-            converted_data.device_name = eval(self.__config["mapping"]["device"]["name"], globals(), data)
+            converted_data.device_name = eval(self.__device_name_expression, globals(), data)
 
-            device_type = eval(self.__config["mapping"]["device"]["type"], globals(), data)
+            device_type = eval(self.__device_type_expression, globals(), data)
             if not device_type:
                 device_type = self.__config["mapping"]["device"].get("type", "default")
             converted_data.device_type = device_type
@@ -0,0 +1,101 @@
+#     Copyright 2026. ThingsBoard
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+from concurrent.futures import ThreadPoolExecutor
+from http.cookiejar import DefaultCookiePolicy
+from threading import BoundedSemaphore, Lock
+from time import monotonic
+from urllib.parse import urlsplit
+
+from requests import Session
+from requests.adapters import HTTPAdapter
+
+from thingsboard_gateway.gateway.statistics.statistics_service import StatisticsService
+
+DEFAULT_MAX_WORKERS = 16
+DEFAULT_MAX_CONCURRENT_REQUESTS_PER_HOST = 4
+
+
+class HttpClientPool:
+    """
+    Bounded worker pool with keep-alive HTTP sessions, one session (and connection pool) per host.
+    The number of simultaneous requests to the same host is limited by maxConcurrentRequestsPerHost.
+    """
+
+    def __init__(self, name, max_workers=DEFAULT_MAX_WORKERS,
+                 max_concurrent_requests_per_host=DEFAULT_MAX_CONCURRENT_REQUESTS_PER_HOST):
+        self.__name = name
+        self.__max_concurrent_requests_per_host = max(int(max_concurrent_requests_per_host), 1)
+        self.__executor = ThreadPoolExecutor(max_workers=max(int(max_workers), 1),
+                                             thread_name_prefix='%s request worker' % name)
+        self.__sessions = {}
+        self.__host_semaphores = {}
+        self.__lock = Lock()
+
+        self.__in_flight = 0
+
+    def submit(self, fn, *args, **kwargs):
+        return self.__executor.submit(fn, *args, **kwargs)
+
+    def request(self, method, url, **kwargs):
+        """
+        Drop-in replacement for requests.request that reuses per-host connections.
+        """
+
+        host = self.__get_host(url)
+        session, semaphore = self.__get_session_for_host(host)
+        with semaphore:
+            with self.__lock:
+                self.__in_flight += 1
+                in_flight = self.__in_flight
+            StatisticsService.set_connector_value(self.__name, 'requestsInFlight', in_flight)
+            started = monotonic()
+            try:
+                return session.request(method, url, **kwargs)
+            finally:
+                latency = (monotonic() - started) * 1000
+                with self.__lock:
+                    self.__in_flight -= 1
+                    in_flight = self.__in_flight
+                StatisticsService.count_connector_message(self.__name, stat_parameter_name='requestsCompleted')
+                StatisticsService.count_connector_message(self.__name, stat_parameter_name='requestsLatencyMs',
+                                                          count=int(latency))
+                StatisticsService.set_connector_max_value(self.__name, 'requestsMaxLatencyMs', int(latency))
+                StatisticsService.set_connector_value(self.__name, 'requestsInFlight', in_flight)
+
+    def close(self):
+        self.__executor.shutdown(wait=False, cancel_futures=True)
+        with self.__lock:
+            for session in self.__sessions.values():
+                session.close()
+            self.__sessions.clear()
+
+    @staticmethod
+    def __get_host(url):
+        split_url = urlsplit(url)
+        return split_url.scheme.lower() + '://' + split_url.netloc.lower()
+
+    def __get_session_for_host(self, host):
+        with self.__lock:
+            session = self.__sessions.get(host)
+            if session is None:
+                session = Session()
+                # Polled devices should not receive cookies from previous responses, as it was before pooling
+                session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=self.__max_concurrent_requests_per_host)
+                session.mount('http://', adapter)
+                session.mount('https://', adapter)
+                self.__sessions[host] = session
+                self.__host_semaphores[host] = BoundedSemaphore(self.__max_concurrent_requests_per_host)
+            return session, self.__host_semaphores[host]
@@ -12,7 +12,7 @@
 #     See the License for the specific language governing permissions and
 #     limitations under the License.
 
-from queue import Queue
+from queue import Queue, Empty
 from random import choice
 from re import fullmatch
 from string import ascii_lowercase
@@ -25,6 +25,8 @@ from thingsboard_gateway.gateway.entities.converted_data import ConvertedData
 from thingsboard_gateway.gateway.statistics.statistics_service import StatisticsService
 from thingsboard_gateway.tb_utility.tb_loader import TBModuleLoader
 from thingsboard_gateway.connectors.request.entities.rpc_execution_result import RpcExecutionResult
+from thingsboard_gateway.connectors.request.http_client_pool import HttpClientPool, DEFAULT_MAX_WORKERS, \
+    DEFAULT_MAX_CONCURRENT_REQUESTS_PER_HOST
 from thingsboard_gateway.tb_utility.tb_utility import TBUtility
 from thingsboard_gateway.tb_utility.tb_logger import init_logger
 
@@ -73,6 +75,10 @@ class RequestConnector(Connector, Thread):
         else:
             self.__host = "http://" + self.__config["host"]
         self.__ssl_verify = self.__config.get("SSLVerify", False)
+        self.__http_pool = HttpClientPool(self.name,
+                                          max_workers=self.__config.get("maxWorkers", DEFAULT_MAX_WORKERS),
+                                          max_concurrent_requests_per_host=self.__config.get(
+                                              "maxConcurrentRequestsPerHost", DEFAULT_MAX_CONCURRENT_REQUESTS_PER_HOST))
         self.daemon = True
         self.__connected = False
         self.__stopped = False
@@ -100,18 +106,25 @@ class RequestConnector(Connector, Thread):
 
     def run(self):
         while not self.__stopped:
-            request_sent = False
-            if self.__requests_in_progress:
-                for req in self.__requests_in_progress:
-                    if time() >= req["next_time"]:
-                        thread = Thread(target=self.__send_request, args=(req, self.__convert_queue, self._log),
-                                        daemon=True,
-                                        name="Request to endpoint \'%s\' Thread" % (req["config"].get("url")))
-                        thread.start()
-                        request_sent = True
-            if not request_sent:
-                sleep(.2)
+            current_time = time()
+            next_poll_time = current_time + .2
+            for req in self.__requests_in_progress:
+                if current_time >= req["next_time"]:
+                    req["next_time"] = current_time + req["config"].get("scanPeriod", 10)
+                    if req["in_progress"]:
+                        # Previous poll of the same endpoint is still running, so this one is skipped
+                        StatisticsService.count_connector_message(self.name, stat_parameter_name='requestsSkipped')
+                        self._log.debug("Request to endpoint '%s' is still in progress, poll skipped.",
+                                        req["config"].get("url"))
+                    else:
+                        req["in_progress"] = True
+                        future = self.__http_pool.submit(self.__send_request, req, self.__convert_queue, self._log)
+                        future.add_done_callback(lambda _, r=req: r.update({"in_progress": False}))
+                next_poll_time = min(next_poll_time, req["next_time"])
+
             self.__process_data()
+            if not self.__stopped and self.__convert_queue.empty():
+                sleep(max(min(next_poll_time - time(), .2), .01))
 
     def on_attributes_update(self, content):
         try:
@@ -122,7 +135,7 @@ class RequestConnector(Connector, Thread):
                     response_queue = Queue(1)
                     request_dict = {"config": {**attribute_request,
                                                **converted_data},
-                                    "request": request,
+                                    "request": self.__http_pool.request,
                                     "withResponse": True}
                     attribute_update_request_thread = Thread(target=self.__send_request,
                                                              args=(request_dict, response_queue, self._log),
@@ -258,7 +271,7 @@ class RequestConnector(Connector, Thread):
         response_queue = Queue(1)
         request_dict = {"config": {**rpc_request,
                                    **converted_data},
-                        "request": request,
+                        "request": self.__http_pool.request,
                         "withResponse": True,
                         }
         send_request_thread = Thread(target=self.__send_request,
@@ -388,7 +401,8 @@ class RequestConnector(Connector, Thread):
                 self.__requests_in_progress.append({"config": endpoint,
                                                     "converter": converter,
                                                     "next_time": time(),
-                                                    "request": request})
+                                                    "in_progress": False,
+                                                    "request": self.__http_pool.request})
             except Exception as e:
                 self._log.exception(e)
 
@@ -414,7 +428,6 @@ class RequestConnector(Connector, Thread):
     def __send_request(self, request, converter_queue, logger):
         url = ""
         try:
-            request["next_time"] = time() + request["config"].get("scanPeriod", 10)
             if request.get("converter") is None and isinstance(request["config"].get("converter"), dict):
                 logger.error("Converter for request to '%s' endpoint is not defined. Request will be skipped.", request["config"].get("url"))
                 return
@@ -527,14 +540,15 @@ class RequestConnector(Connector, Thread):
                 data["ts"] = int(time() * 1000)
 
     def __process_data(self):
-        try:
-            if not self.__convert_queue.empty():
-                data: ConvertedData = self.__convert_queue.get()
+        while not self.__stopped:
+            try:
+                data: ConvertedData = self.__convert_queue.get_nowait()
                 if data and (data.attributes_datapoints_count > 0 or data.telemetry_datapoints_count > 0):
                     self.__gateway.send_to_storage(self.get_name(), self.get_id(), data)
-
-        except Exception as e:
-            self._log.exception(e)
+            except Empty:
+                break
+            except Exception as e:
+                self._log.exception(e)
 
     def get_id(self):
         return self.__id
@@ -557,6 +571,7 @@ class RequestConnector(Connector, Thread):
 
     def close(self):
         self.__stopped = True
+        self.__http_pool.close()
         self._log.info("%r has been stopped.", self.name)
         self._log.stop()
 
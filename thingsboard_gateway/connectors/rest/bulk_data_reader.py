@@ -0,0 +1,136 @@
+#     Copyright 2026. ThingsBoard
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+import json
+from codecs import getincrementaldecoder
+from typing import AsyncIterator
+
+NDJSON_CONTENT_TYPES = ('application/x-ndjson', 'application/ndjson', 'application/jsonl', 'application/json-seq')
+JSON_WHITESPACE = ' \t\n\r'
+DEFAULT_CHUNK_SIZE = 65536
+
+
+class BulkDataReader:
+    """
+    Incrementally parses bulk request bodies (JSON array or NDJSON stream) from an aiohttp StreamReader.
+    Only the currently parsed element and one read chunk are kept in memory, so the request body size is not limited
+    by available memory. Compressed bodies (Content-Encoding: gzip/deflate) are decompressed by aiohttp transparently.
+    """
+
+    def __init__(self, stream, content_type=None, body_format='auto', chunk_size=DEFAULT_CHUNK_SIZE):
+        self.__stream = stream
+        self.__content_type = (content_type or '').lower()
+        self.__format = body_format.lower()
+        self.__chunk_size = chunk_size
+        self.__decoder = json.JSONDecoder()
+        self.__text_decoder = getincrementaldecoder('utf-8')(errors='replace')
+
+    async def __aiter__(self) -> AsyncIterator[dict]:
+        buffer = ''
+        body_format = self.__format
+        if body_format == 'auto' and self.__content_type in NDJSON_CONTENT_TYPES:
+            body_format = 'ndjson'
+
+        if body_format == 'auto':
+            # Detecting body format by the first meaningful character
+            while not buffer.lstrip(JSON_WHITESPACE):
+                chunk = await self.__read_chunk()
+                if chunk is None:
+                    return
+                buffer += chunk
+            buffer = buffer.lstrip(JSON_WHITESPACE)
+            body_format = 'json' if buffer[0] == '[' else 'ndjson'
+
+        if body_format == 'ndjson':
+            async for item in self.__iter_ndjson(buffer):
+                yield item
+        else:
+            async for item in self.__iter_json_array(buffer):
+                yield item
+
+    async def __read_chunk(self):
+        chunk = await self.__stream.read(self.__chunk_size)
+        if not chunk:
+            return None
+        return self.__text_decoder.decode(chunk)
+
+    async def __iter_ndjson(self, buffer):
+        while True:
+            *lines, buffer = buffer.split('\n')
+            for line in lines:
+                item = self.__decode_line(line)
+                if item is not None:
+                    yield item
+
+            chunk = await self.__read_chunk()
+            if chunk is None:
+                break
+            buffer += chunk
+
+        item = self.__decode_line(buffer)
+        if item is not None:
+            yield item
+
+    def __decode_line(self, line):
+        line = line.strip(JSON_WHITESPACE + '\x1e')
+        if not line:
+            return None
+        return json.loads(line)
+
+    async def __iter_json_array(self, buffer):
+        array_started = False
+        eof = False
+        position = 0
+        while True:
+            position = self.__skip_whitespace(buffer, position)
+            if position < len(buffer):
+                symbol = buffer[position]
+                if not array_started:
+                    if symbol == '[':
+                        array_started = True
+                        position += 1
+                        continue
+                    # Single object instead of array is also accepted
+                    array_started = True
+                if symbol == ',':
+                    position += 1
+                    continue
+                if symbol == ']':
+                    return
+                try:
+                    item, end = self.__decoder.raw_decode(buffer, position)
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+                else:
+                    # Element may be a number cut in the middle, so we need to be sure it is finished
+                    if end < len(buffer) or eof:
+                        position = end
+                        yield item
+                        continue
+            elif eof:
+                return
+
+            chunk = await self.__read_chunk()
+            if chunk is None:
+                eof = True
+            else:
+                buffer = buffer[position:] + chunk
+                position = 0
+
+    @staticmethod
+    def __skip_whitespace(buffer, position):
+        while position < len(buffer) and buffer[position] in JSON_WHITESPACE:
+            position += 1
+        return position
@@ -28,7 +28,9 @@ from requests.auth import HTTPBasicAuth as HTTPBasicAuthRequest
 from requests.exceptions import RequestException, JSONDecodeError
 
 from thingsboard_gateway.connectors.rest.backward_compatibility_adapter import BackwardCompatibilityAdapter
+from thingsboard_gateway.connectors.rest.bulk_data_reader import BulkDataReader
 from thingsboard_gateway.gateway.entities.converted_data import ConvertedData
+from thingsboard_gateway.gateway.entities.converted_data_batch import ConvertedDataBatch
 from thingsboard_gateway.gateway.statistics.statistics_service import StatisticsService
 from thingsboard_gateway.tb_utility.tb_loader import TBModuleLoader
 from thingsboard_gateway.tb_utility.tb_utility import TBUtility
@@ -572,6 +574,11 @@ class BaseDataHandler:
         self.unsuccessful_response = self.__endpoint['config'].get('response', {}).get('unsuccessfulResponse')
         self.response_expected = self.__endpoint['config'].get('response', {}).get('responseExpected', False)
 
+        bulk_config = self.__endpoint['config'].get('bulk', {})
+        self.bulk_enabled = bulk_config.get('enabled', False)
+        self.bulk_format = bulk_config.get('format', 'auto')
+        self.bulk_batch_size = max(int(bulk_config.get('batchSize', 1000)), 1)
+
     @property
     def name(self):
         return self.__name
@@ -644,6 +651,71 @@ class BaseDataHandler:
 
         return result
 
+    async def _process_bulk_request(self, request):
+        """
+        Converts every element of JSON array/NDJSON request body with the endpoint converter,
+        merges converted data per device and sends it to storage once per batch.
+        """
+
+        endpoint_config = self.endpoint['config']
+        request_data = dict(request.match_info)
+        request_data.update(dict(request.query))
+
+        converter_config = endpoint_config['converter']
+        converter_config.update({'reportStrategy': endpoint_config.get('reportStrategy')})
+        converter = self.endpoint['converter'](converter_config, self.converter_logger)
+
+        devices_data = ConvertedDataBatch()
+        items_count = 0
+        reader = BulkDataReader(request.content, content_type=request.content_type, body_format=self.bulk_format)
+        async for item in reader:
+            items_count += 1
+            if not isinstance(item, dict):
+                self.connector_logger.warning("Bulk item %r is not a JSON object and will be skipped", item)
+                continue
+
+            item.update(request_data)
+            converted_data: ConvertedData = converter.convert(config=endpoint_config['converter'], data=item)
+            if (converted_data and
+                    (converted_data.attributes_datapoints_count > 0 or
+                     converted_data.telemetry_datapoints_count > 0)):
+                devices_data.add(converted_data)
+
+            if devices_data.messages_count >= self.bulk_batch_size:
+                self.__send_bulk_data(devices_data)
+                devices_data.clear()
+
+        self.__send_bulk_data(devices_data)
+        self.connector_logger.debug("Processed %i bulk items from request to %s", items_count, request.path)
+        return items_count
+
+    def __send_bulk_data(self, devices_data: ConvertedDataBatch):
+        for converted_data in devices_data:
+            self.modify_data_for_remote_response(converted_data, self.response_expected)
+            self.send_to_storage(self.name, self.connector_id, converted_data)
+            self.connector_logger.debug("CONVERTED_DATA: %r", converted_data)
+
+    async def _handle_bulk_request(self, request):
+        endpoint_config = self.endpoint['config']
+        if request.method.upper() not in [method.upper() for method in endpoint_config['HTTPMethods']]:
+            return web.Response(body=str(self.unsuccessful_response) if self.unsuccessful_response else None,
+                                status=405)
+
+        try:
+            StatisticsService.count_connector_message(self.name, stat_parameter_name='connectorMsgsReceived')
+            if await self._process_bulk_request(request) == 0:
+                return web.Response(body=str(self.unsuccessful_response) if self.unsuccessful_response else None,
+                                    status=415)
+            return self.get_response()
+        except (json.decoder.JSONDecodeError, UnicodeDecodeError) as e:
+            self.connector_logger.error("Cannot parse bulk request body: %s", e)
+            return web.Response(body=str(self.unsuccessful_response) if self.unsuccessful_response else None,
+                                status=400)
+        except Exception as e:
+            self.connector_logger.exception("Error while processing bulk request: %s", e)
+            return web.Response(body=str(self.unsuccessful_response) if self.unsuccessful_response else None,
+                                status=500)
+
     @staticmethod
     def modify_data_for_remote_response(data, modify):
         if modify:
@@ -719,6 +791,9 @@ class BaseDataHandler:
 
 class AnonymousDataHandler(BaseDataHandler):
     async def __call__(self, request: web.Request):
+        if self.bulk_enabled:
+            return await self._handle_bulk_request(request)
+
         json_data = await self._convert_data_from_request(request)
 
         if not json_data and not len(request.query):
@@ -771,6 +846,9 @@ class BasicDataHandler(BaseDataHandler):
 
         auth = BasicAuth.decode(request.headers['Authorization'])
         if self.verify(auth.login, auth.password):
+            if self.bulk_enabled:
+                return await self._handle_bulk_request(request)
+
             json_data = await self._convert_data_from_request(request)
 
             if not json_data:
@@ -18,7 +18,7 @@ from re import search
 from socket import gethostbyname
 from string import ascii_lowercase
 from threading import Thread
-from time import sleep, time
+from time import time
 
 from thingsboard_gateway.connectors.connector import Connector
 from thingsboard_gateway.gateway.entities.converted_data import ConvertedData
@@ -74,6 +74,9 @@ class SNMPConnector(Connector, Thread):
         self.__methods = ["get", "multiget", "getnext", "walk", "multiwalk", "set", "multiset",
                           "bulkget", "bulkwalk", "table", "bulktable"]
         self.__datatypes = ('attributes', 'telemetry')
+        self.__bulk_methods = {"walk": "bulkwalk", "multiwalk": "bulkwalk", "table": "bulktable"}
+        self.__max_concurrent_requests = max(int(self.__config.get("maxConcurrentRequests", 32)), 1)
+        self.__polling_devices = set()
 
         self.__loop = asyncio.new_event_loop()
 
@@ -90,19 +93,42 @@ class SNMPConnector(Connector, Thread):
             self._log.exception(e)
 
     async def _run(self):
+        requests_semaphore = asyncio.Semaphore(self.__max_concurrent_requests)
         while not self.__stopped:
             current_time = time() * 1000
+            next_poll_time = current_time + 200
             for device in self.__devices:
                 try:
-                    if device.get("previous_poll_time", 0) + device.get("pollPeriod", 10000) < current_time:
-                        await self.__process_data(device)
+                    device_next_poll_time = device.get("previous_poll_time", 0) + device.get("pollPeriod", 10000)
+                    if device_next_poll_time <= current_time:
                         device["previous_poll_time"] = current_time
+                        device_next_poll_time = current_time + device.get("pollPeriod", 10000)
+                        if device["deviceName"] in self.__polling_devices:
+                            self._log.debug("Previous poll of device \"%s\" is still in progress, poll skipped.",
+                                            device["deviceName"])
+                        else:
+                            self.__polling_devices.add(device["deviceName"])
+                            self.__loop.create_task(self.__poll_device(device, requests_semaphore))
+                    next_poll_time = min(next_poll_time, device_next_poll_time)
                 except Exception as e:
                     self._log.exception(e)
             if self.__stopped:
                 break
             else:
-                sleep(.2)
+                await asyncio.sleep(max(next_poll_time - time() * 1000, 10) / 1000)
+
+    async def __poll_device(self, device, requests_semaphore):
+        # deadline of the whole device poll, so a slow device cannot hold the requests slots for long
+        poll_timeout = device.get("pollTimeout", device.get("pollPeriod", 10000)) / 1000
+        try:
+            await asyncio.wait_for(self.__process_data(device, requests_semaphore), poll_timeout)
+        except asyncio.TimeoutError:
+            self._log.error("Poll of device \"%s\" with ip: \"%s\" was not finished in %.1f seconds and cancelled",
+                            device["deviceName"], device["ip"], poll_timeout)
+        except Exception as e:
+            self._log.exception(e)
+        finally:
+            self.__polling_devices.discard(device["deviceName"])
 
     def close(self):
         self.__stopped = True
@@ -131,33 +157,50 @@ class SNMPConnector(Connector, Thread):
         self.__gateway.send_to_storage(connector_name, connector_id, data)
         self.statistics["MessagesSent"] = self.statistics["MessagesSent"] + 1
 
-    async def __process_data(self, device):
+    async def __process_data(self, device, requests_semaphore):
         common_parameters = self.__get_common_parameters(device)
-        device_responses = {}
+        client = self.__create_client(common_parameters)
+        use_bulk_requests = device.get("use_bulk_requests", False)
+        get_configs = []
+        device_requests = []
         for datatype in self.__datatypes:
             for datatype_config in device[datatype]:
+                method = datatype_config.get("method")
+                if method is None:
+                    self._log.error("Method not found in configuration: %r", datatype_config)
+                    continue
+                else:
+                    method = method.lower()
+                if method not in self.__methods:
+                    self._log.error("Unknown method: %s, configuration is: %r", method, datatype_config)
+                if method == "get":
+                    get_configs.append(datatype_config)
+                else:
+                    if use_bulk_requests and method in self.__bulk_methods:
+                        method = self.__bulk_methods[method]
+                    device_requests.append((method, datatype_config))
+
+        device_responses = {}
+        try:
+            if get_configs:
+                async with requests_semaphore:
+                    await self.__process_get_requests(client, device, get_configs, device_responses)
+
+            for method, datatype_config in device_requests:
                 try:
-                    method = datatype_config.get("method")
-                    if method is None:
-                        self._log.error("Method not found in configuration: %r", datatype_config)
-                        continue
-                    else:
-                        method = method.lower()
-                    if method not in self.__methods:
-                        self._log.error("Unknown method: %s, configuration is: %r", method, datatype_config)
-                    response = await self.__process_methods(method, common_parameters, datatype_config)
-                    device_responses[datatype_config['key']] = response
-
-                    StatisticsService.count_connector_message(self.name, stat_parameter_name='connectorMsgsReceived')
-                    StatisticsService.count_connector_bytes(self.name, response,
-                                                            stat_parameter_name='connectorBytesReceived')
+                    async with requests_semaphore:
+                        response = await self.__process_methods(method, common_parameters, datatype_config,
+                                                                client=client)
+                    self.__add_device_response(device_responses, datatype_config['key'], response)
                 except SNMPTimeoutException:
-                    self._log.error("Timeout exception on connection to device \"%s\" with ip: \"%s\"",
-                                    device["deviceName"],
-                                    device["ip"])
-                    return
+                    raise
                 except Exception as e:
                     self._log.exception(e)
+        except SNMPTimeoutException:
+            self._log.error("Timeout exception on connection to device \"%s\" with ip: \"%s\"",
+                            device["deviceName"],
+                            device["ip"])
+            return
 
         if device_responses:
             converted_data: ConvertedData = device["uplink_converter"].convert(device, device_responses)
@@ -167,12 +210,75 @@ class SNMPConnector(Connector, Thread):
                      converted_data.telemetry_datapoints_count > 0)):
                 self.collect_statistic_and_send(self.get_name(), self.get_id(), converted_data)
 
-    async def __process_methods(self, method, common_parameters, datatype_config):
+    async def __process_get_requests(self, client, device, get_configs, device_responses):
+        """
+        Coalesces all "get" keys of the device into multi-OID GET requests,
+        the keys of chunk are requested one by one only if the agent rejected the whole PDU.
+        """
+
+        max_oids_per_request = max(int(device.get("maxOidsPerRequest", 32)), 1)
+        for chunk_start in range(0, len(get_configs), max_oids_per_request):
+            chunk = get_configs[chunk_start:chunk_start + max_oids_per_request]
+            try:
+                if len(chunk) == 1:
+                    responses = [await client.get(oid=chunk[0]["oid"])]
+                else:
+                    responses = await client.multiget(oids=[datatype_config["oid"] for datatype_config in chunk])
+            except SNMPTimeoutException:
+                raise
+            except Exception as e:
+                self._log.debug("Multi-OID GET for device \"%s\" failed (%r), requesting OIDs one by one",
+                                device["deviceName"], e)
+                responses = []
+                for datatype_config in chunk:
+                    try:
+                        responses.append(await client.get(oid=datatype_config["oid"]))
+                    except SNMPTimeoutException:
+                        raise
+                    except Exception as e:
+                        self._log.exception(e)
+                        responses.append(None)
+
+            for datatype_config, response in zip(chunk, responses):
+                if response is not None:
+                    self.__add_device_response(device_responses, datatype_config['key'], response)
+
+    def __add_device_response(self, device_responses, key, response):
+        device_responses[key] = response
+
+        StatisticsService.count_connector_message(self.name, stat_parameter_name='connectorMsgsReceived')
+        StatisticsService.count_connector_bytes(self.name, response,
+                                                stat_parameter_name='connectorBytesReceived')
+
+    def __is_bulk_requests_enabled(self, device):
+        if not device.get("useBulkRequests", False):
+            return False
+        if self.__get_snmp_version(device) == "v1":
+            self._log.warning("GETBULK requests are not supported by SNMP v1, device \"%s\" will be walked with "
+                              "GETNEXT requests. Set \"snmpVersion\" to \"v2c\" to use GETBULK.",
+                              device["deviceName"])
+            return False
+        return True
+
+    @staticmethod
+    def __get_snmp_version(device):
+        return str(device.get("snmpVersion", "v1")).lower()
+
+    @staticmethod
+    def __create_client(common_parameters):
+        if common_parameters['version'] == "v2c":
+            client_credentials = credentials.V2C(common_parameters['community'])
+        else:
+            client_credentials = credentials.V1(common_parameters['community'])
         client = Client(ip=common_parameters['ip'],
                         port=common_parameters['port'],
-                        credentials=credentials.V1(common_parameters['community']))
+                        credentials=client_credentials)
         client.configure(timeout=common_parameters['timeout'])
-        client = PyWrapper(client)
+        return PyWrapper(client)
+
+    async def __process_methods(self, method, common_parameters, datatype_config, client=None):
+        if client is None:
+            client = self.__create_client(common_parameters)
 
         response = None
 
@@ -216,7 +322,7 @@ class SNMPConnector(Connector, Thread):
             response = response.scalars
         elif method == "bulkwalk":
             oids = datatype_config["oid"]
-            oids = oids if isinstance(oids, list) else list(oids)
+            oids = oids if isinstance(oids, list) else [oids]
             bulk_size = datatype_config.get("bulkSize", 10)
             response = {}
             async for binded_var in client.bulkwalk(bulk_size=bulk_size, oids=oids):
@@ -241,6 +347,7 @@ class SNMPConnector(Connector, Thread):
                                                                                              self._default_converters[
                                                                                                  "uplink"]))(device,
                                                                                                              self._converter_log)
+                device["use_bulk_requests"] = self.__is_bulk_requests_enabled(device)
                 device["downlink_converter"] = TBModuleLoader.import_module("snmp", device.get('converter',
                                                                                                self._default_converters[
                                                                                                    "downlink"]))(device)
@@ -253,6 +360,7 @@ class SNMPConnector(Connector, Thread):
                 "port": device.get("port", 161),
                 "timeout": device.get("timeout", 6),
                 "community": device["community"],
+                "version": SNMPConnector.__get_snmp_version(device),
                 }
 
     def on_attributes_update(self, content):
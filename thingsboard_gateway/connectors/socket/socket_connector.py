@@ -12,8 +12,9 @@
 #     See the License for the specific language governing permissions and
 #     limitations under the License.
 
+import asyncio
 import socket
-from queue import Queue
+from asyncio import CancelledError, DatagramProtocol, QueueEmpty
 from random import choice
 from re import findall, compile, fullmatch
 from string import ascii_lowercase
@@ -24,6 +25,7 @@ from simplejson import dumps
 
 from thingsboard_gateway.connectors.connector import Connector
 from thingsboard_gateway.connectors.socket.backward_compatibility_adapter import BackwardCompatibilityAdapter
+from thingsboard_gateway.connectors.framing import FramingError, create_framer
 from thingsboard_gateway.gateway.entities.converted_data import ConvertedData
 from thingsboard_gateway.gateway.statistics.decorators import CollectStatistics, CollectAllReceivedBytesStatistics
 from thingsboard_gateway.tb_utility.tb_loader import TBModuleLoader
@@ -36,6 +38,18 @@ SOCKET_TYPE = {
     'UDP': socket.SOCK_DGRAM
 }
 DEFAULT_UPLINK_CONVERTER = 'BytesSocketUplinkConverter'
+DEFAULT_BACKLOG = 1024
+# messages processed before giving control back to the event loop to read new data
+MAX_MESSAGES_PER_BATCH = 1000
+MAX_ADDRESS_INDEX_SIZE = 100000
+
+
+class UdpServerProtocol(DatagramProtocol):
+    def __init__(self, on_datagram):
+        self.__on_datagram = on_datagram
+
+    def datagram_received(self, data, addr):
+        self.__on_datagram(addr, data)
 
 
 class SocketConnector(Connector, Thread):
@@ -67,20 +81,26 @@ class SocketConnector(Connector, Thread):
         self.daemon = True
         self.__stopped = False
         self._connected = False
-        self.__bind = False
 
         self.__socket_type = self.__config.get('socket', {}).get('type', 'TCP').upper()
         self.__socket_address = self.__config.get('socket', {}).get('address', '127.0.0.1')
         self.__socket_port = self.__config.get('socket', {}).get('port', 50000)
-        self.__socket_buff_size = self.__config.get('socket', {}).get('buffer_size', 1024)
-
-        self.__socket = socket.socket(socket.AF_INET, SOCKET_TYPE[self.__socket_type])
-        self.__socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-        self.__converting_requests = Queue(-1)
+        self.__socket_buff_size = self.__config.get('socket', {}).get(
+            'bufferSize', self.__config.get('socket', {}).get('buffer_size', 1024))
+        self.__socket_backlog = self.__config.get('socket', {}).get('backlog', DEFAULT_BACKLOG)
+        self.__socket_receive_buffer_size = self.__config.get('socket', {}).get('receiveBufferSize')
+        self.__framing_config = self.__config.get('socket', {}).get('framing', {'type': 'none'})
+
+        self.loop = None
+        self.__server = None
+        self.__udp_transport = None
+        self.__udp_framer = None
+        self.__converting_requests = None
 
         self.__devices = {}
         self.__device_converters = {}
         self.__connections = {}
+        self.__address_index = {}
 
     def __convert_devices_list(self):
         devices = self.__config.get('devices', [])
@@ -178,104 +198,176 @@ class SocketConnector(Connector, Thread):
 
     def run(self):
         self.__devices, self.__device_converters = self.__convert_devices_list()
+        self.__address_index = {}
+
+        try:
+            self.__udp_framer = create_framer(self.__framing_config)
+        except (FramingError, KeyError, ValueError) as e:
+            self.__log.error('Invalid framing configuration %s: %s', self.__framing_config, e)
+            return
 
         self._connected = True
 
-        converting_thread = Thread(target=self.__process_data, daemon=True, name='Converter Thread')
-        converting_thread.start()
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        try:
+            self.loop.run_until_complete(self.__start())
+        except CancelledError as e:
+            self.__log.debug('Task was cancelled due to connector stop: %s', e)
+        except Exception as e:
+            self.__log.exception(e)
+        finally:
+            self.__cancel_all_tasks()
+            self.loop.close()
 
-        while not self.__bind and not self.__stopped:
-            try:
-                self.__socket.bind((self.__socket_address, self.__socket_port))
-            except OSError as e:
-                self.__log.error('Error binding socket: %s', e)
-                sleep(3)
-            else:
-                self.__bind = True
+    def __cancel_all_tasks(self):
+        pending_tasks = asyncio.all_tasks(self.loop)
+        for task in pending_tasks:
+            task.cancel()
 
-        if self.__stopped:
-             return
+        self.loop.run_until_complete(asyncio.gather(*pending_tasks, return_exceptions=True))
 
-        if self.__socket_type == 'TCP':
-            self.__socket.listen(5)
+    async def __start(self):
+        self.__converting_requests = asyncio.Queue()
 
-        self.__log.info('%s socket is up', self.__socket_type)
+        while not self.__stopped and not await self.__bind():
+            await asyncio.sleep(3)
 
-        while not self.__stopped:
-            try:
-                if self.__socket_type == 'TCP':
-                    try:
-                        if self.__socket.fileno() != -1:  # Check if the socket is open
-                            conn, address = self.__socket.accept()
-                            self.__connections[address] = conn
-
-                            self.__log.debug('New connection %s established', address)
-                            thread = Thread(target=self.__process_tcp_connection, daemon=True,
-                                            name=f'Processing {address} connection',
-                                            args=(conn, address))
-                            thread.start()
-                    except OSError as e:
-                        if self.__stopped:
-                            break
-                        self.__log.error('Error accepting connection: %s', e)
-                else:
-                    data, client_address = self.__socket.recvfrom(self.__socket_buff_size)
-                    self.__converting_requests.put((client_address, data))
-            except ConnectionAbortedError:
-                self.__socket.close()
+        if self.__stopped:
+            return
 
-    def __process_tcp_connection(self, connection, address):
-        while not self.__stopped:
-            data = connection.recv(self.__socket_buff_size)
+        self.__log.info('%s socket is up', self.__socket_type)
 
-            if data:
-                self.__converting_requests.put((address, data))
+        await self.__process_data()
+
+    async def __bind(self):
+        try:
+            if self.__socket_type == 'TCP':
+                self.__server = await asyncio.start_server(self.__process_tcp_connection,
+                                                           self.__socket_address,
+                                                           self.__socket_port,
+                                                           reuse_address=True,
+                                                           backlog=self.__socket_backlog)
             else:
-                break
+                self.__udp_transport, _ = await self.loop.create_datagram_endpoint(
+                    lambda: UdpServerProtocol(self.__process_datagram),
+                    local_addr=(self.__socket_address, self.__socket_port))
+
+                # datagrams received while previous messages are converted are dropped if the buffer is full
+                if self.__socket_receive_buffer_size:
+                    self.__udp_transport.get_extra_info('socket').setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF,
+                                                                             self.__socket_receive_buffer_size)
+        except OSError as e:
+            self.__log.error('Error binding socket: %s', e)
+            return False
+
+        return True
+
+    async def __process_tcp_connection(self, reader, writer):
+        address = writer.get_extra_info('peername')[:2]
+        self.__connections[address] = writer
+        self.__log.debug('New connection %s established', address)
+
+        framer = create_framer(self.__framing_config)
+        try:
+            while not self.__stopped:
+                data = await reader.read(self.__socket_buff_size)
+                if not data:
+                    break
+
+                self.__put_frames(address, framer, data)
+        except (ConnectionError, OSError) as e:
+            self.__log.debug('Connection %s error: %s', address, e)
+        finally:
+            self.__connections.pop(address, None)
+            self.__address_index.pop(address, None)
+            writer.close()
+            self.__log.debug('Connection %s closed', address)
+
+    def __process_datagram(self, address, data):
+        self.__put_frames(address[:2], self.__udp_framer, data)
+        # datagrams are independent, incomplete frame from one datagram is not continued in the next one
+        if self.__udp_framer.pending_bytes:
+            self.__log.debug('Incomplete frame from %s dropped', address)
+            self.__udp_framer.reset()
+
+    def __put_frames(self, address, framer, data):
+        try:
+            frames = framer.feed(data)
+        except FramingError as e:
+            self.__log.error('Failed to split data from %s to messages: %s', address, e)
+            return
 
-        connection.close()
-        self.__connections.pop(address)
-        self.__log.debug('Connection %s closed', address)
+        for frame in frames:
+            self.__converting_requests.put_nowait((address, frame))
 
-    def __process_data(self):
+    async def __process_data(self):
         while not self.__stopped:
-            if not self.__converting_requests.empty():
-                (address, port), data = self.__converting_requests.get()
-                for conf_device_address in self.__devices:
-                    client_address = f"{address}:{port}"
-                    if client_address != conf_device_address and not fullmatch(conf_device_address, client_address):
-                        continue
-                    device = self.__devices.get(conf_device_address)
-                    device['address'] = client_address
-
-                    # check data for attribute requests
-                    is_attribute_request = False
-                    attr_requests = device.get('attributeRequests', [])
-                    if len(attr_requests):
-                        for attr in attr_requests:
-                            equal = data
-                            if attr['haveIndex']:
-                                if attr.get('requestIndexFrom') and attr.get('requestIndexTo'):
-                                    index_from = int(attr['requestIndexFrom']) if attr['requestIndexFrom'] != '' else None
-                                    index_to = int(attr['requestIndexTo']) if attr['requestIndexTo'] != '' else None
-                                    equal = data[index_from:index_to]
-                                else:
-                                    equal = data[int(attr['requestIndex'])]
-    
-                            if attr['requestEqual'] == equal.decode('utf-8'):
-                                is_attribute_request = True
-                                self.__process_attribute_request(device['deviceName'], attr, data)
-    
-                        if is_attribute_request:
-                            continue
-
-                    StatisticsService.count_connector_message(self.name, stat_parameter_name='connectorMsgsReceived')
-                    StatisticsService.count_connector_bytes(self.name, data,
-                                                            stat_parameter_name='connectorBytesReceived')
-                    converter = self.__device_converters.get(conf_device_address)
-                    self.__convert_data(device, data, converter)
-
-            sleep(.2)
+            request = await self.__converting_requests.get()
+
+            # drain all messages received since the last wake up
+            processed = 0
+            while request is not None:
+                self.__process_message(*request)
+
+                processed += 1
+                if processed >= MAX_MESSAGES_PER_BATCH:
+                    processed = 0
+                    await asyncio.sleep(0)
+
+                try:
+                    request = self.__converting_requests.get_nowait()
+                except QueueEmpty:
+                    break
+
+    def __process_message(self, address, data):
+        client_address = "%s:%s" % address
+        for conf_device_address in self.__get_devices_by_address(address, client_address):
+            device = self.__devices.get(conf_device_address)
+            device['address'] = client_address
+
+            # check data for attribute requests
+            is_attribute_request = False
+            attr_requests = device.get('attributeRequests', [])
+            if len(attr_requests):
+                for attr in attr_requests:
+                    equal = data
+                    if attr['haveIndex']:
+                        if attr.get('requestIndexFrom') and attr.get('requestIndexTo'):
+                            index_from = int(attr['requestIndexFrom']) if attr['requestIndexFrom'] != '' else None
+                            index_to = int(attr['requestIndexTo']) if attr['requestIndexTo'] != '' else None
+                            equal = data[index_from:index_to]
+                        else:
+                            equal = data[int(attr['requestIndex'])]
+
+                    if attr['requestEqual'] == equal.decode('utf-8'):
+                        is_attribute_request = True
+                        self.__process_attribute_request(device['deviceName'], attr, data)
+
+                if is_attribute_request:
+                    continue
+
+            StatisticsService.count_connector_message(self.name, stat_parameter_name='connectorMsgsReceived')
+            StatisticsService.count_connector_bytes(self.name, data,
+                                                    stat_parameter_name='connectorBytesReceived')
+            converter = self.__device_converters.get(conf_device_address)
+            self.__convert_data(device, data, converter)
+
+    def __get_devices_by_address(self, address, client_address):
+        """
+        Configured devices matching client address are found once and cached for next messages.
+        """
+
+        devices = self.__address_index.get(address)
+        if devices is None:
+            devices = [conf_device_address for conf_device_address in self.__devices
+                       if client_address == conf_device_address or fullmatch(conf_device_address, client_address)]
+
+            if len(self.__address_index) >= MAX_ADDRESS_INDEX_SIZE:
+                self.__address_index.clear()
+            self.__address_index[address] = devices
+
+        return devices
 
     def __convert_data(self, device, data, converter):
         address, port = device['address'].split(':')
@@ -347,17 +439,28 @@ class SocketConnector(Connector, Thread):
     def close(self):
         self.__stopped = True
         self._connected = False
-        self.__log.info('%s connector has been stopped.', self.get_name())
-        self.__connections = {}
-        while self.__socket.fileno() != -1:
+        if self.loop is not None and self.loop.is_running():
             try:
-                self.__socket.shutdown(socket.SHUT_RDWR)
-            except OSError:
-                pass  # Ignore errors when socket is already closed
-            self.__socket.close()
-            sleep(0.01)
+                asyncio.run_coroutine_threadsafe(self.__stop_server(), self.loop).result(timeout=5)
+            except Exception as e:
+                self.__log.debug('Failed to stop %s server: %s', self.__socket_type, e)
+        self.__log.info('%s connector has been stopped.', self.get_name())
         self.__log.stop()
 
+    async def __stop_server(self):
+        if self.__server is not None:
+            self.__server.close()
+
+        if self.__udp_transport is not None:
+            self.__udp_transport.close()
+
+        for writer in list(self.__connections.values()):
+            writer.close()
+        self.__connections = {}
+
+        # wake up data processing to finish the loop
+        self.__converting_requests.put_nowait(None)
+
     def get_name(self):
         return self.name
 
@@ -378,8 +481,12 @@ class SocketConnector(Connector, Thread):
 
     @CustomCollectStatistics(start_stat_type='allBytesSentToDevices')
     def __write_value_via_tcp(self, address, port, value):
+        if isinstance(value, str):
+            value = bytes(value, encoding='utf-8')
+
         try:
-            self.__connections[(address, int(port))].sendall(bytes(value, encoding='utf-8'))
+            # connections are handled by the connector event loop, write is called from gateway threads
+            self.loop.call_soon_threadsafe(self.__connections[(address, int(port))].write, value)
             return 'ok'
         except KeyError:
             try:
@@ -11,6 +11,7 @@ class Device:
     timeseries: List
     attribute_updates: List
     server_side_rpc: List
+    bulk_messages: bool = False
     converter = None
 
     def set_converter(self, converter):
@@ -14,15 +14,14 @@
 
 import asyncio
 from json import dumps
-from queue import Queue
 from random import choice
 from string import ascii_lowercase
 from threading import Thread
-from time import sleep
 
 from thingsboard_gateway.connectors.connector import Connector
 from thingsboard_gateway.connectors.xmpp.device import Device
 from thingsboard_gateway.gateway.entities.converted_data import ConvertedData
+from thingsboard_gateway.gateway.entities.converted_data_batch import ConvertedDataBatch
 from thingsboard_gateway.gateway.statistics.decorators import CollectStatistics, CollectAllReceivedBytesStatistics
 from thingsboard_gateway.tb_utility.tb_loader import TBModuleLoader
 from thingsboard_gateway.tb_utility.tb_utility import TBUtility
@@ -39,12 +38,10 @@ except ImportError:
 from slixmpp.exceptions import IqError, IqTimeout
 
 DEFAULT_UPLINK_CONVERTER = 'XmppUplinkConverter'
+DEFAULT_MAX_MESSAGES_BATCH_SIZE = 100
 
 
 class XMPPConnector(Connector, Thread):
-    INCOMING_MESSAGES = Queue()
-    DATA_TO_SEND = Queue()
-
     def __init__(self, gateway, config, connector_type):
         self.statistics = {'MessagesReceived': 0,
                            'MessagesSent': 0}
@@ -67,7 +64,13 @@ class XMPPConnector(Connector, Thread):
                                            enable_remote_logging=self.__config.get('enableRemoteLogging', False),
                                            is_connector_logger=True, attr_name=self.name)
 
+        self._max_messages_batch_size = self._server_config.get('maxMessagesBatchSize',
+                                                                DEFAULT_MAX_MESSAGES_BATCH_SIZE)
+
         self._devices = {}
+        # cache of resolved message senders (full JID -> Device), bare JID is used as fallback
+        self._devices_by_sender_jid = {}
+        self._converters = {}
         self._reformat_devices_config()
 
         # devices dict for RPC and attributes updates
@@ -79,6 +82,7 @@ class XMPPConnector(Connector, Thread):
         self.daemon = True
 
         self._xmpp = None
+        self._incoming_messages = None
 
     def _reformat_devices_config(self):
         for config in self._devices_config:
@@ -86,9 +90,13 @@ class XMPPConnector(Connector, Thread):
                 device_jid = config.get('jid')
 
                 converter_name = config.pop('converter', DEFAULT_UPLINK_CONVERTER)
-                converter = self._load_converter(converter_name)
-                if not converter:
-                    continue
+                converter = self._converters.get(converter_name)
+                if converter is None:
+                    converter = self._load_converter(converter_name)
+                    if not converter:
+                        continue
+
+                    self._converters[converter_name] = converter
 
                 self._devices[device_jid] = Device(
                     jid=device_jid,
@@ -97,7 +105,8 @@ class XMPPConnector(Connector, Thread):
                     attributes=config.get('attributes', []),
                     timeseries=config.get('timeseries', []),
                     attribute_updates=config.get('attributeUpdates', []),
-                    server_side_rpc=config.get('serverSideRpc', [])
+                    server_side_rpc=config.get('serverSideRpc', []),
+                    bulk_messages=config.get('bulkMessages', False)
                 )
                 self._devices[device_jid].set_converter(converter(config, self.__converter_log))
             except KeyError as e:
@@ -120,18 +129,14 @@ class XMPPConnector(Connector, Thread):
         self.__log.info('Starting XMPP Connector')
 
     def run(self):
-        process_messages_thread = Thread(target=self._process_messages,
-                                         name='Validate incoming msgs thread', daemon=True)
-        process_messages_thread.start()
-
-        data_to_send_thread = Thread(target=self._send_data, name='Data to send thread', daemon=True)
-        data_to_send_thread.start()
-
         self.create_client()
 
     def create_client(self):
-        # creating event loop for slixmpp
-        asyncio.set_event_loop(asyncio.new_event_loop())
+        # creating event loop for slixmpp, incoming messages are converted on the same loop
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        self._incoming_messages = asyncio.Queue()
+        loop.create_task(self._process_messages())
 
         self.__log.info('Starting XMPP Client...')
         self._xmpp = ClientXMPP(jid=self._server_config['jid'], password=self._server_config['password'])
@@ -165,53 +170,77 @@ class XMPPConnector(Connector, Thread):
 
         self._connected = True
 
-    @staticmethod
-    def message(msg):
-        # put incoming messages to the queue because of data missing probability
-        XMPPConnector.INCOMING_MESSAGES.put(msg)
+    def message(self, msg):
+        # keep only sender and body, the stanza itself is not needed after the handler returns
+        self._incoming_messages.put_nowait((str(msg['from']), msg['body']))
+
+    async def _process_messages(self):
+        """
+        Drains incoming messages queue in batches on the slixmpp event loop.
+        """
 
-    def _process_messages(self):
-        while not self.__stopped:
-            if not XMPPConnector.INCOMING_MESSAGES.empty():
-                msg = XMPPConnector.INCOMING_MESSAGES.get()
-                self.__log.debug('Got message: %s', msg.values)
-
-                try:
-                    device_jid = msg.values['from']
-                    device = self._devices.get(device_jid)
-                    if device:
-                        StatisticsService.count_connector_message(self.name,
-                                                                  stat_parameter_name='connectorMsgsReceived')
-                        StatisticsService.count_connector_bytes(self.name, msg.values['body'],
-                                                                stat_parameter_name='connectorBytesReceived')
-
-                        converted_data = device.converter.convert(device, msg.values['body'])
-
-                        if converted_data:
-                            XMPPConnector.DATA_TO_SEND.put(converted_data)
-
-                            if not self._available_device.get(converted_data.device_name):
-                                self._available_device[converted_data.device_name] = device_jid
-                        else:
-                            self.__log.error('Converted data is empty')
-                    else:
-                        self.__log.info('Device %s not found', device_jid)
-                except KeyError as e:
-                    self.__log.exception(e)
-
-            sleep(.2)
-
-    def _send_data(self):
         while not self.__stopped:
-            if not XMPPConnector.DATA_TO_SEND.empty():
-                data: ConvertedData = XMPPConnector.DATA_TO_SEND.get()
-                if data.attributes_datapoints_count > 0 or data.telemetry_datapoints_count > 0:
-                    self.statistics['MessagesReceived'] = self.statistics['MessagesReceived'] + 1
-                    self.__gateway.send_to_storage(self.get_name(), self.get_id(), data)
-                    self.statistics['MessagesSent'] = self.statistics['MessagesSent'] + 1
-                    self.__log.info('Data to ThingsBoard %s', data)
-
-            sleep(.2)
+            try:
+                messages = [await asyncio.wait_for(self._incoming_messages.get(), timeout=1)]
+            except asyncio.TimeoutError:
+                continue
+
+            while len(messages) < self._max_messages_batch_size and not self._incoming_messages.empty():
+                messages.append(self._incoming_messages.get_nowait())
+
+            try:
+                self._process_messages_batch(messages)
+            except Exception as e:
+                self.__log.exception('Failed to process incoming messages: %s', e)
+
+    def _process_messages_batch(self, messages):
+        data_to_send = ConvertedDataBatch()
+
+        for device_jid, body in messages:
+            self.__log.debug('Got message from %s: %s', device_jid, body)
+
+            device = self._get_device(device_jid)
+            if device is None:
+                self.__log.info('Device %s not found', device_jid)
+                continue
+
+            StatisticsService.count_connector_message(self.name, stat_parameter_name='connectorMsgsReceived')
+            StatisticsService.count_connector_bytes(self.name, body, stat_parameter_name='connectorBytesReceived')
+
+            if device.bulk_messages and hasattr(device.converter, 'convert_bulk'):
+                converted_data_list = device.converter.convert_bulk(device, body)
+            else:
+                converted_data = device.converter.convert(device, body)
+                converted_data_list = [converted_data] if converted_data else []
+
+            if not converted_data_list:
+                self.__log.error('Converted data is empty')
+                continue
+
+            for converted_data in converted_data_list:
+                if not self._available_device.get(converted_data.device_name):
+                    self._available_device[converted_data.device_name] = device.jid
+
+                data_to_send.add(converted_data)
+
+        for data in data_to_send:
+            self._send_data(data)
+
+    def _get_device(self, device_jid):
+        device = self._devices_by_sender_jid.get(device_jid)
+        if device is None:
+            device = self._devices.get(device_jid) or self._devices.get(device_jid.split('/', 1)[0])
+            if device is not None:
+                self._devices_by_sender_jid[device_jid] = device
+
+        return device
+
+    def _send_data(self, data: ConvertedData):
+        if data.attributes_datapoints_count > 0 or data.telemetry_datapoints_count > 0:
+            self.statistics['MessagesReceived'] = self.statistics['MessagesReceived'] + 1
+            self.__gateway.send_to_storage(self.get_name(), self.get_id(), data)
+            self.statistics['MessagesSent'] = self.statistics['MessagesSent'] + 1
+            self.__log.info('Data to ThingsBoard %s', data)
 
     def close(self):
         self.__stopped = True
@@ -19,12 +19,14 @@ from time import time
 from thingsboard_gateway.connectors.xmpp.xmpp_converter import XmppConverter
 from thingsboard_gateway.gateway.constants import REPORT_STRATEGY_PARAMETER
 from thingsboard_gateway.gateway.entities.converted_data import ConvertedData
+from thingsboard_gateway.gateway.entities.converted_data_batch import ConvertedDataBatch
 from thingsboard_gateway.gateway.entities.report_strategy_config import ReportStrategyConfig
 from thingsboard_gateway.gateway.entities.telemetry_entry import TelemetryEntry
 from thingsboard_gateway.gateway.statistics.decorators import CollectStatistics
 from thingsboard_gateway.tb_utility.tb_utility import TBUtility
 from thingsboard_gateway.gateway.statistics.statistics_service import StatisticsService
 
+DEFAULT_BULK_MESSAGES_DELIMITER = '\n'
 
 class XmppUplinkConverter(XmppConverter):
     def __init__(self, config, logger):
@@ -32,11 +34,21 @@ class XmppUplinkConverter(XmppConverter):
         self.__config = config
         self._datatypes = {"attributes": "attributes",
                            "timeseries": "telemetry"}
+        self._bulk_messages_delimiter = self.__config.get('bulkMessagesDelimiter', DEFAULT_BULK_MESSAGES_DELIMITER)
+        self.__device_report_strategy = self.__load_device_report_strategy()
 
     def _convert_json(self, val):
         try:
             data = json.loads(val)
+        except Exception as e:
+            StatisticsService.count_connector_message(self._log.name, 'convertersMsgDropped')
+            self._log.exception(e)
+            return None
 
+        return self._convert_json_data(data)
+
+    def _convert_json_data(self, data):
+        try:
             device_name_tags = TBUtility.get_values(self.__config.get("deviceNameExpression"), data,
                                                     get_tag=True)
             device_name_values = TBUtility.get_values(self.__config.get("deviceNameExpression"), data,
@@ -129,11 +141,15 @@ class XmppUplinkConverter(XmppConverter):
             return config[key]
 
     def _get_device_report_strategy(self, device_name):
+        return self.__device_report_strategy
+
+    def __load_device_report_strategy(self):
         device_report_strategy = None
         try:
             device_report_strategy = ReportStrategyConfig(self.__config.get(REPORT_STRATEGY_PARAMETER))
         except ValueError as e:
-            self._log.trace("Report strategy config is not specified for device %s: %s", device_name, e)
+            self._log.trace("Report strategy config is not specified for device %s: %s",
+                            self.__config.get('jid'), e)
 
         return device_report_strategy
 
@@ -165,26 +181,77 @@ class XmppUplinkConverter(XmppConverter):
             StatisticsService.count_connector_message(self._log.name, 'convertersMsgDropped')
             self._log.exception(e)
 
+    def _split_bulk_message(self, val):
+        """
+        Splits message body with multiple readings: JSON array items or text lines separated by delimiter.
+        """
+
+        try:
+            data = json.loads(val)
+        except ValueError:
+            return [reading for reading in val.split(self._bulk_messages_delimiter) if reading.strip()]
+
+        return data if isinstance(data, list) else [data]
+
+    def _convert_reading(self, reading):
+        if isinstance(reading, str):
+            try:
+                data = json.loads(reading)
+                if isinstance(data, dict):
+                    reading = data
+            except ValueError:
+                pass
+
+        if isinstance(reading, dict):
+            return self._convert_json_data(reading)
+
+        if not isinstance(reading, str):
+            self._log.error('Unsupported reading %r in bulk message', reading)
+            return None
+
+        return self._convert_text(reading)
+
+    def _count_produced_datapoints(self, result):
+        StatisticsService.count_connector_message(self._log.name, 'convertersAttrProduced',
+                                                  count=result.attributes_datapoints_count)
+        StatisticsService.count_connector_message(self._log.name, 'convertersTsProduced',
+                                                  count=result.telemetry_datapoints_count)
+
     @CollectStatistics(start_stat_type='receivedBytesFromDevices',
                        end_stat_type='convertedBytesFromDevice')
     def convert(self, config, val):
         # convert data if it is json format
         result = self._convert_json(val)
         if result:
-            StatisticsService.count_connector_message(self._log.name, 'convertersAttrProduced',
-                                                      count=result.attributes_datapoints_count)
-            StatisticsService.count_connector_message(self._log.name, 'convertersTsProduced',
-                                                      count=result.telemetry_datapoints_count)
+            self._count_produced_datapoints(result)
             return result
 
         # convert data using slices if it is text format
         result = self._convert_text(val)
         if result:
-            StatisticsService.count_connector_message(self._log.name, 'convertersAttrProduced',
-                                                      count=result.attributes_datapoints_count)
-            StatisticsService.count_connector_message(self._log.name, 'convertersTsProduced',
-                                                      count=result.telemetry_datapoints_count)
+            self._count_produced_datapoints(result)
             return result
 
         # if none of above
         return None
+
+    @CollectStatistics(start_stat_type='receivedBytesFromDevices',
+                       end_stat_type='convertedBytesFromDevice')
+    def convert_bulk(self, config, val):
+        """
+        Converts message that contains multiple readings, readings of the same device are grouped
+        into as few ConvertedData as possible without overwriting values. Returns list of ConvertedData.
+        """
+
+        result = ConvertedDataBatch()
+        for reading in self._split_bulk_message(val):
+            converted_data = self._convert_reading(reading)
+            if not converted_data:
+                continue
+
+            result.add(converted_data)
+
+        for converted_data in result:
+            self._count_produced_datapoints(converted_data)
+
+        return list(result)
@@ -13,7 +13,7 @@
 #     limitations under the License.
 
 
-from queue import Queue
+from queue import Empty, Queue
 from threading import Event, Thread, Lock
 from typing import List, TYPE_CHECKING
 
@@ -30,6 +30,7 @@ except ImportError:
     import serial
 
 from thingsboard_gateway.connectors.connector import Connector
+from thingsboard_gateway.extensions.serial.serial_frame_reader import SerialFrameReader
 from thingsboard_gateway.tb_utility.tb_loader import TBModuleLoader
 from thingsboard_gateway.tb_utility.tb_logger import init_logger
 
@@ -56,6 +57,7 @@ class SerialDevice(Thread):
         self.uplink_converter = uplink_converter
         self.downlink_converter = None
         self.delimiter = self.config.get('delimiter', '\n')
+        self.__frame_reader = SerialFrameReader(self.config, self.__log)
         self.__rpc_in_progress = Event()
         self.__previous_connect = 0
 
@@ -115,11 +117,12 @@ class SerialDevice(Thread):
                     sleep(3)
                 else:
                     if not self.__rpc_in_progress.is_set():
-                        data_from_device = self.__read_data_from_serial()
-                        if data_from_device:
+                        frames = self.__read_frames_from_serial()
+                        if frames:
                             try:
-                                converted_data = self.uplink_converter.convert(None, data_from_device)
-                                self.uplink_queue.put(converted_data)
+                                converted_data = self.__convert_frames(frames)
+                                if converted_data:
+                                    self.uplink_queue.put(converted_data)
                             except Exception as e:
                                 self.__log.error("Failed to convert data from device %s: %s", self.name, e)
             except Exception as e:
@@ -192,29 +195,44 @@ class SerialDevice(Thread):
             self.__log.exception("Failed to write to device %s: %s", self.name, e)
         return None
 
+    def __convert_frames(self, frames):
+        """
+        Method to convert batch of frames, converters without batch support convert frames one by one.
+        """
+        if hasattr(self.uplink_converter, 'convert_batch'):
+            return self.uplink_converter.convert_batch(frames)
+        return [self.uplink_converter.convert(None, frame) for frame in frames]
+
+    def __read_frames_from_serial(self):
+        """
+        Method to read all available data from the device and split it to frames.
+        """
+        try:
+            serial_conn = self.get_serial()
+            if serial_conn and serial_conn.is_open:
+                return self.__frame_reader.read_frames(serial_conn)
+        except Exception as e:
+            self.__log.exception("Failed to read from device %s: %s", self.name, e)
+        return []
+
     def __read_data_from_serial(self, timeout=1):
         """
         Method to read data from the device.
-        It reads data until the delimiter is found.
+        It reads data until the frame is received or timeout expires.
         """
         data_from_device = b''
         serial_conn = None
+        previous_timeout = None
         try:
             serial_conn = self.get_serial()
-            if serial_conn and serial_conn.is_open: 
-                # Ensure serial_conn is not None before accessing its timeout attribute
+            if serial_conn and serial_conn.is_open:
                 previous_timeout = serial_conn.timeout
-                while not data_from_device.endswith(self.delimiter.encode('utf-8')):
-                    serial_conn.timeout = timeout
-                    chunk = serial_conn.read(1)
-                    if chunk:
-                        data_from_device += chunk
-                    if self.__connector_stopped.is_set() or not chunk or self.stopped:
-                        break
+                serial_conn.timeout = min(timeout, previous_timeout or timeout)
+                data_from_device = self.__frame_reader.read_frame(serial_conn, timeout)
         except Exception as e:
             self.__log.exception("Failed to read from device %s: %s", self.name, e)
         finally:
-            if serial_conn:
+            if serial_conn and previous_timeout is not None:
                 serial_conn.timeout = previous_timeout
         return data_from_device
 
@@ -358,16 +376,36 @@ class SerialConnector(Thread, Connector):
                                                   self._log, self.__uplink_queue)
                             device.start()
                     self.__connected = connected_devices == len(self.__devices)
-                    if not self.__uplink_queue.empty():
-                        data = self.__uplink_queue.get()
-                        self.__gateway.send_to_storage(self.name, self.__id, data)
-                    else:
-                        sleep(0.05)
+                    self.__process_uplink_queue()
                 except Exception as e:
                     self._log.error("Failed to process data from device %s, error: %s", self.name, e)
         except Exception as e:
             self._log.error("Failed to process data from device %s, error: %s", self.name, e)
 
+    def __process_uplink_queue(self):
+        """
+        Method to send all queued data to the storage, it waits for the data not longer than 50ms.
+        """
+        try:
+            data = self.__uplink_queue.get(timeout=0.05)
+        except Empty:
+            return
+
+        self.__send_to_storage(data)
+        # drain only already queued items, so devices connection is still checked under continuous load
+        for _ in range(self.__uplink_queue.qsize()):
+            try:
+                self.__send_to_storage(self.__uplink_queue.get_nowait())
+            except Empty:
+                break
+
+    def __send_to_storage(self, data):
+        if isinstance(data, list):
+            for converted_data in data:
+                self.__gateway.send_to_storage(self.name, self.__id, converted_data)
+        else:
+            self.__gateway.send_to_storage(self.name, self.__id, data)
+
     def close(self):
         """
         Service method to stop the connector and all devices connected to it.
@@ -44,6 +44,27 @@ class SerialUplinkConverter(Converter):
             self.__device_report_strategy = ReportStrategyConfig(self.__config.get(REPORT_STRATEGY_PARAMETER))
         except ValueError as e:
             self._log.trace("Report strategy config is not specified for device %s: %s", self.__device_name, e)
+        self.__telemetry_datapoints = self.__get_datapoints(
+            self.__config.get(TIMESERIES_PARAMETER, self.__config.get(TELEMETRY_PARAMETER, [])))
+        self.__attributes_datapoints = self.__get_datapoints(self.__config.get('attributes', []))
+
+    def __get_datapoints(self, datapoints_config):
+        """Resolves datapoint keys once, so they are not recreated for every received frame."""
+        datapoints = []
+        for dp_config in datapoints_config:
+            datapoint_key = self.__convert_datapoint_key(dp_config.get('key'), dp_config,
+                                                         self.__device_report_strategy, self._log)
+            datapoints.append((datapoint_key, dp_config))
+        return datapoints
+
+    def convert_batch(self, frames):
+        """Converts list of frames received from the device, returns list of converted data."""
+        result = []
+        for frame in frames:
+            converted_data = self.convert(None, frame)
+            if converted_data.telemetry or converted_data.attributes:
+                result.append(converted_data)
+        return result
 
     def convert(self, config, data: bytes):
         """Converts incoming data to the format that platform expects. Config is specified only for RPC responses."""
@@ -53,16 +74,16 @@ class SerialUplinkConverter(Converter):
             return converted_data
         else:
             converted_data = ConvertedData(self.__device_name, self.__device_type)
-            for datapoint_config in self.__config.get(TIMESERIES_PARAMETER, self.__config.get(TELEMETRY_PARAMETER, [])):
+            for datapoint_key, datapoint_config in self.__telemetry_datapoints:
                 try:
-                    telemetry_entry = self.__convert_telemetry_datapoint(data, datapoint_config)
+                    telemetry_entry = self.__convert_telemetry_datapoint(data, datapoint_key, datapoint_config)
                     if telemetry_entry:
                         converted_data.add_to_telemetry(telemetry_entry)
                 except Exception as e:
                     self._log.error("Error converting telemetry datapoint: %s", e)
-            for datapoint_config in self.__config.get('attributes', []):
+            for datapoint_key, datapoint_config in self.__attributes_datapoints:
                 try:
-                    attribute_data = self.__convert_attributes_datapoint(data, datapoint_config)
+                    attribute_data = self.__convert_attributes_datapoint(data, datapoint_key, datapoint_config)
                     if attribute_data:
                         converted_data.add_to_attributes(*attribute_data)
                 except Exception as e:
@@ -70,18 +91,16 @@ class SerialUplinkConverter(Converter):
             self._log.debug("Converted data: %s", converted_data)
         return converted_data
 
-    def __convert_telemetry_datapoint(self, data, dp_config) -> TelemetryEntry:
+    def __convert_telemetry_datapoint(self, data, datapoint_key, dp_config) -> TelemetryEntry:
         key = dp_config.get('key')
-        datapoint_key = self.__convert_datapoint_key(key, dp_config, self.__device_report_strategy, self._log)
         value = self.__convert_value_to_type(data, dp_config)
         if not datapoint_key or not value:
             self._log.trace("Datapoint %s - not found in incoming data: %s", key, data.hex())
             return None
         return TelemetryEntry({datapoint_key: value})
 
-    def __convert_attributes_datapoint(self, data, dp_config) -> Tuple[DatapointKey, Any]:
+    def __convert_attributes_datapoint(self, data, datapoint_key, dp_config) -> Tuple[DatapointKey, Any]:
         key = dp_config.get('key')
-        datapoint_key = self.__convert_datapoint_key(key, dp_config, self.__device_report_strategy, self._log)
         value = self.__convert_value_to_type(data, dp_config)
         if not datapoint_key or not value:
             self._log.trace("Datapoint %s - not found in incoming data: %s", key, data.hex())
@@ -0,0 +1,85 @@
+#     Copyright 2026. ThingsBoard
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+from time import monotonic
+
+from thingsboard_gateway.connectors.framing import DEFAULT_MAX_FRAME_SIZE, FramingError, create_framer
+
+
+class SerialFrameReader:
+    """
+    Reads all bytes available in the serial port input buffer with one call and splits them to frames
+    with the framer configured in "framing" section, the same as for the socket connector.
+    Without it frames are separated by "delimiter" that is included into the frame.
+    Incomplete frame is kept for the next read.
+    """
+
+    def __init__(self, config, logger):
+        self.__log = logger
+        self.__pending_frames = []
+        framing_config = config.get('framing')
+        if framing_config is None:
+            framing_config = {
+                'type': 'delimiter',
+                'delimiter': config.get('delimiter', '\n'),
+                'includeDelimiter': True,
+                'maxFrameSize': config.get('maxFrameSize', DEFAULT_MAX_FRAME_SIZE)
+            }
+        self.__framer = create_framer(framing_config)
+
+    @property
+    def pending_bytes(self):
+        return self.__framer.pending_bytes
+
+    def read_frames(self, serial_conn):
+        """
+        Waits for data not longer than serial port timeout and returns list of complete frames.
+        """
+
+        if self.__pending_frames:
+            frames = self.__pending_frames
+            self.__pending_frames = []
+            return frames
+
+        # blocks until at least one byte is received, then takes everything the port has buffered
+        chunk = serial_conn.read(serial_conn.in_waiting or 1)
+        if not chunk:
+            return []
+
+        waiting = serial_conn.in_waiting
+        if waiting:
+            chunk += serial_conn.read(waiting)
+
+        try:
+            return self.__framer.feed(chunk)
+        except FramingError as e:
+            self.__log.error('Received data dropped: %s', e)
+            return []
+
+    def read_frame(self, serial_conn, timeout):
+        """
+        Returns the first frame received during timeout, or received bytes if frame isn't complete.
+        Frames received after the first one are kept for the next read.
+        """
+
+        end_time = monotonic() + timeout
+        frames = []
+        while not frames and monotonic() < end_time:
+            frames = self.read_frames(serial_conn)
+
+        if not frames:
+            return self.__framer.flush()
+
+        self.__pending_frames = frames[1:]
+        return frames[0]
@@ -0,0 +1,72 @@
+#     Copyright 2026. ThingsBoard
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+from typing import Dict, Iterator, List
+
+from thingsboard_gateway.gateway.entities.converted_data import ConvertedData
+from thingsboard_gateway.gateway.entities.datapoint_key import DatapointKey
+
+
+class ConvertedDataBatch:
+    """
+    Collects converted data of several messages grouped by device, so it is sent to the storage
+    with fewer events. Telemetry entries with the same ts are merged only if they have no common keys,
+    otherwise a new ConvertedData object is started for the device. It keeps all samples that were converted
+    in the same millisecond without explicit ts, which ConvertedData.add_to_telemetry would overwrite.
+    """
+
+    def __init__(self):
+        self.__devices_data: Dict[str, List[ConvertedData]] = {}
+        self.messages_count = 0
+
+    def __len__(self):
+        return sum(len(device_data) for device_data in self.__devices_data.values())
+
+    def __iter__(self) -> Iterator[ConvertedData]:
+        for device_data in self.__devices_data.values():
+            yield from device_data
+
+    def add(self, converted_data: ConvertedData):
+        self.messages_count += 1
+        device_data = self.__devices_data.get(converted_data.device_name)
+        if device_data is None:
+            self.__devices_data[converted_data.device_name] = [converted_data]
+            return
+
+        current_data = device_data[-1]
+        if self.__has_overwritten_values(current_data, converted_data):
+            device_data.append(converted_data)
+            return
+
+        current_data.add_to_telemetry(converted_data.telemetry)
+        current_data.add_to_attributes(converted_data.attributes.values)
+
+    def clear(self):
+        self.__devices_data = {}
+        self.messages_count = 0
+
+    @staticmethod
+    def __has_overwritten_values(current_data: ConvertedData, converted_data: ConvertedData):
+        for telemetry_entry in converted_data.telemetry:
+            index = current_data.ts_index.get(telemetry_entry.ts)
+            if index is None:
+                continue
+            existing_keys = {ConvertedDataBatch.__get_key(key) for key in current_data.telemetry[index].values}
+            if any(ConvertedDataBatch.__get_key(key) in existing_keys for key in telemetry_entry.values):
+                return True
+        return False
+
+    @staticmethod
+    def __get_key(key):
+        return key.key if isinstance(key, DatapointKey) else key
@@ -11,15 +11,18 @@
 #      WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 #      See the License for the specific language governing permissions and
 #      limitations under the License.
+from logging import getLogger
 from time import time
 from typing import Union
 
 from simplejson import dumps
 
-from thingsboard_gateway.connectors.converter import Converter, log
+from thingsboard_gateway.connectors.converter import Converter
 from thingsboard_gateway.gateway.constant_enums import DownlinkMessageType
 from thingsboard_gateway.gateway.proto.messages_pb2 import *
 
+log = getLogger('grpc')
+
 
 class GrpcDownlinkConverter(Converter):
     def __init__(self):
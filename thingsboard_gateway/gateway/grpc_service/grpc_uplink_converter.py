@@ -12,9 +12,21 @@
 #      See the License for the specific language governing permissions and
 #      limitations under the License.
 
-from thingsboard_gateway.connectors.converter import Converter, log
+from logging import getLogger
+
+from thingsboard_gateway.connectors.converter import Converter
 from thingsboard_gateway.gateway.proto.messages_pb2 import ConnectMsg, DisconnectMsg, GatewayAttributesMsg, GatewayAttributesRequestMsg, GatewayClaimMsg, \
-    GatewayRpcResponseMsg, GatewayTelemetryMsg, KeyValueProto, KeyValueType, Response
+    GatewayRpcResponseMsg, GatewayTelemetryBatchMsg, GatewayTelemetryMsg, KeyValueProto, KeyValueType, Response
+
+log = getLogger('grpc')
+
+VALUE_FIELDS = {
+    KeyValueType.BOOLEAN_V: 'bool_v',
+    KeyValueType.LONG_V: 'long_v',
+    KeyValueType.DOUBLE_V: 'double_v',
+    KeyValueType.STRING_V: 'string_v',
+    KeyValueType.JSON_V: 'json_v'
+}
 
 
 class GrpcUplinkConverter(Converter):
@@ -22,6 +34,7 @@ class GrpcUplinkConverter(Converter):
         self.__conversion_methods = {
             Response.DESCRIPTOR: self.__convert_response_msg,
             GatewayTelemetryMsg.DESCRIPTOR: self.__convert_gateway_telemetry_msg,
+            GatewayTelemetryBatchMsg.DESCRIPTOR: self.__convert_gateway_telemetry_batch_msg,
             GatewayAttributesMsg.DESCRIPTOR: self.__convert_gateway_attributes_msg,
             GatewayClaimMsg.DESCRIPTOR: self.__convert_gateway_claim_msg,
             ConnectMsg.DESCRIPTOR: self.__convert_connect_msg,
@@ -58,6 +71,24 @@ class GrpcUplinkConverter(Converter):
             result.append(device_dict)
         return result
 
+    @staticmethod
+    def __convert_gateway_telemetry_batch_msg(msg: GatewayTelemetryBatchMsg):
+        """
+        Converts all telemetry messages of the batch, telemetry of the same device is merged into one entry.
+        """
+
+        devices = {}
+        get_value = GrpcUplinkConverter.get_value
+        for gateway_telemetry_msg in msg.msg:
+            for telemetry_msg in gateway_telemetry_msg.msg:
+                device_telemetry = devices.get(telemetry_msg.deviceName)
+                if device_telemetry is None:
+                    device_telemetry = devices[telemetry_msg.deviceName] = []
+                for ts_kv_list in telemetry_msg.msg.tsKvList:
+                    device_telemetry.append({"ts": ts_kv_list.ts,
+                                             "values": {kv.key: get_value(kv) for kv in ts_kv_list.kv}})
+        return [{"deviceName": device_name, "telemetry": telemetry} for device_name, telemetry in devices.items()]
+
     @staticmethod
     def __convert_gateway_attributes_msg(msg: GatewayAttributesMsg):
         result = []
@@ -94,13 +125,6 @@ class GrpcUplinkConverter(Converter):
 
     @staticmethod
     def get_value(msg: KeyValueProto):
-        if msg.type == KeyValueType.BOOLEAN_V:
-            return msg.bool_v
-        if msg.type == KeyValueType.LONG_V:
-            return msg.long_v
-        if msg.type == KeyValueType.DOUBLE_V:
-            return msg.double_v
-        if msg.type == KeyValueType.STRING_V:
-            return msg.string_v
-        if msg.type == KeyValueType.JSON_V:
-            return msg.json_v
+        value_field = VALUE_FIELDS.get(msg.type)
+        if value_field is not None:
+            return getattr(msg, value_field)
@@ -68,6 +68,7 @@ class TBGRPCServerManager(Thread):
         log.debug("[GRPC] incoming message: %s", msg)
         try:
             outgoing_message = None
+            session = self.sessions.get(session_id)
             downlink_converter_config = {"message_type": [DownlinkMessageType.Response], "additional_message": msg}
             if msg.HasField("registerConnectorMsg"):
                 self.__register_connector(session_id, msg.registerConnectorMsg.connectorKey)
@@ -75,42 +76,45 @@ class TBGRPCServerManager(Thread):
             elif msg.HasField("unregisterConnectorMsg"):
                 self.__unregister_connector(session_id, msg.unregisterConnectorMsg.connectorKey)
                 outgoing_message = True
-            elif self.sessions.get(session_id) is not None and self.sessions[session_id].get('name') is not None:
+            elif session is not None and session.get('name') is not None:
                 if msg.HasField("response"):
                     if msg.response.ByteSize() == 0:
                         outgoing_message = True
                 if msg.HasField("connectorGetConnectedDevicesMsg"):
-                    connector_id = list(self.__connectors_sessions.keys())[
-                        list(self.__connectors_sessions.values()).index(session_id)]
-                    connected_devices = self.__get_connector_devices(connector_id)
+                    connected_devices = self.__get_connector_devices(session['id'])
                     downlink_converter_config = {
                         "message_type": [DownlinkMessageType.ConnectorGetConnectedDevicesResponseMsg],
                         "additional_message": connected_devices}
                     outgoing_message = self.__downlink_converter.convert(downlink_converter_config, None)
                 if msg.HasField("gatewayTelemetryMsg"):
                     data = self.__convert_with_uplink_converter(msg.gatewayTelemetryMsg)
-                    result_status = self.__gateway.send_to_storage(self.sessions[session_id]['name'], self.sessions[session_id]['id'], data)
+                    result_status = self.__gateway.send_to_storage(session['name'], session['id'], data)
                     outgoing_message = True
                     self.__increase_incoming_statistic(session_id)
+                if msg.HasField("gatewayTelemetryBatchMsg"):
+                    data = self.__convert_with_uplink_converter(msg.gatewayTelemetryBatchMsg)
+                    result_status = self.__gateway.send_to_storage(session['name'], session['id'], data)
+                    outgoing_message = True
+                    self.__increase_incoming_statistic(session_id, len(msg.gatewayTelemetryBatchMsg.msg))
                 if msg.HasField("gatewayAttributesMsg"):
                     data = self.__convert_with_uplink_converter(msg.gatewayAttributesMsg)
-                    result_status = self.__gateway.send_to_storage(self.sessions[session_id]['name'], self.sessions[session_id]['id'], data)
+                    result_status = self.__gateway.send_to_storage(session['name'], session['id'], data)
                     outgoing_message = True
                     self.__increase_incoming_statistic(session_id)
                 if msg.HasField("gatewayClaimMsg"):
                     data = self.__convert_with_uplink_converter(msg.gatewayClaimMsg)
-                    result_status = self.__gateway.send_to_storage(self.sessions[session_id]['name'], self.sessions[session_id]['id'], data)
+                    result_status = self.__gateway.send_to_storage(session['name'], session['id'], data)
                     outgoing_message = self.__downlink_converter.convert(downlink_converter_config, result_status)
                     self.__increase_incoming_statistic(session_id)
                 if msg.HasField("connectMsg"):
                     data = self.__convert_with_uplink_converter(msg.connectMsg)
-                    data['name'] = self.sessions[session_id]['name']
+                    data['name'] = session['name']
                     result_status = self.__gateway.add_device_async(data)
                     outgoing_message = self.__downlink_converter.convert(downlink_converter_config, result_status)
                     self.__increase_incoming_statistic(session_id)
                 if msg.HasField("disconnectMsg"):
                     data = self.__convert_with_uplink_converter(msg.disconnectMsg)
-                    data['name'] = self.sessions[session_id]['name']
+                    data['name'] = session['name']
                     result_status = self.__gateway.del_device_async(data)
                     outgoing_message = self.__downlink_converter.convert(downlink_converter_config, result_status)
                     self.__increase_incoming_statistic(session_id)
@@ -221,9 +225,9 @@ class TBGRPCServerManager(Thread):
     def __convert_with_uplink_converter(self, data):
         return self.__uplink_converter.convert(None, data)
 
-    def __increase_incoming_statistic(self, session_id):
+    def __increase_incoming_statistic(self, session_id, count=1):
         if session_id in self.sessions:
-            self.sessions[session_id]['statistics']["MessagesReceived"] += 1
+            self.sessions[session_id]['statistics']["MessagesReceived"] += count
 
     def __increase_outgoing_statistic(self, session_id):
         if session_id in self.sessions:
@@ -1,10 +1,12 @@
+import logging
 from queue import SimpleQueue
 from threading import RLock, Thread
-from time import sleep
 
 import thingsboard_gateway.gateway.proto.messages_pb2_grpc as messages_pb2_grpc
 from thingsboard_gateway.gateway.proto.messages_pb2 import *
 
+log = logging.getLogger('grpc')
+
 
 class TBGRPCServer(messages_pb2_grpc.TBGatewayProtoServiceServicer):
     def __init__(self, read_callback):
@@ -38,11 +40,11 @@ class TBGRPCServer(messages_pb2_grpc.TBGatewayProtoServiceServicer):
 
     def __processing_read(self):
         while True:
-            if not self.__read_queue.empty():
-                context, request = self.__read_queue.get()
-                self._read_callback(context, request)
-            else:
-                sleep(.2)
+            session_id, request = self.__read_queue.get()
+            try:
+                self._read_callback(session_id, request)
+            except Exception as e:
+                log.exception("Failed to process message from session %s: %s", session_id, e)
 
     @staticmethod
     def get_response(status, connector_message):
@@ -0,0 +1,133 @@
+#     Copyright 2026. ThingsBoard
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+from thingsboard_gateway.tb_utility.tb_utility import TBUtility
+
+NEVER_MERGE_DEVICES = "never"
+AUTO_MERGE_DEVICES = "auto"
+ALWAYS_MERGE_DEVICES = "always"
+MERGE_DEVICES_MODES = (NEVER_MERGE_DEVICES, AUTO_MERGE_DEVICES, ALWAYS_MERGE_DEVICES)
+
+
+class RateLimitBudget:
+    """
+    Messages and datapoints that can be sent now without waiting for the rate limits,
+    infinite budget means that there is no limit.
+    """
+
+    __slots__ = ('messages', 'datapoints', 'max_datapoints_per_message')
+
+    def __init__(self, messages=float('inf'), datapoints=float('inf'), max_datapoints_per_message=0):
+        self.messages = messages
+        self.datapoints = datapoints
+        # single message cannot contain more datapoints than the smallest datapoints limit
+        self.max_datapoints_per_message = max_datapoints_per_message
+
+    def consume(self, messages, datapoints):
+        self.messages = max(self.messages - messages, 0)
+        self.datapoints = max(self.datapoints - datapoints, 0)
+
+    def __repr__(self):
+        return "RateLimitBudget(messages=%r, datapoints=%r, max_datapoints_per_message=%r)" % (
+            self.messages, self.datapoints, self.max_datapoints_per_message)
+
+
+class PlannedMessage:
+    __slots__ = ('devices_data', 'datapoints', 'size')
+
+    def __init__(self):
+        self.devices_data = {}
+        self.datapoints = 0
+        # size of the serialized message with enclosing braces
+        self.size = 2
+
+    def add(self, device, data, datapoints, size):
+        self.devices_data[device] = data
+        self.datapoints += datapoints
+        self.size += size + (1 if len(self.devices_data) > 1 else 0)
+
+
+class PackPlanner:
+    """
+    Plans gateway messages for the data of the event pack devices.
+    Data of several devices is merged into one message up to the max payload size and datapoints limit,
+    so the pack is sent with fewer publishes and acknowledgements. Devices are always merged by default,
+    in "auto" mode they are merged only when the message budget is not enough to send a message per device,
+    in "never" mode every device is sent in its own message.
+    Device data that does not fit into one message is planned alone and split by the client.
+    """
+
+    def __init__(self, max_payload_size, merge_mode=ALWAYS_MERGE_DEVICES):
+        self.max_payload_size = max_payload_size
+        self.merge_mode = merge_mode
+
+    def plan(self, devices_data, budget: RateLimitBudget):
+        """
+        Returns list of planned messages for devices data in gateway format ({device: telemetry or attributes}),
+        planned messages and datapoints are consumed from the budget.
+        """
+
+        entries = []
+        datapoints = 0
+        for device, data in devices_data.items():
+            device_datapoints = self.count_datapoints(data)
+            # size of "device":data pair without enclosing braces
+            entries.append((device, data, device_datapoints, TBUtility.get_data_size({device: data}) - 2))
+            datapoints += device_datapoints
+
+        if self.should_merge(len(entries), datapoints, budget):
+            messages = self.__merge(entries, budget.max_datapoints_per_message)
+        else:
+            messages = []
+            for device, data, device_datapoints, size in entries:
+                message = PlannedMessage()
+                message.add(device, data, device_datapoints, size)
+                messages.append(message)
+
+        budget.consume(len(messages), datapoints)
+        return messages
+
+    def should_merge(self, messages_count, datapoints, budget: RateLimitBudget):
+        if self.merge_mode == ALWAYS_MERGE_DEVICES:
+            return messages_count > 1
+        if self.merge_mode == NEVER_MERGE_DEVICES:
+            return False
+        # merging does not change datapoints count, so it helps only if messages are the bottleneck
+        return messages_count > 1 and messages_count > budget.messages
+
+    def __merge(self, entries, max_datapoints_per_message):
+        messages = []
+        for device, data, datapoints, size in entries:
+            for message in messages:
+                if self.__fits(message, datapoints, size, max_datapoints_per_message):
+                    break
+            else:
+                message = PlannedMessage()
+                messages.append(message)
+            message.add(device, data, datapoints, size)
+        return messages
+
+    def __fits(self, message, datapoints, size, max_datapoints_per_message):
+        if message.size + size + 1 > self.max_payload_size:
+            return False
+        return max_datapoints_per_message <= 0 or message.datapoints + datapoints <= max_datapoints_per_message
+
+    @staticmethod
+    def count_datapoints(data):
+        if isinstance(data, list):
+            return sum(PackPlanner.count_datapoints(item) for item in data)
+        if isinstance(data, dict):
+            values = data.get('values')
+            return len(values) if isinstance(values, dict) and 'ts' in data else len(data)
+        return 1
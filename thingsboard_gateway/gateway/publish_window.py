@@ -0,0 +1,150 @@
+#     Copyright 2026. ThingsBoard
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+from collections import deque
+from time import monotonic
+
+DEFAULT_MAX_IN_FLIGHT_EVENT_PACKS = 4
+DEFAULT_ACKNOWLEDGEMENT_TIMEOUT = 60
+
+
+class InFlightEventPack:
+    __slots__ = ('position', 'published_events', 'events_count', 'telemetry_dp_count', 'attribute_dp_count',
+                 'published_at', 'acknowledged')
+
+    def __init__(self, position, published_events, events_count, telemetry_dp_count, attribute_dp_count,
+                 acknowledged=False):
+        self.position = position
+        self.published_events = published_events
+        self.events_count = events_count
+        self.telemetry_dp_count = telemetry_dp_count
+        self.attribute_dp_count = attribute_dp_count
+        self.published_at = monotonic()
+        self.acknowledged = acknowledged
+
+
+class PublishWindow:
+    """
+    Tracks event packs published to the platform but not acknowledged yet.
+    Packs may be acknowledged out of order, but they are released in the order of their storage positions,
+    so the storage is committed only for the contiguous acknowledged prefix of the window.
+    """
+
+    PENDING = 0
+    ACKNOWLEDGED = 1
+    FAILED = 2
+
+    def __init__(self, max_in_flight=DEFAULT_MAX_IN_FLIGHT_EVENT_PACKS,
+                 acknowledgement_timeout=DEFAULT_ACKNOWLEDGEMENT_TIMEOUT):
+        self.max_in_flight = max(int(max_in_flight), 1)
+        self.acknowledgement_timeout = acknowledgement_timeout
+        self.__packs = deque()
+        self.__next_position = 0
+        self.failed = False
+
+        self.acknowledged_packs = 0
+        self.acknowledged_events = 0
+        self.last_acknowledgement_latency_ms = 0
+        self.max_acknowledgement_latency_ms = 0
+
+    def __len__(self):
+        return len(self.__packs)
+
+    def is_full(self):
+        return len(self.__packs) >= self.max_in_flight
+
+    def add(self, published_events, events_count, telemetry_dp_count=0, attribute_dp_count=0,
+            wait_for_acknowledgement=True) -> InFlightEventPack:
+        pack = InFlightEventPack(self.__next_position, published_events, events_count, telemetry_dp_count,
+                                 attribute_dp_count, acknowledged=not wait_for_acknowledgement)
+        self.__next_position += 1
+        self.__packs.append(pack)
+        return pack
+
+    def pop_acknowledged(self):
+        """
+        Checks publish results of the packs in flight and returns the acknowledged packs from the window head.
+        Sets "failed" flag if any pack is failed or not acknowledged in time, such packs are never returned.
+        """
+
+        now = monotonic()
+        for pack in self.__packs:
+            if pack.acknowledged:
+                continue
+
+            state = self.get_pack_state(pack)
+            if state == self.ACKNOWLEDGED:
+                pack.acknowledged = True
+                self.last_acknowledgement_latency_ms = int((now - pack.published_at) * 1000)
+                self.max_acknowledgement_latency_ms = max(self.max_acknowledgement_latency_ms,
+                                                          self.last_acknowledgement_latency_ms)
+            elif state == self.FAILED or now - pack.published_at > self.acknowledgement_timeout:
+                self.failed = True
+
+        acknowledged_packs = []
+        while self.__packs and self.__packs[0].acknowledged:
+            pack = self.__packs.popleft()
+            self.acknowledged_packs += 1
+            self.acknowledged_events += pack.events_count
+            acknowledged_packs.append(pack)
+        return acknowledged_packs
+
+    def wait_for_acknowledgement(self, timeout):
+        """
+        Blocks until the first not acknowledged message of the window head is published or timeout occurs.
+        """
+
+        for pack in self.__packs:
+            if pack.acknowledged:
+                continue
+            for message_info in self.__get_message_infos(pack):
+                try:
+                    if not message_info.is_published():
+                        message_info.wait_for_publish(timeout)
+                        return
+                except Exception:
+                    return
+            return
+
+    def pop_max_acknowledgement_latency_ms(self):
+        max_acknowledgement_latency_ms = self.max_acknowledgement_latency_ms
+        self.max_acknowledgement_latency_ms = 0
+        return max_acknowledgement_latency_ms
+
+    def clear(self):
+        self.__packs.clear()
+        self.failed = False
+
+    def get_pack_state(self, pack: InFlightEventPack):
+        state = self.ACKNOWLEDGED
+        for published_event in pack.published_events:
+            try:
+                if published_event.rc() != published_event.TB_ERR_SUCCESS:
+                    return self.FAILED
+                message_infos = published_event.message_info
+                for message_info in message_infos if isinstance(message_infos, list) else [message_infos]:
+                    if not message_info.is_published():
+                        state = self.PENDING
+            except Exception:
+                return self.FAILED
+        return state
+
+    @staticmethod
+    def __get_message_infos(pack: InFlightEventPack):
+        for published_event in pack.published_events:
+            message_infos = getattr(published_event, 'message_info', None)
+            if isinstance(message_infos, list):
+                yield from message_infos
+            elif message_infos is not None:
+                yield message_infos
@@ -38,6 +38,10 @@ SERVICE_STATS_CONFIG = [
         "function": StatisticsServiceFunctions.storage_msgs_count,
         "attributeOnGateway": "storageMsgCount"
     },
+    {
+        "function": StatisticsServiceFunctions.storage_msgs_dropped,
+        "attributeOnGateway": "storageMsgDropped"
+    },
     {
         "function": StatisticsServiceFunctions.platform_msgs_pushed,
         "attributeOnGateway": "platformMsgPushed"
@@ -49,6 +53,22 @@ SERVICE_STATS_CONFIG = [
     {
         "function": StatisticsServiceFunctions.platform_ts_produced,
         "attributeOnGateway": "platformTsProduced"
+    },
+    {
+        "function": StatisticsServiceFunctions.platform_packs_in_flight,
+        "attributeOnGateway": "platformPacksInFlight"
+    },
+    {
+        "function": StatisticsServiceFunctions.platform_packs_acknowledged,
+        "attributeOnGateway": "platformPacksAcknowledged"
+    },
+    {
+        "function": StatisticsServiceFunctions.platform_ack_latency_avg,
+        "attributeOnGateway": "platformAckLatencyAvgMs"
+    },
+    {
+        "function": StatisticsServiceFunctions.platform_ack_latency_max,
+        "attributeOnGateway": "platformAckLatencyMaxMs"
     }
 ]
 
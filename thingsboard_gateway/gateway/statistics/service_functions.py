@@ -97,6 +97,10 @@ class StatisticsServiceFunctions:
     def storage_msgs_count(gateway):
         return gateway.get_storage_events_count()
 
+    @staticmethod
+    def storage_msgs_dropped(gateway):
+        return gateway.get_storage_dropped_events_count()
+
     @staticmethod
     def platform_msgs_pushed(_):
         return statistics_service.StatisticsService.STATISTICS_STORAGE.get('platformMsgPushed')
@@ -108,3 +112,23 @@ class StatisticsServiceFunctions:
     @staticmethod
     def platform_ts_produced(_):
         return statistics_service.StatisticsService.STATISTICS_STORAGE.get('platformTsProduced')
+
+    @staticmethod
+    def platform_packs_in_flight(gateway):
+        return len(gateway.get_publish_window())
+
+    @staticmethod
+    def platform_packs_acknowledged(_):
+        return statistics_service.StatisticsService.STATISTICS_STORAGE.get('platformPacksAcknowledged')
+
+    @staticmethod
+    def platform_ack_latency_avg(_):
+        statistics_storage = statistics_service.StatisticsService.STATISTICS_STORAGE
+        packs_acknowledged = statistics_storage.get('platformPacksAcknowledged')
+        if not packs_acknowledged:
+            return 0
+        return round(statistics_storage.get('platformAckLatencyMs') / packs_acknowledged, 2)
+
+    @staticmethod
+    def platform_ack_latency_max(gateway):
+        return gateway.get_publish_window().pop_max_acknowledgement_latency_ms()
@@ -41,6 +41,8 @@ class StatisticsService(Thread):
         'platformMsgPushed': 0,
         'platformAttrProduced': 0,
         'platformTsProduced': 0,
+        'platformPacksAcknowledged': 0,
+        'platformAckLatencyMs': 0,
     }
 
     # This is a dictionary that stores the statistics for each connector
@@ -141,6 +143,18 @@ class StatisticsService(Thread):
             StatisticsService.add_count(connector_name, stat_parameter_name=stat_parameter_name,
                                         statistics_type='CONNECTOR_STATISTICS_STORAGE', count=count)
 
+    @staticmethod
+    def set_connector_value(connector_name, stat_parameter_name, value):
+        # for gauges, e.g. current count of requests in progress, the last value is sent instead of the sum
+        if StatisticsService.ENABLED:
+            StatisticsService.CONNECTOR_STATISTICS_STORAGE.setdefault(connector_name, {})[stat_parameter_name] = value
+
+    @staticmethod
+    def set_connector_max_value(connector_name, stat_parameter_name, value):
+        if StatisticsService.ENABLED:
+            connector_statistics = StatisticsService.CONNECTOR_STATISTICS_STORAGE.setdefault(connector_name, {})
+            connector_statistics[stat_parameter_name] = max(connector_statistics.get(stat_parameter_name, value), value)
+
     @staticmethod
     def count_connector_bytes(connector_name, msg, stat_parameter_name):
         if StatisticsService.ENABLED:
@@ -31,13 +31,14 @@ import socks
 from simplejson import dumps, load
 
 from thingsboard_gateway.gateway.constants import DEV_MODE_PARAMETER_NAME, PROVISIONED_CREDENTIALS_FILENAME
+from thingsboard_gateway.gateway.pack_planner import RateLimitBudget
 from thingsboard_gateway.tb_utility.tb_utility import TBUtility
 
 try:
     if environ.get(DEV_MODE_PARAMETER_NAME) is not None and environ.get(DEV_MODE_PARAMETER_NAME).lower() == 'true':
         raise ImportError
     from tb_gateway_mqtt import TBGatewayMqttClient, TBDeviceMqttClient, \
-        GATEWAY_ATTRIBUTES_RESPONSE_TOPIC, GATEWAY_ATTRIBUTES_TOPIC
+        GATEWAY_ATTRIBUTES_RESPONSE_TOPIC, GATEWAY_ATTRIBUTES_TOPIC, GATEWAY_TELEMETRY_TOPIC
     import tb_device_mqtt
 except ImportError:
     mqtt_client_path = abspath(join(dirname(__file__), '..', '..', 'tb_mqtt_client'))
@@ -45,18 +46,82 @@ except ImportError:
     if exists(mqtt_client_path) and TBUtility.str_to_bool(environ.get(DEV_MODE_PARAMETER_NAME, 'false')):
         path.insert(0, mqtt_client_path)
         from tb_gateway_mqtt import TBGatewayMqttClient, TBDeviceMqttClient, \
-            GATEWAY_ATTRIBUTES_RESPONSE_TOPIC, GATEWAY_ATTRIBUTES_TOPIC
+            GATEWAY_ATTRIBUTES_RESPONSE_TOPIC, GATEWAY_ATTRIBUTES_TOPIC, GATEWAY_TELEMETRY_TOPIC
         import tb_device_mqtt
     else:
         print("tb-mqtt-client library not found - installing...")
         TBUtility.install_package('tb-mqtt-client')
         from tb_gateway_mqtt import TBGatewayMqttClient, TBDeviceMqttClient, \
-            GATEWAY_ATTRIBUTES_RESPONSE_TOPIC, GATEWAY_ATTRIBUTES_TOPIC
+            GATEWAY_ATTRIBUTES_RESPONSE_TOPIC, GATEWAY_ATTRIBUTES_TOPIC, GATEWAY_TELEMETRY_TOPIC
         import tb_device_mqtt
 
 tb_device_mqtt.DEFAULT_TIMEOUT = 3
 
 
+class TBGatewayDevicesMqttClient(TBGatewayMqttClient):
+    """
+    Gateway MQTT client that also sends data of several devices ({device: data}) in one gateway message.
+    Such message is not split by the client, so it has to fit into the payload size and datapoints limits.
+    """
+
+    def gw_send_devices_telemetry(self, devices_telemetry, datapoints, quality_of_service=1):
+        return self.__send_devices_data(GATEWAY_TELEMETRY_TOPIC, devices_telemetry, datapoints, quality_of_service)
+
+    def gw_send_devices_attributes(self, devices_attributes, datapoints, quality_of_service=1):
+        return self.__send_devices_data(GATEWAY_ATTRIBUTES_TOPIC, devices_attributes, datapoints, quality_of_service)
+
+    def get_devices_rate_limit_budget(self):
+        """
+        Returns messages and datapoints that can be sent now without waiting for the rate limits
+        of the devices telemetry and attributes.
+        """
+
+        msg_rate_limit = self._devices_connected_through_gateway_telemetry_messages_rate_limit
+        dp_rate_limit = self._devices_connected_through_gateway_telemetry_datapoints_rate_limit
+        return RateLimitBudget(self.__get_remaining_tokens(msg_rate_limit),
+                               self.__get_remaining_tokens(dp_rate_limit),
+                               int(dp_rate_limit.get_minimal_limit()))
+
+    @staticmethod
+    def __get_remaining_tokens(rate_limit):
+        tokens = [bucket['tokens'] for bucket in rate_limit.__dict__['rateLimits'].values()]
+        return int(min(tokens)) if rate_limit.has_limit() and tokens else float('inf')
+
+    def __send_devices_data(self, topic, devices_data, datapoints, quality_of_service):
+        if quality_of_service not in (0, 1):
+            raise tb_device_mqtt.TBQoSException("Quality of service (qos) value must be 0 or 1")
+
+        msg_rate_limit = self._devices_connected_through_gateway_telemetry_messages_rate_limit
+        dp_rate_limit = self._devices_connected_through_gateway_telemetry_datapoints_rate_limit
+        if msg_rate_limit.has_limit() or dp_rate_limit.has_limit():
+            msg_rate_limit.increase_rate_limit_counter()
+            dp_rate_limit.increase_rate_limit_counter(datapoints)
+            rate_limited = self._wait_for_rate_limit_released(tb_device_mqtt.DEFAULT_TIMEOUT, msg_rate_limit,
+                                                              dp_rate_limit, amount=datapoints)
+            if rate_limited:
+                return rate_limited
+            self._wait_until_current_queued_messages_processed()
+
+        while not self.is_connected():
+            if self.stopped:
+                return tb_device_mqtt.TBPublishInfo(tb_device_mqtt.paho.MQTTMessageInfo(None))
+            sleep(0.01)
+
+        published_ts = int(time() * 1000)
+        for device_data in devices_data.values():
+            for entry in device_data if isinstance(device_data, list) else ():
+                if isinstance(entry, dict) and 'ts' in entry and isinstance(entry.get('metadata'), dict):
+                    entry['metadata']['publishedTs'] = published_ts
+
+        payload = dumps(devices_data, separators=(',', ':'), skipkeys=True, ignore_nan=True)
+        result = self._client.publish(topic=topic, payload=payload, qos=quality_of_service)
+        while result.rc == tb_device_mqtt.MQTT_ERR_QUEUE_SIZE and not self.stopped:
+            # give some time for paho to process queued messages
+            sleep(0.1)
+            result = self._client.publish(topic=topic, payload=payload, qos=quality_of_service)
+        return tb_device_mqtt.TBPublishInfo([result])
+
+
 class TBClient(threading.Thread):
     def __init__(self, config, config_folder_path, logger):
         self.__logger = logger
@@ -71,7 +136,7 @@ class TBClient(threading.Thread):
         self.__proxy_port = config.get("proxy_port", None)
         self.__default_quality_of_service = config.get("qos", 1)
         self.__min_reconnect_delay = 1
-        self.client: Union[TBGatewayMqttClient, None] = None
+        self.client: Union[TBGatewayDevicesMqttClient, None] = None
         self.__ca_cert = None
         self.__private_key = None
         self.__cert = None
@@ -238,13 +303,13 @@ class TBClient(threading.Thread):
         rate_limits_config = self.__get_rate_limit_config()
 
         if rate_limits_config:
-            self.client = TBGatewayMqttClient(self.__host, self.__port, self.__username, self.__password, self,
-                                              quality_of_service=self.__default_quality_of_service,
-                                              client_id=self.__client_id, **rate_limits_config)
+            self.client = TBGatewayDevicesMqttClient(self.__host, self.__port, self.__username, self.__password, self,
+                                                     quality_of_service=self.__default_quality_of_service,
+                                                     client_id=self.__client_id, **rate_limits_config)
         else:
-            self.client = TBGatewayMqttClient(self.__host, self.__port, self.__username, self.__password, self,
-                                              quality_of_service=self.__default_quality_of_service,
-                                              client_id=self.__client_id)
+            self.client = TBGatewayDevicesMqttClient(self.__host, self.__port, self.__username, self.__password, self,
+                                                     quality_of_service=self.__default_quality_of_service,
+                                                     client_id=self.__client_id)
 
         self.__ca_cert = self.__get_path_to_cert(credentials.get("caCert")) \
             if credentials.get("caCert") is not None else None
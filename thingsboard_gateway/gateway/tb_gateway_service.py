@@ -12,7 +12,6 @@
 #     See the License for the specific language governing permissions and
 #     limitations under the License.
 
-import concurrent
 import logging
 import logging.config
 import logging.handlers
@@ -46,6 +45,8 @@ from thingsboard_gateway.gateway.device_filter import DeviceFilter
 from thingsboard_gateway.gateway.entities.converted_data import ConvertedData
 from thingsboard_gateway.gateway.entities.datapoint_key import DatapointKey
 from thingsboard_gateway.gateway.entities.report_strategy_config import ReportStrategyConfig
+from thingsboard_gateway.gateway.pack_planner import ALWAYS_MERGE_DEVICES, MERGE_DEVICES_MODES, PackPlanner
+from thingsboard_gateway.gateway.publish_window import DEFAULT_MAX_IN_FLIGHT_EVENT_PACKS, PublishWindow
 from thingsboard_gateway.gateway.report_strategy.report_strategy_service import ReportStrategyService
 from thingsboard_gateway.gateway.shell.proxy import AutoProxy
 from thingsboard_gateway.gateway.statistics.decorators import CountMessage, CollectStorageEventsStatistics, \
@@ -53,7 +54,10 @@ from thingsboard_gateway.gateway.statistics.decorators import CountMessage, Coll
 from thingsboard_gateway.gateway.statistics.statistics_service import StatisticsService
 from thingsboard_gateway.gateway.tb_client import TBClient
 from thingsboard_gateway.storage.file.file_event_storage import FileEventStorage
+from thingsboard_gateway.storage.hybrid.hybrid_event_storage import HybridEventStorage
 from thingsboard_gateway.storage.memory.memory_event_storage import MemoryEventStorage
+from thingsboard_gateway.storage.priority.priority_event_storage import (ATTRIBUTES_LANE, BACKLOG_LANE, LIVE_LANE,
+                                                                         PriorityEventStorage)
 from thingsboard_gateway.storage.sqlite.sqlite_event_storage import SQLiteEventStorage
 from thingsboard_gateway.tb_utility.tb_gateway_remote_configurator import RemoteConfigurator
 from thingsboard_gateway.tb_utility.tb_handler import TBRemoteLoggerHandler
@@ -154,9 +158,7 @@ class TBGatewayService:
 
         log.info("Gateway starting...")
         storage_log = logging.getLogger('storage')
-        self._event_storage = self._event_storage_types[self.__config["storage"]["type"]](self.__config["storage"],
-                                                                                          storage_log,
-                                                                                          self.stop_event)
+        self._event_storage = self.create_event_storage(self.__config["storage"], storage_log)
         if self.__config['thingsboard'].get('reportStrategy', {}).get('type') != "DISABLED":
             self._report_strategy_service = ReportStrategyService(self.__config['thingsboard'],
                                                                   self,
@@ -232,6 +234,14 @@ class TBGatewayService:
         self.__min_pack_send_delay_ms = self.__min_pack_send_delay_ms / 1000.0
         self.__min_pack_size_to_send = self.__config['thingsboard'].get('minPackSizeToSend', 500)
         self.__max_payload_size_in_bytes = self.__config["thingsboard"].get("maxPayloadSizeBytes", 8196)
+        self.__publish_window = PublishWindow(self.__config['thingsboard'].get('maxInFlightEventPacks',
+                                                                               DEFAULT_MAX_IN_FLIGHT_EVENT_PACKS))
+        merge_devices_mode = self.__config['thingsboard'].get('mergeDevicesMessages', ALWAYS_MERGE_DEVICES)
+        if merge_devices_mode not in MERGE_DEVICES_MODES:
+            log.warning("Unknown mergeDevicesMessages value %r, %r is used. Available values: %s",
+                        merge_devices_mode, ALWAYS_MERGE_DEVICES, ", ".join(MERGE_DEVICES_MODES))
+            merge_devices_mode = ALWAYS_MERGE_DEVICES
+        self.__pack_planner = PackPlanner(self.get_max_payload_size_bytes(), merge_devices_mode)
 
         self._send_thread = Thread(target=self.__read_data_from_storage, daemon=True,
                                    name="Send data to Thingsboard Thread")
@@ -327,7 +337,6 @@ class TBGatewayService:
         self.__grpc_connectors = {}
         self._default_connectors = DEFAULT_CONNECTORS
 
-        self._published_events = SimpleQueue()
         self.__rpc_processing_queue = SimpleQueue()
         self.__rpc_to_devices_queue = SimpleQueue()
         self.__async_device_actions_queue = SimpleQueue()
@@ -335,8 +344,6 @@ class TBGatewayService:
         self.__converted_data_queue = SimpleQueue()
         self.__sync_device_shared_attrs_queue = SimpleQueue()
 
-        self.__messages_confirmation_executor = concurrent.futures.ThreadPoolExecutor(max_workers=4) # noqa
-
         self.__updates_check_period_ms = 300000
         self.__updates_check_time = 0
 
@@ -345,6 +352,7 @@ class TBGatewayService:
             "memory": MemoryEventStorage,
             "file": FileEventStorage,
             "sqlite": SQLiteEventStorage,
+            "hybrid": HybridEventStorage,
         }
         self.__gateway_rpc_methods = {
             "ping": self.__rpc_ping,
@@ -448,6 +456,12 @@ class TBGatewayService:
     def event_storage_types(self):
         return self._event_storage_types
 
+    def create_event_storage(self, config, logger):
+        storage_class = self._event_storage_types[config["type"]]
+        if config.get("priority_lanes"):
+            return PriorityEventStorage(config, logger, self.stop_event, storage_class)
+        return storage_class(config, logger, self.stop_event)
+
     @property
     def config(self):
         return self.__config
@@ -623,8 +637,6 @@ class TBGatewayService:
         log.info("The gateway has been stopped.")
         if hasattr(self, 'remote_handler'):
             self.remote_handler.deactivate()
-        if hasattr(self, "_TBGatewayService__messages_confirmation_executor") is not None:
-            self.__messages_confirmation_executor.shutdown(wait=True, cancel_futures=True)
         if hasattr(self, "tb_client") and self.tb_client is not None:
             self.tb_client.disconnect()
             self.tb_client.stop()
@@ -1407,18 +1419,27 @@ class TBGatewayService:
                               ignore_nan=True)
         else:
             json_data = dumps(data, separators=(',', ':'), skipkeys=True, ignore_nan=True)
-        save_result = self._event_storage.put(json_data)
+        lane = self.__get_event_storage_lane(data)
+        save_result = self._event_storage.put(json_data, lane)
         tries = 4
         current_try = 0
         while not save_result and current_try < tries:
             sleep(0.1)
-            save_result = self._event_storage.put(json_data)
+            save_result = self._event_storage.put(json_data, lane)
             current_try += 1
         if not save_result:
             log.error('%rData from the device "%s" cannot be saved, connector name is %s.',
                       "[" + connector_id + "] " if connector_id is not None else "",
                       data.device_name if isinstance(data, ConvertedData) else data["deviceName"], connector_name)
 
+    def __get_event_storage_lane(self, data):
+        # all attribute updates go through one lane to keep their order, telemetry saved while the gateway
+        # is disconnected goes to the backlog, so the current telemetry is sent first after reconnect
+        has_attributes = bool(data.attributes) if isinstance(data, ConvertedData) else bool(data.get("attributes"))
+        if has_attributes:
+            return ATTRIBUTES_LANE
+        return LIVE_LANE if self.tb_client.is_connected() else BACKLOG_LANE
+
     # def check_size(self, devices_data_in_event_pack, current_data_pack_size, item_size):
     #
     #     if current_data_pack_size + item_size >= self.get_max_payload_size_bytes() - max(100, self.get_max_payload_size_bytes()/10): # noqa
@@ -1435,202 +1456,199 @@ class TBGatewayService:
     #     return current_data_pack_size
 
     def __read_data_from_storage(self):
-        devices_data_in_event_pack = {}
         global log
         log.debug("Send data Thread has been started successfully.")
         log.debug("Maximal size of the client message queue is: %r",
                   self.tb_client.client._client._max_queued_messages) # noqa pylint: disable=protected-access
-        current_event_pack_data_size = 0
+        log.debug("Maximal count of event packs in flight is: %r", self.__publish_window.max_in_flight)
         logger_get_time = 0
+        # storage and connection state it was notified about, storage can be replaced by the remote configuration
+        event_storage_connection_state = None
 
         while not self.stopped:
             try:
                 if monotonic() - logger_get_time > 60:
                     log = logging.getLogger('service')
                     logger_get_time = monotonic()
-                if self.tb_client.is_connected():
-                    events = []
+                connected = self.tb_client.is_connected()
+                if not connected:
+                    # not acknowledged packs will be read from the storage and sent again after reconnect
+                    self.__reset_publish_window()
+                if event_storage_connection_state != (self._event_storage, connected):
+                    event_storage_connection_state = (self._event_storage, connected)
+                    self._event_storage.update_connection_state(connected)
+                if not connected:
+                    self.stop_event.wait(1)
+                    continue
+                if self.__remote_configurator is not None and self.__remote_configurator.in_process:
+                    self.stop_event.wait(self.__min_pack_send_delay_ms)
+                    continue
 
-                    if self.__remote_configurator is None or not self.__remote_configurator.in_process:
+                self.__process_acknowledged_event_packs()
+                if self.__publish_window.failed:
+                    log.error("Error while sending data to ThingsBoard, it will be resent.")
+                    self.__reset_publish_window()
+                    continue
+
+                if not self.__publish_window.is_full():
+                    if len(self.__publish_window) == 0:
                         events = self._event_storage.get_event_pack()
+                    else:
+                        events = self._event_storage.read_ahead_event_pack()
 
                     if events:
-                        events_len = len(events)
-                        StatisticsService.add_count('storageMsgPulled', count=events_len)
-
-                        # telemetry_dp_count and attribute_dp_count using only for statistics
-                        telemetry_dp_count = 0
-                        attribute_dp_count = 0
-
-                        if self.__latency_debug_mode and events_len > 100:
-                            log.debug("Retrieved %r events from the storage.", events_len)
-                        start_pack_processing = time()
-                        for event in events:
-                            try:
-                                current_event = loads(event)
-                            except Exception as e:
-                                log.error("Error while processing event from the storage, it will be skipped.",
-                                          exc_info=e)
-                                continue
-
-                            if not devices_data_in_event_pack.get(current_event["deviceName"]): # noqa
-                                devices_data_in_event_pack[current_event["deviceName"]] = {"telemetry": [],
-                                                                                           "attributes": {}}
-                            # start_processing_telemetry_in_event = time()
-                            has_metadata = False
-                            if current_event.get('metadata'):
-                                has_metadata = True
-                            if current_event.get("telemetry"):
-                                if isinstance(current_event["telemetry"], list):
-                                    for item in current_event["telemetry"]:
-                                        if has_metadata and item.get('ts'):
-                                            item.update({'metadata': current_event.get('metadata')})
-                                        # current_event_pack_data_size = self.check_size(devices_data_in_event_pack,
-                                        #                                                current_event_pack_data_size,
-                                        #                                                TBUtility.get_data_size(item))
-                                        devices_data_in_event_pack[current_event["deviceName"]]["telemetry"].append(item) # noqa
-                                        telemetry_dp_count += len(item.get('values', []))
-                                else:
-                                    if has_metadata and current_event["telemetry"].get('ts'):
-                                        current_event["telemetry"].update({'metadata': current_event.get('metadata')})
-                                    # current_event_pack_data_size = self.check_size(devices_data_in_event_pack,
-                                    #                                                current_event_pack_data_size,
-                                    #                                                TBUtility.get_data_size(current_event["telemetry"])) # noqa
-                                    devices_data_in_event_pack[current_event["deviceName"]]["telemetry"].append(current_event["telemetry"]) # noqa
-                                    telemetry_dp_count += len(current_event["telemetry"].get('values', []))
-                            # log.debug("Processing telemetry in event took %r seconds.", time() - start_processing_telemetry_in_event) # noqa
-                            # start_processing_attributes_in_event = time()
-                            if current_event.get("attributes"):
-                                if isinstance(current_event["attributes"], list):
-                                    for item in current_event["attributes"]:
-                                        # current_event_pack_data_size = self.check_size(devices_data_in_event_pack,
-                                        #                                                current_event_pack_data_size,
-                                        #                                                TBUtility.get_data_size(item))
-                                        devices_data_in_event_pack[current_event["deviceName"]]["attributes"].update(item.items()) # noqa
-                                        attribute_dp_count += 1
-                                else:
-                                    # current_event_pack_data_size = self.check_size(devices_data_in_event_pack,
-                                    #                                                current_event_pack_data_size,
-                                    #                                                TBUtility.get_data_size(current_event["attributes"])) # noqa
-                                    devices_data_in_event_pack[current_event["deviceName"]]["attributes"].update(current_event["attributes"].items()) # noqa
-                                    attribute_dp_count += 1
-
-                            # log.debug("Processing attributes in event took %r seconds.", time() - start_processing_attributes_in_event) # noqa
-                        log.debug("Telemetry dp count: %r and attributes dp count: %r. Counting took: %r milliseconds.",  # noqa
-                                  telemetry_dp_count, attribute_dp_count, int((time() - start_pack_processing)*1000))  # noqa
-                        if devices_data_in_event_pack:
-                            if not self.tb_client.is_connected():
-                                continue
-                            while self.__rpc_reply_sent:
-                                self.stop_event.wait(0.01)
-                            if self.__latency_debug_mode and events_len > 100:
-                                pack_processing_time = int((time() - start_pack_processing) * 1000)
-                                average_event_processing_time = (pack_processing_time / events_len)
-                                if average_event_processing_time < 1.0:
-                                    average_event_processing_time_str = f"{average_event_processing_time * 1000:.2f} microseconds." # noqa
-                                else:
-                                    average_event_processing_time_str = f"{average_event_processing_time:.2f} milliseconds." # noqa
-                                log.debug("Sending data to ThingsBoard, pack size %i processing took %i ,milliseconds. Average event processing time is %s",  # noqa
-                                          events_len,
-                                          pack_processing_time,
-                                          average_event_processing_time_str) # noqa
-
-                            self.__send_data(devices_data_in_event_pack) # noqa
-                            current_event_pack_data_size = 0
-
-                        if self.tb_client.is_connected() and (
-                                self.__remote_configurator is None or not self.__remote_configurator.in_process):
-
-                            success = self.__handle_published_events()
-
-                            if success and self.tb_client.is_connected():
-                                self._event_storage.event_pack_processing_done()
-                                del devices_data_in_event_pack
-                                devices_data_in_event_pack = {}
-                                StatisticsService.add_count('platformTsProduced', count=telemetry_dp_count)
-                                StatisticsService.add_count('platformAttrProduced', count=attribute_dp_count)
-                                StatisticsService.add_count('platformMsgPushed', count=len(events))
-                        else:
-                            continue
-                    else:
-                        self.stop_event.wait(self.__min_pack_send_delay_ms)
+                        self.__publish_event_pack(events)
+                        continue
+
+                if len(self.__publish_window) == 0:
+                    self.stop_event.wait(self.__min_pack_send_delay_ms)
                 else:
-                    self.stop_event.wait(1)
+                    self.__publish_window.wait_for_acknowledgement(self.__min_pack_send_delay_ms)
             except Exception as e:
                 log.error("Error while sending data to ThingsBoard, it will be resent.", exc_info=e)
+                self.__reset_publish_window()
                 self.stop_event.wait(1)
         log.info("Send data Thread has been stopped successfully.")
 
-    def __handle_published_events(self):
-        events = []
+    def __publish_event_pack(self, events):
+        events_len = len(events)
+        StatisticsService.add_count('storageMsgPulled', count=events_len)
+
+        if self.__latency_debug_mode and events_len > 100:
+            log.debug("Retrieved %r events from the storage.", events_len)
+        start_pack_processing = time()
+        devices_data_in_event_pack, telemetry_dp_count, attribute_dp_count = \
+            self.__get_devices_data_in_event_pack(events)
+        log.debug("Telemetry dp count: %r and attributes dp count: %r. Counting took: %r milliseconds.",  # noqa
+                  telemetry_dp_count, attribute_dp_count, int((time() - start_pack_processing)*1000))  # noqa
+
+        published_events = []
+        if devices_data_in_event_pack:
+            while self.__rpc_reply_sent:
+                self.stop_event.wait(0.01)
+            if self.__latency_debug_mode and events_len > 100:
+                pack_processing_time = int((time() - start_pack_processing) * 1000)
+                average_event_processing_time = (pack_processing_time / events_len)
+                if average_event_processing_time < 1.0:
+                    average_event_processing_time_str = f"{average_event_processing_time * 1000:.2f} microseconds." # noqa
+                else:
+                    average_event_processing_time_str = f"{average_event_processing_time:.2f} milliseconds." # noqa
+                log.debug("Sending data to ThingsBoard, pack size %i processing took %i ,milliseconds. Average event processing time is %s",  # noqa
+                          events_len,
+                          pack_processing_time,
+                          average_event_processing_time_str) # noqa
+
+            published_events = self.__send_data(devices_data_in_event_pack) # noqa
+
+        self.__publish_window.add(published_events, events_len, telemetry_dp_count, attribute_dp_count,
+                                  wait_for_acknowledgement=self.tb_client.client.quality_of_service == 1)
 
-        while not self._published_events.empty() and not self.stopped:
+    @staticmethod
+    def __get_devices_data_in_event_pack(events):
+        devices_data_in_event_pack = {}
+        # telemetry_dp_count and attribute_dp_count using only for statistics
+        telemetry_dp_count = 0
+        attribute_dp_count = 0
+
+        for event in events:
             try:
-                events.append(self._published_events.get_nowait())
-            except Empty:
-                break
+                current_event = loads(event)
+            except Exception as e:
+                log.error("Error while processing event from the storage, it will be skipped.",
+                          exc_info=e)
+                continue
 
-        if not events:
-            return False
+            if not devices_data_in_event_pack.get(current_event["deviceName"]): # noqa
+                devices_data_in_event_pack[current_event["deviceName"]] = {"telemetry": [],
+                                                                           "attributes": {}}
+            has_metadata = False
+            if current_event.get('metadata'):
+                has_metadata = True
+            if current_event.get("telemetry"):
+                if isinstance(current_event["telemetry"], list):
+                    for item in current_event["telemetry"]:
+                        if has_metadata and item.get('ts'):
+                            item.update({'metadata': current_event.get('metadata')})
+                        devices_data_in_event_pack[current_event["deviceName"]]["telemetry"].append(item) # noqa
+                        telemetry_dp_count += len(item.get('values', []))
+                else:
+                    if has_metadata and current_event["telemetry"].get('ts'):
+                        current_event["telemetry"].update({'metadata': current_event.get('metadata')})
+                    devices_data_in_event_pack[current_event["deviceName"]]["telemetry"].append(current_event["telemetry"]) # noqa
+                    telemetry_dp_count += len(current_event["telemetry"].get('values', []))
+            if current_event.get("attributes"):
+                if isinstance(current_event["attributes"], list):
+                    for item in current_event["attributes"]:
+                        devices_data_in_event_pack[current_event["deviceName"]]["attributes"].update(item.items()) # noqa
+                        attribute_dp_count += 1
+                else:
+                    devices_data_in_event_pack[current_event["deviceName"]]["attributes"].update(current_event["attributes"].items()) # noqa
+                    attribute_dp_count += 1
 
-        futures = []
-        try:
-            if self.tb_client.is_connected() and (self.__remote_configurator is None or
-                                                  not self.__remote_configurator.in_process):
-                qos = self.tb_client.client.quality_of_service
-                if qos == 1:
-                    futures = list(self.__messages_confirmation_executor.map(self.__process_published_event, events))
-
-            event_num = 0
-            for success in futures:
-                event_num += 1
-                if event_num % 100 == 0:
-                    log.debug("Confirming %i event sent to ThingsBoard", event_num)
-                if not success:
-                    return False
+        return devices_data_in_event_pack, telemetry_dp_count, attribute_dp_count
 
-            return True
-        except Exception:  # noqa
-            log.debug("Error while sending data to ThingsBoard, it will be resent.")
-            return False
+    def __process_acknowledged_event_packs(self):
+        for event_pack in self.__publish_window.pop_acknowledged():
+            self._event_storage.event_pack_processing_done()
+            StatisticsService.add_count('platformTsProduced', count=event_pack.telemetry_dp_count)
+            StatisticsService.add_count('platformAttrProduced', count=event_pack.attribute_dp_count)
+            StatisticsService.add_count('platformMsgPushed', count=event_pack.events_count)
+            StatisticsService.add_count('platformPacksAcknowledged')
+            StatisticsService.add_count('platformAckLatencyMs',
+                                        count=self.__publish_window.last_acknowledgement_latency_ms)
 
-    @staticmethod
-    def __process_published_event(event):
-        try:
-            return event.get() == event.TB_ERR_SUCCESS
-        except RuntimeError as e:
-            log.error("Error while sending data to ThingsBoard, it will be resent.", exc_info=e)
-            return False
-        except Exception as e:
-            log.error("Error while sending data to ThingsBoard, it will be resent.", exc_info=e)
-            return False
+    def __reset_publish_window(self):
+        if len(self.__publish_window) > 0:
+            self.__publish_window.clear()
+            self._event_storage.reset_read_ahead()
+
+    def get_publish_window(self):
+        return self.__publish_window
 
     @CollectAllSentTBBytesStatistics(start_stat_type='allBytesSentToTB')
     def __send_data(self, devices_data_in_event_pack):
+        published_events = []
         try:
+            devices_attributes = {}
+            devices_telemetry = {}
             for device in devices_data_in_event_pack:
                 final_device_name = device if self.__renamed_devices.get(device) is None else self.__renamed_devices[
                     device]
 
                 if devices_data_in_event_pack[device].get("attributes"):
                     if device == self.name or device == "currentThingsBoardGateway":
-                        self._published_events.put(
+                        published_events.append(
                             self.send_attributes(devices_data_in_event_pack[device]["attributes"]))
                     else:
-                        self._published_events.put(self.gw_send_attributes(final_device_name,
-                                                                           devices_data_in_event_pack[
-                                                                               device]["attributes"]))
+                        devices_attributes[final_device_name] = devices_data_in_event_pack[device]["attributes"]
                 if devices_data_in_event_pack[device].get("telemetry"):
                     if device == self.name or device == "currentThingsBoardGateway":
-                        self._published_events.put(
+                        published_events.append(
                             self.send_telemetry(devices_data_in_event_pack[device]["telemetry"]))
                     else:
-                        self._published_events.put(self.gw_send_telemetry(final_device_name,
-                                                                          devices_data_in_event_pack[
-                                                                              device]["telemetry"]))
+                        devices_telemetry[final_device_name] = devices_data_in_event_pack[device]["telemetry"]
                 devices_data_in_event_pack[device] = {"telemetry": [], "attributes": {}}
+
+            # attributes and telemetry of the devices share the same gateway rate limits
+            self.__pack_planner.max_payload_size = self.get_max_payload_size_bytes()
+            budget = self.tb_client.client.get_devices_rate_limit_budget()
+            for message in self.__pack_planner.plan(devices_attributes, budget):
+                if len(message.devices_data) == 1:
+                    published_events.append(self.gw_send_attributes(*next(iter(message.devices_data.items()))))
+                else:
+                    published_events.append(self.gw_send_devices_attributes(message.devices_data,
+                                                                            message.datapoints))
+            for message in self.__pack_planner.plan(devices_telemetry, budget):
+                if len(message.devices_data) == 1:
+                    published_events.append(self.gw_send_telemetry(*next(iter(message.devices_data.items()))))
+                else:
+                    published_events.append(self.gw_send_devices_telemetry(message.devices_data,
+                                                                           message.datapoints))
         except Exception as e:
             log.error("Error while sending data to ThingsBoard, it will be resent.", exc_info=e)
+            # event pack is marked as failed, so it will be read from the storage and sent again
+            published_events.append(None)
+        return published_events
 
     @CountMessage('msgsReceivedFromPlatform')
     def _rpc_request_handler(self, request_id, content):
@@ -2251,6 +2269,18 @@ class TBGatewayService:
                                                         attributes,
                                                         quality_of_service=self.quality_of_service)
 
+    @CountMessage('msgsSentToPlatform')
+    def gw_send_devices_telemetry(self, devices_telemetry, datapoints):
+        return self.tb_client.client.gw_send_devices_telemetry(devices_telemetry,
+                                                               datapoints,
+                                                               quality_of_service=self.quality_of_service)
+
+    @CountMessage('msgsSentToPlatform')
+    def gw_send_devices_attributes(self, devices_attributes, datapoints):
+        return self.tb_client.client.gw_send_devices_attributes(devices_attributes,
+                                                                datapoints,
+                                                                quality_of_service=self.quality_of_service)
+
     # Service RPC methods ----------------
     def ping(self):
         return self.name
@@ -2309,6 +2339,9 @@ class TBGatewayService:
     def get_storage_events_count(self):
         return self._event_storage.len()
 
+    def get_storage_dropped_events_count(self):
+        return self._event_storage.get_dropped_events_count()
+
     # Connectors -----------------
     def get_available_connectors(self):
         return {num + 1: name for (num, name) in enumerate(self.available_connectors_by_name)}
@@ -27,7 +27,7 @@ log = getLogger('grpc')
 
 
 class GrpcClient(Thread):
-    def __init__(self, connect_callback, response_callback, host, port):
+    def __init__(self, connect_callback, response_callback, host, port, max_telemetry_batch_size=1):
         super().__init__()
         self.__identifier = [("identifier", str(uuid4()))]
         self.__host = host
@@ -40,6 +40,9 @@ class GrpcClient(Thread):
         self.channel = grpc.insecure_channel("%s:%i" % (self.__host, self.__port))
         self.stub = messages_pb2_grpc.TBGatewayProtoServiceStub(self.channel)
         self.output_queue = queue.SimpleQueue()
+        # telemetry messages queued together are sent as one GatewayTelemetryBatchMsg, 1 disables batching
+        self.__max_telemetry_batch_size = max_telemetry_batch_size
+        self.__pending_output_message = None
         self.__service_queue = queue.SimpleQueue()
         self.__request_data_queue = queue.SimpleQueue()
         self.__response_queue = queue.SimpleQueue()
@@ -54,13 +57,37 @@ class GrpcClient(Thread):
     def output_iter(self):
         if not self.__service_queue.empty():
             yield self.__service_queue.get()
+        elif self.__pending_output_message is not None and self.connected:
+            message, self.__pending_output_message = self.__pending_output_message, None
+            yield message
         elif not self.output_queue.empty() and self.connected:
-            yield self.output_queue.get()
+            yield self.__get_output_message()
         elif not self.__request_data_queue.empty() and self.connected:
             yield self.__request_data_queue.get()
         else:
             return None
 
+    def __get_output_message(self):
+        message = self.output_queue.get()
+        if self.__max_telemetry_batch_size <= 1 or not self.__is_telemetry_message(message):
+            return message
+
+        telemetry_messages = [message]
+        while len(telemetry_messages) < self.__max_telemetry_batch_size and not self.output_queue.empty():
+            next_message = self.output_queue.get()
+            if not self.__is_telemetry_message(next_message):
+                self.__pending_output_message = next_message
+                break
+            telemetry_messages.append(next_message)
+
+        if len(telemetry_messages) == 1:
+            return message
+        return GrpcMsgCreator.create_telemetry_batch_connector_msg(telemetry_messages)
+
+    @staticmethod
+    def __is_telemetry_message(message):
+        return message.HasField("gatewayTelemetryMsg") and len(message.ListFields()) == 1
+
     def send(self, message):
         # log.debug("Sending message to gateway %r", message)
         self.output_queue.put(message)
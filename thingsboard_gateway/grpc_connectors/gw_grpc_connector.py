@@ -50,7 +50,8 @@ class GwGrpcConnector(Thread):
         self._grpc_client = GrpcClient(self.__on_connect,
                                        self._incoming_messages_callback,
                                        self.connection_config['gateway']['host'],
-                                       self.connection_config['gateway']['port'])
+                                       self.connection_config['gateway']['port'],
+                                       self.connection_config['gateway'].get('maxTelemetryBatchSize', 1))
         self.__connection_thread = Thread(target=self.connect,
                                           name="Registration thread",
                                           daemon=True)
@@ -103,6 +103,24 @@ class GrpcMsgCreator:
         basic_message.gatewayTelemetryMsg.MergeFrom(gateway_telemetry_msg)
         return basic_message
 
+    @staticmethod
+    def create_telemetry_batch_connector_msg(telemetry_messages: list,
+                                             basic_message=None) -> FromConnectorMessage:
+        """
+        Creates GatewayTelemetryBatchMsg.\n
+        :param telemetry_messages: list of messages created by create_telemetry_connector_msg
+        :param basic_message:
+        :return FromConnectorMessage:
+        All telemetry messages are sent to the gateway in a single frame.
+        """
+        is_not_none(telemetry_messages)
+        basic_message = GrpcMsgCreator.get_basic_message(basic_message)
+        gateway_telemetry_batch_msg = GatewayTelemetryBatchMsg()
+        gateway_telemetry_batch_msg.msg.extend([telemetry_message.gatewayTelemetryMsg
+                                                for telemetry_message in telemetry_messages])
+        basic_message.gatewayTelemetryBatchMsg.MergeFrom(gateway_telemetry_batch_msg)
+        return basic_message
+
     @staticmethod
     def create_attributes_connector_msg(attributes: Union[list, dict] = None, device_name=None,
                                         basic_message=None) -> FromConnectorMessage:
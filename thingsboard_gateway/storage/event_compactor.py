@@ -0,0 +1,120 @@
+#     Copyright 2026. ThingsBoard
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+from simplejson import dumps, loads
+
+
+class EventCompactor:
+    """
+    Removes values that are overwritten by newer events from the stored events.
+    Events have to be passed from the newest to the oldest one, so the compactor knows
+    which attributes and "latest only" telemetry keys are already sent later for every device.
+    """
+
+    def __init__(self, latest_only_keys=None):
+        self.latest_only_keys = set(latest_only_keys or [])
+        self.__seen_attributes = set()
+        self.__seen_telemetry_ts = {}
+
+    def start_pass(self):
+        self.__seen_attributes.clear()
+        self.__seen_telemetry_ts.clear()
+
+    @property
+    def tracked_keys_count(self):
+        return len(self.__seen_attributes) + len(self.__seen_telemetry_ts)
+
+    def compact(self, event):
+        """
+        Returns tuple of compacted event and flag whether the event was changed,
+        compacted event is None if all values of the event are overwritten by newer events.
+        """
+
+        try:
+            data = loads(event)
+            device_name = data["deviceName"]
+        except Exception:
+            return event, False
+
+        attributes, attributes_changed = self.__compact_attributes(device_name, data.get("attributes"))
+        telemetry, telemetry_changed = self.__compact_telemetry(device_name, data.get("telemetry"))
+        if not attributes_changed and not telemetry_changed:
+            return event, False
+
+        if not attributes and not telemetry:
+            return None, True
+
+        data["attributes"] = attributes
+        data["telemetry"] = telemetry
+        return dumps(data, separators=(',', ':'), skipkeys=True, ignore_nan=True), True
+
+    def __compact_attributes(self, device_name, attributes):
+        if not attributes:
+            return attributes, False
+
+        if isinstance(attributes, list):
+            compacted_attributes = []
+            changed = False
+            for item in attributes:
+                compacted_item, item_changed = self.__compact_attributes(device_name, item)
+                changed = changed or item_changed
+                if compacted_item:
+                    compacted_attributes.append(compacted_item)
+            return compacted_attributes, changed
+
+        compacted_attributes = {}
+        for key, value in attributes.items():
+            if (device_name, key) in self.__seen_attributes:
+                continue
+            self.__seen_attributes.add((device_name, key))
+            compacted_attributes[key] = value
+        return compacted_attributes, len(compacted_attributes) != len(attributes)
+
+    def __compact_telemetry(self, device_name, telemetry):
+        if not telemetry or not self.latest_only_keys:
+            return telemetry, False
+
+        if isinstance(telemetry, dict):
+            compacted_entry, changed = self.__compact_telemetry_entry(device_name, telemetry)
+            return compacted_entry or [], changed
+
+        compacted_telemetry = []
+        changed = False
+        for entry in telemetry:
+            compacted_entry, entry_changed = self.__compact_telemetry_entry(device_name, entry)
+            changed = changed or entry_changed
+            if compacted_entry:
+                compacted_telemetry.append(compacted_entry)
+        return compacted_telemetry, changed
+
+    def __compact_telemetry_entry(self, device_name, entry):
+        values = entry.get("values")
+        ts = entry.get("ts")
+        if not isinstance(values, dict) or ts is None:
+            return entry, False
+
+        compacted_values = {}
+        for key, value in values.items():
+            if key in self.latest_only_keys:
+                newest_ts = self.__seen_telemetry_ts.get((device_name, key))
+                if newest_ts is not None and newest_ts >= ts:
+                    continue
+                self.__seen_telemetry_ts[(device_name, key)] = ts
+            compacted_values[key] = value
+
+        if len(compacted_values) == len(values):
+            return entry, False
+        if not compacted_values:
+            return None, True
+        return {**entry, "values": compacted_values}, True
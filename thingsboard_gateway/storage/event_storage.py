@@ -22,7 +22,8 @@ class EventStorage(ABC):
         self._main_stop_event = main_stop_event
 
     @abstractmethod
-    def put(self, event):
+    def put(self, event, lane=None):
+        # Saves the event, lane is the priority lane of the event, storages without lanes ignore it
         pass
 
     @abstractmethod
@@ -32,7 +33,28 @@ class EventStorage(ABC):
 
     @abstractmethod
     def event_pack_processing_done(self):
-        # Indicates that events from previous "get_event_pack" may be cleared
+        # Indicates that events from the oldest not processed pack may be cleared
+        pass
+
+    def read_ahead_event_pack(self):
+        # Returns the next events pack while packs from previous calls are not processed yet,
+        # storages that cannot read ahead return empty list, so only one pack is processed at a time
+        return []
+
+    def reset_read_ahead(self):
+        # Packs read ahead will be returned again by the next "read_ahead_event_pack" calls
+        pass
+
+    def has_pending_writes(self):
+        # Returns True while some events accepted by "put" may be not available for reading yet
+        return False
+
+    def get_dropped_events_count(self):
+        # Returns count of events that were not saved because the storage was full
+        return 0
+
+    def update_connection_state(self, connected):
+        # Called when the connection to the platform is established or lost
         pass
 
     @abstractmethod
@@ -50,3 +72,9 @@ class EventStorage(ABC):
 
     def get_configuration(self):
         return self._config
+
+    @staticmethod
+    def get_lane_configuration(config, lane):
+        # Returns configuration for the storage of the additional priority lane,
+        # storages that keep events on disk have to use separate location for every lane
+        return dict(config)
@@ -0,0 +1,123 @@
+#     Copyright 2026. ThingsBoard
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+from os import linesep, remove, replace
+from os.path import exists
+from threading import Event, Thread
+from time import monotonic
+
+from pybase64 import b64decode, b64encode
+
+from thingsboard_gateway.storage.event_compactor import EventCompactor
+from thingsboard_gateway.storage.file.event_storage_files import EventStorageFiles
+from thingsboard_gateway.storage.file.file_event_storage_settings import FileEventStorageSettings
+
+COMPACTION_FILE_DELAY = 0.5
+
+
+class EventStorageCompactor(Thread):
+    """
+    Rewrites data files that are already closed by the writer and not reached by the reader yet,
+    removing attribute values and "latest only" telemetry values that are overwritten by newer events.
+    Files are processed from the newest to the oldest one, one file per step.
+    """
+
+    def __init__(self, files: EventStorageFiles, settings: FileEventStorageSettings, reader, writer, files_lock,
+                 logger, stopped: Event):
+        super().__init__(name="File storage compaction thread", daemon=True)
+        self.__log = logger
+        self.files = files
+        self.settings = settings
+        self.__reader = reader
+        self.__writer = writer
+        self.__files_lock = files_lock
+        self.__stopped = stopped
+        self.__compactor = EventCompactor(settings.get_compaction_latest_only_keys())
+
+    def run(self):
+        while not self.__stopped.wait(self.settings.get_compaction_period()):
+            try:
+                self.compact()
+            except Exception as e:
+                self.__log.exception("Failed to compact data files! Error: %s", e)
+
+    def compact(self):
+        pass_start_time = monotonic()
+        removed_events_count = 0
+        self.__compactor.start_pass()
+        for file in reversed(self.get_files_to_compact()):
+            if self.__stopped.is_set():
+                break
+            removed_events_count += self.compact_file(file)
+            self.__stopped.wait(COMPACTION_FILE_DELAY)
+        self.__compactor.start_pass()
+        self.__log.debug("FileStorage_compactor -- Compaction pass finished in %.2f s, removed events: %d",
+                         monotonic() - pass_start_time, removed_events_count)
+        return removed_events_count
+
+    def get_files_to_compact(self):
+        with self.__files_lock:
+            data_files = self.files.get_data_files()
+            reader_files = (self.__reader.current_pos.get_file(), self.__reader.new_pos.get_file())
+            last_read_file_index = max((data_files.index(file) for file in reader_files if file in data_files),
+                                       default=-1)
+            if self.__writer.current_file not in data_files:
+                return []
+            return data_files[last_read_file_index + 1:data_files.index(self.__writer.current_file)]
+
+    def compact_file(self, file):
+        file_path = self.settings.get_data_folder_path() + file
+        try:
+            with open(file_path, 'rb') as data_file:
+                lines = [line.rstrip() for line in data_file if line.strip()]
+        except IOError as e:
+            self.__log.warning("FileStorage_compactor -- Failed to read file %s! Error: %s", file, e)
+            return 0
+
+        compacted_lines = []
+        changed = False
+        for line in reversed(lines):
+            try:
+                event = b64decode(line).decode("utf-8")
+            except Exception:
+                compacted_lines.append(line)
+                continue
+            compacted_event, event_changed = self.__compactor.compact(event)
+            if not event_changed:
+                compacted_lines.append(line)
+                continue
+            changed = True
+            if compacted_event is not None:
+                compacted_lines.append(b64encode(compacted_event.encode("utf-8")))
+
+        if not changed:
+            return 0
+
+        compacted_file_path = self.settings.get_data_folder_path() + "compacted_" + file
+        with open(compacted_file_path, 'wb') as compacted_file:
+            for line in reversed(compacted_lines):
+                compacted_file.write(line + linesep.encode('utf-8'))
+
+        with self.__files_lock:
+            # the reader could reach the file while it was compacted
+            if file in self.get_files_to_compact():
+                replace(compacted_file_path, file_path)
+                return len(lines) - len(compacted_lines)
+
+        if exists(compacted_file_path):
+            remove(compacted_file_path)
+        return 0
+
+    def update_logger(self, logger):
+        self.__log = logger
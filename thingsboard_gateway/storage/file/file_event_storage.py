@@ -14,11 +14,13 @@
 
 import os
 import time
+from threading import Event, RLock
 
 from simplejson import dump
 from logging import getLogger
 
 from thingsboard_gateway.storage.event_storage import EventStorage
+from thingsboard_gateway.storage.file.event_storage_compactor import EventStorageCompactor
 from thingsboard_gateway.storage.file.event_storage_files import EventStorageFiles
 from thingsboard_gateway.storage.file.event_storage_reader import EventStorageReader
 from thingsboard_gateway.storage.file.event_storage_writer import DataFileCountError, EventStorageWriter
@@ -37,8 +39,17 @@ class FileEventStorage(EventStorage):
         self.__writer = EventStorageWriter(self.event_storage_files, self.settings, self.__log)
         self.__reader = EventStorageReader(self.event_storage_files, self.settings, self.__log)
         self.__stopped = False
+        # reader switches data files only while holding the lock, so the compactor never replaces the file in use
+        self.__files_lock = RLock()
+        self.__compactor = None
+        if self.settings.get_compaction_enabled():
+            self.__compactor_stopped = Event()
+            self.__compactor = EventStorageCompactor(self.event_storage_files, self.settings, self.__reader,
+                                                     self.__writer, self.__files_lock, self.__log,
+                                                     self.__compactor_stopped)
+            self.__compactor.start()
 
-    def put(self, event):
+    def put(self, event, lane=None):
         success = False
         if not self.__stopped:
             try:
@@ -54,7 +65,8 @@ class FileEventStorage(EventStorage):
         return success
 
     def get_event_pack(self):
-        return self.__reader.read()
+        with self.__files_lock:
+            return self.__reader.read()
 
     def event_pack_processing_done(self):
         self.__reader.discard_batch()
@@ -101,8 +113,16 @@ class FileEventStorage(EventStorage):
         except IOError as e:
             self.__log.error("Failed to create a new file! Error: %s", e)
 
+    @staticmethod
+    def get_lane_configuration(config, lane):
+        lane_config = dict(config)
+        lane_config["data_folder_path"] = os.path.join(config.get("data_folder_path", "./"), lane, "")
+        return lane_config
+
     def stop(self):
         self.__stopped = True
+        if self.__compactor is not None:
+            self.__compactor_stopped.set()
 
     def len(self):
         return len(self.__writer.files.data_files)
@@ -111,3 +131,5 @@ class FileEventStorage(EventStorage):
         self.__log = getLogger("storage")
         self.__writer.update_logger(self.__log)
         self.__reader.update_logger(self.__log)
+        if self.__compactor is not None:
+            self.__compactor.update_logger(self.__log)
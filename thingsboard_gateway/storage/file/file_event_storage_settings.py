@@ -20,6 +20,9 @@ class FileEventStorageSettings:
         self.max_records_per_file = config.get("max_records_per_file", 3)
         self.max_records_between_fsync = config.get("max_records_between_fsync", 1)
         self.max_read_records_count = config.get("max_read_records_count", 1000)
+        self.compaction_enabled = config.get("compaction_enabled", False)
+        self.compaction_latest_only_keys = config.get("compaction_latest_only_keys", [])
+        self.compaction_period = config.get("compaction_period_in_seconds", 60)
 
     def get_data_folder_path(self):
         return self.data_folder_path
@@ -35,3 +38,12 @@ class FileEventStorageSettings:
 
     def get_max_read_records_count(self):
         return self.max_read_records_count
+
+    def get_compaction_enabled(self):
+        return self.compaction_enabled
+
+    def get_compaction_latest_only_keys(self):
+        return self.compaction_latest_only_keys
+
+    def get_compaction_period(self):
+        return self.compaction_period
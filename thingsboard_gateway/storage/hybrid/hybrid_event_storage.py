@@ -0,0 +1,235 @@
+#     Copyright 2026. ThingsBoard
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+from collections import deque
+from logging import getLogger
+from threading import RLock
+from time import monotonic
+
+from thingsboard_gateway.storage.event_storage import EventStorage
+from thingsboard_gateway.storage.file.file_event_storage import FileEventStorage
+from thingsboard_gateway.storage.sqlite.sqlite_event_storage import SQLiteEventStorage
+
+SPILL_STORAGE_TYPES = {
+    "sqlite": SQLiteEventStorage,
+    "file": FileEventStorage,
+}
+
+MEMORY_SOURCE = "memory"
+SPILL_SOURCE = "spill"
+
+
+class HybridEventStorage(EventStorage):
+    """
+    Keeps events in memory while the gateway is connected to the platform and sends them fast enough,
+    so the healthy connection does not cost disk writes for every event.
+    Events are moved (spilled) to the persistent storage of "spill_storage_type" when the size or the age of events
+    in memory exceeds the limit, when the connection is lost and on stop.
+    Persistent storage contains only events older than the events waiting in memory,
+    so packs are read from it first and from memory only when it has nothing to read.
+    """
+
+    def __init__(self, config, logger, main_stop_event):
+        super().__init__(config, logger, main_stop_event)
+        self.__log = logger
+        self.__max_memory_size = config.get("max_memory_size_in_bytes", 10485760)
+        self.__max_memory_event_age = config.get("max_memory_event_age_in_seconds", 60)
+        self.__events_per_time = config.get("read_records_count", 1000)
+        self.__spill_storage = self.get_spill_storage_class(config)(config, logger, main_stop_event)
+        self.__lock = RLock()
+        self.__connected = False
+        self.__stopped = False
+
+        # events waiting in memory with monotonic time of putting, the first one is the oldest
+        self.__events = deque()
+        # serialized events are ASCII JSON, so the length of the string is its size in bytes
+        self.__events_size = 0
+
+        # sources of the packs that were returned and are not processed yet, the first one is the current event pack
+        self.__returned_event_packs_sources = deque()
+        self.__memory_event_packs = deque()
+        # packs returned after the last reset of read ahead, packs returned before are returned again in the same order
+        self.__returned_event_packs_count = 0
+        self.__returned_memory_event_packs_count = 0
+        self.__returned_spill_event_packs_count = 0
+        self.__log.debug("Hybrid storage created with following configuration: \nSpill storage type: %s\n"
+                         "Max memory size: %i bytes\nMax memory event age: %r s",
+                         type(self.__spill_storage).__name__, self.__max_memory_size, self.__max_memory_event_age)
+
+    @staticmethod
+    def get_spill_storage_class(config):
+        spill_storage_type = config.get("spill_storage_type", "sqlite")
+        if spill_storage_type not in SPILL_STORAGE_TYPES:
+            raise ValueError("Unknown spill storage type %r, available types: %s"
+                             % (spill_storage_type, ", ".join(SPILL_STORAGE_TYPES)))
+        return SPILL_STORAGE_TYPES[spill_storage_type]
+
+    @staticmethod
+    def get_lane_configuration(config, lane):
+        return HybridEventStorage.get_spill_storage_class(config).get_lane_configuration(config, lane)
+
+    @property
+    def spill_storage(self):
+        return self.__spill_storage
+
+    def put(self, event, lane=None):
+        with self.__lock:
+            if self.__stopped:
+                self.__log.error("Storage is stopped!")
+                return False
+
+            if not self.__connected:
+                # events are not kept in memory while they cannot be sent
+                if self.__events:
+                    self.__spill_events()
+                if not self.__events:
+                    return self.__spill_storage.put(event)
+
+            self.__events.append((monotonic(), event))
+            self.__events_size += len(event)
+            if self.__events_size > self.__max_memory_size or self.__has_expired_events():
+                self.__spill_events()
+            return True
+
+    def get_event_pack(self):
+        with self.__lock:
+            if self.__has_expired_events():
+                self.__spill_events()
+
+            if self.__returned_event_packs_count > 0:
+                if self.__returned_event_packs_sources[0] == MEMORY_SOURCE:
+                    return self.__memory_event_packs[0]
+                return self.__spill_storage.get_event_pack()
+            return self.__read_event_pack()
+
+    def read_ahead_event_pack(self):
+        with self.__lock:
+            if self.__has_expired_events():
+                self.__spill_events()
+            return self.__read_event_pack()
+
+    def __read_event_pack(self):
+        if self.__returned_event_packs_count < len(self.__returned_event_packs_sources):
+            source = self.__returned_event_packs_sources[self.__returned_event_packs_count]
+            self.__returned_event_packs_count += 1
+            if source == MEMORY_SOURCE:
+                self.__returned_memory_event_packs_count += 1
+                return self.__memory_event_packs[self.__returned_memory_event_packs_count - 1]
+            return self.__read_spill_event_pack()
+
+        # pending writes are checked before reading, so events written after the check are not missed
+        has_pending_writes = self.__spill_storage.has_pending_writes()
+        event_pack = self.__read_spill_event_pack()
+        if event_pack:
+            self.__returned_event_packs_sources.append(SPILL_SOURCE)
+            self.__returned_event_packs_count += 1
+            return event_pack
+        if has_pending_writes or self.__returned_spill_event_packs_count > 0:
+            # spill storage may have not returned older events yet
+            return []
+
+        event_pack = []
+        for _ in range(min(self.__events_per_time, len(self.__events))):
+            _, event = self.__events.popleft()
+            self.__events_size -= len(event)
+            event_pack.append(event)
+        if event_pack:
+            self.__memory_event_packs.append(event_pack)
+            self.__returned_memory_event_packs_count += 1
+            self.__returned_event_packs_sources.append(MEMORY_SOURCE)
+            self.__returned_event_packs_count += 1
+        return event_pack
+
+    def __read_spill_event_pack(self):
+        if self.__returned_spill_event_packs_count == 0:
+            event_pack = self.__spill_storage.get_event_pack()
+        else:
+            event_pack = self.__spill_storage.read_ahead_event_pack()
+        if event_pack:
+            self.__returned_spill_event_packs_count += 1
+        return event_pack
+
+    def event_pack_processing_done(self):
+        with self.__lock:
+            if not self.__returned_event_packs_sources:
+                return
+            source = self.__returned_event_packs_sources.popleft()
+            self.__returned_event_packs_count = max(self.__returned_event_packs_count - 1, 0)
+            if source == MEMORY_SOURCE:
+                self.__memory_event_packs.popleft()
+                self.__returned_memory_event_packs_count = max(self.__returned_memory_event_packs_count - 1, 0)
+            else:
+                self.__returned_spill_event_packs_count = max(self.__returned_spill_event_packs_count - 1, 0)
+                self.__spill_storage.event_pack_processing_done()
+
+    def reset_read_ahead(self):
+        with self.__lock:
+            self.__returned_event_packs_count = 0
+            self.__returned_memory_event_packs_count = 0
+            self.__returned_spill_event_packs_count = 0
+            self.__spill_storage.reset_read_ahead()
+
+    def update_connection_state(self, connected):
+        with self.__lock:
+            self.__connected = connected
+            if not connected and self.__events:
+                self.__log.debug("Connection is lost, moving %i events from memory to the spill storage",
+                                 len(self.__events))
+                self.__spill_events()
+
+    def __has_expired_events(self):
+        return bool(self.__events) and monotonic() - self.__events[0][0] > self.__max_memory_event_age
+
+    def __spill_events(self):
+        spilled_events_count = 0
+        while self.__events:
+            event = self.__events[0][1]
+            if not self.__spill_storage.put(event):
+                self.__log.error("Failed to move events from memory to the spill storage, %i events are kept in memory",
+                                 len(self.__events))
+                break
+            self.__events.popleft()
+            self.__events_size -= len(event)
+            spilled_events_count += 1
+        if spilled_events_count:
+            self.__log.trace("Moved %i events from memory to the spill storage", spilled_events_count)
+
+    def stop(self):
+        with self.__lock:
+            if not self.__stopped:
+                self.__stopped = True
+                # packs sent without acknowledgement are saved before waiting events to be sent again after restart,
+                # they are saved after older spilled events, if events were spilled while the packs were in flight
+                for event_pack in reversed(self.__memory_event_packs):
+                    for event in reversed(event_pack):
+                        self.__events.appendleft((monotonic(), event))
+                        self.__events_size += len(event)
+                self.__memory_event_packs.clear()
+                self.__returned_event_packs_sources.clear()
+                self.__returned_event_packs_count = 0
+                self.__returned_memory_event_packs_count = 0
+                self.__returned_spill_event_packs_count = 0
+                self.__spill_events()
+                if self.__events:
+                    self.__log.error("%i events from memory are lost on storage stop", len(self.__events))
+            self.__spill_storage.stop()
+
+    def len(self):
+        with self.__lock:
+            return (len(self.__events) + sum(len(event_pack) for event_pack in self.__memory_event_packs)
+                    + self.__spill_storage.len())
+
+    def update_logger(self):
+        self.__log = getLogger("storage")
+        self.__spill_storage.update_logger()
@@ -12,53 +12,161 @@
 #     See the License for the specific language governing permissions and
 #     limitations under the License.
 
+from collections import deque
 from logging import getLogger
-from queue import Empty, Full, Queue
+from threading import Condition
+from time import monotonic
 
 from thingsboard_gateway.storage.event_storage import EventStorage
 
+DROP_OLDEST_POLICY = "drop_oldest"
+DROP_NEWEST_POLICY = "drop_newest"
+BLOCK_POLICY = "block"
+OVERFLOW_POLICIES = (DROP_OLDEST_POLICY, DROP_NEWEST_POLICY, BLOCK_POLICY)
+
 
 class MemoryEventStorage(EventStorage):
     def __init__(self, config, logger, main_stop_event):
         super().__init__(config, logger, main_stop_event)
         self.__log = logger
         self.__queue_len = config.get("max_records_count", 10000)
+        # size of the serialized events in UTF-8 bytes, 0 means that only count of events is limited
+        self.__max_size = config.get("max_size_in_bytes", 0)
         self.__events_per_time = config.get("read_records_count", 1000)
-        self.__events_queue = Queue(self.__queue_len)
-        self.__event_pack = []
+        self.__overflow_policy = config.get("overflow_policy", DROP_NEWEST_POLICY)
+        if self.__overflow_policy not in OVERFLOW_POLICIES:
+            self.__log.warning("Unknown memory storage overflow policy %r, %r is used. Available policies: %s",
+                               self.__overflow_policy, DROP_NEWEST_POLICY, ", ".join(OVERFLOW_POLICIES))
+            self.__overflow_policy = DROP_NEWEST_POLICY
+        # "block" policy makes put wait in the caller thread, so a connector thread that sends data
+        # to the storage is stalled up to this timeout for every event while the storage is full
+        self.__block_timeout = config.get("overflow_block_timeout_in_seconds", 1)
+        if self.__overflow_policy == BLOCK_POLICY:
+            self.__log.info("Memory storage is configured with %r overflow policy, connector threads will wait up to "
+                            "%s seconds for every event while the storage is full",
+                            BLOCK_POLICY, self.__block_timeout)
+
+        # waiting events are taken by the whole pack under one lock acquisition
+        self.__events = deque()
+        # sizes of the waiting events, they are tracked only if "max_size_in_bytes" is set
+        self.__events_sizes = deque()
+        self.__events_size = 0
+        self.__not_full = Condition()
+        self.__dropped_events_count = {policy: 0 for policy in OVERFLOW_POLICIES}
+        # packs that were returned and are not processed yet, the first one is the current event pack
+        self.__event_packs = deque()
+        self.__returned_event_packs_count = 0
         self.__stopped = False
-        self.__log.debug("Memory storage created with following configuration: \nMax size: %i\n Read records per time: %i",
-                  self.__queue_len, self.__events_per_time)
-
-    def put(self, event):
-        success = False
-        if not self.__stopped:
-            try:
-                self.__events_queue.put_nowait(event)
-                success = True
-            except Full:
-                self.__log.error("Memory storage is full!")
-        else:
-            self.__log.error("Storage is stopped!")
-        return success
+        self.__log.debug("Memory storage created with following configuration: \nMax size: %i\n Max size in bytes: %i\n"
+                         " Read records per time: %i\n Overflow policy: %s",
+                         self.__queue_len, self.__max_size, self.__events_per_time, self.__overflow_policy)
+
+    @property
+    def dropped_events_count(self):
+        return dict(self.__dropped_events_count)
+
+    def get_dropped_events_count(self):
+        return sum(self.__dropped_events_count.values())
+
+    def put(self, event, lane=None):
+        event_size = self.__get_event_size(event) if self.__max_size else 0
+        with self.__not_full:
+            if self.__stopped:
+                self.__log.error("Storage is stopped!")
+                return False
+
+            if self.__max_size and event_size > self.__max_size:
+                self.__dropped_events_count[self.__overflow_policy] += 1
+                self.__log.error("Event of %i bytes is bigger than the memory storage size limit!", event_size)
+                return False
+
+            if self.__is_full(event_size):
+                if self.__overflow_policy == DROP_OLDEST_POLICY:
+                    while self.__is_full(event_size):
+                        self.__events.popleft()
+                        if self.__max_size:
+                            self.__events_size -= self.__events_sizes.popleft()
+                        self.__dropped_events_count[DROP_OLDEST_POLICY] += 1
+                    self.__log.warning("Memory storage is full! The oldest events are dropped.")
+                elif self.__overflow_policy == BLOCK_POLICY:
+                    wait_until = monotonic() + self.__block_timeout
+                    while self.__is_full(event_size) and not self.__stopped and monotonic() < wait_until:
+                        self.__not_full.wait(wait_until - monotonic())
+                    if self.__stopped or self.__is_full(event_size):
+                        self.__dropped_events_count[BLOCK_POLICY] += 1
+                        self.__log.error("Memory storage is full!")
+                        return False
+                else:
+                    self.__dropped_events_count[DROP_NEWEST_POLICY] += 1
+                    self.__log.error("Memory storage is full!")
+                    return False
+
+            self.__events.append(event)
+            if self.__max_size:
+                self.__events_sizes.append(event_size)
+                self.__events_size += event_size
+            return True
+
+    @staticmethod
+    def __get_event_size(event):
+        # events are serialized to str, their limit is set in bytes
+        return len(event.encode('utf-8')) if isinstance(event, str) else len(event)
+
+    def __is_full(self, event_size):
+        # count of events is not limited if "max_records_count" is not positive, as it was for the queue
+        return (0 < self.__queue_len <= len(self.__events)
+                or (self.__max_size and self.__events_size + event_size > self.__max_size))
 
     def get_event_pack(self):
-        try:
-            if not self.__event_pack:
-                self.__event_pack = [self.__events_queue.get_nowait() for _ in
-                                     range(min(self.__events_per_time, self.__events_queue.qsize()))]
-        except Empty:
-            pass
-        return self.__event_pack
+        if not self.__event_packs:
+            self.__read_event_pack()
+        if self.__event_packs:
+            self.__returned_event_packs_count = max(self.__returned_event_packs_count, 1)
+            return self.__event_packs[0]
+        return []
+
+    def read_ahead_event_pack(self):
+        if self.__returned_event_packs_count >= len(self.__event_packs) and not self.__read_event_pack():
+            return []
+        event_pack = self.__event_packs[self.__returned_event_packs_count]
+        self.__returned_event_packs_count += 1
+        return event_pack
+
+    def reset_read_ahead(self):
+        self.__returned_event_packs_count = min(self.__returned_event_packs_count, 1)
+
+    def __read_event_pack(self):
+        if not self.__events:
+            return []
+        with self.__not_full:
+            if len(self.__events) <= self.__events_per_time:
+                event_pack = list(self.__events)
+                self.__events = deque()
+                self.__events_sizes = deque()
+                self.__events_size = 0
+            else:
+                pop_event = self.__events.popleft
+                event_pack = [pop_event() for _ in range(self.__events_per_time)]
+                if self.__max_size:
+                    pop_event_size = self.__events_sizes.popleft
+                    self.__events_size -= sum(pop_event_size() for _ in range(self.__events_per_time))
+            self.__not_full.notify_all()
+        if event_pack:
+            self.__event_packs.append(event_pack)
+        return event_pack
 
     def event_pack_processing_done(self):
-        self.__event_pack = []
+        if self.__event_packs:
+            self.__event_packs.popleft()
+            self.__returned_event_packs_count = max(self.__returned_event_packs_count - 1, 0)
 
     def stop(self):
-        self.__stopped = True
+        with self.__not_full:
+            self.__stopped = True
+            self.__not_full.notify_all()
 
     def len(self):
-        return self.__events_queue.qsize()
+        return len(self.__events)
 
     def update_logger(self):
         self.__log = getLogger("storage")
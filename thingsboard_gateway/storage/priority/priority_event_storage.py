@@ -0,0 +1,145 @@
+#     Copyright 2026. ThingsBoard
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+from collections import deque
+from logging import getLogger
+
+from thingsboard_gateway.storage.event_storage import EventStorage
+
+ATTRIBUTES_LANE = "attributes"
+LIVE_LANE = "live"
+BACKLOG_LANE = "backlog"
+
+# lanes are listed in order of priority, it is used when lanes have equal weights
+DEFAULT_LANES_WEIGHTS = {
+    ATTRIBUTES_LANE: 4,
+    LIVE_LANE: 4,
+    BACKLOG_LANE: 2,
+}
+
+
+class PriorityEventStorage(EventStorage):
+    """
+    Keeps events of every priority lane in a separate storage of the configured type.
+    Event packs are taken from the lanes by smooth weighted round-robin, so every lane with data gets
+    its configured share of the packs sent to the platform. Storage of the backlog lane uses
+    the configuration as is, so events saved before the lanes were enabled are sent as backlog.
+    """
+
+    def __init__(self, config, logger, main_stop_event, storage_class):
+        super().__init__(config, logger, main_stop_event)
+        self.__log = logger
+        self.__weights = self.__get_lanes_weights(config.get("priority_lanes", {}))
+        self.__lanes = {}
+        for lane in self.__weights:
+            lane_config = config if lane == BACKLOG_LANE else storage_class.get_lane_configuration(config, lane)
+            self.__lanes[lane] = storage_class(lane_config, logger, main_stop_event)
+
+        self.__current_weights = {lane: 0 for lane in self.__weights}
+        self.__total_weight = sum(self.__weights.values())
+        # lanes of the packs that were returned and are not processed yet, in order of returning
+        self.__returned_event_packs_lanes = deque()
+        self.__returned_event_packs_count = {lane: 0 for lane in self.__weights}
+        self.__log.debug("Priority storage created with following lanes weights: %r", self.__weights)
+
+    def __get_lanes_weights(self, lanes_config):
+        weights = dict(DEFAULT_LANES_WEIGHTS)
+        for lane, weight in lanes_config.items():
+            if lane not in weights:
+                self.__log.warning("Unknown storage priority lane %r, it will be skipped. Available lanes: %s",
+                                   lane, ", ".join(DEFAULT_LANES_WEIGHTS))
+                continue
+            try:
+                weights[lane] = max(int(weight), 0)
+            except (TypeError, ValueError):
+                self.__log.warning("Invalid weight %r of the storage priority lane %r, default weight %r is used",
+                                   weight, lane, weights[lane])
+        return weights
+
+    @property
+    def lanes(self):
+        return self.__lanes
+
+    @property
+    def weights(self):
+        return self.__weights
+
+    def put(self, event, lane=BACKLOG_LANE):
+        return self.__lanes[lane].put(event)
+
+    def get_event_pack(self):
+        if self.__returned_event_packs_lanes:
+            return self.__lanes[self.__returned_event_packs_lanes[0]].get_event_pack()
+        return self.__read_next_event_pack()
+
+    def read_ahead_event_pack(self):
+        return self.__read_next_event_pack()
+
+    def __read_next_event_pack(self):
+        for lane in self.__current_weights:
+            self.__current_weights[lane] += self.__weights[lane]
+
+        for lane in sorted(self.__current_weights, key=self.__current_weights.get, reverse=True):
+            event_pack = self.__read_lane_event_pack(lane)
+            if event_pack:
+                self.__current_weights[lane] -= self.__total_weight
+                self.__returned_event_packs_lanes.append(lane)
+                self.__returned_event_packs_count[lane] += 1
+                return event_pack
+
+            # lane without data should not collect the share to send burst of packs later
+            self.__current_weights[lane] = min(self.__current_weights[lane], 0)
+        return []
+
+    def __read_lane_event_pack(self, lane):
+        if self.__returned_event_packs_count[lane] == 0:
+            return self.__lanes[lane].get_event_pack()
+        return self.__lanes[lane].read_ahead_event_pack()
+
+    def event_pack_processing_done(self):
+        if self.__returned_event_packs_lanes:
+            lane = self.__returned_event_packs_lanes.popleft()
+            self.__returned_event_packs_count[lane] -= 1
+            self.__lanes[lane].event_pack_processing_done()
+
+    def reset_read_ahead(self):
+        self.__returned_event_packs_lanes.clear()
+        for lane, storage in self.__lanes.items():
+            self.__returned_event_packs_count[lane] = 0
+            storage.reset_read_ahead()
+
+    def has_pending_writes(self):
+        return any(storage.has_pending_writes() for storage in self.__lanes.values())
+
+    def get_dropped_events_count(self):
+        return sum(storage.get_dropped_events_count() for storage in self.__lanes.values())
+
+    def update_connection_state(self, connected):
+        for storage in self.__lanes.values():
+            storage.update_connection_state(connected)
+
+    def stop(self):
+        for storage in self.__lanes.values():
+            storage.stop()
+
+    def len(self):
+        return sum(storage.len() for storage in self.__lanes.values())
+
+    def len_by_lane(self):
+        return {lane: storage.len() for lane, storage in self.__lanes.items()}
+
+    def update_logger(self):
+        self.__log = getLogger("storage")
+        for storage in self.__lanes.values():
+            storage.update_logger()
@@ -21,9 +21,13 @@ from queue import Queue, Empty
 import datetime
 from typing import Callable
 
+from thingsboard_gateway.storage.event_compactor import EventCompactor
 from thingsboard_gateway.storage.sqlite.database_connector import DatabaseConnector
+from thingsboard_gateway.storage.sqlite.events_block_codec import EventsBlockCodec
 from thingsboard_gateway.storage.sqlite.storage_settings import StorageSettings
 
+INCREMENTAL_AUTO_VACUUM_MODE = 2
+
 
 class Database(Thread):
     """
@@ -67,6 +71,20 @@ class Database(Thread):
         self.__last_msg_check = 0
         self.__can_prepare_new_batch = True
         self.__next_batch = []
+        self.__last_deleted_id = 0
+        self.__auto_vacuum_mode = None
+        self.__compactor = None
+        if self.settings.compaction_enabled:
+            self.__compactor = EventCompactor(self.settings.compaction_latest_only_keys)
+        # id of the oldest record checked by the current compaction pass, None if there is no pass in progress
+        self.__compaction_cursor = None
+        self.__compaction_pass_start_time = monotonic()
+        self.__compaction_removed_count = 0
+        self.__block_codec = None
+        if self.settings.compression_enabled:
+            self.__block_codec = EventsBlockCodec(self.settings.compression_codec,
+                                                  self.settings.compression_level,
+                                                  self.__log)
         self.__initialized = True
 
     def init_table(self):
@@ -91,19 +109,72 @@ class Database(Thread):
                 """CREATE TABLE IF NOT EXISTS messages (
                                         id INTEGER PRIMARY KEY AUTOINCREMENT,
                                         timestamp INTEGER NOT NULL,
-                                        message TEXT NOT NULL
+                                        message TEXT NOT NULL,
+                                        events_count INTEGER NOT NULL DEFAULT 1
                                     );"""
             )
             cursor = self.db.execute_write(
                 "CREATE INDEX IF NOT EXISTS idx_timestamp ON messages (timestamp);"
             )
             cursor.close()
+            self.init_events_count_column()
+            self.init_metadata_table()
             self.db.commit()
 
         except Exception as e:
             self.db.rollback()
             self.__log.exception("Failed to create table or migrate data! Error: %s", e)
 
+    def init_events_count_column(self):
+        """
+        Adds the column with count of events in the record to the table created by the previous versions,
+        every record with plain message contains one event, compressed block contains several events.
+        """
+
+        cursor = self.db.execute_read("PRAGMA table_info(messages);")
+        columns = [column[1] for column in cursor.fetchall()] if cursor else []
+        if columns and "events_count" not in columns:
+            self.db.execute_write("ALTER TABLE messages ADD COLUMN events_count INTEGER NOT NULL DEFAULT 1;")
+
+    def init_metadata_table(self):
+        """
+        Creates table with the stored messages counter, it is changed in the same transactions as the messages,
+        so the count of stored messages can be read without scanning the messages table.
+        """
+
+        self.db.execute_write(
+            """CREATE TABLE IF NOT EXISTS messages_metadata (
+                                    name TEXT PRIMARY KEY,
+                                    value INTEGER NOT NULL
+                                );"""
+        )
+        cursor = self.db.execute_read(
+            "SELECT value FROM messages_metadata WHERE name = 'messages_count';"
+        )
+        if cursor is not None and cursor.fetchone() is None:
+            # database created by the previous versions, messages are counted once
+            messages_count = self.db.execute_read("SELECT COUNT(*) FROM messages;").fetchone()[0]
+            self.db.execute_write(
+                "INSERT INTO messages_metadata (name, value) VALUES ('messages_count', ?);",
+                (messages_count,),
+            )
+
+    def __change_stored_messages_count(self, delta):
+        # has to be called in the transaction of the query that changed messages
+        if delta:
+            self.db.execute_write(
+                "UPDATE messages_metadata SET value = value + ? WHERE name = 'messages_count';",
+                (delta,),
+            )
+        return delta
+
+    def __count_events(self, condition, parameters):
+        cursor = self.db.execute_read(
+            "SELECT COALESCE(SUM(events_count), 0) FROM messages WHERE %s;" % condition, parameters
+        )
+        row = cursor.fetchone() if cursor else None
+        return row[0] if row else 0
+
     def run(self):
         self.__log.debug("Database thread started %r", id(self))
         interval = self.settings.oversize_check_period * 60
@@ -119,6 +190,10 @@ class Database(Thread):
                         self.__can_prepare_new_batch = False
                 if self.__should_write:
                     self.process()
+                if self.__compactor is not None:
+                    self.compact_data()
+                if self.process_queue.empty():
+                    self.reclaim_free_pages()
 
                 remaining = sleep_time - (monotonic() - processing_started)
                 if remaining > 0 and self.process_queue.empty():
@@ -180,12 +255,25 @@ class Database(Thread):
                 if batch:
                     start_writing = monotonic()
 
-                    self.db.execute_many_write(
-                        """INSERT INTO messages (timestamp, message) VALUES (?, ?);""",
-                        batch,
-                    )
-
-                    self.db.commit()
+                    try:
+                        if self.__block_codec is not None:
+                            cursor = self.db.execute_many_write(
+                                """INSERT INTO messages (timestamp, message, events_count) VALUES (?, ?, ?);""",
+                                self.__pack_blocks(cur_time, batch),
+                            )
+                        else:
+                            cursor = self.db.execute_many_write(
+                                """INSERT INTO messages (timestamp, message) VALUES (?, ?);""",
+                                batch,
+                            )
+                        if cursor is not None:
+                            self.__change_stored_messages_count(len(batch))
+
+                        self.db.commit()
+                    finally:
+                        # queued messages are counted as processed only after they are committed or failed
+                        for _ in batch:
+                            self.process_queue.task_done()
 
                     self.__log.trace(
                         "Wrote %d records in %.2f ms, queue size: %d, Avg time per 1 record: %.2f ms",
@@ -201,6 +289,115 @@ class Database(Thread):
             self.db.rollback()
             self.__log.exception("Failed to write data to storage! Error: %s", e)
 
+    def __pack_blocks(self, cur_time, batch):
+        block_size = self.settings.compression_block_size
+        blocks = []
+        for start in range(0, len(batch), block_size):
+            events = [message for _, message in batch[start:start + block_size]]
+            blocks.append((cur_time, self.__block_codec.encode(events), len(events)))
+        return blocks
+
+    def compact_data(self):
+        """
+        Makes one step of the compaction pass, that checks records from the newest to the oldest one and
+        removes attribute values and "latest only" telemetry values overwritten by newer records.
+        Every step processes not more than "compaction_batch_size" records to keep the I/O bounded.
+        """
+
+        if self.database_stopped_event.is_set() or self.stopped.is_set():
+            return
+        try:
+            if self.__compaction_cursor is None:
+                if monotonic() - self.__compaction_pass_start_time < self.settings.compaction_period:
+                    return
+                self.__compaction_pass_start_time = monotonic()
+                cursor = self.db.execute_read("SELECT MAX(id) FROM messages;")
+                row = cursor.fetchone() if cursor else None
+                if not row or row[0] is None:
+                    return
+                self.__compaction_cursor = row[0] + 1
+                self.__compaction_removed_count = 0
+                self.__compactor.start_pass()
+
+            cursor = self.db.execute_read(
+                """SELECT id, message, events_count FROM messages WHERE id < ? ORDER BY id DESC LIMIT ?;""",
+                (self.__compaction_cursor, self.settings.compaction_batch_size),
+            )
+            rows = cursor.fetchall() if cursor else []
+            if not rows:
+                self.__log.debug("Compaction pass finished in %.2f s, removed records: %d, tracked keys: %d",
+                                 monotonic() - self.__compaction_pass_start_time,
+                                 self.__compaction_removed_count,
+                                 self.__compactor.tracked_keys_count)
+                self.__compaction_cursor = None
+                self.__compactor.start_pass()
+                return
+
+            records_to_delete = []
+            records_to_update = []
+            deleted_events_count = 0
+            updated_events_delta = 0
+            for row in rows:
+                if EventsBlockCodec.is_block(row["message"]):
+                    compacted_message, events_count, changed = self.__compact_block(row["message"])
+                else:
+                    compacted_message, changed = self.__compactor.compact(row["message"])
+                    events_count = 1
+                if not changed:
+                    continue
+                if compacted_message is None:
+                    records_to_delete.append((row["id"],))
+                    deleted_events_count += row["events_count"]
+                else:
+                    records_to_update.append((compacted_message, events_count, row["id"]))
+                    updated_events_delta += events_count - row["events_count"]
+            self.__compaction_cursor = rows[-1]["id"]
+
+            if records_to_delete:
+                cursor = self.db.execute_many_write("""DELETE FROM messages WHERE id = ?;""", records_to_delete)
+                if cursor is not None:
+                    self.__compaction_removed_count -= self.__change_stored_messages_count(-deleted_events_count)
+                self.db.commit()
+            if records_to_update:
+                cursor = self.db.execute_many_write(
+                    """UPDATE messages SET message = ?, events_count = ? WHERE id = ?;""", records_to_update
+                )
+                if cursor is not None:
+                    self.__compaction_removed_count -= self.__change_stored_messages_count(updated_events_delta)
+                self.db.commit()
+            if records_to_delete or records_to_update:
+                # prepared batch may contain records changed by compaction, they will be read again on request
+                self.__next_batch = []
+        except Exception as e:
+            self.db.rollback()
+            self.__compaction_cursor = None
+            self.__log.exception("Failed to compact data in storage! Error: %s", e)
+
+    def __compact_block(self, block):
+        # events of the block are checked from the newest to the oldest one, as the records are
+        compacted_events = []
+        block_changed = False
+        for event in reversed(EventsBlockCodec.decode(block)):
+            compacted_event, changed = self.__compactor.compact(event)
+            block_changed = block_changed or changed
+            if compacted_event is not None:
+                compacted_events.append(compacted_event)
+        if not block_changed:
+            return block, len(compacted_events), False
+        if not compacted_events:
+            return None, 0, True
+        compacted_events.reverse()
+        return self.__encode_block(compacted_events), len(compacted_events), True
+
+    def __encode_block(self, events):
+        codec = self.__block_codec
+        if codec is None:
+            # compression was disabled after the block was written, the block is still kept compressed
+            codec = self.__block_codec = EventsBlockCodec(self.settings.compression_codec,
+                                                          self.settings.compression_level,
+                                                          self.__log)
+        return codec.encode(events)
+
     def clean_next_batch(self):
         self.__next_batch = []
 
@@ -227,16 +424,21 @@ class Database(Thread):
         try:
             if self.db.closed or self.stopped.is_set() or not self.db.connection:
                 return []
-            if self.__next_batch:
-                return self.__next_batch
+            next_batch = self.__next_batch
+            if next_batch:
+                if next_batch[0]["id"] > self.__last_deleted_id:
+                    return next_batch
+                # batch was prepared by the database thread before the last records were deleted
+                self.__next_batch = []
             start_time = monotonic()
+            # keyset pagination from the last deleted record, so the reading does not walk over freed pages
             data = self.db.execute_read(
-                """SELECT id, timestamp, message FROM messages LIMIT ?;""",
-                (self.settings.max_read_records_count,),
+                """SELECT id, timestamp, message, events_count FROM messages WHERE id > ? ORDER BY id LIMIT ?;""",
+                (self.__last_deleted_id, self.settings.max_read_records_count),
             )
             if not data:
                 return []
-            collected_data = data.fetchall()
+            collected_data = self.__fetch_records(data)
             elapsed_time = (monotonic() - start_time) * 1000
             if collected_data:
                 self.__log.trace(
@@ -249,6 +451,41 @@ class Database(Thread):
         except MemoryError:
             return []
 
+    def read_data_after(self, row_id):
+        """
+        Reads next records after the given row id without waiting until previous records are deleted.
+        """
+
+        if self.database_stopped_event.is_set() or not self.__initialized:
+            return []
+        try:
+            if self.db.closed or self.stopped.is_set() or not self.db.connection:
+                return []
+            data = self.db.execute_read(
+                """SELECT id, timestamp, message, events_count FROM messages WHERE id > ? ORDER BY id LIMIT ?;""",
+                (row_id, self.settings.max_read_records_count),
+            )
+            if not data:
+                return []
+            return self.__fetch_records(data)
+        except (ProgrammingError, InterfaceError, DatabaseError) as e:
+            self.__log.debug("Error reading data from storage: %s", e)
+            return []
+        except MemoryError:
+            return []
+
+    def __fetch_records(self, cursor):
+        # records are fetched until "max_read_records_count" events are collected, compressed block counts
+        # as all its events, so the pack size does not depend on the compression
+        records = []
+        events_count = 0
+        for record in cursor:
+            records.append(record)
+            events_count += record["events_count"]
+            if events_count >= self.settings.max_read_records_count:
+                break
+        return records
+
     def interrupt(self):
         self.db.interrupt()
 
@@ -256,26 +493,74 @@ class Database(Thread):
         if self.database_stopped_event.is_set():
             return
         try:
+            deleted_events_count = self.__count_events("id <= ?", (row_id,))
             data = self.db.execute_write(
                 """DELETE FROM messages WHERE id <= ?;""",
                 [
                     row_id,
                 ],
             )
+            if data is not None and data.rowcount > 0:
+                self.__change_stored_messages_count(-deleted_events_count)
             self.db.commit()
+            self.__last_deleted_id = max(self.__last_deleted_id, row_id)
             return data
         except Exception as e:
             self.db.rollback()
             self.__log.exception("Failed to delete data from storage! Error: %s", e)
 
+    def reclaim_free_pages(self):
+        """
+        Returns not more than "incremental_vacuum_pages" free pages to the file system,
+        it is called when there are no records to write, so reclamation does not compete with writing.
+        """
+
+        if (self.settings.incremental_vacuum_pages <= 0 or self.database_stopped_event.is_set()
+                or self.stopped.is_set()):
+            return 0
+        try:
+            if self.__auto_vacuum_mode != INCREMENTAL_AUTO_VACUUM_MODE:
+                # mode of the file created by the previous versions is changed when the file becomes empty
+                self.__auto_vacuum_mode = self.__get_auto_vacuum_mode()
+                if self.__auto_vacuum_mode != INCREMENTAL_AUTO_VACUUM_MODE:
+                    return 0
+
+            cursor = self.db.execute_read("PRAGMA freelist_count;")
+            row = cursor.fetchone() if cursor else None
+            if not row or not row[0]:
+                return 0
+            pages_to_reclaim = min(row[0], self.settings.incremental_vacuum_pages)
+            # the pragma frees one page per statement step, so it is executed as a script to make all steps
+            if not self.db.execute_script("PRAGMA incremental_vacuum(%i);" % pages_to_reclaim):
+                return 0
+            return pages_to_reclaim
+        except Exception as e:
+            self.__log.debug("Failed to reclaim free pages in storage: %s", e)
+            return 0
+
+    def __get_auto_vacuum_mode(self):
+        cursor = self.db.execute_read("PRAGMA auto_vacuum;")
+        row = cursor.fetchone() if cursor else None
+        auto_vacuum_mode = row[0] if row else 0
+        if auto_vacuum_mode != INCREMENTAL_AUTO_VACUUM_MODE and not self.database_has_records():
+            # the mode is changed by the full vacuum, that is cheap only for the empty database
+            self.db.execute_script("VACUUM;")
+            cursor = self.db.execute_read("PRAGMA auto_vacuum;")
+            row = cursor.fetchone() if cursor else None
+            auto_vacuum_mode = row[0] if row else 0
+        return auto_vacuum_mode
+
     def delete_data_lte(self, days):
         if self.database_stopped_event.is_set():
             return
         try:
             ts = (datetime.datetime.now() - datetime.timedelta(days=days)).timestamp()
+            deleted_events_count = self.__count_events("timestamp <= ?", (ts,))
             data = self.db.execute_write(
                 """DELETE FROM messages WHERE timestamp <= ? ;""", [ts]
             )
+            if data is not None and data.rowcount > 0:
+                self.__change_stored_messages_count(-deleted_events_count)
             self.db.commit()
             return data
         except Exception as e:
@@ -295,7 +580,8 @@ class Database(Thread):
                 """CREATE TABLE messages (
                                         id INTEGER PRIMARY KEY AUTOINCREMENT,
                                         timestamp INTEGER NOT NULL,
-                                        message TEXT NOT NULL
+                                        message TEXT NOT NULL,
+                                        events_count INTEGER NOT NULL DEFAULT 1
                                     );"""
             )
             self.db.commit()
@@ -324,7 +610,9 @@ class Database(Thread):
             return -1
 
         try:
-            cursor = self.db.execute_read("SELECT COUNT(*) FROM messages;")
+            cursor = self.db.execute_read(
+                "SELECT value FROM messages_metadata WHERE name = 'messages_count';"
+            )
             if cursor is None:
                 return -1
 
@@ -35,6 +35,8 @@ class DatabaseConnector:
         try:
             with self.lock:
                 self.connection = connect(self.data_file_path, check_same_thread=False)
+                # auto vacuum mode is applied only to a new file, so it has to be set before the WAL mode
+                self.connection.execute("PRAGMA auto_vacuum=INCREMENTAL;")
                 self.connection.execute("PRAGMA journal_mode=WAL;")
                 self.connection.execute("PRAGMA synchronous=NORMAL;")
                 self.connection.execute("PRAGMA cache_size=-20000;")
@@ -46,7 +48,6 @@ class DatabaseConnector:
                 self.connection.execute("PRAGMA page_size=4096;")
                 self.connection.execute("PRAGMA locking_mode=NORMAL;")
                 self.connection.execute("PRAGMA read_uncommitted=ON;")
-                self.connection.execute("PRAGMA auto_vacuum=INCREMENTAL;")
                 self.connection.execute("PRAGMA foreign_keys=ON;")
                 self.connection.row_factory = sqlite3.Row
                 self.__closed = False
@@ -210,6 +211,22 @@ class DatabaseConnector:
                 current_try += 1
                 sleep(0.05 * current_try)
 
+    def execute_script(self, script):
+        """
+        Execute script in database, pending transaction is committed before the script
+        """
+        if self.__closed or self.database_stopped_event.is_set() or self.connection is None:
+            return False
+        try:
+            with self.lock:
+                self.connection.executescript(script)
+            return True
+        except sqlite3.OperationalError as e:
+            self.__log.debug("Failed to execute script in database", exc_info=e)
+        except Exception as e:
+            self.__log.exception("Failed to execute script in database", exc_info=e)
+        return False
+
     def rollback(self):
         """
         Rollback changes after exception
@@ -0,0 +1,84 @@
+#     Copyright 2026. ThingsBoard
+#
+#     Licensed under the Apache License, Version 2.0 (the "License");
+#     you may not use this file except in compliance with the License.
+#     You may obtain a copy of the License at
+#
+#         http://www.apache.org/licenses/LICENSE-2.0
+#
+#     Unless required by applicable law or agreed to in writing, software
+#     distributed under the License is distributed on an "AS IS" BASIS,
+#     WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+#     See the License for the specific language governing permissions and
+#     limitations under the License.
+
+from struct import Struct
+from zlib import compress as zlib_compress, decompress as zlib_decompress
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+ZLIB_CODEC = "zlib"
+ZSTD_CODEC = "zstd"
+
+# first byte of the block identifies the codec, so blocks written with different codecs can be read together
+_CODEC_IDS = {ZLIB_CODEC: b"z", ZSTD_CODEC: b"s"}
+_EVENT_LENGTH = Struct(">I")
+
+
+class EventsBlockCodec:
+    """
+    Packs events into one compressed block, every event is prefixed by its length in bytes.
+    """
+
+    def __init__(self, codec=ZLIB_CODEC, level=None, logger=None):
+        if codec == ZSTD_CODEC and zstandard is None:
+            if logger is not None:
+                logger.warning("zstandard package is not installed, zlib is used to compress storage blocks")
+            codec = ZLIB_CODEC
+        if codec not in _CODEC_IDS:
+            if logger is not None:
+                logger.warning("Unknown compression codec %r, zlib is used to compress storage blocks", codec)
+            codec = ZLIB_CODEC
+
+        self.codec = codec
+        self.__codec_id = _CODEC_IDS[codec]
+        if codec == ZSTD_CODEC:
+            self.__compress = zstandard.ZstdCompressor(level=level if level is not None else 3).compress
+        else:
+            zlib_level = level if level is not None else 6
+            self.__compress = lambda data: zlib_compress(data, zlib_level)
+
+    def encode(self, events):
+        payload = []
+        for event in events:
+            encoded_event = event.encode("utf-8")
+            payload.append(_EVENT_LENGTH.pack(len(encoded_event)))
+            payload.append(encoded_event)
+        return self.__codec_id + self.__compress(b"".join(payload))
+
+    @staticmethod
+    def decode(block):
+        codec_id, compressed_payload = block[:1], block[1:]
+        if codec_id == _CODEC_IDS[ZSTD_CODEC]:
+            if zstandard is None:
+                raise RuntimeError("zstandard package is required to read storage blocks compressed with zstd")
+            payload = zstandard.ZstdDecompressor().decompress(compressed_payload)
+        else:
+            payload = zlib_decompress(compressed_payload)
+
+        events = []
+        position = 0
+        payload_length = len(payload)
+        while position < payload_length:
+            event_length, = _EVENT_LENGTH.unpack_from(payload, position)
+            position += _EVENT_LENGTH.size
+            events.append(payload[position:position + event_length].decode("utf-8"))
+            position += event_length
+        return events
+
+    @staticmethod
+    def is_block(message):
+        return isinstance(message, bytes)
@@ -12,21 +12,25 @@
 #     See the License for the specific language governing permissions and
 #     limitations under the License.
 
+from collections import deque
 from copy import copy
 from gc import collect
 from logging import getLogger
 from os import path, makedirs, remove
 from queue import Queue, Full
-from sqlite3 import ProgrammingError, DatabaseError
-from threading import Event, Thread
+from sqlite3 import ProgrammingError, DatabaseError, OperationalError
+from threading import Event
 from time import sleep, monotonic
 
 from thingsboard_gateway.storage.event_storage import EventStorage
 from thingsboard_gateway.storage.sqlite.database import Database
 from thingsboard_gateway.storage.sqlite.database_connector import DatabaseConnector
+from thingsboard_gateway.storage.sqlite.events_block_codec import EventsBlockCodec
 from thingsboard_gateway.storage.sqlite.sqlite_event_storage_pointer import Pointer
 from thingsboard_gateway.storage.sqlite.storage_settings import StorageSettings
 
+PENDING_WRITES_TIMEOUT = 5
+
 
 class SQLiteEventStorage(EventStorage):
 
@@ -106,6 +110,7 @@ class SQLiteEventStorage(EventStorage):
             self.__write_database_name,
         )
         self._database_files = self.__pointer.sort_db_files()
+        self.__closed_databases_messages_count = {}
 
         if not self.__read_database.database_has_records():
             self.__read_database.process_file_limit()
@@ -115,6 +120,8 @@ class SQLiteEventStorage(EventStorage):
         if not self.__read_database.database_has_records() and len(self._database_files) > 1:
             self.__rotate_read_database()
         self.delete_time_point = 0
+        # last row ids of packs read ahead, they are deleted one by one after the current pack
+        self.__read_ahead_row_ids = deque()
         self.__join_thread_timeout = 5
         self.__event_pack_processing_start = monotonic()
 
@@ -144,6 +151,7 @@ class SQLiteEventStorage(EventStorage):
 
     def __create_read_database(self):
         read_database_filename = self._database_files[0]
+        self.__closed_databases_messages_count.pop(read_database_filename, None)
         full_path = str(
             path.join(self.__settings.directory_path, read_database_filename)
         )
@@ -251,6 +259,11 @@ class SQLiteEventStorage(EventStorage):
         )
         if not self.stopped.is_set():
             self.delete_data(self.delete_time_point)
+            if self.__read_ahead_row_ids:
+                # the next pack was read ahead, prepared batch can be made only after it is deleted too
+                self.delete_time_point = self.__read_ahead_row_ids.popleft()
+                return
+
             self.__read_database.can_prepare_new_batch()
             if not self.__read_database.database_has_records():
 
@@ -260,6 +273,29 @@ class SQLiteEventStorage(EventStorage):
 
         collect()
 
+    def read_ahead_event_pack(self):
+        if self.stopped.is_set():
+            return []
+
+        last_row_id = self.__read_ahead_row_ids[-1] if self.__read_ahead_row_ids else self.delete_time_point
+        event_pack_messages = []
+        for row in self.__read_database.read_data_after(last_row_id):
+            try:
+                if row["message"]:
+                    self.__append_row_events(row["message"], event_pack_messages)
+                last_row_id = max(last_row_id, row["id"])
+            except (IndexError, KeyError) as e:
+                self.__log.error("Failed to extract message from storage row %r: %s", row, e)
+
+        if event_pack_messages:
+            self.__read_ahead_row_ids.append(last_row_id)
+        return event_pack_messages
+
+    def reset_read_ahead(self):
+        self.__read_ahead_row_ids.clear()
+        # batch prepared before the packs read ahead were deleted may contain stale records
+        self.__read_database.can_prepare_new_batch()
+
     def get_event_pack(self):
         if not self.stopped.is_set():
             self.__event_pack_processing_start = monotonic()
@@ -290,6 +326,13 @@ class SQLiteEventStorage(EventStorage):
         else:
             return []
 
+    @staticmethod
+    def __append_row_events(message, event_pack_messages):
+        if EventsBlockCodec.is_block(message):
+            event_pack_messages.extend(EventsBlockCodec.decode(message))
+        else:
+            event_pack_messages.append(message)
+
     def process_event_storage_data(self, data_from_storage, event_pack_messages):
 
         if not data_from_storage:
@@ -302,7 +345,7 @@ class SQLiteEventStorage(EventStorage):
                 if not element_to_insert:
                     continue
 
-                event_pack_messages.append(element_to_insert)
+                self.__append_row_events(element_to_insert, event_pack_messages)
                 if not self.delete_time_point or self.delete_time_point < row["id"]:
                     self.delete_time_point = row["id"]
             except (IndexError, KeyError) as e:
@@ -394,7 +437,7 @@ class SQLiteEventStorage(EventStorage):
             self.__cleanup_write_db_after_thread_termination()
             self.__start_write_database(new_config=new_write_database_config)
 
-    def put(self, message):
+    def put(self, message, lane=None):
         try:
 
             if self.__is_max_db_amount_reached:
@@ -412,43 +455,43 @@ class SQLiteEventStorage(EventStorage):
         except Exception as e:
             self.__log.exception("Failed to put message, %s", e)
 
+    def has_pending_writes(self):
+        return self.write_queue.unfinished_tasks > 0
+
     def stop(self):
+        self.__wait_for_pending_writes()
         self.stopped.set()
         self.__read_database.close_db()
         self.__write_database.close_db()
         collect()
 
+    def __wait_for_pending_writes(self):
+        # messages accepted by "put" are written before the databases are closed, but the shutdown is not blocked
+        # for longer than the timeout, if the writing database thread is stuck
+        wait_until = monotonic() + PENDING_WRITES_TIMEOUT
+        while (self.has_pending_writes() and monotonic() < wait_until
+               and self.__write_database is not None and self.__write_database.is_alive()):
+            sleep(0.05)
+
     def len(self):
         write_queue_size = self.write_queue.qsize()
         read_database_stored_messages_count = (
             self.__read_database.get_stored_messages_count()
         )
-        saved_databases_rows_count = 0
         write_database_stored_messages_count = 0
+        saved_databases_rows_count = 0
 
-        if (
-                self.__write_database is not None
-                and self.__write_database != self.__read_database
-        ):
-            write_database_stored_messages_count = (
-                self.__write_database.get_stored_messages_count()
-            )
+        opened_databases_names = [self.__read_database.settings.db_file_name]
+        if self.__write_database is not None:
+            opened_databases_names.append(self.__write_database.settings.db_file_name)
+            if self.__write_database != self.__read_database:
+                write_database_stored_messages_count = (
+                    self.__write_database.get_stored_messages_count()
+                )
 
-        if len(self._database_files) > 2:
-            result = {"result": 0}
-            check_thread = Thread(
-                target=self.__check_db_sizes,
-                args=(result,),
-                daemon=True,
-                name="Database row count check thread",
-            )
-            check_thread.start()
-            try:
-                check_thread.join(timeout=self.__join_thread_timeout)
-                saved_databases_rows_count = result["result"]
-            except Exception as e:
-                self.__log.error("Database row count check thread failed: %s", e)
-                self.__log.debug("Database row count check thread failed:", exc_info=e)
+        for database_name in self._database_files:
+            if database_name not in opened_databases_names:
+                saved_databases_rows_count += self.__get_closed_database_messages_count(database_name)
 
         return (
                 write_queue_size
@@ -457,36 +500,50 @@ class SQLiteEventStorage(EventStorage):
                 + saved_databases_rows_count
         )
 
-    def __check_db_sizes(self, result):
-        databases_rows_count = 0
-        for database_name in self._database_files:
-            if database_name not in (
-                    self.__read_database.settings.db_file_name,
-                    self.__write_database.settings.db_file_name,
-            ):
-                try:
-                    db_path = path.join(self.__settings.directory_path, database_name)
-                    db_connector = DatabaseConnector(
-                        db_path,
-                        self.__log,
-                        self._main_stop_event,
-                    )
-                    db_connector.connect_on_closed_db(database_path=db_path)
-                    cursor = db_connector.closed_db_connection.cursor()
-                    cursor.execute("SELECT COUNT(id) FROM messages;")
-
-                    row = cursor.fetchone()
-                    if row:
-                        databases_rows_count += row[0]
-
-                except Exception as e:
-                    self.__log.error(
-                        "Failed to check db size for %s: %s", database_name, e
-                    )
-                    self.__log.debug("Stack trace:", exc_info=e)
-                    continue
+    def __get_closed_database_messages_count(self, database_name):
+        # rotated databases are not changed until they are opened for reading, so their counts are cached
+        if database_name not in self.__closed_databases_messages_count:
+            messages_count = self.__read_closed_database_messages_count(database_name)
+            if messages_count is None:
+                return 0
+            self.__closed_databases_messages_count[database_name] = messages_count
+        return self.__closed_databases_messages_count[database_name]
+
+    def __read_closed_database_messages_count(self, database_name):
+        db_path = path.join(self.__settings.directory_path, database_name)
+        db_connector = DatabaseConnector(db_path, self.__log, self._main_stop_event)
+        db_connector.connect_on_closed_db(database_path=db_path)
+        try:
+            cursor = db_connector.closed_db_connection.cursor()
+            try:
+                cursor.execute("SELECT value FROM messages_metadata WHERE name = 'messages_count';")
+                row = cursor.fetchone()
+            except OperationalError:
+                row = None
+            if row is None:
+                # database created by the previous versions has no metadata table
+                cursor.execute("SELECT COUNT(id) FROM messages;")
+                row = cursor.fetchone()
+            return row[0] if row else 0
+        except Exception as e:
+            self.__log.error("Failed to check db size for %s: %s", database_name, e)
+            self.__log.debug("Stack trace:", exc_info=e)
+        finally:
+            closed_db_connection = getattr(db_connector, "closed_db_connection", None)
+            if closed_db_connection is not None:
+                closed_db_connection.close()
 
-        result["result"] = databases_rows_count
+    @staticmethod
+    def get_lane_configuration(config, lane):
+        if isinstance(config, StorageSettings):
+            lane_settings = copy(config)
+            lane_settings.data_file_path = path.join(config.directory_path, lane, "")
+            lane_settings.directory_path = path.dirname(lane_settings.data_file_path)
+            return lane_settings
+
+        lane_config = dict(config)
+        lane_config["data_file_path"] = path.join(path.dirname(config.get("data_file_path", "./")), lane, "")
+        return lane_config
 
     @staticmethod
     def update_settings(storage_settings: StorageSettings, data_file_path: str):
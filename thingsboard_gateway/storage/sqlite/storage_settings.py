@@ -30,6 +30,15 @@ class StorageSettings:
         self.size_limit = config.get("size_limit", 1024)
         self.max_db_amount = config.get("max_db_amount", 10)
         self.oversize_check_period = config.get("oversize_check_period", 1)
+        self.incremental_vacuum_pages = config.get("incremental_vacuum_pages", 256)
+        self.compaction_enabled = config.get("compaction_enabled", False)
+        self.compaction_latest_only_keys = config.get("compaction_latest_only_keys", [])
+        self.compaction_batch_size = config.get("compaction_batch_size", 500)
+        self.compaction_period = config.get("compaction_period_in_seconds", 60)
+        self.compression_enabled = config.get("compression_enabled", False)
+        self.compression_codec = config.get("compression_codec", "zlib")
+        self.compression_level = config.get("compression_level")
+        self.compression_block_size = config.get("compression_block_size", self.max_read_records_count)
         self.warnings = self.validate_settings()
 
     def validate_settings(self):
@@ -46,4 +55,8 @@ class StorageSettings:
             self.oversize_check_period = 1
             warnings.append("The oversize check period is too small - using the minimum value 1 minute;")
 
+        if self.compression_block_size < 1 and self.enable_validation:
+            self.compression_block_size = 1
+            warnings.append("The compression block size is too small - using the minimum value 1 record;")
+
         return warnings
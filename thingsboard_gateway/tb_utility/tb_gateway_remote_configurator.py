@@ -392,16 +392,13 @@ class RemoteConfigurator:
         self._gateway._event_storage.stop()
         storage_logger = self._gateway.remote_handler.get_logger('storage')
         try:
-            storage_class = self._gateway.event_storage_types[config["type"]]
             self._gateway._event_storage.stop()
-            self._gateway._event_storage = storage_class(config, storage_logger, self._gateway.stop_event)
+            self._gateway._event_storage = self._gateway.create_event_storage(config, storage_logger)
         except Exception as e:
             self.__log.error('Something went wrong with applying the new storage configuration. Reverting...')
             self.__log.exception(e)
-            old_storage_class = self._gateway.event_storage_types[old_event_storage_config["type"]]
-            self._gateway._event_storage = old_storage_class(old_event_storage_config,
-                                                             storage_logger,
-                                                             self._gateway.stop_event)
+            self._gateway._event_storage = self._gateway.create_event_storage(old_event_storage_config,
+                                                                              storage_logger)
         else:
             self.storage_configuration = config
             with open(self._gateway.get_config_path() + "tb_gateway.json", "w", encoding="UTF-8") as file: